@@ -1,11 +1,17 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 17:40, Claude 업데이트 (/detailed 실제 의존 서비스 확인)
+# 2026-10-17 18:20, Claude 업데이트 (/ready 준비 상태 확인)
 """
 Health Check API
 시스템 상태 확인 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from typing import Any, Dict
+
+from ..core.startup import StartupState, get_startup_state
+from ..services.health_checker import HealthChecker, get_health_checker
 
 router = APIRouter()
 
@@ -24,24 +30,35 @@ async def health_check() -> Dict[str, str]:
     }
 
 
+@router.get("/ready")
+async def readiness_check(
+    state: StartupState = Depends(get_startup_state)
+):
+    """
+    준비 상태 확인 (로드밸런서/오케스트레이터 readiness 프로브용)
+    
+    서비스 초기화, 연결, 워밍업이 모두 끝나야 200을 반환하고
+    그 전(또는 시작 실패 시)에는 503을 반환합니다.
+    
+    Returns:
+        Dict: 상태(ready/starting/failed), 전체 시작 시간, 컴포넌트별 콜드 스타트 시간(ms), 실패 사유
+    """
+    return JSONResponse(state.to_dict(), status_code=200 if state.ready else 503)
+
+
 @router.get("/detailed")
-async def detailed_health_check() -> Dict[str, any]:
+async def detailed_health_check(
+    checker: HealthChecker = Depends(get_health_checker)
+) -> Dict[str, Any]:
     """
     상세 헬스체크
-    각 서비스(Weaviate, MongoDB, Redis) 연결 상태 확인
+    각 서비스(Weaviate, MongoDB, Redis, Claude API) 연결 상태 확인
     
-    TODO: Phase 1에서 실제 연결 체크 로직 구현
+    프로브는 동시에 실행되며 결과는 몇 초간 캐시됩니다.
     
     Returns:
-        Dict: 각 서비스별 상태
+        Dict: 전체 상태(healthy/degraded/unhealthy)와 서비스별 상태/응답 시간
+            예: {"status": "healthy", "services": {"mongodb": {"status": "up", "latency_ms": 1.3}, ...},
+                 "cached": true, "age_seconds": 1.2}
     """
-    # TODO: 실제 서비스 연결 체크
-    return {
-        "status": "healthy",
-        "services": {
-            "weaviate": "not_configured",
-            "mongodb": "not_configured",
-            "redis": "not_configured",
-            "claude_api": "not_configured"
-        }
-    }
+    return await checker.check()
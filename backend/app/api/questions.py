@@ -1,43 +1,89 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 16:10, Claude 업데이트 (/analyze 답변 생성 + SSE 스트리밍)
 """
 Questions API
 질문 접수 및 처리 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from ..core.answer_generator import AnswerGenerator, get_answer_generator
+from ..schemas.question import QuestionAnswerRequest
 
 router = APIRouter()
 
 
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 한 건 직렬화"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _sse_events(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    """AnswerGenerator.stream_answer 이벤트 → SSE 문자열"""
+    try:
+        async for item in events:
+            yield format_sse(item['event'], item['data'])
+    finally:
+        # 클라이언트 연결이 끊기면 생성도 중단
+        await events.aclose()
+
+
 @router.post("/analyze")
-async def analyze_question(question: Dict[str, str]) -> Dict[str, any]:
+async def analyze_question(
+    request: QuestionAnswerRequest,
+    generator: AnswerGenerator = Depends(get_answer_generator)
+):
     """
     질문 분석 및 답변 생성
     
-    TODO: Phase 3에서 구현
+    stream=True(기본값)이면 text/event-stream으로 응답합니다.
+    - event: metadata → 카테고리, 분석 단계(analysis_tier), 신뢰도, 유사 FAQ (조회가 끝나는 즉시)
+    - event: token → 답변 조각 (생성되는 대로)
+    - event: done → 전체 답변, 검수 필요 여부, 토큰 사용량, 단계별 소요 시간
+    - event: error → 생성 실패 (그때까지의 답변 조각 포함)
+    
+    stream=False이면 완성된 답변을 JSON으로 반환합니다.
     
     Args:
-        question: 질문 데이터
-        
+        request: 질문 데이터
+    
     Returns:
-        Dict: 분석 결과 및 답변
+        StreamingResponse 또는 Dict: 분석 결과 및 답변
     """
-    # TODO: QuestionAnalyzer 호출
-    # TODO: WeaviateService로 유사 FAQ 검색
-    # TODO: MongoDBService로 제품 정보 조회
-    # TODO: ConfidenceScorer로 신뢰도 평가
-    # TODO: ClaudeService로 답변 생성
+    if request.stream:
+        events = generator.stream_answer(
+            request.question,
+            request.customer_id,
+            brand_channel=request.brand_channel,
+            product_codes=request.product_codes
+        )
+        return StreamingResponse(
+            _sse_events(events),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no"  # nginx 버퍼링 방지
+            }
+        )
     
-    return {
-        "question_id": "temp_id",
-        "status": "not_implemented",
-        "message": "Phase 3에서 구현 예정"
-    }
+    try:
+        return await generator.generate_answer(
+            request.question,
+            request.customer_id,
+            brand_channel=request.brand_channel,
+            product_codes=request.product_codes
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"답변 생성 실패: {e}")
 
 
 @router.get("/{question_id}")
-async def get_question_status(question_id: str) -> Dict[str, any]:
+async def get_question_status(question_id: str) -> Dict[str, Any]:
     """
     질문 처리 상태 조회
     
@@ -45,7 +91,7 @@ async def get_question_status(question_id: str) -> Dict[str, any]:
     
     Args:
         question_id: 질문 ID
-        
+    
     Returns:
         Dict: 질문 상태 정보
     """
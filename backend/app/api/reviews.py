@@ -1,15 +1,45 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 17:10, Claude 업데이트 (승인/거부 결과를 시맨틱 답변 캐시에 반영)
+# 2026-10-17 22:00, Claude 업데이트 (답변 캐시는 선택 의존성: 비활성화돼도 검수 동작)
+# 2026-10-17 22:20, Claude 업데이트 (승인 대기 답변을 저장소에서 불러와 처리, 없는 answer_id는 404)
+# 2026-10-18 01:30, Claude 업데이트 (승인된 답변을 저장소에 기록해 모든 워커가 재사용)
 """
 Reviews API
 CS 검수 관련 엔드포인트
 """
 
-from fastapi import APIRouter
-from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List, Optional
+
+from ..services.answer_cache import SemanticAnswerCache, get_optional_answer_cache
 
 router = APIRouter()
 
 
+async def _load_pending(cache: Optional[SemanticAnswerCache], answer_id: str):
+    """
+    승인 대기 답변 불러오기 (다른 워커가 생성했으면 저장소에서)
+    
+    캐시가 비활성화되어 있으면 확인할 수 없으므로 그대로 통과시킵니다.
+    
+    Raises:
+        HTTPException: 승인 대기 중인 답변이 없음 (404)
+    """
+    if cache is not None and not await cache.restore_pending(answer_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"승인 대기 중인 답변이 없습니다: {answer_id}"
+        )
+
+
+async def _finish_approval(cache: SemanticAnswerCache, answer_id: str, cached: bool):
+    """승인 결과를 저장소에 반영 (등록됐으면 승인 항목으로 기록해 다른 워커도 재사용, 아니면 삭제)"""
+    if cached:
+        await cache.save_approved(answer_id)
+    else:
+        await cache.delete_pending(answer_id)
+
+
 @router.get("/queue")
 async def get_review_queue() -> Dict[str, List]:
     """
@@ -28,63 +58,103 @@ async def get_review_queue() -> Dict[str, List]:
 
 
 @router.post("/{answer_id}/approve")
-async def approve_answer(answer_id: str) -> Dict[str, str]:
+async def approve_answer(
+    answer_id: str,
+    cache: Optional[SemanticAnswerCache] = Depends(get_optional_answer_cache)
+) -> Dict[str, Any]:
     """
     답변 승인
     
-    TODO: Phase 4에서 구현
+    승인된 답변은 시맨틱 답변 캐시에 등록되어 유사 질문에 재사용됩니다.
+    (캐시가 비활성화되어 있으면 등록 없이 승인만)
+    
+    TODO: Phase 4에서 검수 이력 저장 구현
     
     Args:
         answer_id: 답변 ID
-        
+    
     Returns:
-        Dict: 승인 결과
+        Dict: 승인 결과 (cached: 캐시 등록 여부)
+    
+    Raises:
+        HTTPException: 승인 대기 중인 답변이 없음 (404)
     """
+    await _load_pending(cache, answer_id)
+    cached = False
+    if cache is not None:
+        cached = cache.approve(answer_id)
+        await _finish_approval(cache, answer_id, cached)
     return {
         "answer_id": answer_id,
         "status": "approved",
-        "message": "Phase 4에서 구현 예정"
+        "cached": cached
     }
 
 
 @router.post("/{answer_id}/reject")
-async def reject_answer(answer_id: str, reason: str) -> Dict[str, str]:
+async def reject_answer(
+    answer_id: str,
+    reason: str,
+    cache: Optional[SemanticAnswerCache] = Depends(get_optional_answer_cache)
+) -> Dict[str, Any]:
     """
     답변 거부
     
-    TODO: Phase 4에서 구현
+    승인 대기 중인 캐시 항목도 버립니다.
+    
+    TODO: Phase 4에서 검수 이력 저장 구현
     
     Args:
         answer_id: 답변 ID
         reason: 거부 사유
-        
+    
     Returns:
         Dict: 거부 결과
+    
+    Raises:
+        HTTPException: 승인 대기 중인 답변이 없음 (404)
     """
+    await _load_pending(cache, answer_id)
+    if cache is not None:
+        cache.discard(answer_id)
+        await cache.delete_pending(answer_id)
     return {
         "answer_id": answer_id,
         "status": "rejected",
-        "reason": reason,
-        "message": "Phase 4에서 구현 예정"
+        "reason": reason
     }
 
 
 @router.put("/{answer_id}")
-async def update_answer(answer_id: str, content: str) -> Dict[str, str]:
+async def update_answer(
+    answer_id: str,
+    content: str,
+    cache: Optional[SemanticAnswerCache] = Depends(get_optional_answer_cache)
+) -> Dict[str, Any]:
     """
     답변 수정 후 승인
     
-    TODO: Phase 4에서 구현
+    수정된 답변이 캐시에 등록됩니다.
+    
+    TODO: Phase 4에서 검수 이력 저장 구현
     
     Args:
         answer_id: 답변 ID
         content: 수정된 답변 내용
-        
+    
     Returns:
-        Dict: 수정 결과
+        Dict: 수정 결과 (cached: 캐시 등록 여부)
+    
+    Raises:
+        HTTPException: 승인 대기 중인 답변이 없음 (404)
     """
+    await _load_pending(cache, answer_id)
+    cached = False
+    if cache is not None:
+        cached = cache.approve(answer_id, content)
+        await _finish_approval(cache, answer_id, cached)
     return {
         "answer_id": answer_id,
         "status": "modified_and_approved",
-        "message": "Phase 4에서 구현 예정"
+        "cached": cached
     }
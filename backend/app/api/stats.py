@@ -1,17 +1,22 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 17:10, Claude 업데이트 (시맨틱 답변 캐시 통계)
+# 2026-10-17 22:00, Claude 업데이트 (캐시 비활성화 시 enabled: False)
+# 2026-10-18 01:30, Claude 업데이트 (답변 캐시 전체 워커 적중률 all_workers)
 """
 Statistics API
 통계 및 대시보드 데이터 제공
 """
 
-from fastapi import APIRouter
-from typing import Dict
+from fastapi import APIRouter, Depends
+from typing import Any, Dict, Optional
+
+from ..services.answer_cache import SemanticAnswerCache, get_optional_answer_cache
 
 router = APIRouter()
 
 
 @router.get("/dashboard")
-async def get_dashboard_stats() -> Dict[str, any]:
+async def get_dashboard_stats() -> Dict[str, Any]:
     """
     대시보드 통계 조회
     
@@ -33,7 +38,7 @@ async def get_dashboard_stats() -> Dict[str, any]:
 
 
 @router.get("/performance")
-async def get_performance_metrics() -> Dict[str, any]:
+async def get_performance_metrics() -> Dict[str, Any]:
     """
     성능 지표 조회
     
@@ -48,3 +53,24 @@ async def get_performance_metrics() -> Dict[str, any]:
         "approval_rate": 0,
         "message": "Phase 5에서 구현 예정"
     }
+
+
+@router.get("/answer-cache")
+async def get_answer_cache_stats(
+    cache: Optional[SemanticAnswerCache] = Depends(get_optional_answer_cache)
+) -> Dict[str, Any]:
+    """
+    시맨틱 답변 캐시 통계 조회
+    
+    Returns:
+        Dict: enabled, 이 워커의 적중/미스/적중률, 항목 수, 승인 대기 수, 무효화 횟수 등
+              + all_workers (전체 워커 적중/미스/적중률, 저장소가 없으면 None)
+              (캐시가 비활성화되어 있으면 {'enabled': False})
+    """
+    if cache is None:
+        return {'enabled': False}
+    return {
+        'enabled': True,
+        **cache.get_stats(),
+        'all_workers': await cache.get_shared_stats()
+    }
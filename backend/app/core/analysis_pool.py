@@ -0,0 +1,248 @@
+# backend/app/core/analysis_pool.py
+# 2026-10-17 20:20, Claude 작성
+# 2026-10-17 23:59, Claude 업데이트 (워커별 워밍업 배리어, 앱 시작/종료 연결)
+# 2026-10-18 01:50, Claude 업데이트 (앱 lifespan 연결 제거: 배치/벤치마크 전용)
+
+"""
+프로세스 풀 질문 분석 백엔드
+
+QuestionAnalyzer.analyze()는 spaCy 태깅 + 정규식으로 CPU 바운드라
+uvicorn 워커 하나 안에서는 GIL 때문에 코어 하나만 씁니다.
+이 모듈은 분석을 별도 프로세스들에서 실행해 여러 코어를 사용합니다.
+
+앱의 요청 경로는 services/question_analyzer(임베딩 기반)를 쓰므로 이 풀은
+앱 lifespan에서 띄우지 않습니다. 대량 문의 일괄 분석 같은 배치 작업과
+scripts/benchmark_analysis_pool.py에서 직접 만들어 씁니다.
+
+- 워커 프로세스마다 initializer에서 분석기(spaCy 모델)를 한 번만 로드
+- analyze / analyze_many를 워커로 보내고 결과는 AnalysisResult(dataclass)로만 받음
+  (spaCy Doc 같은 큰 객체는 프로세스 경계를 넘지 않음)
+- analyze_many는 chunk_size개씩 나눠 워커들에 동시에 분배
+- start()는 워커마다 워밍업 분석을 한 번씩 실행 (배리어로 워커 하나가 두 번 받지 않게)
+- 기본 시작 방식은 spawn (스레드를 쓰는 서버 프로세스에서 fork하지 않도록)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .question_analyzer import AnalysisResult, InquiryData, QuestionAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== 워커 프로세스 ====================
+
+# 워커 프로세스 전역 분석기/워밍업 배리어 (initializer에서 설정)
+_worker_analyzer: Any = None
+_worker_barrier: Any = None
+
+# 워밍업에 사용할 문의 (제품 코드 + 기술 용어가 있어 분석 경로 대부분을 거침)
+WARMUP_INQUIRY = InquiryData(
+    brand_channel="KEYCHRON",
+    inquiry_category="상품",
+    title="워밍업",
+    inquiry_content="K10 펌웨어 업데이트 후 블루투스 연결이 안돼요",
+    product_name="키크론 K10"
+)
+
+
+def create_analyzer(spacy_model: str, pos_tagging: bool) -> QuestionAnalyzer:
+    """기본 분석기 팩토리 (워커 프로세스에서 호출)"""
+    return QuestionAnalyzer(spacy_model, pos_tagging=pos_tagging)
+
+
+def _init_worker(factory: Callable[..., Any], args: Tuple[Any, ...], barrier: Any):
+    """워커 initializer: 분석기(모델) 한 번만 로드"""
+    global _worker_analyzer, _worker_barrier
+    _worker_analyzer = factory(*args)
+    _worker_barrier = barrier
+
+
+def _warm_up(timeout: float) -> int:
+    """
+    워커 워밍업 (첫 분석 1회 후 모든 워커가 워밍업할 때까지 배리어에서 대기)
+    
+    배리어에서 기다리는 동안 이 워커는 다음 작업을 가져가지 않으므로
+    워밍업 작업 max_workers개가 워커마다 정확히 하나씩 돌아갑니다.
+    
+    Returns:
+        워밍업한 워커의 pid
+    """
+    _worker_analyzer.analyze(WARMUP_INQUIRY)
+    _worker_barrier.wait(timeout)
+    return os.getpid()
+
+
+def _analyze_one(data: InquiryData) -> AnalysisResult:
+    return _worker_analyzer.analyze(data)
+
+
+def _analyze_chunk(data_list: List[InquiryData]) -> List[AnalysisResult]:
+    return _worker_analyzer.analyze_many(data_list)
+
+
+# ==================== 풀 ====================
+
+class AnalysisPool:
+    """
+    질문 분석 프로세스 풀
+    
+    Example:
+        >>> pool = AnalysisPool(max_workers=4)
+        >>> await pool.start()                      # 워커 기동 + 모델 로드 + 워밍업
+        >>> result = await pool.analyze(data)
+        >>> results = await pool.analyze_many(data_list)
+        >>> await pool.close()
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        spacy_model: str = 'ko_core_news_sm',
+        pos_tagging: bool = True,
+        chunk_size: int = 64,
+        analyzer_factory: Callable[..., Any] = create_analyzer,
+        factory_args: Optional[Tuple[Any, ...]] = None,
+        start_method: str = 'spawn'
+    ):
+        """
+        초기화
+        
+        Args:
+            max_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            spacy_model: spaCy 모델명 (기본 팩토리 인자)
+            pos_tagging: False면 토크나이저 전용 모드 (기본 팩토리 인자)
+            chunk_size: analyze_many에서 워커 하나에 보낼 문의 수
+            analyzer_factory: 워커에서 분석기를 만드는 함수 (모듈 최상위 함수여야 pickle 가능)
+            factory_args: analyzer_factory 인자 (None이면 (spacy_model, pos_tagging))
+            start_method: multiprocessing 시작 방식 (spawn/forkserver/fork)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        
+        if factory_args is None:
+            factory_args = (spacy_model, pos_tagging)
+        
+        # 워밍업 배리어 (동기화 객체는 작업 인자로 넘길 수 없어 initializer로 전달)
+        context = multiprocessing.get_context(start_method)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(analyzer_factory, factory_args, context.Barrier(self.max_workers))
+        )
+        
+        # 통계
+        self.tasks = 0
+        self.analyzed = 0
+        self.worker_pids: List[int] = []
+    
+    async def start(self, timeout: float = 120.0) -> float:
+        """
+        워커 프로세스를 모두 띄우고 워커마다 분석기 로드 + 워밍업 분석 1회까지 대기
+        
+        첫 분석이 모델 로드/첫 추론 비용을 내지 않도록 작업 시작 전에 호출합니다.
+        timeout 안에 모든 워커가 워밍업하지 못하면 threading.BrokenBarrierError가 납니다.
+        
+        Args:
+            timeout: 워커들이 서로를 기다리는 최대 시간 (초)
+        
+        Returns:
+            기동에 걸린 시간 (초)
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        
+        self.worker_pids = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _warm_up, timeout) for _ in range(self.max_workers)
+        ])
+        
+        elapsed = time.perf_counter() - started
+        logger.info(f"🧵 분석 프로세스 풀 준비 완료: 워커 {len(set(self.worker_pids))}개 워밍업 ({elapsed:.2f}초)")
+        return elapsed
+    
+    async def analyze(self, data: InquiryData) -> AnalysisResult:
+        """문의 하나 분석 (워커 프로세스에서)"""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, _analyze_one, data)
+        
+        self.tasks += 1
+        self.analyzed += 1
+        return result
+    
+    async def analyze_many(
+        self,
+        data_list: List[InquiryData],
+        chunk_size: Optional[int] = None
+    ) -> List[AnalysisResult]:
+        """
+        여러 문의 분석 (chunk_size개씩 워커들에 동시 분배)
+        
+        Returns:
+            AnalysisResult 리스트 (입력 순서 유지)
+        """
+        size = chunk_size or self.chunk_size
+        chunks = [data_list[i:i + size] for i in range(0, len(data_list), size)]
+        
+        loop = asyncio.get_running_loop()
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _analyze_chunk, chunk) for chunk in chunks
+        ])
+        
+        self.tasks += len(chunks)
+        self.analyzed += len(data_list)
+        return [result for results in chunk_results for result in results]
+    
+    def shutdown(self, wait: bool = True):
+        """워커 프로세스 종료 (대기 중인 작업은 취소)"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+    
+    async def close(self):
+        """워커 프로세스 종료 (앱 종료 시, 이벤트 루프를 막지 않도록 스레드에서 대기)"""
+        await asyncio.to_thread(self.shutdown)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        풀 통계
+        
+        Returns:
+            워커 수, 워밍업한 워커 수, 전송한 작업 수, 분석한 문의 수
+        """
+        return {
+            'workers': self.max_workers,
+            'warmed_workers': len(set(self.worker_pids)),
+            'chunk_size': self.chunk_size,
+            'tasks': self.tasks,
+            'analyzed': self.analyzed
+        }
+
+
+# 싱글톤 인스턴스
+_analysis_pool: Optional[AnalysisPool] = None
+
+
+def get_analysis_pool() -> AnalysisPool:
+    """
+    AnalysisPool 싱글톤 인스턴스 반환
+    """
+    global _analysis_pool
+    if _analysis_pool is None:
+        raise RuntimeError("AnalysisPool이 초기화되지 않았습니다")
+    return _analysis_pool
+
+
+def init_analysis_pool(**kwargs) -> AnalysisPool:
+    """
+    AnalysisPool 초기화
+    
+    배치 작업 시작 시 호출합니다.
+    워커 기동은 start()에서 합니다.
+    """
+    global _analysis_pool
+    _analysis_pool = AnalysisPool(**kwargs)
+    return _analysis_pool
@@ -1,107 +1,810 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 14:40, Claude 업데이트 (독립 조회 단계 병렬 실행, 단계별 타임아웃/소요 시간)
+# 2026-10-17 15:10, Claude 업데이트 (동시 실행 수 제한 배치 처리, 완료 순 스트리밍)
+# 2026-10-17 15:40, Claude 업데이트 (비동기 ClaudeService 호출)
+# 2026-10-17 16:10, Claude 업데이트 (스트리밍 답변 생성, 분석 메타데이터 선전송)
+# 2026-10-17 16:40, Claude 업데이트 (브랜드 카탈로그 로드 → 프롬프트 캐시 prefix)
+# 2026-10-17 17:10, Claude 업데이트 (시맨틱 답변 캐시 조회/승인 대기 등록)
+# 2026-10-17 22:20, Claude 업데이트 (승인 대기 답변 MongoDB 저장)
+# 2026-10-17 23:50, Claude 업데이트 (단계별 질문 분석 analyze_tiered 연결, 설정으로 켬)
+# 2026-10-18 02:20, Claude 업데이트 (iter_batch 중단 시 취소한 작업이 끝날 때까지 대기)
 """
 답변 생성 오케스트레이션
 전체 답변 생성 플로우 관리
 """
 
-from typing import Dict
+import asyncio
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# 단계별 기본 타임아웃 (초)
+DEFAULT_STAGE_TIMEOUTS = {
+    'similar_faqs': 3.0,
+    'product_lookup': 1.0,
+    'customer_lookup': 1.0,
+    'catalog_lookup': 2.0,
+    'generation': 60.0,
+}
+
+
 class AnswerGenerator:
     """
     답변 생성 오케스트레이터 클래스
     
     전체 플로우:
-    1. 질문 분석 (QuestionAnalyzer)
-    2. 벡터 검색 (WeaviateService)
-    3. 데이터 조회 (MongoDBService)
-    4. 신뢰도 평가 (ConfidenceScorer)
-    5. 답변 생성 (ClaudeService)
+    1. 질문 분석 (QuestionAnalyzer, 카테고리/제품 코드)
+       - tiered_analysis면 analyze_tiered로 애매한 질문만 spaCy/임베딩+검색 단계까지 승격
+    2. 독립 조회 병렬 실행 (asyncio.gather, 단계별 타임아웃)
+       - 벡터 검색 (WeaviateService)
+       - 제품 정보 조회 (MongoDBService)
+       - 고객 문의 이력 조회 (MongoDBService)
+    3. 신뢰도 평가
+    4. 답변 생성 (ClaudeService) - 조회 결과가 모두 모인 뒤 실행
+    
+    answer_cache가 있으면 1 이전에 CS 승인된 유사 질문의 답변을 찾고,
+    적중하면 조회/생성 없이 바로 반환합니다. 새로 생성한 답변은
+    answer_id로 승인 대기 등록되어 CS 승인 후 캐시에 들어갑니다.
+    
+    조회 단계가 타임아웃/실패하면 해당 컨텍스트 없이 진행하고
+    응답의 stage_errors에 기록합니다.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        weaviate_service=None,
+        mongodb_service=None,
+        claude_service=None,
+        question_analyzer=None,
+        answer_cache=None,
+        confidence_threshold: float = 0.7,
+        similar_faq_limit: int = 5,
+        min_similarity: float = 0.6,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        batch_concurrency: int = 8,
+        item_timeout: float = 90.0,
+        catalog_refresh_seconds: float = 3600.0,
+        catalog_limit: int = 200,
+        tiered_analysis: bool = False,
+        analysis_max_tier: str = 'full'
+    ):
         """
         AnswerGenerator 초기화
         
-        TODO: Phase 3에서 구현
-        - 각 서비스 초기화
+        Args:
+            weaviate_service: 유사 FAQ 검색용 WeaviateService
+            mongodb_service: 제품/고객 조회용 MongoDBService
+            claude_service: 답변 생성용 ClaudeService
+            question_analyzer: 제품 코드 추출용 QuestionAnalyzer (선택)
+            answer_cache: 시맨틱 답변 캐시 SemanticAnswerCache (선택)
+            confidence_threshold: 이 값 미만이면 CS 검수 필요
+            similar_faq_limit: 유사 FAQ 최대 개수
+            min_similarity: 유사 FAQ 최소 유사도
+            stage_timeouts: 단계별 타임아웃 (초), DEFAULT_STAGE_TIMEOUTS를 덮어씀
+            batch_concurrency: 배치 처리 시 동시에 처리할 질문 수
+            item_timeout: 배치 처리 시 질문 하나의 최대 처리 시간 (초)
+            catalog_refresh_seconds: 브랜드 제품 카탈로그(프롬프트 캐시 prefix) 재조회 주기 (초)
+            catalog_limit: 카탈로그에 넣을 최대 제품 수
+            tiered_analysis: True면 질문 분석에 analyze_tiered 사용 (False면 키워드 규칙 분류만)
+            analysis_max_tier: analyze_tiered 최대 단계 (rules/spacy/full)
         """
         logger.info("AnswerGenerator 초기화")
-        # TODO: self.question_analyzer = QuestionAnalyzer()
-        # TODO: self.weaviate_service = WeaviateService()
-        # TODO: self.mongodb_service = MongoDBService()
-        # TODO: self.confidence_scorer = ConfidenceScorer()
-        # TODO: self.claude_service = ClaudeService()
+        
+        self.weaviate_service = weaviate_service
+        self.mongodb_service = mongodb_service
+        self.claude_service = claude_service
+        self.question_analyzer = question_analyzer
+        self.answer_cache = answer_cache
+        
+        self.confidence_threshold = confidence_threshold
+        self.similar_faq_limit = similar_faq_limit
+        self.min_similarity = min_similarity
+        self.stage_timeouts = {**DEFAULT_STAGE_TIMEOUTS, **(stage_timeouts or {})}
+        self.batch_concurrency = batch_concurrency
+        self.item_timeout = item_timeout
+        self.catalog_refresh_seconds = catalog_refresh_seconds
+        self.catalog_limit = catalog_limit
+        self.tiered_analysis = tiered_analysis
+        self.analysis_max_tier = analysis_max_tier
+        self._catalog_locks: Dict[str, asyncio.Lock] = {}
     
-    async def generate_answer(self, question_text: str, customer_id: str = None) -> Dict[str, any]:
+    async def _run_stage(
+        self,
+        name: str,
+        awaitable: Awaitable,
+        default: Any,
+        timings: Dict[str, float],
+        errors: Dict[str, str]
+    ) -> Any:
+        """
+        단계 실행 (타임아웃 적용, 소요 시간 기록)
+        
+        실패하거나 시간을 넘기면 default를 반환하고 errors에 사유를 남깁니다.
+        """
+        started = time.perf_counter()
+        
+        try:
+            return await asyncio.wait_for(awaitable, self.stage_timeouts[name])
+        except asyncio.TimeoutError:
+            errors[name] = f"timeout ({self.stage_timeouts[name]}초)"
+            logger.warning(f"⏱️ {name} 단계 타임아웃 ({self.stage_timeouts[name]}초)")
+            return default
+        except Exception as e:
+            errors[name] = str(e)
+            logger.error(f"❌ {name} 단계 실패: {e}")
+            return default
+        finally:
+            timings[f"{name}_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    async def _search_similar_faqs(
+        self,
+        question_text: str,
+        brand_channel: str,
+        query_vector: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """유사 FAQ 검색"""
+        if not self.weaviate_service:
+            return []
+        
+        return await self.weaviate_service.search_similar_faqs(
+            query_text=question_text,
+            brand_channel=brand_channel,
+            limit=self.similar_faq_limit,
+            min_similarity=self.min_similarity,
+            query_vector=query_vector
+        )
+    
+    async def _lookup_product(self, product_codes: List[str], brand_channel: str) -> Optional[Dict[str, Any]]:
+        """제품 코드로 제품 정보 조회"""
+        if not self.mongodb_service or not product_codes:
+            return None
+        
+        return await self.mongodb_service.get_product_by_code(product_codes, brand_channel)
+    
+    async def _lookup_customer(self, customer_id: Optional[str]) -> List[Dict[str, Any]]:
+        """고객 문의 이력 조회"""
+        if not self.mongodb_service or not customer_id:
+            return []
+        
+        return await self.mongodb_service.get_customer_history(customer_id)
+    
+    async def _ensure_brand_catalog(self, brand_channel: str) -> None:
+        """
+        브랜드 제품 카탈로그를 ClaudeService에 설정 (없거나 오래된 경우만 조회)
+        
+        카탈로그는 프롬프트 캐시 prefix에 들어가므로 자주 바꾸지 않습니다.
+        같은 브랜드의 동시 요청은 한 번만 조회합니다.
+        """
+        catalog_age = getattr(self.claude_service, 'brand_catalog_age', None)
+        if not self.mongodb_service or catalog_age is None:
+            return
+        
+        age = catalog_age(brand_channel)
+        if age is not None and age < self.catalog_refresh_seconds:
+            return
+        
+        lock = self._catalog_locks.setdefault(brand_channel, asyncio.Lock())
+        async with lock:
+            age = catalog_age(brand_channel)
+            if age is not None and age < self.catalog_refresh_seconds:
+                return
+            
+            products = await self.mongodb_service.search_products(
+                brand_channel=brand_channel,
+                limit=self.catalog_limit
+            )
+            self.claude_service.set_brand_catalog(brand_channel, products)
+    
+    def _extract_product_codes(self, text: str) -> List[str]:
+        """질문에서 제품 코드 추출 (분석기가 없으면 빈 리스트)"""
+        if not self.question_analyzer:
+            return []
+        return self.question_analyzer.extract_product_codes(text)
+    
+    def _classify_category(self, text: str) -> Optional[str]:
+        """질문 카테고리 추정 (키워드 규칙 기반, 분석기가 없으면 None)"""
+        if not self.question_analyzer:
+            return None
+        return self.question_analyzer.classify_category(text, [])
+    
+    async def _analyze_question(
+        self,
+        question_text: str,
+        brand_channel: str,
+        product_codes: Optional[List[str]],
+        query_vector: Optional[List[float]],
+        errors: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        질문 분석 (카테고리, 제품 코드)
+        
+        tiered_analysis가 꺼져 있으면 키워드 규칙 분류만 합니다.
+        켜져 있으면 analyze_tiered로 애매한 질문만 다음 단계로 올리고,
+        full 단계에서 만든 임베딩은 유사 FAQ 검색에 재사용합니다.
+        단계별 분석이 실패하면 규칙 분류로 대신하고 errors['analysis']에 남깁니다.
+        
+        Returns:
+            category, product_codes, tier, escalation_reason, query_vector
+        """
+        if self.tiered_analysis and self.question_analyzer:
+            try:
+                result = await self.question_analyzer.analyze_tiered(
+                    question_text,
+                    brand_channel,
+                    max_tier=self.analysis_max_tier,
+                    embedding=query_vector
+                )
+                return {
+                    'category': result.category,
+                    'product_codes': product_codes if product_codes is not None else result.product_codes,
+                    'tier': result.tier,
+                    'escalation_reason': result.escalation_reason,
+                    'query_vector': query_vector or result.embedding
+                }
+            except Exception as e:
+                errors['analysis'] = str(e)
+                logger.error(f"❌ 단계별 질문 분석 실패, 규칙 분류로 대신합니다: {e}")
+        
+        return {
+            'category': self._classify_category(question_text),
+            'product_codes': product_codes if product_codes is not None else self._extract_product_codes(question_text),
+            'tier': None,
+            'escalation_reason': None,
+            'query_vector': query_vector
+        }
+    
+    async def _gather_context(
+        self,
+        question_text: str,
+        customer_id: Optional[str],
+        brand_channel: str,
+        product_codes: Optional[List[str]],
+        query_vector: Optional[List[float]],
+        timings: Dict[str, float],
+        errors: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        답변 생성 전 단계 (질문 분석 + 독립 조회 병렬 실행 + 신뢰도 평가)
+        
+        Returns:
+            brand_channel, category, product_codes, analysis_tier, similar_faqs, product_info,
+            customer_info, confidence, references
+        """
+        # 1. 질문 분석 (카테고리, 제품 코드)
+        analysis_started = time.perf_counter()
+        analysis = await self._analyze_question(question_text, brand_channel, product_codes, query_vector, errors)
+        category = analysis['category']
+        product_codes = analysis['product_codes']
+        query_vector = analysis['query_vector']
+        timings['analysis_ms'] = round((time.perf_counter() - analysis_started) * 1000, 1)
+        
+        # 2. 서로 독립적인 조회를 동시에 실행 (카탈로그는 처음/만료 시에만 실제 조회)
+        fanout_started = time.perf_counter()
+        similar_faqs, product_info, customer_info, _ = await asyncio.gather(
+            self._run_stage(
+                'similar_faqs',
+                self._search_similar_faqs(question_text, brand_channel, query_vector),
+                [], timings, errors
+            ),
+            self._run_stage(
+                'product_lookup',
+                self._lookup_product(product_codes, brand_channel),
+                None, timings, errors
+            ),
+            self._run_stage(
+                'customer_lookup',
+                self._lookup_customer(customer_id),
+                [], timings, errors
+            ),
+            self._run_stage(
+                'catalog_lookup',
+                self._ensure_brand_catalog(brand_channel),
+                None, timings, errors
+            ),
+        )
+        timings['fanout_ms'] = round((time.perf_counter() - fanout_started) * 1000, 1)
+        
+        # 3. 신뢰도 평가 (가장 유사한 FAQ 기준)
+        confidence = max((faq.get('similarity', 0.0) for faq in similar_faqs), default=0.0)
+        
+        references = [f"FAQ_{faq['inquiry_no']}" for faq in similar_faqs]
+        if product_info:
+            references.append(f"PRODUCT_{product_info.get('product_id')}")
+        
+        return {
+            'brand_channel': brand_channel,
+            'category': category,
+            'product_codes': product_codes,
+            'analysis_tier': analysis['tier'],
+            'escalation_reason': analysis['escalation_reason'],
+            'similar_faqs': similar_faqs,
+            'product_info': product_info,
+            'customer_info': customer_info,
+            'confidence': confidence,
+            'references': references
+        }
+    
+    async def _check_cache(
+        self,
+        question_text: str,
+        brand_channel: str,
+        query_vector: Optional[List[float]],
+        timings: Dict[str, float]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[List[float]]]:
+        """
+        시맨틱 답변 캐시 조회
+        
+        임베딩이 없으면 여기서 계산하고, 캐시 미스 시 유사 FAQ 검색에 그대로 재사용합니다.
+        
+        Returns:
+            (적중 항목 또는 None, 질문 임베딩)
+        """
+        if self.answer_cache is None:
+            return None, query_vector
+        
+        started = time.perf_counter()
+        if query_vector is None:
+            query_vector = (await self._embed_questions([question_text]))[0]
+        
+        hit = None
+        if query_vector is not None:
+            hit = self.answer_cache.lookup(
+                query_vector, brand_channel, self._classify_category(question_text)
+            )
+        
+        timings['cache_lookup_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return hit, query_vector
+    
+    async def _stage_answer(
+        self,
+        answer_id: str,
+        question_text: str,
+        query_vector: Optional[List[float]],
+        answer: Optional[str],
+        gathered: Dict[str, Any]
+    ):
+        """생성된 답변을 캐시 승인 대기 목록에 등록 (CS 승인 시 캐시에 들어감, 다른 워커도 승인할 수 있게 저장소에도 기록)"""
+        if self.answer_cache is None or not answer or query_vector is None:
+            return
+        
+        # 캐시 버킷은 조회(_check_cache)와 같은 규칙 분류 기준 (단계별 분석 결과와 다를 수 있음)
+        product_info = gathered['product_info']
+        self.answer_cache.stage(
+            answer_id,
+            question_text,
+            query_vector,
+            answer,
+            gathered['brand_channel'],
+            self._classify_category(question_text),
+            faq_ids=[faq['inquiry_no'] for faq in gathered['similar_faqs']],
+            product_ids=[product_info['product_id']] if product_info and product_info.get('product_id') else [],
+            references=gathered['references']
+        )
+        await self.answer_cache.save_pending(answer_id)
+    
+    @staticmethod
+    def _generation_context(gathered: Dict[str, Any]) -> Dict[str, Any]:
+        """ClaudeService에 넘길 컨텍스트 (brand_channel은 캐시 prefix 선택용)"""
+        return {
+            'brand_channel': gathered['brand_channel'],
+            'similar_faqs': gathered['similar_faqs'],
+            'product_info': gathered['product_info'],
+            'customer_info': gathered['customer_info']
+        }
+    
+    async def generate_answer(
+        self,
+        question_text: str,
+        customer_id: str = None,
+        brand_channel: str = "KEYCHRON",
+        product_codes: Optional[List[str]] = None,
+        query_vector: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
         """
         질문에 대한 답변 생성
         
         Args:
             question_text: 고객 질문
             customer_id: 고객 ID (선택)
-            
+            brand_channel: 브랜드 채널
+            product_codes: 제품 코드 (없으면 질문에서 추출)
+            query_vector: 미리 계산된 질문 임베딩 (배치 처리 시 공유)
+        
         Returns:
             Dict: 답변 결과
                 - answer: 생성된 답변
                 - confidence: 신뢰도 점수
                 - requires_review: 검수 필요 여부
                 - references: 참조한 FAQ/제품 정보
-                
-        TODO: Phase 3에서 구현
+                - timings: 단계별 소요 시간 (밀리초)
+                - stage_errors: 실패/타임아웃 단계와 사유
+                - answer_id: 답변 ID (CS 승인/거부 시 사용)
+                - cached: 시맨틱 캐시에서 가져온 답변인지 여부
         """
         logger.info(f"답변 생성 시작: {question_text[:50]}...")
         
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        answer_id = uuid.uuid4().hex
+        
         try:
-            # 1. 질문 분석
-            # analysis = self.question_analyzer.analyze(question_text)
+            # 0. 시맨틱 캐시 (적중 시 조회/생성 생략)
+            hit, query_vector = await self._check_cache(question_text, brand_channel, query_vector, timings)
+            if hit:
+                timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+                logger.info(f"💾 캐시 답변 사용 (유사도 {hit['similarity']}, 원 답변 {hit['answer_id']})")
+                return {
+                    "answer": hit['answer'],
+                    "category": self._classify_category(question_text),
+                    "confidence": hit['similarity'],
+                    "requires_review": False,
+                    "references": hit['references'],
+                    "timings": timings,
+                    "stage_errors": errors,
+                    "answer_id": answer_id,
+                    "cached": True,
+                    "cached_from": hit['answer_id']
+                }
             
-            # 2. 벡터 검색 (유사 FAQ)
-            # similar_faqs = self.weaviate_service.search(...)
+            gathered = await self._gather_context(
+                question_text, customer_id, brand_channel, product_codes, query_vector,
+                timings, errors
+            )
             
-            # 3. 제품 정보 조회
-            # product_info = self.mongodb_service.get_products(...)
+            # 4. 답변 생성 (Claude) - 조회 결과가 모두 모인 뒤 실행
+            context = self._generation_context(gathered)
             
-            # 4. 고객 정보 조회 (선택)
-            # customer_info = self.mongodb_service.get_customer(customer_id)
+            generation = None
+            if self.claude_service:
+                generation = await self._run_stage(
+                    'generation',
+                    self.claude_service.generate_answer(question_text, context),
+                    None, timings, errors
+                )
             
-            # 5. 신뢰도 평가
-            # confidence = self.confidence_scorer.calculate_confidence(...)
+            answer = generation['answer'] if generation else None
+            confidence = gathered['confidence']
+            requires_review = answer is None or confidence < self.confidence_threshold
             
-            # 6. 답변 생성 (Claude)
-            # answer = self.claude_service.generate_answer(...)
+            await self._stage_answer(answer_id, question_text, query_vector, answer, gathered)
+            
+            timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            
+            logger.info(f"답변 생성 완료: {timings}")
             
             return {
-                "answer": "Not implemented",
-                "confidence": 0.0,
-                "requires_review": True,
-                "references": []
+                "answer": answer,
+                "category": gathered['category'],
+                "analysis_tier": gathered['analysis_tier'],
+                "confidence": confidence,
+                "requires_review": requires_review,
+                "references": gathered['references'],
+                "timings": timings,
+                "stage_errors": errors,
+                "answer_id": answer_id,
+                "cached": False
             }
-            
+        
         except Exception as e:
             logger.error(f"답변 생성 중 오류: {e}")
             raise
     
-    async def process_batch(self, questions: list) -> list:
+    async def stream_answer(
+        self,
+        question_text: str,
+        customer_id: str = None,
+        brand_channel: str = "KEYCHRON",
+        product_codes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        답변 스트리밍 생성
+        
+        조회가 끝나는 즉시 분석 메타데이터를 먼저 보내고,
+        이후 Claude가 생성하는 답변 조각을 그대로 전달합니다.
+        → 첫 응답까지의 시간 = 조회 시간
+        
+        generation 타임아웃은 스트림 전체(첫 토큰 ~ 마지막 토큰)에 적용됩니다.
+        
+        Args:
+            question_text: 고객 질문
+            customer_id: 고객 ID (선택)
+            brand_channel: 브랜드 채널
+            product_codes: 제품 코드 (없으면 질문에서 추출)
+        
+        Yields:
+            {'event': 'metadata', 'data': {answer_id, cached, category, confidence, similar_faqs, references, ...}}
+            {'event': 'token', 'data': {'text': 조각}} (여러 번, 캐시 적중 시 전체 답변 한 번)
+            {'event': 'done', 'data': {answer, requires_review, usage, timings, stage_errors}}
+            생성 실패 시 마지막 이벤트는 {'event': 'error', 'data': {...}}
+        """
+        logger.info(f"스트리밍 답변 생성 시작: {question_text[:50]}...")
+        
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        answer_id = uuid.uuid4().hex
+        
+        hit, query_vector = await self._check_cache(question_text, brand_channel, None, timings)
+        if hit:
+            timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            yield {
+                'event': 'metadata',
+                'data': {
+                    'answer_id': answer_id,
+                    'cached': True,
+                    'cached_from': hit['answer_id'],
+                    'category': self._classify_category(question_text),
+                    'confidence': hit['similarity'],
+                    'similar_faqs': [],
+                    'references': hit['references'],
+                    'stage_errors': {}
+                }
+            }
+            yield {'event': 'token', 'data': {'text': hit['answer']}}
+            yield {
+                'event': 'done',
+                'data': {'answer': hit['answer'], 'requires_review': False, 'usage': None,
+                         'timings': timings, 'stage_errors': errors}
+            }
+            return
+        
+        gathered = await self._gather_context(
+            question_text, customer_id, brand_channel, product_codes, query_vector,
+            timings, errors
+        )
+        confidence = gathered['confidence']
+        timings['metadata_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        
+        yield {
+            'event': 'metadata',
+            'data': {
+                'answer_id': answer_id,
+                'cached': False,
+                'category': gathered['category'],
+                'product_codes': gathered['product_codes'],
+                'analysis_tier': gathered['analysis_tier'],
+                'escalation_reason': gathered['escalation_reason'],
+                'confidence': confidence,
+                'similar_faqs': [
+                    {
+                        'inquiry_no': faq.get('inquiry_no'),
+                        'title': faq.get('title'),
+                        'similarity': faq.get('similarity')
+                    }
+                    for faq in gathered['similar_faqs']
+                ],
+                'references': gathered['references'],
+                'stage_errors': dict(errors)
+            }
+        }
+        
+        if not self.claude_service:
+            timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            yield {
+                'event': 'done',
+                'data': {'answer': None, 'requires_review': True, 'usage': None,
+                         'timings': timings, 'stage_errors': errors}
+            }
+            return
+        
+        # 답변 조각 중계 (조각 단위로 남은 시간 확인)
+        context = self._generation_context(gathered)
+        timeout = self.stage_timeouts['generation']
+        generation_started = time.perf_counter()
+        deadline = generation_started + timeout
+        
+        parts: List[str] = []
+        usage = None
+        stream = self.claude_service.stream_answer(question_text, context)
+        
+        try:
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                
+                try:
+                    event = await asyncio.wait_for(stream.__anext__(), remaining)
+                except StopAsyncIteration:
+                    break
+                
+                if event['type'] == 'text':
+                    if not parts:
+                        timings['first_token_ms'] = round((time.perf_counter() - started) * 1000, 1)
+                    parts.append(event['text'])
+                    yield {'event': 'token', 'data': {'text': event['text']}}
+                elif event['type'] == 'done':
+                    usage = event['usage']
+        
+        except Exception as e:
+            errors['generation'] = f"timeout ({timeout}초)" if isinstance(e, asyncio.TimeoutError) else str(e)
+            logger.error(f"❌ 스트리밍 생성 실패: {errors['generation']}")
+            timings['generation_ms'] = round((time.perf_counter() - generation_started) * 1000, 1)
+            timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            yield {
+                'event': 'error',
+                'data': {'message': errors['generation'], 'partial_answer': ''.join(parts) or None,
+                         'requires_review': True, 'timings': timings, 'stage_errors': errors}
+            }
+            return
+        
+        finally:
+            await stream.aclose()
+        
+        timings['generation_ms'] = round((time.perf_counter() - generation_started) * 1000, 1)
+        timings['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        
+        answer = ''.join(parts).strip() or None
+        await self._stage_answer(answer_id, question_text, query_vector, answer, gathered)
+        logger.info(f"스트리밍 답변 생성 완료: {timings}")
+        
+        yield {
+            'event': 'done',
+            'data': {
+                'answer': answer,
+                'requires_review': answer is None or confidence < self.confidence_threshold,
+                'usage': usage,
+                'timings': timings,
+                'stage_errors': errors
+            }
+        }
+    
+    async def _embed_questions(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        배치 전체 질문을 한 번의 encode로 임베딩
+        
+        실패하면 질문별로 검색 시점에 임베딩하도록 None을 반환합니다.
+        """
+        engine = getattr(self.weaviate_service, 'embedding_engine', None)
+        if engine is None or not texts:
+            return [None] * len(texts)
+        
+        try:
+            return await engine.aencode(texts, batch_size=len(texts))
+        except Exception as e:
+            logger.warning(f"⚠️ 배치 임베딩 실패, 질문별 임베딩으로 진행: {e}")
+            return [None] * len(texts)
+    
+    async def iter_batch(
+        self,
+        questions: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        item_timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        여러 질문을 동시에 처리하고 끝나는 순서대로 결과 반환
+        
+        - 동시에 처리하는 질문 수는 concurrency로 제한
+        - 질문마다 item_timeout 적용, 한 질문의 실패가 배치를 멈추지 않음
+        - 질문 임베딩은 배치 전체에서 한 번에 계산해 공유
+        
+        Args:
+            questions: 질문 리스트 ({'text', 'customer_id', 'brand_channel', 'product_codes'})
+            concurrency: 동시 처리 수 (기본값: batch_concurrency)
+            item_timeout: 질문별 타임아웃 (기본값: item_timeout)
+        
+        Yields:
+            {'index', 'result', 'error', 'elapsed_ms'} (성공 시 error는 None)
+        """
+        concurrency = concurrency or self.batch_concurrency
+        item_timeout = item_timeout or self.item_timeout
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        vectors = await self._embed_questions([question["text"] for question in questions])
+        
+        async def run(index: int, question: Dict[str, Any], query_vector):
+            async with semaphore:
+                started = time.perf_counter()
+                result, error = None, None
+                
+                try:
+                    result = await asyncio.wait_for(
+                        self.generate_answer(
+                            question["text"],
+                            question.get("customer_id"),
+                            brand_channel=question.get("brand_channel", "KEYCHRON"),
+                            product_codes=question.get("product_codes"),
+                            query_vector=query_vector
+                        ),
+                        item_timeout
+                    )
+                except asyncio.TimeoutError:
+                    error = f"timeout ({item_timeout}초)"
+                except Exception as e:
+                    error = str(e)
+                
+                if error:
+                    logger.error(f"❌ 질문 {index} 처리 실패: {error}")
+                
+                return {
+                    'index': index,
+                    'result': result,
+                    'error': error,
+                    'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+                }
+        
+        tasks = [
+            asyncio.create_task(run(index, question, vector))
+            for index, (question, vector) in enumerate(zip(questions, vectors))
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 호출자가 중간에 멈추면 남은 작업 취소 후 정리(finally/세마포어 반환)가 끝날 때까지 대기
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def process_batch(
+        self,
+        questions: list,
+        concurrency: Optional[int] = None,
+        item_timeout: Optional[float] = None
+    ) -> list:
         """
         여러 질문 일괄 처리
         
+        iter_batch로 동시에 처리한 뒤 입력 순서대로 정렬해 반환합니다.
+        실패한 질문은 {'error': 사유, 'requires_review': True} 형태로 들어갑니다.
+        
         Args:
             questions: 질문 리스트
-            
+            concurrency: 동시 처리 수
+            item_timeout: 질문별 타임아웃 (초)
+        
         Returns:
-            list: 답변 결과 리스트
-            
-        TODO: Phase 3에서 구현
+            list: 답변 결과 리스트 (입력 순서)
         """
         logger.info(f"일괄 처리 시작: {len(questions)}개 질문")
         
-        results = []
-        for question in questions:
-            result = await self.generate_answer(question["text"], question.get("customer_id"))
-            results.append(result)
+        started = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        failed = 0
+        
+        async for item in self.iter_batch(questions, concurrency, item_timeout):
+            if item['error']:
+                failed += 1
+                results[item['index']] = {'error': item['error'], 'requires_review': True}
+            else:
+                results[item['index']] = item['result']
+        
+        logger.info(
+            f"일괄 처리 완료: {len(questions)}개 중 실패 {failed}개 "
+            f"({time.perf_counter() - started:.1f}초)"
+        )
         
         return results
+
+
+# 싱글톤 인스턴스
+_answer_generator: Optional[AnswerGenerator] = None
+
+
+def get_answer_generator() -> AnswerGenerator:
+    """
+    AnswerGenerator 싱글톤 인스턴스 반환
+    
+    FastAPI의 Depends에서 사용합니다.
+    """
+    global _answer_generator
+    if _answer_generator is None:
+        raise RuntimeError("AnswerGenerator가 초기화되지 않았습니다")
+    return _answer_generator
+
+
+def init_answer_generator(**kwargs) -> AnswerGenerator:
+    """
+    AnswerGenerator 초기화
+    
+    main.py에서 각 서비스 초기화 후 호출합니다.
+    """
+    global _answer_generator
+    _answer_generator = AnswerGenerator(**kwargs)
+    return _answer_generator
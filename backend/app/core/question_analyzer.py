@@ -1,5 +1,10 @@
 # backend/app/core/question_analyzer.py
 # 2025-10-02 16:30, Claude 작성
+# 2026-10-17 18:50, Claude 업데이트 (spaCy 지연 임포트, 미사용 임포트 제거)
+# 2026-10-17 19:20, Claude 업데이트 (색상/스위치/기술 용어 단일 스캔 매칭)
+# 2026-10-17 19:50, Claude 업데이트 (analyze_many: nlp.pipe 일괄 분석, 토크나이저 전용 모드)
+# 2026-10-17 20:20, Claude 업데이트 (키워드 중복 제거 순서 고정)
+# 2026-10-18 02:10, Claude 업데이트 (문의 내용 사전 매칭 1회: 색상/스위치/기술 용어/복잡도 공용)
 
 """
 고객 문의 질문 분석 모듈 (개선 버전)
@@ -16,12 +21,12 @@
 """
 
 import re
-import spacy
-import numpy as np
-from sentence_transformers import SentenceTransformer
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
 
+from ..utils.keyword_matcher import get_keyword_matcher
+from ..utils.ml_loader import load_spacy, spacy_exclude
+
 
 @dataclass
 class InquiryData:
@@ -168,7 +173,7 @@ class QuestionAnalyzer:
         '핫스왑', '키캡', 'rgb', '백라이트',
     ]
     
-    def __init__(self, spacy_model: str = 'ko_core_news_sm'):
+    def __init__(self, spacy_model: str = 'ko_core_news_sm', pos_tagging: bool = True):
         """
         QuestionAnalyzer 초기화 (경량화 버전)
         
@@ -176,12 +181,14 @@ class QuestionAnalyzer:
         
         Args:
             spacy_model: spaCy 한국어 모델명
+            pos_tagging: False면 토크나이저만 실행 (품사 없이 어절 기반 키워드, 더 빠름)
         """
         print("📚 QuestionAnalyzer 초기화 중 (경량 모드)...")
         
-        # spaCy 한국어 모델만 로드
+        # spaCy 한국어 모델만 로드 (파서/NER 등 품사 태깅에 불필요한 컴포넌트 제외)
         print(f"  - spaCy 한국어 모델 로드: {spacy_model}")
-        self.nlp = spacy.load(spacy_model)
+        self.pos_tagging = pos_tagging
+        self.nlp = load_spacy(spacy_model, spacy_exclude(pos_tagging))
         
         # 정규표현식 컴파일 (성능 최적화)
         self.product_code_regex = re.compile(
@@ -194,6 +201,11 @@ class QuestionAnalyzer:
             re.IGNORECASE
         )
         
+        # 색상/스위치/기술 용어 사전을 한 번에 찾는 매처
+        self.keyword_matcher = get_keyword_matcher(
+            self.COLOR_KEYWORDS + self.SWITCH_TYPES + self.TECH_TERMS
+        )
+        
         print("✅ QuestionAnalyzer 초기화 완료! (Sentence-BERT 없이 경량 모드)\n")
     
     def analyze(self, data: InquiryData) -> AnalysisResult:
@@ -216,23 +228,64 @@ class QuestionAnalyzer:
             ... )
             >>> result = analyzer.analyze(data)
         """
+        return self._analyze_with_keywords(data, self._extract_keywords(data.inquiry_content))
+    
+    def analyze_many(
+        self,
+        data_list: List[InquiryData],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[AnalysisResult]:
+        """
+        여러 질문 일괄 분석 (nlp.pipe)
+        
+        spaCy를 문의마다 호출하지 않고 batch_size개씩 묶어 처리합니다.
+        과거 문의 전체 재분석처럼 건수가 많을 때 n_process로 여러 프로세스를 쓸 수 있습니다.
+        
+        Args:
+            data_list: InquiryData 리스트
+            batch_size: spaCy 배치 크기
+            n_process: spaCy 프로세스 수 (1이면 현재 프로세스)
+        
+        Returns:
+            AnalysisResult 리스트 (입력 순서 유지)
+        """
+        docs = self.nlp.pipe(
+            (data.inquiry_content for data in data_list),
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        
+        return [
+            self._analyze_with_keywords(data, self._keywords_from_doc(doc))
+            for data, doc in zip(data_list, docs)
+        ]
+    
+    def _analyze_with_keywords(self, data: InquiryData, keywords: List[str]) -> AnalysisResult:
+        """키워드 추출 이후 단계 (analyze/analyze_many 공용)"""
         # 1. 카테고리: 재분류 안 함! (이미 분류된 데이터 사용)
         category = data.inquiry_category
         
-        # 2. 제품 정보 추출 (product_name + content)
+        # 2. 사전 매칭: content는 한 번만 스캔해 색상/스위치/기술 용어에 함께 사용
+        product_name = data.product_name or ""
+        product_option = data.product_order_option or ""
+        content_matched = self.keyword_matcher.find(data.inquiry_content)
+        matched = self.keyword_matcher.find(f"{product_name} {product_option}") | content_matched
+        
+        # 3. 제품 정보 추출 (product_name + content)
         product_codes, product_color, product_switch = self._extract_product_info(
-            data.product_name or "",
-            data.product_order_option or "",
-            data.inquiry_content
+            product_name,
+            product_option,
+            data.inquiry_content,
+            matched
         )
         
-        # 3. 키워드 추출 (content에서만)
-        keywords = self._extract_keywords(data.inquiry_content)
+        # 4. 키워드: analyze/analyze_many에서 추출해 전달 (content에서만)
         
-        # 4. 기술 용어 추출
-        tech_terms = self._extract_tech_terms(data.inquiry_content)
+        # 5. 기술 용어 추출 (content에서만)
+        tech_terms = self._extract_tech_terms(content_matched)
         
-        # 5. 복잡도 계산
+        # 6. 복잡도 계산 (기술 용어는 위 매칭 결과)
         complexity = self._calculate_complexity(
             data.title,
             data.inquiry_content,
@@ -256,7 +309,8 @@ class QuestionAnalyzer:
         self,
         product_name: str,
         product_option: str,
-        content: str
+        content: str,
+        matched: Set[str]
     ) -> Tuple[List[str], Optional[str], Optional[str]]:
         """
         제품 정보 추출 (코드, 색상, 스위치)
@@ -270,6 +324,7 @@ class QuestionAnalyzer:
             product_name: DB의 product_name
             product_option: DB의 product_order_option
             content: inquiry_content
+            matched: 세 텍스트의 keyword_matcher.find 결과
             
         Returns:
             (제품코드 리스트, 색상, 스위치)
@@ -291,17 +346,17 @@ class QuestionAnalyzer:
         # 중복 제거
         codes = list(dict.fromkeys(codes))  # 순서 유지하며 중복 제거
         
-        # 2. 색상 추출
+        # 2. 색상 추출 (사전 순서상 첫 번째)
         color = None
         for color_kw in self.COLOR_KEYWORDS:
-            if color_kw.lower() in full_text.lower():
+            if color_kw.lower() in matched:
                 color = color_kw
                 break
         
         # 3. 스위치 타입 추출
         switch = None
         for switch_type in self.SWITCH_TYPES:
-            if switch_type in full_text:
+            if switch_type in matched:
                 switch = switch_type
                 break
         
@@ -319,37 +374,41 @@ class QuestionAnalyzer:
         Returns:
             키워드 리스트
         """
-        doc = self.nlp(content)
-        
+        return self._keywords_from_doc(self.nlp(content))
+    
+    def _keywords_from_doc(self, doc) -> List[str]:
+        """spaCy Doc에서 키워드 추출"""
         keywords = []
         
-        # 명사와 고유명사 추출
+        # 명사와 고유명사 추출 (토크나이저 전용 모드: 불용어/구두점/숫자가 아닌 어절)
         for token in doc:
-            if token.pos_ in ['NOUN', 'PROPN']:
-                # 2글자 이상만
-                if len(token.text) > 1:
+            # 2글자 이상만
+            if len(token.text) <= 1:
+                continue
+            if self.pos_tagging:
+                if token.pos_ in ['NOUN', 'PROPN']:
                     keywords.append(token.text)
+            elif not (token.is_stop or token.is_punct or token.like_num):
+                keywords.append(token.text)
         
-        # 중복 제거
-        keywords = list(set(keywords))
+        # 중복 제거 (등장 순서 유지 → 프로세스가 달라도 같은 결과)
+        keywords = list(dict.fromkeys(keywords))
         
         return keywords[:10]  # 최대 10개로 제한
     
-    def _extract_tech_terms(self, content: str) -> List[str]:
+    def _extract_tech_terms(self, matched: Set[str]) -> List[str]:
         """
         기술 용어 추출
         
         Args:
-            content: inquiry_content
+            matched: keyword_matcher.find(inquiry_content) 결과
             
         Returns:
             기술 용어 리스트
         """
-        content_lower = content.lower()
-        
         found_terms = []
         for term in self.TECH_TERMS:
-            if term in content_lower:
+            if term in matched:
                 found_terms.append(term)
         
         return found_terms
@@ -410,7 +469,7 @@ class QuestionAnalyzer:
         Returns:
             AnalysisResult 리스트
         """
-        return [self.analyze(data) for data in data_list]
+        return self.analyze_many(data_list)
 
 
 # 테스트 함수
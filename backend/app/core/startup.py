@@ -0,0 +1,302 @@
+# backend/app/core/startup.py
+# 2026-10-17 18:20, Claude 작성
+# 2026-10-17 22:20, Claude 업데이트 (승인 대기 답변 저장 컬렉션 연결)
+# 2026-10-17 23:50, Claude 업데이트 (단계별 질문 분석 설정 전달)
+# 2026-10-18 00:40, Claude 업데이트 (제품 코드 색인 주기적 재로드 태스크)
+# 2026-10-18 01:00, Claude 업데이트 (벌크 임베딩 배치 크기 설정 전달)
+# 2026-10-18 01:30, Claude 업데이트 (승인된 답변 캐시 시작 시 로드 + 주기 동기화)
+
+"""
+앱 시작/종료 처리
+
+FastAPI lifespan에서 호출합니다.
+
+- 모든 싱글톤 서비스 초기화, 연결 풀 생성
+- 임베딩 1회 + Weaviate 검색 1회로 워밍업 (첫 실제 요청이 모델 로드/연결 비용을 내지 않도록)
+- 모든 단계가 끝난 뒤에만 ready=True (/health/ready가 200 반환)
+- 컴포넌트별 콜드 스타트 시간을 로그로 남기고 StartupState.timings에 보관
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from ..services.answer_cache import init_answer_cache
+from ..services.claude_service import init_claude_service
+from ..services.embedding_engine import get_embedding_engine
+from ..services.health_checker import init_health_checker
+from ..services.mongodb_service import init_mongodb_service
+from ..services.question_analyzer import QuestionAnalyzer
+from ..services.weaviate_service import init_weaviate_service
+from .answer_generator import init_answer_generator
+
+logger = logging.getLogger(__name__)
+
+
+# 워밍업에 사용할 질문
+WARMUP_QUESTION = "배송 언제 오나요?"
+
+
+class StartupState:
+    """
+    시작 진행 상태 (준비 여부, 단계별 소요 시간, 실패 사유)
+    
+    Example:
+        >>> state = StartupState()
+        >>> async with state.step('mongodb'):
+        ...     await mongodb_service.connect()
+        >>> state.timings
+        {'mongodb': 35.2}
+    """
+    
+    def __init__(self):
+        self.ready = False
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.total_ms: Optional[float] = None
+        
+        # 종료 시 정리할 서비스/백그라운드 태스크
+        self.services: Dict[str, Any] = {}
+        self.tasks: List[asyncio.Task] = []
+    
+    @asynccontextmanager
+    async def step(self, name: str):
+        """
+        단계 실행 (소요 시간 기록, 실패 시 errors에 사유 기록)
+        
+        예외는 다시 던지지 않습니다. 실패한 단계가 있으면 ready가 되지 않습니다.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.errors[name] = str(e)
+            logger.error(f"❌ {name} 시작 실패: {e}")
+        finally:
+            elapsed = round((time.perf_counter() - started) * 1000, 1)
+            self.timings[name] = elapsed
+            if name not in self.errors:
+                logger.info(f"  ⏱️ {name}: {elapsed}ms")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """/health/ready 응답용"""
+        return {
+            'status': 'ready' if self.ready else 'starting' if self.total_ms is None else 'failed',
+            'startup_ms': self.total_ms,
+            'timings_ms': self.timings,
+            'errors': self.errors
+        }
+
+
+async def start_services(settings, state: StartupState):
+    """
+    모든 서비스 초기화 + 워밍업
+    
+    임베딩 모델을 먼저 로드하고(다른 서비스가 같은 엔진을 공유),
+    DB 연결과 spaCy 로드는 동시에 진행합니다.
+    
+    Args:
+        settings: config.Settings
+        state: 진행 상태 (타이밍/실패 기록)
+    """
+    logger.info("🚀 서비스 시작 중...")
+    state.started_at = time.perf_counter()
+    services = state.services
+    
+    # 1. 임베딩 모델 (Sentence-BERT 로드)
+    async with state.step('embedding_model'):
+        services['embedding_engine'] = await asyncio.to_thread(
+            get_embedding_engine,
+            settings.SENTENCE_BERT_MODEL,
+            redis_url=settings.REDIS_URL,
+            redis_ttl=settings.REDIS_TTL
+        )
+    engine = services.get('embedding_engine')
+    
+    if engine is not None:
+        services['weaviate'] = init_weaviate_service(
+            settings.WEAVIATE_URL,
+            settings.SENTENCE_BERT_MODEL,
+            settings.WEAVIATE_API_KEY,
+            engine,
+            max_concurrency=settings.WEAVIATE_MAX_CONCURRENCY,
+            encode_batch_size=settings.EMBEDDING_ENCODE_BATCH_SIZE
+        )
+    services['mongodb'] = init_mongodb_service(
+        settings.MONGODB_URL,
+        settings.MONGODB_DB_NAME,
+        settings.MONGODB_BULK_CHUNK_SIZE,
+        settings.PRODUCT_INDEX_REFRESH_SECONDS
+    )
+    
+    # 2. 연결 풀 + spaCy 로드 (동시)
+    async def connect_mongodb():
+        async with state.step('mongodb'):
+            await services['mongodb'].connect()
+            # 다른 워커/임포트 스크립트의 제품 변경을 메모리 색인에 반영
+            state.tasks.append(asyncio.create_task(services['mongodb'].watch_product_index()))
+    
+    async def connect_weaviate():
+        async with state.step('weaviate'):
+            await services['weaviate'].connect()
+    
+    async def load_question_analyzer():
+        async with state.step('question_analyzer'):
+            services['question_analyzer'] = await asyncio.to_thread(
+                QuestionAnalyzer,
+                sbert_model=settings.SENTENCE_BERT_MODEL,
+                weaviate_service=services['weaviate'],
+                embedding_engine=engine
+            )
+    
+    steps = [connect_mongodb()]
+    if engine is not None:
+        steps += [connect_weaviate(), load_question_analyzer()]
+    await asyncio.gather(*steps)
+    
+    async with state.step('claude'):
+        services['claude'] = init_claude_service(
+            settings.ANTHROPIC_API_KEY,
+            settings.CLAUDE_MODEL,
+            max_tokens=settings.CLAUDE_MAX_TOKENS,
+            max_concurrency=settings.CLAUDE_MAX_CONCURRENCY,
+            requests_per_minute=settings.CLAUDE_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.CLAUDE_TOKENS_PER_MINUTE,
+            max_retries=settings.CLAUDE_MAX_RETRIES,
+            base_url=settings.CLAUDE_BASE_URL
+        )
+    
+    # 3. 답변 캐시 + 답변 생성기 + 헬스체커
+    if settings.ANSWER_CACHE_ENABLED:
+        # 승인 대기/승인된 답변은 MongoDB에 저장 (다른 워커도 승인 가능, 승인 답변은 모든 워커가 재사용)
+        mongodb_ok = 'mongodb' not in state.errors
+        services['answer_cache'] = init_answer_cache(
+            similarity_threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+            ttl=settings.ANSWER_CACHE_TTL,
+            pending_ttl=settings.ANSWER_CACHE_PENDING_TTL,
+            max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+            pending_collection=services['mongodb'].db.answer_cache_pending if mongodb_ok else None
+        )
+        if mongodb_ok:
+            async with state.step('answer_cache_pending'):
+                await services['answer_cache'].ensure_pending_indexes()
+                await services['answer_cache'].sync_approved()
+            state.tasks.append(asyncio.create_task(
+                services['answer_cache'].watch_invalidations(services['mongodb'].db)
+            ))
+            state.tasks.append(asyncio.create_task(
+                services['answer_cache'].watch_approved(settings.ANSWER_CACHE_SYNC_SECONDS)
+            ))
+    
+    async with state.step('answer_generator'):
+        services['answer_generator'] = init_answer_generator(
+            weaviate_service=services.get('weaviate'),
+            mongodb_service=services['mongodb'],
+            claude_service=services.get('claude'),
+            question_analyzer=services.get('question_analyzer'),
+            answer_cache=services.get('answer_cache'),
+            confidence_threshold=settings.CONFIDENCE_THRESHOLD,
+            similar_faq_limit=settings.SIMILAR_FAQ_LIMIT,
+            min_similarity=settings.MIN_SIMILARITY,
+            stage_timeouts={
+                'similar_faqs': settings.ANSWER_SEARCH_TIMEOUT,
+                'product_lookup': settings.ANSWER_LOOKUP_TIMEOUT,
+                'customer_lookup': settings.ANSWER_LOOKUP_TIMEOUT,
+                'generation': settings.ANSWER_GENERATION_TIMEOUT
+            },
+            batch_concurrency=settings.ANSWER_BATCH_CONCURRENCY,
+            item_timeout=settings.ANSWER_ITEM_TIMEOUT,
+            catalog_refresh_seconds=settings.ANSWER_CATALOG_REFRESH_SECONDS,
+            tiered_analysis=settings.QUESTION_ANALYSIS_TIERED,
+            analysis_max_tier=settings.QUESTION_ANALYSIS_MAX_TIER
+        )
+    
+    init_health_checker(
+        weaviate_service=services.get('weaviate'),
+        mongodb_service=services['mongodb'],
+        redis_url=settings.REDIS_URL,
+        claude_service=services.get('claude'),
+        timeout=settings.HEALTH_PROBE_TIMEOUT,
+        cache_ttl=settings.HEALTH_CACHE_TTL
+    )
+    
+    # 4. 워밍업 (실제 요청과 같은 경로: 인코딩 → 벡터 검색, 형태소 분석)
+    if not state.errors:
+        await warm_up(state)
+    
+    state.total_ms = round((time.perf_counter() - state.started_at) * 1000, 1)
+    state.ready = not state.errors
+    
+    if state.ready:
+        logger.info(f"✅ 서비스 준비 완료 ({state.total_ms}ms)")
+    else:
+        logger.error(f"❌ 서비스 시작 실패 ({state.total_ms}ms): {list(state.errors)}")
+
+
+async def warm_up(state: StartupState):
+    """
+    워밍업: 임베딩 1회, Weaviate 검색 1회, spaCy 분석 1회
+    
+    첫 호출에만 드는 비용(스레드 풀 생성, 모델 첫 추론, gRPC 채널 준비)을 미리 치릅니다.
+    """
+    services = state.services
+    vector = None
+    
+    async with state.step('warmup_encode'):
+        vector = await services['embedding_engine'].aencode(WARMUP_QUESTION)
+    
+    if vector is not None:
+        async with state.step('warmup_query'):
+            await services['weaviate'].search_similar_faqs(
+                WARMUP_QUESTION,
+                limit=1,
+                query_vector=vector
+            )
+    
+    async with state.step('warmup_analyze'):
+        await asyncio.to_thread(services['question_analyzer'].extract_keywords, WARMUP_QUESTION)
+
+
+async def stop_services(state: StartupState):
+    """
+    종료 처리: 백그라운드 태스크 취소, 연결 풀 닫기
+    """
+    state.ready = False
+    
+    for task in state.tasks:
+        task.cancel()
+    await asyncio.gather(*state.tasks, return_exceptions=True)
+    state.tasks.clear()
+    
+    services = state.services
+    closers = [
+        ('claude', 'close'),
+        ('weaviate', 'disconnect'),
+        ('mongodb', 'disconnect')
+    ]
+    for name, method in closers:
+        service = services.get(name)
+        if service is None:
+            continue
+        try:
+            await getattr(service, method)()
+        except Exception as e:
+            logger.warning(f"⚠️ {name} 종료 중 오류: {e}")
+    
+    logger.info("👋 서비스 종료 완료")
+
+
+# 싱글톤 인스턴스 (lifespan 이전에도 /health/ready가 응답할 수 있도록 미리 생성)
+_startup_state = StartupState()
+
+
+def get_startup_state() -> StartupState:
+    """
+    StartupState 싱글톤 인스턴스 반환
+    
+    FastAPI의 Depends에서 사용합니다.
+    """
+    return _startup_state
@@ -1,5 +1,6 @@
 # backend/app/schemas/question.py
 # 2025-10-02 17:00, Claude 작성
+# 2026-10-17 16:10, Claude 업데이트 (답변 생성 요청 스키마 추가)
 
 """
 질문 분석 관련 Pydantic 스키마
@@ -133,3 +134,32 @@ class QuestionAnalysisResponse(BaseModel):
                 "should_answer": True
             }
         }
+
+
+class QuestionAnswerRequest(BaseModel):
+    """
+    답변 생성 요청 (/api/questions/analyze)
+    
+    stream=True(기본값)이면 Server-Sent Events로 응답합니다.
+    분석 메타데이터(metadata) → 답변 조각(token) → 완료(done) 순서로 전송됩니다.
+    """
+    
+    question: str = Field(..., min_length=1, description="고객 질문")
+    customer_id: Optional[str] = Field(None, description="고객 ID (이전 문의 조회용)")
+    brand_channel: str = Field("KEYCHRON", description="브랜드 채널")
+    product_codes: Optional[List[str]] = Field(
+        None,
+        description="제품 코드 (없으면 질문에서 추출)"
+    )
+    stream: bool = Field(True, description="SSE 스트리밍 응답 여부")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "question": "K10 PRO MAX 블루투스 연결이 자꾸 끊겨요",
+                "customer_id": "cust_1234",
+                "brand_channel": "KEYCHRON",
+                "product_codes": None,
+                "stream": True
+            }
+        }
@@ -0,0 +1,750 @@
+# backend/app/services/answer_cache.py
+# 2026-10-17 17:10, Claude 작성
+# 2026-10-17 21:50, Claude 업데이트 (change stream 미지원 서버에서 감시 중단, 동작하던 스트림이 끊길 때만 전체 비움)
+# 2026-10-17 22:00, Claude 업데이트 (캐시 비활성화 시 None을 주는 get_optional_answer_cache)
+# 2026-10-17 22:20, Claude 업데이트 (승인 대기 항목 MongoDB 저장: 다른 워커/재시작 후에도 승인 가능)
+# 2026-10-18 01:30, Claude 업데이트 (승인된 항목도 저장소에 기록, 시작 시 로드 + 워커 간 주기 동기화, 전체 워커 적중률)
+
+"""
+시맨틱 답변 캐시
+
+질문 임베딩이 CS 승인된 기존 답변의 질문과 충분히 가까우면
+(같은 brand_channel + inquiry_category, 코사인 유사도 threshold 이상)
+Claude 호출 없이 그 답변을 돌려줍니다.
+"반품 주소가 어디인가요" 같은 거의 같은 문의가 반복될 때 LLM 비용/지연을 없앱니다.
+
+흐름:
+1. 생성된 답변은 answer_id로 staged(승인 대기) 상태로 보관
+2. CS가 승인(approve)하면 캐시에 등록 (수정 승인이면 수정된 답변으로 등록)
+3. 거부(discard)되거나 pending_ttl이 지나면 버림
+
+무효화:
+- 항목마다 ttl 적용
+- 답변 근거인 FAQ/제품이 바뀌면 그 항목을 제거 (invalidate_faqs / invalidate_products)
+- watch_invalidations()가 faqs/products change stream을 받아 자동으로 호출
+  (저장소의 같은 항목도 삭제, 동작하던 스트림이 끊기면 그 사이 변경을 알 수 없으므로
+  메모리와 저장소의 승인된 항목 전체를 비움)
+- standalone MongoDB처럼 change stream을 지원하지 않으면 경고 한 번 남기고 감시를 멈춤
+  (TTL + 명시적 무효화만 사용)
+
+저장 위치 (pending_collection: MongoDB answer_cache_pending, answer_id 키, expires_at TTL 인덱스):
+- 승인 대기 항목: 프로세스 메모리 + 저장소 (approved=False)
+  → 생성한 워커가 아닌 워커나 재시작 후의 승인도 저장소에서 불러와 처리 (restore_pending)
+- 승인된 항목: 저장소에 approved=True로 기록 (save_approved)
+  → 앱 시작 시 sync_approved()로 로드, watch_approved()가 주기적으로 다시 맞춰
+    다른 워커가 승인/거부/무효화한 결과를 반영 (모든 워커가 같은 승인 답변을 재사용)
+- 적중/미스 횟수: 동기화 때마다 저장소의 통계 문서에 더해 전체 워커 적중률 제공 (get_shared_stats)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from pymongo.errors import OperationFailure, PyMongoError
+
+from .faq_indexer import INDEXED_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+# products 이벤트에서 무효화 대상을 찾는 키 (제품 문서는 어떤 필드가 바뀌어도 무효화)
+PRODUCT_KEY_FIELD = 'product_id'
+
+# change stream 미지원 서버 (standalone) 오류 코드
+CHANGE_STREAM_UNSUPPORTED = 40573
+
+# 저장소의 전체 워커 적중/미스 통계 문서 _id (answer_id는 16진수라 겹치지 않음)
+STATS_DOCUMENT_ID = '_stats'
+
+
+@dataclass
+class CachedAnswer:
+    """
+    캐시 항목
+    
+    Attributes:
+        answer_id: 답변 ID (AnswerGenerator가 발급)
+        question: 원 질문
+        answer: 답변 (승인 시 수정된 답변으로 교체될 수 있음)
+        brand_channel: 브랜드 채널
+        category: 문의 카테고리
+        vector: 정규화된 질문 임베딩 (float32)
+        faq_ids: 답변 근거 FAQ inquiry_no
+        product_ids: 답변 근거 제품 product_id
+        references: 원 답변의 참조 목록
+        created_at: 생성 시각 (time.time())
+        expires_at: 만료 시각 (time.time())
+    """
+    answer_id: str
+    question: str
+    answer: str
+    brand_channel: str
+    category: str
+    vector: np.ndarray
+    faq_ids: Set[int] = field(default_factory=set)
+    product_ids: Set[str] = field(default_factory=set)
+    references: List[str] = field(default_factory=list)
+    created_at: float = 0.0
+    expires_at: float = 0.0
+
+
+class SemanticAnswerCache:
+    """
+    brand_channel + inquiry_category 버킷별 코사인 유사도 캐시
+    
+    Example:
+        >>> cache = SemanticAnswerCache(similarity_threshold=0.92)
+        >>> cache.stage(answer_id, question, vector, answer, "KEYCHRON", "반품", faq_ids=[1])
+        >>> cache.approve(answer_id)
+        >>> cache.lookup(new_vector, "KEYCHRON", "반품")
+        {'answer_id': ..., 'answer': ..., 'similarity': 0.95, ...}
+    """
+    
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        ttl: float = 7 * 24 * 3600,
+        pending_ttl: float = 3 * 24 * 3600,
+        max_entries: int = 5000,
+        max_pending: int = 10000,
+        retry_interval: float = 5.0,
+        pending_collection=None
+    ):
+        """
+        초기화
+        
+        Args:
+            similarity_threshold: 캐시 적중 최소 코사인 유사도
+            ttl: 승인된 항목 만료 시간 (초)
+            pending_ttl: 승인 대기 항목 보관 시간 (초)
+            max_entries: 승인된 항목 최대 개수 (넘으면 오래된 것부터 제거)
+            max_pending: 승인 대기 항목 최대 개수
+            retry_interval: change stream 재연결 대기 시간 (초)
+            pending_collection: 승인 대기/승인된 항목 저장 컬렉션 (motor, None이면 메모리에만)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.pending_ttl = pending_ttl
+        self.max_entries = max_entries
+        self.max_pending = max_pending
+        self.retry_interval = retry_interval
+        self.pending_collection = pending_collection
+        
+        self._pending: "OrderedDict[str, CachedAnswer]" = OrderedDict()
+        self._entries: "OrderedDict[str, CachedAnswer]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, str], Set[str]] = {}
+        
+        # 버킷별 (answer_id 리스트, 임베딩 행렬) - 변경 시 다시 만듦
+        self._matrices: Dict[Tuple[str, str], Tuple[List[str], np.ndarray]] = {}
+        
+        # 이 프로세스에서 승인했지만 아직 저장소에 기록하지 못한 항목 (동기화 시 제거하지 않음)
+        self._unsaved: Set[str] = set()
+        
+        # 통계 (flushed_*: 저장소 통계 문서에 이미 더한 값)
+        self.hits = 0
+        self.misses = 0
+        self.flushed_hits = 0
+        self.flushed_misses = 0
+        self.staged = 0
+        self.promoted = 0
+        self.discarded = 0
+        self.expired = 0
+        self.evicted = 0
+        self.invalidated = 0
+    
+    # ==================== 조회 ====================
+    
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+    
+    @staticmethod
+    def _bucket_key(brand_channel: str, category: Optional[str]) -> Tuple[str, str]:
+        return (brand_channel, category or '기타')
+    
+    def _matrix(self, key: Tuple[str, str]) -> Tuple[List[str], Optional[np.ndarray]]:
+        """버킷 임베딩 행렬 (캐시된 것이 없으면 생성)"""
+        if key not in self._matrices:
+            ids = list(self._buckets.get(key, ()))
+            matrix = np.stack([self._entries[answer_id].vector for answer_id in ids]) if ids else None
+            self._matrices[key] = (ids, matrix)
+        return self._matrices[key]
+    
+    def lookup(
+        self,
+        vector,
+        brand_channel: str,
+        category: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        가장 가까운 승인 답변 조회
+        
+        Args:
+            vector: 질문 임베딩
+            brand_channel: 브랜드 채널
+            category: 문의 카테고리
+        
+        Returns:
+            적중 시 {'answer_id', 'question', 'answer', 'similarity', 'references'}, 아니면 None
+        """
+        key = self._bucket_key(brand_channel, category)
+        ids, matrix = self._matrix(key)
+        
+        if matrix is None:
+            self.misses += 1
+            return None
+        
+        scores = matrix @ self._normalize(vector)
+        now = time.time()
+        
+        # 유사도 높은 순으로 보면서 만료된 항목은 제거
+        for index in np.argsort(-scores):
+            similarity = float(scores[index])
+            if similarity < self.similarity_threshold:
+                break
+            
+            entry = self._entries.get(ids[index])
+            if entry is None:
+                continue
+            if entry.expires_at <= now:
+                self._remove(entry.answer_id)
+                self.expired += 1
+                continue
+            
+            self.hits += 1
+            return {
+                'answer_id': entry.answer_id,
+                'question': entry.question,
+                'answer': entry.answer,
+                'similarity': round(similarity, 4),
+                'references': list(entry.references)
+            }
+        
+        self.misses += 1
+        return None
+    
+    # ==================== 등록 / 승인 ====================
+    
+    def stage(
+        self,
+        answer_id: str,
+        question: str,
+        vector,
+        answer: str,
+        brand_channel: str,
+        category: Optional[str],
+        faq_ids: Iterable[int] = (),
+        product_ids: Iterable[str] = (),
+        references: Optional[List[str]] = None
+    ):
+        """
+        생성된 답변을 승인 대기 상태로 보관
+        
+        승인 전에는 lookup에 걸리지 않습니다.
+        """
+        now = time.time()
+        self._expire_pending(now)
+        
+        self._pending[answer_id] = CachedAnswer(
+            answer_id=answer_id,
+            question=question,
+            answer=answer,
+            brand_channel=brand_channel,
+            category=category or '기타',
+            vector=self._normalize(vector),
+            faq_ids=set(faq_ids),
+            product_ids=set(product_ids),
+            references=list(references or []),
+            created_at=now,
+            expires_at=now + self.pending_ttl
+        )
+        self.staged += 1
+        
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.expired += 1
+    
+    def approve(self, answer_id: str, final_answer: Optional[str] = None) -> bool:
+        """
+        CS 승인된 답변을 캐시에 등록
+        
+        Args:
+            answer_id: 답변 ID
+            final_answer: 수정 승인된 답변 (None이면 생성된 답변 그대로)
+        
+        Returns:
+            등록 여부 (승인 대기 목록에 없으면 False)
+        """
+        entry = self._pending.pop(answer_id, None)
+        if entry is None or entry.expires_at <= time.time():
+            return False
+        
+        if final_answer:
+            entry.answer = final_answer
+        entry.expires_at = time.time() + self.ttl
+        
+        self._add_entry(entry)
+        if self.pending_collection is not None:
+            self._unsaved.add(answer_id)
+        self.promoted += 1
+        return True
+    
+    def _add_entry(self, entry: CachedAnswer):
+        """승인된 항목 등록 (max_entries를 넘으면 오래된 것부터 제거)"""
+        key = self._bucket_key(entry.brand_channel, entry.category)
+        self._entries[entry.answer_id] = entry
+        self._buckets.setdefault(key, set()).add(entry.answer_id)
+        self._matrices.pop(key, None)
+        
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evicted += 1
+    
+    def discard(self, answer_id: str) -> bool:
+        """거부된 답변 버림 (승인 대기 또는 등록된 항목)"""
+        if self._pending.pop(answer_id, None) is not None or self._remove(answer_id):
+            self.discarded += 1
+            return True
+        return False
+    
+    # ==================== 답변 저장소 (MongoDB) ====================
+    
+    async def ensure_pending_indexes(self):
+        """답변 저장소 인덱스 (expires_at TTL: 지나면 MongoDB가 삭제, 승인 항목 동기화용 approved_at)"""
+        if self.pending_collection is not None:
+            await self.pending_collection.create_index('expires_at', expireAfterSeconds=0)
+            await self.pending_collection.create_index([('approved', 1), ('approved_at', -1)])
+    
+    @staticmethod
+    def _document(entry: CachedAnswer, approved: bool) -> Dict[str, Any]:
+        """저장소 문서 (승인 대기/승인 공통)"""
+        return {
+            'question': entry.question,
+            'answer': entry.answer,
+            'brand_channel': entry.brand_channel,
+            'category': entry.category,
+            'vector': entry.vector.tolist(),
+            'faq_ids': sorted(entry.faq_ids),
+            'product_ids': sorted(entry.product_ids),
+            'references': entry.references,
+            'created_at': entry.created_at,
+            'expires_at': datetime.fromtimestamp(entry.expires_at, timezone.utc),
+            'approved': approved,
+            'approved_at': time.time() if approved else None
+        }
+    
+    @staticmethod
+    def _entry(document: Dict[str, Any]) -> Optional[CachedAnswer]:
+        """저장소 문서 → 캐시 항목 (만료됐으면 None)"""
+        expires_at = document['expires_at']
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at.timestamp() <= time.time():
+            return None
+        
+        return CachedAnswer(
+            answer_id=document['_id'],
+            question=document['question'],
+            answer=document['answer'],
+            brand_channel=document['brand_channel'],
+            category=document['category'],
+            vector=np.asarray(document['vector'], dtype=np.float32),
+            faq_ids=set(document.get('faq_ids', [])),
+            product_ids=set(document.get('product_ids', [])),
+            references=list(document.get('references', [])),
+            created_at=document.get('created_at', 0.0),
+            expires_at=expires_at.timestamp()
+        )
+    
+    async def save_pending(self, answer_id: str):
+        """
+        승인 대기 항목을 저장소에 기록
+        
+        stage() 후 호출합니다. 저장 실패는 답변 생성을 막지 않도록 로그만 남깁니다.
+        """
+        entry = self._pending.get(answer_id)
+        if self.pending_collection is None or entry is None:
+            return
+        
+        try:
+            await self.pending_collection.replace_one(
+                {'_id': answer_id}, self._document(entry, approved=False), upsert=True
+            )
+        except PyMongoError as e:
+            logger.warning(f"승인 대기 답변 저장 실패 ({answer_id}, 이 프로세스에서만 승인 가능): {e}")
+    
+    async def save_approved(self, answer_id: str):
+        """
+        승인된 항목을 저장소에 기록 (approve() 후 호출)
+        
+        다른 워커는 다음 동기화(watch_approved)에서, 재시작한 워커는 시작 시 불러갑니다.
+        저장 실패 시 이 프로세스에서만 재사용됩니다.
+        """
+        entry = self._entries.get(answer_id)
+        if self.pending_collection is None or entry is None:
+            return
+        
+        try:
+            await self.pending_collection.replace_one(
+                {'_id': answer_id}, self._document(entry, approved=True), upsert=True
+            )
+            self._unsaved.discard(answer_id)
+        except PyMongoError as e:
+            logger.warning(f"승인 답변 저장 실패 ({answer_id}, 이 프로세스에서만 재사용): {e}")
+    
+    async def restore_pending(self, answer_id: str) -> bool:
+        """
+        승인 대기 항목 확인 (이 프로세스에 없으면 저장소에서 불러옴)
+        
+        Returns:
+            승인 대기 중인지 여부 (없거나, 이미 승인됐거나, 만료됐으면 False)
+        """
+        if answer_id in self._pending:
+            return True
+        if self.pending_collection is None:
+            return False
+        
+        document = await self.pending_collection.find_one({'_id': answer_id})
+        if document is None or document.get('approved'):
+            return False
+        
+        entry = self._entry(document)
+        if entry is None:
+            return False
+        
+        self._pending[answer_id] = entry
+        return True
+    
+    async def delete_pending(self, answer_id: str):
+        """거부됐거나 승인 등록되지 않은 답변을 저장소에서 삭제"""
+        if self.pending_collection is not None:
+            await self.pending_collection.delete_one({'_id': answer_id})
+    
+    async def sync_approved(self) -> int:
+        """
+        메모리의 승인된 항목을 저장소와 맞춤 (앱 시작 시, 이후 watch_approved 주기마다)
+        
+        - 저장소의 최신 승인 항목 max_entries개가 기준
+        - 다른 워커가 승인한 항목은 불러오고, 거부/무효화/만료로 저장소에서 빠진 항목은 제거
+        - 이 프로세스의 적중/미스 증가분을 저장소 통계 문서에 더함
+        
+        Returns:
+            새로 불러온 항목 수
+        """
+        if self.pending_collection is None:
+            return 0
+        
+        cursor = self.pending_collection.find(
+            {'approved': True, 'expires_at': {'$gt': datetime.now(timezone.utc)}},
+            {'_id': 1}
+        ).sort('approved_at', -1).limit(self.max_entries)
+        stored = [document['_id'] async for document in cursor]
+        stored_ids = set(stored)
+        
+        for answer_id in [answer_id for answer_id in self._entries if answer_id not in stored_ids]:
+            if answer_id not in self._unsaved:
+                self._remove(answer_id)
+        
+        missing = [answer_id for answer_id in stored if answer_id not in self._entries]
+        documents = []
+        if missing:
+            documents = [document async for document in self.pending_collection.find({'_id': {'$in': missing}})]
+        
+        # 오래 전에 승인된 것부터 넣어 max_entries 초과 시 오래된 것이 밀려나도록
+        loaded = 0
+        for document in sorted(documents, key=lambda document: document.get('approved_at') or 0.0):
+            entry = self._entry(document)
+            if entry is not None:
+                self._add_entry(entry)
+                loaded += 1
+        
+        await self._flush_stats()
+        return loaded
+    
+    async def watch_approved(self, interval: float = 5.0):
+        """
+        승인된 항목 주기 동기화 (취소될 때까지 실행, startup에서 백그라운드 태스크로)
+        
+        Args:
+            interval: 동기화 간격 (초)
+        """
+        if self.pending_collection is None:
+            return
+        
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync_approved()
+            except PyMongoError as e:
+                logger.warning(f"⚠️ 승인 답변 동기화 실패 ({interval:.0f}초 후 재시도): {e}")
+    
+    async def _flush_stats(self):
+        """이 프로세스의 적중/미스 증가분을 저장소 통계 문서에 더함"""
+        hits, misses = self.hits - self.flushed_hits, self.misses - self.flushed_misses
+        if not hits and not misses:
+            return
+        
+        await self.pending_collection.update_one(
+            {'_id': STATS_DOCUMENT_ID},
+            {'$inc': {'hits': hits, 'misses': misses}},
+            upsert=True
+        )
+        self.flushed_hits += hits
+        self.flushed_misses += misses
+    
+    async def _invalidate_stored(self, field_name: str, keys: List[Any]):
+        """근거 FAQ/제품이 바뀐 승인 대기/승인 항목을 저장소에서도 삭제"""
+        if self.pending_collection is None:
+            return
+        try:
+            await self.pending_collection.delete_many({field_name: {'$in': keys}})
+        except PyMongoError as e:
+            logger.warning(f"캐시 답변 저장소 무효화 실패 ({field_name}={keys}): {e}")
+    
+    async def _clear_all(self):
+        """승인된 항목 전체 비우기 (메모리 + 저장소, 다른 워커는 다음 동기화에서 비워짐)"""
+        self.clear()
+        if self.pending_collection is None:
+            return
+        try:
+            await self.pending_collection.delete_many({'approved': True})
+        except PyMongoError as e:
+            logger.warning(f"캐시 답변 저장소 비우기 실패: {e}")
+    
+    def _expire_pending(self, now: float):
+        """만료된 승인 대기 항목 제거 (오래된 것부터)"""
+        while self._pending:
+            oldest = next(iter(self._pending.values()))
+            if oldest.expires_at > now:
+                break
+            self._pending.popitem(last=False)
+            self.expired += 1
+    
+    def _remove(self, answer_id: str) -> bool:
+        entry = self._entries.pop(answer_id, None)
+        if entry is None:
+            return False
+        
+        key = self._bucket_key(entry.brand_channel, entry.category)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.discard(answer_id)
+            if not bucket:
+                del self._buckets[key]
+        self._matrices.pop(key, None)
+        return True
+    
+    # ==================== 무효화 ====================
+    
+    def _invalidate(self, predicate) -> int:
+        """조건에 맞는 승인/대기 항목 제거"""
+        removed = [answer_id for answer_id, entry in self._entries.items() if predicate(entry)]
+        for answer_id in removed:
+            self._remove(answer_id)
+        
+        pending = [answer_id for answer_id, entry in self._pending.items() if predicate(entry)]
+        for answer_id in pending:
+            del self._pending[answer_id]
+        
+        count = len(removed) + len(pending)
+        self.invalidated += count
+        return count
+    
+    def invalidate_faqs(self, inquiry_nos: Iterable[int]) -> int:
+        """근거 FAQ가 바뀐 답변 제거"""
+        targets = set(inquiry_nos)
+        count = self._invalidate(lambda entry: bool(entry.faq_ids & targets))
+        if count:
+            logger.info(f"🧹 FAQ 변경으로 캐시 답변 {count}개 무효화")
+        return count
+    
+    def invalidate_products(self, product_ids: Iterable[str]) -> int:
+        """근거 제품이 바뀐 답변 제거"""
+        targets = set(product_ids)
+        count = self._invalidate(lambda entry: bool(entry.product_ids & targets))
+        if count:
+            logger.info(f"🧹 제품 변경으로 캐시 답변 {count}개 무효화")
+        return count
+    
+    def clear(self) -> int:
+        """승인된 항목 전체 비우기 (메모리만, 승인 대기 항목은 유지)"""
+        count = len(self._entries)
+        self._entries.clear()
+        self._buckets.clear()
+        self._matrices.clear()
+        self._unsaved.clear()
+        self.invalidated += count
+        return count
+    
+    async def _watch_collection(
+        self,
+        collection,
+        key_field: str,
+        handler,
+        fields: Optional[Set[str]],
+        pending_field: Optional[str] = None
+    ):
+        """
+        컬렉션 change stream → handler(키 리스트)
+        
+        - 동작하던 스트림이 끊기면 승인된 항목 전체를 (저장소까지) 비우고 재연결
+          (재연결 시도가 실패하는 동안에는 다시 비우지 않음)
+        - change stream 미지원 서버면 경고 한 번 남기고 종료
+        - pending_field가 있으면 저장소의 승인 대기/승인 항목도 같은 키로 무효화
+        """
+        pipeline = [
+            {'$match': {'operationType': {'$in': ['update', 'replace', 'delete']}}}
+        ]
+        
+        while True:
+            streaming = False
+            try:
+                async with collection.watch(
+                    pipeline,
+                    full_document='updateLookup',
+                    full_document_before_change='whenAvailable'
+                ) as stream:
+                    streaming = True
+                    logger.info(f"👀 {collection.name} 캐시 무효화 스트림 수신 시작")
+                    async for change in stream:
+                        if fields is not None and change['operationType'] == 'update':
+                            description = change.get('updateDescription') or {}
+                            changed = set(description.get('updatedFields', {})) | set(description.get('removedFields', []))
+                            if not any(name.split('.')[0] in fields for name in changed):
+                                continue
+                        
+                        document = change.get('fullDocument') or change.get('fullDocumentBeforeChange')
+                        if document and document.get(key_field) is not None:
+                            handler([document[key_field]])
+                            if pending_field:
+                                await self._invalidate_stored(pending_field, [document[key_field]])
+                        else:
+                            # 어떤 항목인지 알 수 없는 삭제 (pre-image 없음) → 안전하게 전체 비움
+                            await self._clear_all()
+            
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_UNSUPPORTED:
+                    logger.warning(
+                        f"⚠️ {collection.name} change stream 미지원 서버 (레플리카셋 아님): "
+                        f"캐시 무효화 스트림 없이 TTL + 명시적 무효화만 사용합니다"
+                    )
+                    return
+                logger.error(f"❌ {collection.name} 캐시 무효화 스트림 오류 ({self.retry_interval:.0f}초 후 재시도): {e}")
+            except PyMongoError as e:
+                logger.error(f"❌ {collection.name} 캐시 무효화 스트림 오류 ({self.retry_interval:.0f}초 후 재시도): {e}")
+            
+            # 동작하던 스트림이 끊김 → 수신하지 못한 변경이 있을 수 있으므로 전체 비움
+            #   (저장소도 비워야 다음 동기화에서 다시 불러오지 않음)
+            if streaming:
+                await self._clear_all()
+            await asyncio.sleep(self.retry_interval)
+    
+    async def watch_invalidations(self, db):
+        """
+        faqs/products 변경을 받아 캐시 무효화 (취소될 때까지 실행)
+        
+        main.py에서 백그라운드 태스크로 실행합니다.
+        change stream은 레플리카셋에서만 동작합니다. (standalone이면 경고 후 바로 종료)
+        
+        Args:
+            db: motor 데이터베이스 (mongodb_service.db)
+        """
+        await asyncio.gather(
+            self._watch_collection(db.faqs, 'inquiry_no', self.invalidate_faqs, INDEXED_FIELDS, 'faq_ids'),
+            self._watch_collection(db.products, PRODUCT_KEY_FIELD, self.invalidate_products, None, 'product_ids'),
+        )
+    
+    # ==================== 통계 ====================
+    
+    async def get_shared_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        전체 워커 적중/미스 통계 (저장소 통계 문서, 이 프로세스 증가분을 먼저 더함)
+        
+        Returns:
+            {'hits', 'misses', 'hit_rate'} 또는 None (저장소 없음/조회 실패)
+        """
+        if self.pending_collection is None:
+            return None
+        
+        try:
+            await self._flush_stats()
+            document = await self.pending_collection.find_one({'_id': STATS_DOCUMENT_ID}) or {}
+        except PyMongoError as e:
+            logger.warning(f"전체 워커 캐시 통계 조회 실패: {e}")
+            return None
+        
+        hits, misses = document.get('hits', 0), document.get('misses', 0)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0
+        }
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 (이 프로세스)
+        
+        Returns:
+            적중/미스/적중률, 항목 수, 승인 대기 수, 등록/폐기/만료/무효화 횟수
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'entries': len(self._entries),
+            'pending': len(self._pending),
+            'buckets': len(self._buckets),
+            'staged': self.staged,
+            'promoted': self.promoted,
+            'discarded': self.discarded,
+            'expired': self.expired,
+            'evicted': self.evicted,
+            'invalidated': self.invalidated,
+            'similarity_threshold': self.similarity_threshold
+        }
+
+
+# 싱글톤 인스턴스
+_answer_cache: Optional[SemanticAnswerCache] = None
+
+
+def get_answer_cache() -> SemanticAnswerCache:
+    """
+    SemanticAnswerCache 싱글톤 인스턴스 반환
+    
+    FastAPI의 Depends에서 사용합니다.
+    """
+    global _answer_cache
+    if _answer_cache is None:
+        raise RuntimeError("SemanticAnswerCache가 초기화되지 않았습니다")
+    return _answer_cache
+
+
+def get_optional_answer_cache() -> Optional[SemanticAnswerCache]:
+    """
+    SemanticAnswerCache 인스턴스 반환 (ANSWER_CACHE_ENABLED=False면 None)
+    
+    캐시가 없어도 동작해야 하는 엔드포인트(검수 승인/거부 등)의 Depends에서 사용합니다.
+    """
+    return _answer_cache
+
+
+def init_answer_cache(**kwargs) -> SemanticAnswerCache:
+    """
+    SemanticAnswerCache 초기화
+    
+    main.py에서 앱 시작 시 호출합니다.
+    """
+    global _answer_cache
+    _answer_cache = SemanticAnswerCache(**kwargs)
+    return _answer_cache
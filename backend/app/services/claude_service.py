@@ -1,15 +1,59 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 14:40, Claude 업데이트 (Anthropic 클라이언트 연동, 컨텍스트 프롬프트 구성)
+# 2026-10-17 15:40, Claude 업데이트 (비동기 클라이언트, 연결 재사용, 레이트 리밋/재시도/동시 실행 제한)
+# 2026-10-17 16:10, Claude 업데이트 (스트리밍 답변 생성)
+# 2026-10-17 16:40, Claude 업데이트 (프롬프트 캐싱: 고정 prefix / 가변 suffix 분리)
+# 2026-10-17 17:40, Claude 업데이트 (health_check 구현)
 """
 Claude API 서비스
 답변 생성 및 MCP 연동
+
+호출 제어:
+- 하나의 httpx 연결 풀을 공유하는 AsyncAnthropic 클라이언트
+- 분당 요청 수/토큰 수 토큰 버킷 (utils/rate_limiter.py)
+- 동시 요청 수 제한 (세마포어)
+- 429/529 응답은 지수 백오프 + 지터로 재시도 (retry-after 헤더 우선)
+→ process_batch의 동시 요청이 몰려도 API에 한꺼번에 쏟아지지 않음
+
+프롬프트 구성 (프롬프트 캐싱):
+- system: 페르소나 + 답변 정책 + 브랜드별 제품 카탈로그 → 요청마다 같은 바이트, cache_control 지정
+- user: 유사 FAQ + 제품/고객 정보 + 질문 → 요청마다 다름
+→ 같은 브랜드 요청은 prefix를 캐시에서 읽음 (입력 토큰 비용/지연 감소)
+  (캐시는 prefix가 모델 최소 길이(Sonnet 1024토큰) 이상일 때만 적용됨)
 """
 
-from typing import Dict, List
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import logging
 
+import httpx
+from anthropic import AsyncAnthropic, APIConnectionError, APIStatusError
+
+from ..utils.exceptions import AnswerGenerationError
+from ..utils.rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
+# 재시도할 HTTP 상태 코드 (429: 레이트 리밋, 529: 과부하)
+RETRY_STATUS_CODES = {429, 529}
+
+# 고정 prefix (바뀌면 캐시가 무효화되므로 요청별 값을 넣지 않음)
+SYSTEM_PERSONA = """당신은 투비네트웍스 글로벌의 고객 지원 AI입니다.
+참고 정보(유사 FAQ, 제품 정보, 고객 이전 문의)를 바탕으로 고객의 질문에 답변해주세요."""
+
+ANSWER_POLICY = """## 답변 지침
+1. 정확하고 친절하게 답변하세요
+2. 제품 코드나 스펙은 정확히 명시하세요
+3. 불확실한 경우 "확인이 필요합니다"라고 명시하세요
+4. 한국어로 답변하세요"""
+
+# 카탈로그에 넣을 제품 필드
+CATALOG_FIELDS = ['product_name', 'price', 'discontinued', 'connection_method', 'warranty_period']
+
+
 class ClaudeService:
     """
     Claude API 서비스 클래스
@@ -20,29 +64,318 @@ class ClaudeService:
     - MCP 도구 활용
     """
     
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        max_tokens: int = 4096,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[float] = 50,
+        tokens_per_minute: Optional[float] = 40000,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        timeout: float = 60.0,
+        base_url: Optional[str] = None
+    ):
         """
         ClaudeService 초기화
         
         Args:
             api_key: Anthropic API 키
             model: 사용할 Claude 모델
-            
-        TODO: Phase 3에서 구현
+            max_tokens: 최대 생성 토큰 수
+            max_concurrency: 동시에 보낼 수 있는 최대 요청 수 (연결 풀 크기)
+            requests_per_minute: 분당 요청 수 제한 (None이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 제한 (None이면 제한 없음)
+            max_retries: 429/529/연결 오류 재시도 횟수
+            backoff_base: 첫 재시도 대기 시간 (초), 이후 2배씩 증가
+            backoff_max: 재시도 대기 시간 상한 (초)
+            timeout: 요청 타임아웃 (초)
+            base_url: API 주소 (테스트용 로컬 서버 등, None이면 기본값)
         """
         self.api_key = api_key
         self.model = model
-        logger.info(f"ClaudeService 초기화: {model}")
+        self.max_tokens = max_tokens
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        logger.info(f"ClaudeService 초기화: {model} (동시 {max_concurrency}, RPM {requests_per_minute}, TPM {tokens_per_minute})")
+        
+        # 연결 풀 공유 (keep-alive 재사용)
+        self.http_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            )
+        )
+        
+        # 재시도는 직접 처리 (레이트 리미터/백오프와 함께 동작하도록 SDK 재시도 비활성화)
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=self.http_client,
+            max_retries=0
+        )
+        
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # 브랜드별 제품 카탈로그 (system prefix에 들어감)
+        self._brand_catalogs: Dict[str, Dict[str, Any]] = {}
+        
+        # 통계
+        self._in_flight = 0
+        self._requests = 0
+        self._retries = 0
+        self._failures = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_read_tokens = 0
+        self._cache_write_tokens = 0
+        self._uncached_input_tokens = 0
+    
+    # ==================== 프롬프트 캐싱 ====================
+    
+    def set_brand_catalog(self, brand_channel: str, products: List[Dict[str, Any]]):
+        """
+        브랜드 제품 카탈로그 설정
+        
+        product_id 순으로 정렬해 항상 같은 텍스트가 되도록 만듭니다.
+        (순서가 바뀌면 캐시 prefix가 달라져 매번 캐시 쓰기가 발생)
+        
+        Args:
+            brand_channel: 브랜드 채널
+            products: 제품 리스트 (MongoDB products 문서)
+        """
+        lines = []
+        for product in sorted(products, key=lambda p: str(p.get('product_id', ''))):
+            specs = ', '.join(
+                f"{field}: {product[field]}"
+                for field in CATALOG_FIELDS if product.get(field) is not None
+            )
+            lines.append(f"- {product.get('product_id')}: {specs}")
+        
+        self._brand_catalogs[brand_channel] = {
+            'text': '\n'.join(lines),
+            'count': len(products),
+            'loaded_at': time.monotonic()
+        }
+        logger.info(f"📚 {brand_channel} 카탈로그 설정: 제품 {len(products)}개")
+    
+    def brand_catalog_age(self, brand_channel: str) -> Optional[float]:
+        """카탈로그 설정 후 지난 시간 (초), 없으면 None"""
+        catalog = self._brand_catalogs.get(brand_channel)
+        if catalog is None:
+            return None
+        return time.monotonic() - catalog['loaded_at']
+    
+    def _build_system(self, brand_channel: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        고정 prefix (system 블록) 구성
+        
+        마지막 블록에 cache_control을 달아 그 앞까지 전체를 캐시합니다.
+        브랜드마다 카탈로그가 다르므로 캐시도 브랜드별로 생깁니다.
+        """
+        blocks = [{'type': 'text', 'text': f"{SYSTEM_PERSONA}\n\n{ANSWER_POLICY}"}]
+        
+        catalog = self._brand_catalogs.get(brand_channel) if brand_channel else None
+        if catalog and catalog['text']:
+            blocks.append({
+                'type': 'text',
+                'text': f"## {brand_channel} 제품 카탈로그\n{catalog['text']}"
+            })
         
-        # TODO: Anthropic 클라이언트 초기화
-        # from anthropic import Anthropic
-        # self.client = Anthropic(api_key=api_key)
+        blocks[-1]['cache_control'] = {'type': 'ephemeral'}
+        return blocks
     
-    def generate_answer(
+    def _record_usage(self, estimated: int, usage: Any) -> Dict[str, int]:
+        """
+        응답 토큰 사용량 기록 (레이트 리미터 보정 + 캐시 적중 통계)
+        
+        Returns:
+            input_tokens(캐시 미사용분), output_tokens,
+            cache_creation_input_tokens, cache_read_input_tokens
+        """
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        
+        self.limiter.record_usage(
+            estimated,
+            usage.input_tokens + cache_write + cache_read + usage.output_tokens
+        )
+        
+        if cache_read:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+        self._cache_read_tokens += cache_read
+        self._cache_write_tokens += cache_write
+        self._uncached_input_tokens += usage.input_tokens
+        
+        return {
+            'input_tokens': usage.input_tokens,
+            'output_tokens': usage.output_tokens,
+            'cache_creation_input_tokens': cache_write,
+            'cache_read_input_tokens': cache_read
+        }
+    
+    # ==================== API 호출 ====================
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        입력 토큰 수 대략 추정 (TPM 버킷 선차감용)
+        
+        한국어는 대략 2글자당 1토큰으로 계산하고, 응답 후 실제 사용량으로 보정합니다.
+        """
+        return max(1, len(text) // 2)
+    
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """재시도 대기 시간 (retry-after 헤더 우선, 없으면 지수 백오프 + full jitter)"""
+        if isinstance(error, APIStatusError):
+            retry_after = error.response.headers.get('retry-after')
+            if retry_after:
+                try:
+                    return min(self.backoff_max, float(retry_after))
+                except ValueError:
+                    pass
+        
+        cap = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(cap / 2, cap)
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, APIStatusError):
+            return error.status_code in RETRY_STATUS_CODES
+        return isinstance(error, APIConnectionError)
+    
+    def _retry_delay(self, attempt: int, error: Exception, estimated: int) -> float:
+        """
+        API 오류 처리 (재시도 대기 시간 반환, 재시도 불가면 예외)
+        
+        Raises:
+            AnswerGenerationError: 재시도할 수 없거나 재시도 횟수를 다 쓴 경우
+        """
+        # 거절된 요청은 토큰을 쓰지 않았으므로 환급
+        self.limiter.record_usage(estimated, 0)
+        
+        if not self._is_retryable(error) or attempt == self.max_retries:
+            self._failures += 1
+            raise AnswerGenerationError(f"Claude API 호출 실패: {error}") from error
+        
+        delay = self._backoff_delay(attempt, error)
+        self._retries += 1
+        logger.warning(
+            f"⏳ Claude API 재시도 {attempt + 1}/{self.max_retries} "
+            f"({getattr(error, 'status_code', '연결 오류')}, {delay:.1f}초 후)"
+        )
+        return delay
+    
+    async def create_message(
+        self,
+        prompt: str,
+        system: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[Any, Dict[str, int]]:
+        """
+        Messages API 호출 (동시 실행 제한, 레이트 리밋, 재시도 적용)
+        
+        Args:
+            prompt: 사용자 프롬프트 (가변 suffix)
+            system: system 블록 (고정 prefix, 없으면 브랜드 카탈로그 없는 기본 prefix)
+        
+        Returns:
+            (anthropic Message 객체, 토큰 사용량)
+        
+        Raises:
+            AnswerGenerationError: 재시도 후에도 실패한 경우
+        """
+        system = system or self._build_system(None)
+        estimated = self.estimate_tokens(prompt + ''.join(block['text'] for block in system))
+        
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                for attempt in range(self.max_retries + 1):
+                    await self.limiter.acquire(estimated)
+                    self._requests += 1
+                    
+                    try:
+                        response = await self.client.beta.prompt_caching.messages.create(
+                            model=self.model,
+                            max_tokens=self.max_tokens,
+                            system=system,
+                            messages=[{"role": "user", "content": prompt}]
+                        )
+                    except (APIStatusError, APIConnectionError) as e:
+                        await asyncio.sleep(self._retry_delay(attempt, e, estimated))
+                        continue
+                    
+                    return response, self._record_usage(estimated, response.usage)
+            finally:
+                self._in_flight -= 1
+    
+    async def stream_message(
+        self,
+        prompt: str,
+        system: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Messages API 스트리밍 호출 (create_message와 같은 동시 실행 제한/레이트 리밋 적용)
+        
+        재시도는 첫 토큰을 보내기 전에만 합니다.
+        이미 보낸 토큰을 되돌릴 수 없으므로 도중에 끊기면 예외를 그대로 올립니다.
+        
+        Args:
+            prompt: 사용자 프롬프트 (가변 suffix)
+            system: system 블록 (고정 prefix)
+        
+        Yields:
+            {'type': 'text', 'text': 조각} ... 마지막에 {'type': 'done', 'usage': {...}}
+        
+        Raises:
+            AnswerGenerationError: 연결 재시도 후에도 실패하거나 스트림이 중간에 끊긴 경우
+        """
+        system = system or self._build_system(None)
+        estimated = self.estimate_tokens(prompt + ''.join(block['text'] for block in system))
+        
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                for attempt in range(self.max_retries + 1):
+                    await self.limiter.acquire(estimated)
+                    self._requests += 1
+                    
+                    started_output = False
+                    try:
+                        async with self.client.beta.prompt_caching.messages.stream(
+                            model=self.model,
+                            max_tokens=self.max_tokens,
+                            system=system,
+                            messages=[{"role": "user", "content": prompt}]
+                        ) as stream:
+                            async for text in stream.text_stream:
+                                started_output = True
+                                yield {'type': 'text', 'text': text}
+                            message = await stream.get_final_message()
+                    except (APIStatusError, APIConnectionError) as e:
+                        if started_output:
+                            self._failures += 1
+                            raise AnswerGenerationError(f"Claude 스트림 중단: {e}") from e
+                        await asyncio.sleep(self._retry_delay(attempt, e, estimated))
+                        continue
+                    
+                    yield {'type': 'done', 'usage': self._record_usage(estimated, message.usage)}
+                    return
+            finally:
+                self._in_flight -= 1
+    
+    async def generate_answer(
         self,
         question: str,
-        context: Dict[str, any]
-    ) -> Dict[str, any]:
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         질문에 대한 답변 생성
         
@@ -52,76 +385,200 @@ class ClaudeService:
                 - similar_faqs: 유사 FAQ 리스트
                 - product_info: 제품 정보
                 - customer_info: 고객 정보 (선택)
-                
+                - brand_channel: 브랜드 채널 (카탈로그 prefix 선택, 선택)
+        
         Returns:
             Dict: 답변 결과
                 - answer: 생성된 답변
                 - reasoning: 답변 근거
-                
-        TODO: Phase 3에서 구현
+                - usage: 토큰 사용량 (캐시 읽기/쓰기 토큰 포함)
         """
         logger.info(f"답변 생성 요청: {question[:50]}...")
         
-        # TODO: 프롬프트 구성
         prompt = self._build_prompt(question, context)
+        system = self._build_system(context.get('brand_channel'))
+        
+        started = time.perf_counter()
+        response, usage = await self.create_message(prompt, system)
         
-        # TODO: Claude API 호출
-        # response = self.client.messages.create(
-        #     model=self.model,
-        #     max_tokens=4096,
-        #     messages=[{"role": "user", "content": prompt}]
-        # )
+        answer = ''.join(
+            block.text for block in response.content if block.type == 'text'
+        ).strip()
         
         return {
-            "answer": "Not implemented",
-            "reasoning": "Not implemented"
+            "answer": answer,
+            "reasoning": f"유사 FAQ {len(context.get('similar_faqs') or [])}개 참고",
+            "usage": usage,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1)
         }
     
+    async def stream_answer(
+        self,
+        question: str,
+        context: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        질문에 대한 답변을 생성되는 대로 스트리밍
+        
+        프롬프트는 generate_answer와 같습니다.
+        
+        Args:
+            question: 고객 질문
+            context: 컨텍스트 정보 (generate_answer와 동일)
+        
+        Yields:
+            {'type': 'text', 'text': 조각} ... 마지막에 {'type': 'done', 'usage': {...}}
+        """
+        logger.info(f"스트리밍 답변 생성 요청: {question[:50]}...")
+        
+        prompt = self._build_prompt(question, context)
+        system = self._build_system(context.get('brand_channel'))
+        
+        async for event in self.stream_message(prompt, system):
+            yield event
+    
+    @staticmethod
+    def _format_faqs(similar_faqs: List[Dict[str, Any]]) -> str:
+        """유사 FAQ를 프롬프트용 텍스트로 변환"""
+        if not similar_faqs:
+            return "(없음)"
+        
+        lines = []
+        for i, faq in enumerate(similar_faqs, 1):
+            lines.append(f"{i}. [{faq.get('inquiry_category', '')}] {faq.get('title', '')}")
+            lines.append(f"   질문: {faq.get('inquiry_content', '')}")
+            lines.append(f"   답변: {faq.get('answer_content') or '(답변 없음)'}")
+        return '\n'.join(lines)
+    
+    @staticmethod
+    def _format_product(product_info: Optional[Dict[str, Any]]) -> str:
+        """제품 정보를 프롬프트용 텍스트로 변환"""
+        if not product_info:
+            return "(없음)"
+        
+        fields = [
+            'product_name', 'price', 'discontinued', 'keyboard_layout', 'switch_options',
+            'connection_method', 'support_platforms', 'battery_capacity', 'warranty_period'
+        ]
+        return '\n'.join(
+            f"- {field}: {product_info[field]}"
+            for field in fields if product_info.get(field) is not None
+        )
+    
+    @staticmethod
+    def _format_customer(customer_info: Optional[List[Dict[str, Any]]]) -> str:
+        """고객 문의 이력을 프롬프트용 텍스트로 변환"""
+        if not customer_info:
+            return "(없음)"
+        
+        return '\n'.join(
+            f"- [{item.get('inquiry_category', '')}] {item.get('title', '')} "
+            f"(주문: {item.get('order_id') or '-'}, 답변 완료: {item.get('answered', False)})"
+            for item in customer_info
+        )
+    
     def _build_prompt(self, question: str, context: Dict) -> str:
         """
-        프롬프트 템플릿 구성
+        가변 suffix (user 메시지) 구성
+        
+        페르소나/지침/카탈로그는 _build_system의 고정 prefix에 있고,
+        여기에는 요청마다 달라지는 정보만 넣습니다.
         
         Args:
             question: 질문
             context: 컨텍스트
-            
+        
         Returns:
-            str: 완성된 프롬프트
-            
-        TODO: Phase 3에서 구현
+            str: user 메시지
         """
         prompt = f"""
-당신은 투비네트웍스 글로벌의 고객 지원 AI입니다.
-아래 정보를 바탕으로 고객의 질문에 답변해주세요.
-
-## 고객 질문
-{question}
-
 ## 참고 정보
 ### 유사 FAQ
-TODO: FAQ 정보 추가
+{self._format_faqs(context.get('similar_faqs') or [])}
 
 ### 제품 정보
-TODO: 제품 정보 추가
+{self._format_product(context.get('product_info'))}
 
-## 답변 지침
-1. 정확하고 친절하게 답변하세요
-2. 제품 코드나 스펙은 정확히 명시하세요
-3. 불확실한 경우 "확인이 필요합니다"라고 명시하세요
-4. 한국어로 답변하세요
+### 고객 이전 문의
+{self._format_customer(context.get('customer_info'))}
+
+## 고객 질문
+{question}
 
 답변:
 """
         return prompt
     
-    def health_check(self) -> bool:
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        호출 통계
+        
+        Returns:
+            진행 중 요청 수, 요청/재시도/실패 횟수, 프롬프트 캐시 적중/토큰, 레이트 리미터 상태
+        """
+        return {
+            'in_flight': self._in_flight,
+            'requests': self._requests,
+            'retries': self._retries,
+            'failures': self._failures,
+            'cache': {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'read_tokens': self._cache_read_tokens,
+                'write_tokens': self._cache_write_tokens,
+                'uncached_input_tokens': self._uncached_input_tokens,
+                'brands': sorted(self._brand_catalogs)
+            },
+            'rate_limiter': self.limiter.get_stats()
+        }
+    
+    async def close(self):
+        """HTTP 연결 풀 종료"""
+        await self.http_client.aclose()
+    
+    async def health_check(self) -> bool:
         """
         Claude API 연결 상태 확인
         
+        토큰을 쓰지 않는 모델 목록 조회(GET /v1/models)로 도달 가능 여부와
+        API 키 유효성을 함께 확인합니다. 레이트 리미터/세마포어는 거치지 않습니다.
+        
         Returns:
-            bool: API 키 유효성 여부
-            
-        TODO: Phase 3에서 구현
+            bool: API 응답 성공(2xx) 여부
         """
-        # TODO: 간단한 API 호출로 확인
-        return False
+        response = await self.http_client.get(
+            self.client.base_url.join("v1/models"),
+            headers={
+                'x-api-key': self.api_key,
+                'anthropic-version': '2023-06-01'
+            },
+            params={'limit': 1}
+        )
+        return response.is_success
+
+
+# 싱글톤 인스턴스
+_claude_service: Optional[ClaudeService] = None
+
+
+def get_claude_service() -> ClaudeService:
+    """
+    Claude Service 싱글톤 인스턴스 반환
+    
+    FastAPI의 Depends에서 사용합니다.
+    """
+    global _claude_service
+    if _claude_service is None:
+        raise RuntimeError("Claude Service가 초기화되지 않았습니다")
+    return _claude_service
+
+
+def init_claude_service(api_key: str, model: str, **kwargs) -> ClaudeService:
+    """
+    Claude Service 초기화
+    
+    main.py에서 앱 시작 시 호출합니다. 연결 풀과 레이트 리미터는 프로세스 전체에서 공유됩니다.
+    """
+    global _claude_service
+    _claude_service = ClaudeService(api_key, model, **kwargs)
+    return _claude_service
@@ -0,0 +1,239 @@
+# backend/app/services/embedding_batcher.py
+# 2026-10-17 09:40, Claude 작성
+# 2026-10-17 10:10, Claude 업데이트 (로컬 캐시 적중 시 배치 대기 생략)
+# 2026-10-18 02:30, Claude 업데이트 (워커가 취소/중단되면 대기 중인 요청 실패 처리, 다음 요청에서 재시작)
+
+"""
+임베딩 마이크로 배처
+
+동시에 들어오는 단건 임베딩 요청(analyze, hybrid_search 등)을
+짧은 시간 창(예: 5ms 또는 32개) 동안 모아서 한 번의 배치 encode로 처리합니다.
+
+주요 기능:
+1. 요청 수집 후 배치 인코딩 (max_batch_size / max_wait_ms)
+2. 요청별 결과 벡터 분배
+3. 큐 길이, 배치 크기 통계 (get_stats)
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .embedding_engine import EmbeddingEngine
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    asyncio 기반 임베딩 마이크로 배처
+
+    워커 태스크는 첫 요청 시 현재 이벤트 루프에서 자동으로 시작됩니다.
+    워커가 취소되거나 예기치 못하게 중단되면 대기 중인 요청은 RuntimeError로 실패하고,
+    다음 요청에서 워커를 다시 시작합니다.
+
+    Example:
+        >>> batcher = get_embedding_batcher(get_embedding_engine())
+        >>> vector = await batcher.embed("배송 언제 오나요?")
+    """
+
+    def __init__(
+        self,
+        engine: EmbeddingEngine,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        초기화
+
+        Args:
+            engine: 임베딩 엔진
+            max_batch_size: 한 배치의 최대 텍스트 수
+            max_wait_ms: 첫 요청 이후 배치를 모으는 최대 대기 시간 (밀리초)
+        """
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 통계
+        self._batches = 0
+        self._items = 0
+        self._max_batch_seen = 0
+        self._last_batch_size = 0
+        self._max_queue_depth = 0
+        self._batch_size_histogram: Dict[int, int] = {}
+
+    def _ensure_worker(self):
+        """현재 이벤트 루프에 큐와 워커 태스크 준비"""
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+
+        if self._worker is None or self._worker.done():
+            if self._worker is not None and not self._worker.cancelled():
+                logger.warning(f"임베딩 배치 워커 재시작 (중단 원인: {self._worker.exception()!r})")
+            self._worker = loop.create_task(self._run())
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        단일 텍스트 임베딩 (배치에 합류)
+
+        Args:
+            text: 임베딩할 텍스트
+
+        Returns:
+            임베딩 벡터
+        """
+        # 로컬 캐시에 있으면 배치 시간 창을 기다리지 않음
+        cached = self.engine.cache.get_local(text)
+        if cached is not None:
+            return cached
+
+        self._ensure_worker()
+
+        future = self._loop.create_future()
+        self._queue.put_nowait((text, future))
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+        return await future
+
+    async def _collect_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """
+        첫 요청을 기다린 뒤 시간 창 안에서 추가 요청을 모음
+
+        큐에서 꺼낸 요청은 바로 batch에 넣어, 모으는 중에 워커가 멈춰도 실패 처리할 수 있게 합니다.
+        """
+        batch.append(await self._queue.get())
+
+        deadline = self._loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            # 이미 큐에 쌓인 요청은 기다리지 않고 가져감
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self):
+        """배치 수집 → encode → 결과 분배 루프"""
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = []
+                await self._collect_batch(batch)
+
+                # 호출자가 이미 취소한 요청은 제외
+                batch = [(text, future) for text, future in batch if not future.done()]
+                if not batch:
+                    continue
+
+                texts = [text for text, _ in batch]
+
+                try:
+                    vectors = await self.engine.aencode(texts, batch_size=len(texts))
+                except Exception as e:
+                    logger.error(f"배치 임베딩 실패 ({len(texts)}개): {e}")
+                    self._fail(batch, e)
+                    continue
+
+                for (_, future), vector in zip(batch, vectors):
+                    if not future.done():
+                        future.set_result(vector)
+
+                self._record_batch(len(batch))
+        except BaseException as e:
+            # 취소(close) 또는 BaseException으로 워커가 멈춤 → 처리 중/대기 중 요청이 영원히 기다리지 않도록
+            error = RuntimeError(f"임베딩 배치 워커 중단: {e!r}")
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._fail(batch, error)
+            raise
+
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], error: BaseException):
+        """아직 끝나지 않은 요청을 error로 실패 처리"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _record_batch(self, size: int):
+        """배치 통계 기록"""
+        self._batches += 1
+        self._items += size
+        self._last_batch_size = size
+        self._max_batch_seen = max(self._max_batch_seen, size)
+        self._batch_size_histogram[size] = self._batch_size_histogram.get(size, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        배처 통계 조회 (시간 창 튜닝용)
+
+        Returns:
+            큐 길이, 배치 수, 평균/최대 배치 크기, 배치 크기 분포
+        """
+        return {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'max_queue_depth': self._max_queue_depth,
+            'batches': self._batches,
+            'items': self._items,
+            'avg_batch_size': round(self._items / self._batches, 2) if self._batches else 0.0,
+            'max_batch_size': self._max_batch_seen,
+            'last_batch_size': self._last_batch_size,
+            'batch_size_histogram': dict(sorted(self._batch_size_histogram.items())),
+            'config': {
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait_ms
+            }
+        }
+
+    async def close(self):
+        """워커 태스크 종료"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+
+# 엔진(모델명)별 공유 배처
+_batchers: Dict[str, EmbeddingBatcher] = {}
+
+
+def get_embedding_batcher(
+    engine: EmbeddingEngine,
+    max_batch_size: int = 32,
+    max_wait_ms: float = 5.0
+) -> EmbeddingBatcher:
+    """
+    임베딩 배처 공유 인스턴스 반환
+
+    같은 엔진을 쓰는 서비스들이 하나의 배처를 공유해야
+    서로 다른 호출(analyze, hybrid_search)의 요청이 같은 배치로 묶입니다.
+    배치 설정은 최초 생성 시에만 적용됩니다.
+
+    Args:
+        engine: 임베딩 엔진
+        max_batch_size: 한 배치의 최대 텍스트 수
+        max_wait_ms: 배치 수집 대기 시간 (밀리초)
+    """
+    batcher = _batchers.get(engine.model_name)
+    if batcher is None or batcher.engine is not engine:
+        batcher = EmbeddingBatcher(engine, max_batch_size, max_wait_ms)
+        _batchers[engine.model_name] = batcher
+    return batcher
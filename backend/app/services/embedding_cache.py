@@ -0,0 +1,322 @@
+# backend/app/services/embedding_cache.py
+# 2026-10-17 10:10, Claude 작성
+# 2026-10-18 02:00, Claude 업데이트 (Redis 연결/소켓 타임아웃: 장애 시 임베딩이 오래 막히지 않도록)
+
+"""
+임베딩 캐시
+
+정규화된 텍스트 + 모델명 해시를 키로 임베딩 벡터를 캐싱합니다.
+고객이 거의 같은 문의("반품주소 여기로 보내면되나요")를 다시 보내도
+다시 임베딩하지 않습니다.
+
+캐시 계층:
+1. 프로세스 내 LRU (크기 제한, float32 바이트로 저장)
+2. Redis (float32 바이트, TTL 적용, 워커 간 공유)
+
+Redis 오류는 캐시 미스로 처리하며 임베딩 생성을 막지 않습니다.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    2계층 임베딩 캐시 (로컬 LRU + Redis)
+
+    Example:
+        >>> cache = EmbeddingCache("jhgan/ko-sroberta-multitask", redis_url="redis://localhost:6379")
+        >>> cache.get_many(["배송 언제 오나요?"])
+        [None]
+    """
+
+    KEY_PREFIX = "emb"
+
+    # Redis 오류 후 재시도까지 쉬는 시간 (초)
+    REDIS_RETRY_INTERVAL = 30.0
+
+    # Redis 연결/명령 타임아웃 (초, 응답 없는 Redis가 임베딩을 막지 않도록 짧게)
+    REDIS_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        model_name: str,
+        max_items: int = 5000,
+        redis_url: Optional[str] = None,
+        ttl: int = 3600
+    ):
+        """
+        초기화
+
+        Args:
+            model_name: 임베딩 모델명 (키에 포함되어 모델 교체 시 캐시가 섞이지 않음)
+            max_items: 로컬 LRU 최대 항목 수
+            redis_url: Redis URL (None이면 로컬 캐시만 사용)
+            ttl: Redis 항목 만료 시간 (초)
+        """
+        self.model_name = model_name
+        self.max_items = max_items
+        self.ttl = ttl
+
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.redis_url: Optional[str] = None
+        self._redis: Optional[redis.Redis] = None
+        self._aredis: Optional[aioredis.Redis] = None
+        self._redis_disabled_until = 0.0
+
+        # 통계
+        self.hits_local = 0
+        self.hits_redis = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+        if redis_url:
+            self.enable_redis(redis_url, ttl)
+
+    def enable_redis(self, redis_url: str, ttl: Optional[int] = None):
+        """
+        Redis 계층 활성화
+
+        Args:
+            redis_url: Redis URL
+            ttl: 항목 만료 시간 (초, None이면 기존 값 유지)
+        """
+        self.redis_url = redis_url
+        if ttl is not None:
+            self.ttl = ttl
+
+        # 실제 연결은 첫 사용 시 맺어짐
+        timeouts = {'socket_connect_timeout': self.REDIS_TIMEOUT, 'socket_timeout': self.REDIS_TIMEOUT}
+        self._redis = redis.Redis.from_url(redis_url, **timeouts)
+        self._aredis = aioredis.Redis.from_url(redis_url, **timeouts)
+        logger.info(f"임베딩 캐시 Redis 계층 활성화: {redis_url} (TTL {self.ttl}초)")
+
+    # ==================== 키 / 직렬화 ====================
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        캐시 키용 텍스트 정규화
+
+        유니코드 정규화(NFKC), 공백 정리, 소문자 변환을 적용합니다.
+        """
+        text = unicodedata.normalize('NFKC', text)
+        return ' '.join(text.split()).lower()
+
+    def make_key(self, text: str) -> str:
+        """텍스트의 캐시 키 생성 (모델명 + 정규화 텍스트의 SHA-256)"""
+        digest = hashlib.sha256(
+            f"{self.model_name}\0{self.normalize_text(text)}".encode('utf-8')
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    @staticmethod
+    def pack(vector: List[float]) -> bytes:
+        """벡터 → float32 바이트"""
+        return array('f', vector).tobytes()
+
+    @staticmethod
+    def unpack(data: bytes) -> List[float]:
+        """float32 바이트 → 벡터"""
+        vector = array('f')
+        vector.frombytes(data)
+        return vector.tolist()
+
+    # ==================== 로컬 LRU ====================
+
+    def _local_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._local.get(key)
+            if data is not None:
+                self._local.move_to_end(key)
+            return data
+
+    def _local_put(self, key: str, data: bytes):
+        with self._lock:
+            self._local[key] = data
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_items:
+                self._local.popitem(last=False)
+
+    def get_local(self, text: str) -> Optional[List[float]]:
+        """
+        로컬 LRU만 조회 (Redis 왕복 없음)
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            캐시된 벡터 또는 None
+        """
+        data = self._local_get(self.make_key(text))
+        if data is None:
+            return None
+        self.hits_local += 1
+        return self.unpack(data)
+
+    # ==================== Redis 상태 ====================
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_disabled_until
+
+    def _on_redis_error(self, error: Exception):
+        self.redis_errors += 1
+        self._redis_disabled_until = time.monotonic() + self.REDIS_RETRY_INTERVAL
+        logger.warning(f"임베딩 캐시 Redis 오류 ({self.REDIS_RETRY_INTERVAL:.0f}초간 로컬 캐시만 사용): {error}")
+
+    # ==================== 조회 / 저장 ====================
+
+    def _lookup_local(self, keys: List[str]) -> List[Optional[List[float]]]:
+        results: List[Optional[List[float]]] = []
+        for key in keys:
+            data = self._local_get(key)
+            if data is not None:
+                self.hits_local += 1
+                results.append(self.unpack(data))
+            else:
+                results.append(None)
+        return results
+
+    def _apply_redis_values(
+        self,
+        keys: List[str],
+        results: List[Optional[List[float]]],
+        missing: List[int],
+        values: List[Optional[bytes]]
+    ):
+        for index, data in zip(missing, values):
+            if data is not None:
+                self.hits_redis += 1
+                self._local_put(keys[index], data)
+                results[index] = self.unpack(data)
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트의 캐시 벡터 조회 (동기)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            텍스트 순서대로 벡터 또는 None (미스)
+        """
+        keys = [self.make_key(text) for text in texts]
+        results = self._lookup_local(keys)
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing and self._redis_available():
+            try:
+                values = self._redis.mget([keys[i] for i in missing])
+                self._apply_redis_values(keys, results, missing, values)
+            except redis.RedisError as e:
+                self._on_redis_error(e)
+
+        self.misses += sum(1 for vector in results if vector is None)
+        return results
+
+    async def aget_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트의 캐시 벡터 조회 (비동기)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            텍스트 순서대로 벡터 또는 None (미스)
+        """
+        keys = [self.make_key(text) for text in texts]
+        results = self._lookup_local(keys)
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing and self._redis_available():
+            try:
+                values = await self._aredis.mget([keys[i] for i in missing])
+                self._apply_redis_values(keys, results, missing, values)
+            except redis.RedisError as e:
+                self._on_redis_error(e)
+
+        self.misses += sum(1 for vector in results if vector is None)
+        return results
+
+    def _store_local(self, texts: List[str], vectors: List[List[float]]) -> Dict[str, bytes]:
+        entries = {}
+        for text, vector in zip(texts, vectors):
+            key = self.make_key(text)
+            data = self.pack(vector)
+            self._local_put(key, data)
+            entries[key] = data
+        return entries
+
+    def put_many(self, texts: List[str], vectors: List[List[float]]):
+        """
+        벡터 저장 (동기)
+
+        Args:
+            texts: 텍스트 리스트
+            vectors: 텍스트 순서대로의 벡터 리스트
+        """
+        entries = self._store_local(texts, vectors)
+
+        if entries and self._redis_available():
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for key, data in entries.items():
+                    pipe.set(key, data, ex=self.ttl)
+                pipe.execute()
+            except redis.RedisError as e:
+                self._on_redis_error(e)
+
+    async def aput_many(self, texts: List[str], vectors: List[List[float]]):
+        """
+        벡터 저장 (비동기)
+
+        Args:
+            texts: 텍스트 리스트
+            vectors: 텍스트 순서대로의 벡터 리스트
+        """
+        entries = self._store_local(texts, vectors)
+
+        if entries and self._redis_available():
+            try:
+                pipe = self._aredis.pipeline(transaction=False)
+                for key, data in entries.items():
+                    pipe.set(key, data, ex=self.ttl)
+                await pipe.execute()
+            except redis.RedisError as e:
+                self._on_redis_error(e)
+
+    # ==================== 통계 ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중 통계
+
+        Returns:
+            계층별 적중/미스 횟수, 적중률, 로컬 항목 수, Redis 상태
+        """
+        hits = self.hits_local + self.hits_redis
+        total = hits + self.misses
+
+        return {
+            'hits_local': self.hits_local,
+            'hits_redis': self.hits_redis,
+            'misses': self.misses,
+            'hit_rate': round(hits / total, 4) if total else 0.0,
+            'local_items': len(self._local),
+            'local_max_items': self.max_items,
+            'redis_enabled': self._redis is not None,
+            'redis_errors': self.redis_errors
+        }
@@ -0,0 +1,261 @@
+# backend/app/services/embedding_engine.py
+# 2026-10-17 09:10, Claude 작성
+# 2026-10-17 10:10, Claude 업데이트 (임베딩 캐시 read-through)
+# 2026-10-17 10:40, Claude 업데이트 (인코딩 전용 스레드 풀)
+# 2026-10-17 18:50, Claude 업데이트 (torch/sentence_transformers 지연 임포트)
+
+"""
+임베딩 엔진
+
+Sentence-BERT 모델을 프로세스당 한 번만 로드하여
+WeaviateService, QuestionAnalyzer, 임포트 스크립트가 공유하도록 합니다.
+
+주요 기능:
+1. 모델명 기준 프로세스 전역 싱글톤 (get_embedding_engine)
+2. 동기/비동기 배치 인코딩 (encode / aencode)
+3. 임베딩 캐시 read-through (로컬 LRU + Redis, embedding_cache 참고)
+4. 모델 메모리 사용량 조회 (memory_footprint)
+
+torch/sentence_transformers는 엔진을 처음 만들 때 임포트합니다 (utils/ml_loader 참고).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+
+from .embedding_cache import EmbeddingCache
+from ..utils.ml_loader import cuda_device_name, default_device, load_sentence_transformer
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MODEL_NAME = "jhgan/ko-sroberta-multitask"
+
+
+class EmbeddingEngine:
+    """
+    Sentence-BERT 임베딩 엔진
+
+    직접 생성하기보다는 get_embedding_engine()으로 공유 인스턴스를 받아 사용합니다.
+
+    Example:
+        >>> engine = get_embedding_engine()
+        >>> vector = engine.encode("배송 언제 오나요?")
+        >>> vectors = await engine.aencode(["반품 문의", "교환 문의"])
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        device: Optional[str] = None,
+        normalize: bool = True,
+        cache: Optional[EmbeddingCache] = None,
+        encode_workers: int = 2
+    ):
+        """
+        임베딩 엔진 초기화 (모델 로드)
+
+        Args:
+            model_name: Sentence-BERT 모델명
+            device: 실행 디바이스 (None이면 GPU 사용 가능 여부로 자동 선택)
+            normalize: 임베딩 정규화 여부 (코사인 유사도 계산 최적화)
+            cache: 임베딩 캐시 (None이면 로컬 LRU 캐시만 사용)
+            encode_workers: 비동기 인코딩용 스레드 수 (동시 encode 상한)
+        """
+        self.model_name = model_name
+        self.normalize = normalize
+        self.cache = cache or EmbeddingCache(model_name)
+
+        # aencode 전용 스레드 풀 (기본 풀을 점유하지 않도록 분리)
+        self._executor = ThreadPoolExecutor(
+            max_workers=encode_workers,
+            thread_name_prefix="embedding"
+        )
+
+        self.device = device or default_device()
+
+        logger.info(f"🧠 Sentence-BERT 모델 로딩: {model_name} (디바이스: {self.device})")
+        if self.device == "cuda":
+            logger.info(f"  🎮 GPU: {cuda_device_name()}")
+        
+        self.model = load_sentence_transformer(model_name, device=self.device)
+
+        logger.info(f"  ✅ 모델 로드 완료! (임베딩 차원: {self.dimension})")
+
+    @property
+    def dimension(self) -> int:
+        """임베딩 벡터 차원"""
+        return self.model.get_sentence_embedding_dimension()
+
+    def _encode_raw(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False
+    ) -> List[List[float]]:
+        """캐시를 거치지 않고 모델로 직접 인코딩"""
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+            convert_to_tensor=False,
+            normalize_embeddings=self.normalize
+        )
+        return embeddings.tolist()
+
+    @staticmethod
+    def _unique_misses(texts: List[str], cached: List[Optional[List[float]]]) -> List[str]:
+        """캐시 미스 텍스트 (중복 제거, 순서 유지)"""
+        return list(dict.fromkeys(
+            text for text, vector in zip(texts, cached) if vector is None
+        ))
+
+    @staticmethod
+    def _fill_misses(
+        texts: List[str],
+        cached: List[Optional[List[float]]],
+        missing: List[str],
+        vectors: List[List[float]]
+    ) -> List[List[float]]:
+        """새로 인코딩한 벡터로 미스 자리를 채움"""
+        encoded = dict(zip(missing, vectors))
+        return [
+            vector if vector is not None else encoded[text]
+            for text, vector in zip(texts, cached)
+        ]
+
+    def encode(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        텍스트(또는 텍스트 리스트)를 벡터로 변환
+
+        캐시에 있는 텍스트는 재사용하고 미스만 모델로 인코딩합니다.
+
+        Args:
+            texts: 단일 텍스트 또는 텍스트 리스트
+            batch_size: 배치 크기
+            show_progress_bar: 진행 표시줄 출력 여부
+
+        Returns:
+            단일 텍스트면 벡터 하나, 리스트면 벡터 리스트
+        """
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+
+        cached = self.cache.get_many(items)
+        missing = self._unique_misses(items, cached)
+
+        vectors = []
+        if missing:
+            vectors = self._encode_raw(missing, batch_size, show_progress_bar)
+            self.cache.put_many(missing, vectors)
+
+        results = self._fill_misses(items, cached, missing, vectors)
+        return results[0] if single else results
+
+    async def aencode(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 32
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        비동기 인코딩
+
+        인코딩은 CPU 바운드 작업이므로 크기가 제한된 전용 스레드 풀에서 실행하여
+        이벤트 루프를 막지 않습니다. 캐시 조회/저장은 비동기 Redis 클라이언트를 사용합니다.
+
+        Args:
+            texts: 단일 텍스트 또는 텍스트 리스트
+            batch_size: 배치 크기
+
+        Returns:
+            encode()와 동일
+        """
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+
+        cached = await self.cache.aget_many(items)
+        missing = self._unique_misses(items, cached)
+
+        vectors = []
+        if missing:
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(
+                self._executor,
+                partial(self._encode_raw, missing, batch_size)
+            )
+            await self.cache.aput_many(missing, vectors)
+
+        results = self._fill_misses(items, cached, missing, vectors)
+        return results[0] if single else results
+
+    def memory_footprint(self) -> Dict[str, Any]:
+        """
+        모델 메모리 사용량 조회
+
+        파라미터와 버퍼가 차지하는 바이트 수를 합산합니다.
+
+        Returns:
+            {'model_name', 'device', 'parameters', 'bytes', 'megabytes'}
+        """
+        parameters = 0
+        total_bytes = 0
+
+        for param in self.model.parameters():
+            parameters += param.numel()
+            total_bytes += param.numel() * param.element_size()
+
+        for buffer in self.model.buffers():
+            total_bytes += buffer.numel() * buffer.element_size()
+
+        return {
+            'model_name': self.model_name,
+            'device': self.device,
+            'parameters': parameters,
+            'bytes': total_bytes,
+            'megabytes': round(total_bytes / (1024 * 1024), 1)
+        }
+
+
+# 모델명별 공유 인스턴스
+_engines: Dict[str, EmbeddingEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_embedding_engine(
+    model_name: str = DEFAULT_MODEL_NAME,
+    device: Optional[str] = None,
+    redis_url: Optional[str] = None,
+    redis_ttl: int = 3600
+) -> EmbeddingEngine:
+    """
+    임베딩 엔진 공유 인스턴스 반환
+
+    같은 모델명으로 여러 번 호출해도 모델은 프로세스당 한 번만 로드됩니다.
+
+    Args:
+        model_name: Sentence-BERT 모델명
+        device: 실행 디바이스 (최초 로드 시에만 적용)
+        redis_url: 임베딩 캐시 Redis URL (지정하면 캐시의 Redis 계층 활성화)
+        redis_ttl: Redis 캐시 만료 시간 (초)
+    """
+    engine = _engines.get(model_name)
+
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(model_name)
+            if engine is None:
+                engine = EmbeddingEngine(model_name, device=device)
+                _engines[model_name] = engine
+
+    if redis_url and engine.cache.redis_url != redis_url:
+        engine.cache.enable_redis(redis_url, redis_ttl)
+
+    return engine
@@ -0,0 +1,488 @@
+# backend/app/services/faq_indexer.py
+# 2026-10-17 14:10, Claude 작성
+# 2026-10-17 18:50, Claude 업데이트 (WeaviateService 타입 힌트 전용 임포트)
+# 2026-10-17 22:50, Claude 업데이트 (실패 재시도/보류 컬렉션, 모든 이벤트 처리 후에만 resume token 전진)
+# 2026-10-17 23:30, Claude 업데이트 (faq_vector_state 기록 → 증분 동기화와 상태 공유)
+
+"""
+FAQ 실시간 인덱서
+
+MongoDB change stream으로 faqs 컬렉션의 변경(insert/update/replace/delete)을 받아
+Weaviate FAQ 컬렉션에 몇 초 안에 반영하는 상주 워커입니다.
+주기적인 전체 재임포트 없이 새로 답변된 문의가 바로 검색됩니다.
+
+주요 기능:
+1. 이벤트 마이크로 배칭 (batch_size개 또는 max_wait_seconds)
+2. 배치 단위 일괄 임베딩 + 저장 (WeaviateService.add_faqs_batch)
+3. resume token 저장 (sync_state 컬렉션) → 재시작 시 이어서 처리
+4. 실패 처리
+   - 일부 FAQ 저장 실패: 백오프로 max_retries번 재시도, 그래도 실패하면
+     faq_index_failures 컬렉션에 보류 (증분 동기화 --incremental이 다시 반영)
+   - 배치 전체 실패(Weaviate/MongoDB 오류): 성공할 때까지 같은 배치를 백오프로 재시도
+5. faq_vector_state 기록 (저장한 FAQ의 내용 해시, 삭제한 FAQ는 상태도 삭제)
+   → 증분 동기화가 인덱서가 이미 반영한 FAQ를 다시 임베딩하지 않음
+6. 지연 시간(lag), 큐 길이 통계 (get_stats)
+
+참고:
+- change stream은 레플리카셋(단일 노드 포함)에서만 동작합니다.
+- delete 이벤트에는 문서 내용이 없으므로 pre-image(MongoDB 6.0+)로 inquiry_no를 찾습니다.
+  pre-image가 없으면 해당 삭제는 건너뛰고 경고만 남깁니다.
+- resume token은 배치의 모든 이벤트가 반영되었거나 보류 컬렉션에 기록된 뒤에만 저장합니다.
+  반영하지 못한 배치 뒤의 배치는 처리하지 않으므로 token이 실패 지점을 건너뛰지 않습니다.
+- 종료 중 재시도가 실패하면 남은 배치는 버리고 token을 그대로 둡니다 (다음 실행에서 다시 수신).
+  즉 반영은 at-least-once이며, 같은 이벤트가 다시 처리되어도 결정적 UUID로 덮어씁니다.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure, PyMongoError
+
+if TYPE_CHECKING:
+    # 타입 힌트 전용 (answer_cache가 INDEXED_FIELDS만 가져갈 때 weaviate/torch 임포트 방지)
+    from .weaviate_service import WeaviateService
+
+logger = logging.getLogger(__name__)
+
+
+# 이 필드가 바뀐 update 이벤트만 다시 임베딩 (processing_status 변경 등은 무시)
+INDEXED_FIELDS = {
+    'title', 'inquiry_content', 'answer_content', 'brand_channel',
+    'inquiry_category', 'product_name', 'product_codes'
+}
+
+# resume token이 oplog에서 사라졌을 때의 에러 코드 (ChangeStreamHistoryLost)
+CHANGE_STREAM_HISTORY_LOST = 286
+
+# 재시도 후에도 저장하지 못한 FAQ (증분 동기화가 다시 반영하고 지움)
+FAILURE_COLLECTION = "faq_index_failures"
+
+# Weaviate에 저장된 FAQ별 내용 해시 (_id: inquiry_no)
+# 모든 쓰기 경로(인덱서, import_to_weaviate.py 전체/스트리밍/증분)가 기록합니다.
+VECTOR_STATE_COLLECTION = "faq_vector_state"
+
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_BACKOFF = 60.0
+
+
+def vector_state_update(faq: Dict[str, Any], text_hash: str, synced_at: datetime) -> UpdateOne:
+    """faq_vector_state 갱신 연산 (Weaviate 저장에 성공한 FAQ)"""
+    return UpdateOne(
+        {'_id': faq['inquiry_no']},
+        {'$set': {
+            'brand_channel': faq.get('brand_channel'),
+            'text_hash': text_hash,
+            'synced_at': synced_at
+        }},
+        upsert=True
+    )
+
+
+class FAQIndexer:
+    """
+    MongoDB change stream → Weaviate 인덱서
+
+    Example:
+        >>> indexer = FAQIndexer(mongodb_service.db, weaviate_service)
+        >>> await indexer.run()  # stop() 호출 전까지 실행
+    """
+
+    def __init__(
+        self,
+        db,
+        weaviate_service: "WeaviateService",
+        batch_size: int = 64,
+        max_wait_seconds: float = 1.0,
+        queue_size: int = 1000,
+        state_id: str = "faq_indexer",
+        retry_interval: float = 5.0,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0
+    ):
+        """
+        초기화
+
+        Args:
+            db: motor 데이터베이스 (faqs, sync_state 컬렉션 사용)
+            weaviate_service: 연결된 Weaviate 서비스
+            batch_size: 한 번에 반영할 최대 이벤트 수
+            max_wait_seconds: 첫 이벤트 이후 배치를 모으는 최대 대기 시간
+            queue_size: 수신 후 반영 대기 이벤트 최대 수 (넘으면 수신 일시 중지)
+            state_id: sync_state 문서 ID
+            retry_interval: change stream 오류 후 재연결 대기 시간 (초)
+            max_retries: 저장 실패한 FAQ 재시도 횟수 (넘으면 보류 컬렉션에 기록)
+            retry_backoff: 첫 재시도 대기 시간 (초, 재시도마다 2배, 최대 MAX_RETRY_BACKOFF)
+        """
+        self.db = db
+        self.weaviate_service = weaviate_service
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.state_id = state_id
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._stopping = asyncio.Event()
+        self._resume_token: Optional[Dict[str, Any]] = None
+
+        # 통계
+        self._events_received = 0
+        self._indexed = 0
+        self._deleted = 0
+        self._skipped = 0
+        self._failed = 0
+        self._retried = 0
+        self._parked = 0
+        self._batches = 0
+        self._last_lag: Optional[float] = None
+        self._last_flush_at: Optional[datetime] = None
+
+    # ==================== 상태 저장 ====================
+
+    async def load_resume_token(self) -> Optional[Dict[str, Any]]:
+        """sync_state에서 마지막으로 반영한 이벤트의 resume token 조회"""
+        state = await self.db.sync_state.find_one({'_id': self.state_id})
+        return state.get('resume_token') if state else None
+
+    async def save_resume_token(self, token: Dict[str, Any]):
+        """반영이 끝난 이벤트의 resume token 저장"""
+        await self.db.sync_state.update_one(
+            {'_id': self.state_id},
+            {'$set': {'resume_token': token, 'updated_at': datetime.now()}},
+            upsert=True
+        )
+        self._resume_token = token
+
+    async def park_failures(self, faqs: List[Dict[str, Any]], errors: Dict[Any, str]):
+        """
+        재시도 후에도 저장하지 못한 FAQ를 보류 컬렉션에 기록
+
+        증분 동기화(import_to_weaviate.py --incremental)가 다음 실행에서 다시 반영하고 지웁니다.
+        기록에 실패하면 예외를 그대로 던져 resume token이 전진하지 않게 합니다.
+        """
+        now = datetime.now()
+        for faq in faqs:
+            await self.db[FAILURE_COLLECTION].update_one(
+                {'_id': faq['inquiry_no']},
+                {'$set': {
+                    'brand_channel': faq.get('brand_channel'),
+                    'error': errors.get(faq['inquiry_no']),
+                    'attempts': self.max_retries + 1,
+                    'failed_at': now
+                }},
+                upsert=True
+            )
+        self._parked += len(faqs)
+
+    async def enable_pre_images(self):
+        """
+        faqs 컬렉션의 pre-image 기록 활성화 (delete 이벤트에서 inquiry_no 확인용)
+
+        MongoDB 6.0 미만이거나 권한이 없으면 경고만 남깁니다.
+        """
+        try:
+            await self.db.command(
+                'collMod', 'faqs',
+                changeStreamPreAndPostImages={'enabled': True}
+            )
+        except PyMongoError as e:
+            logger.warning(f"⚠️ pre-image 활성화 실패 (삭제 반영 불가): {e}")
+
+    # ==================== 실행 ====================
+
+    async def run(self):
+        """
+        인덱서 실행 (stop() 호출 전까지)
+
+        수신 태스크와 반영 태스크를 함께 실행합니다.
+        """
+        self._stopping.clear()
+        self._resume_token = await self.load_resume_token()
+
+        if self._resume_token:
+            logger.info("🔁 저장된 resume token에서 이어서 처리")
+        else:
+            logger.info("🆕 resume token 없음 → 지금부터 변경 사항 처리")
+
+        consumer = asyncio.create_task(self._consume())
+        flusher = asyncio.create_task(self._flush_loop())
+
+        try:
+            await self._stopping.wait()
+        finally:
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+
+            # 이미 받은 이벤트는 반영 후 종료
+            await self._queue.join()
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+
+            logger.info(f"🛑 FAQ 인덱서 종료: {self.get_stats()}")
+
+    def stop(self):
+        """인덱서 종료 요청"""
+        self._stopping.set()
+
+    def _watch(self, resume_after: Optional[Dict[str, Any]]):
+        """faqs change stream 열기"""
+        pipeline = [
+            {'$match': {'operationType': {'$in': ['insert', 'update', 'replace', 'delete']}}}
+        ]
+        return self.db.faqs.watch(
+            pipeline,
+            full_document='updateLookup',
+            full_document_before_change='whenAvailable',
+            resume_after=resume_after
+        )
+
+    async def _consume(self):
+        """change stream 이벤트를 큐에 넣음 (오류 시 마지막 저장 지점부터 재연결)"""
+        resume_after = self._resume_token
+
+        while not self._stopping.is_set():
+            try:
+                async with self._watch(resume_after) as stream:
+                    logger.info("👀 faqs change stream 수신 시작")
+                    async for change in stream:
+                        self._events_received += 1
+                        await self._queue.put(change)
+
+                # 스트림이 닫히면(invalidate 등) 마지막 반영 지점부터 다시 열기
+                resume_after = self._resume_token
+
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    # oplog 보관 기간을 넘김 → 현재 시점부터 다시 시작 (누락분은 증분 동기화로 보완)
+                    logger.error("❌ resume token이 만료되었습니다. 현재 시점부터 다시 수신합니다 (누락분은 증분 동기화 필요)")
+                    resume_after = None
+                else:
+                    logger.error(f"❌ change stream 오류: {e}")
+                    resume_after = self._resume_token
+                await asyncio.sleep(self.retry_interval)
+
+            except PyMongoError as e:
+                logger.error(f"❌ change stream 연결 오류 ({self.retry_interval:.0f}초 후 재시도): {e}")
+                resume_after = self._resume_token
+                await asyncio.sleep(self.retry_interval)
+
+    async def _backoff(self, attempt: int) -> bool:
+        """
+        재시도 전 대기 (retry_backoff * 2^attempt초, 종료 요청 시 바로 깨어남)
+
+        Returns:
+            종료 요청 여부
+        """
+        delay = min(self.retry_backoff * (2 ** attempt), MAX_RETRY_BACKOFF)
+        try:
+            await asyncio.wait_for(self._stopping.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        return self._stopping.is_set()
+
+    async def _collect_batch(self) -> List[Dict[str, Any]]:
+        """첫 이벤트를 기다린 뒤 시간 창 안에서 추가 이벤트를 모음"""
+        batch = [await self._queue.get()]
+
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _flush_loop(self):
+        """
+        배치 수집 → 반영 → resume token 저장 루프
+
+        배치 반영이 실패하면 다음 배치로 넘어가지 않고 같은 배치를 백오프로 재시도합니다.
+        (다음 배치가 더 뒤의 token을 저장하면 실패한 이벤트를 영영 건너뛰게 됨)
+        종료 중에 실패하면 남은 배치는 반영하지 않고 버립니다. token이 실패 지점에
+        머물러 있으므로 다음 실행이 그 지점부터 다시 수신합니다.
+        """
+        abandoned = False
+
+        while True:
+            batch = await self._collect_batch()
+
+            try:
+                attempt = 0
+                while not abandoned:
+                    try:
+                        await self.process_batch(batch)
+                        break
+                    except Exception as e:
+                        logger.error(f"❌ 배치 반영 실패 ({len(batch)}개, 재시도 {attempt + 1}회차): {e}")
+                        if await self._backoff(attempt):
+                            logger.error("🛑 종료 중 반영 실패 → 남은 이벤트는 다음 실행에서 저장된 token부터 다시 처리")
+                            abandoned = True
+                        attempt += 1
+
+                if abandoned:
+                    self._failed += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    # ==================== 이벤트 반영 ====================
+
+    @staticmethod
+    def _inquiry_no(change: Dict[str, Any]) -> Optional[int]:
+        """이벤트에서 inquiry_no 추출 (삭제는 pre-image 사용)"""
+        document = change.get('fullDocument') or change.get('fullDocumentBeforeChange')
+        return document.get('inquiry_no') if document else None
+
+    @staticmethod
+    def _needs_reindex(change: Dict[str, Any]) -> bool:
+        """update 이벤트가 임베딩/검색 필드를 바꿨는지 확인"""
+        if change['operationType'] != 'update':
+            return True
+
+        description = change.get('updateDescription') or {}
+        changed = set(description.get('updatedFields', {})) | set(description.get('removedFields', []))
+        return any(field.split('.')[0] in INDEXED_FIELDS for field in changed)
+
+    async def process_batch(self, changes: List[Dict[str, Any]]):
+        """
+        이벤트 배치를 Weaviate에 반영
+
+        같은 문의의 이벤트가 여러 개면 마지막 이벤트만 반영합니다.
+
+        Args:
+            changes: change stream 이벤트 리스트 (수신 순서)
+        """
+        latest: Dict[int, Dict[str, Any]] = {}
+
+        for change in changes:
+            inquiry_no = self._inquiry_no(change)
+
+            if inquiry_no is None:
+                if change['operationType'] == 'delete':
+                    logger.warning(f"⚠️ pre-image 없는 삭제 이벤트 건너뜀: {change.get('documentKey')}")
+                self._skipped += 1
+                continue
+
+            if not self._needs_reindex(change):
+                self._skipped += 1
+                continue
+
+            latest[inquiry_no] = change
+
+        upserts = [
+            change['fullDocument'] for change in latest.values()
+            if change['operationType'] != 'delete' and change.get('fullDocument')
+        ]
+        deletes = [
+            inquiry_no for inquiry_no, change in latest.items()
+            if change['operationType'] == 'delete'
+        ]
+
+        vector_state = self.db[VECTOR_STATE_COLLECTION]
+
+        if upserts:
+            parked = await self._index_with_retry(upserts)
+            now = datetime.now()
+            synced = [
+                vector_state_update(faq, self.weaviate_service.faq_content_hash(faq), now)
+                for faq in upserts if faq['inquiry_no'] not in parked
+            ]
+            if synced:
+                await vector_state.bulk_write(synced, ordered=False)
+
+        if deletes:
+            await self.weaviate_service.delete_faqs(deletes)
+            await vector_state.delete_many({'_id': {'$in': deletes}})
+            self._deleted += len(deletes)
+
+        last = changes[-1]
+        await self.save_resume_token(last['_id'])
+
+        # 지연 시간: 배치의 마지막 이벤트가 MongoDB에 기록된 시각 → 반영 완료 시각
+        cluster_time = last.get('clusterTime')
+        if cluster_time is not None:
+            self._last_lag = max(0.0, time.time() - cluster_time.time)
+
+        self._batches += 1
+        self._last_flush_at = datetime.now()
+
+        logger.info(
+            f"🔄 인덱스 반영: 이벤트 {len(changes)}개 → "
+            f"저장 {len(upserts)}, 삭제 {len(deletes)} (대기 {self._queue.qsize()})"
+        )
+
+    async def _index_with_retry(self, faqs: List[Dict[str, Any]]) -> Set[Any]:
+        """
+        FAQ 저장 (실패한 FAQ만 백오프로 재시도, 끝내 실패하면 보류 컬렉션에 기록)
+
+        add_faqs_batch 자체가 예외를 던지면(연결 오류 등) 그대로 전파되어 배치 전체를 재시도합니다.
+
+        Returns:
+            보류된 FAQ의 inquiry_no 집합
+        """
+        pending = faqs
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._retried += len(pending)
+                if await self._backoff(attempt - 1):
+                    break
+
+            result = await self.weaviate_service.add_faqs_batch(pending)
+            self._indexed += result['succeeded']
+
+            errors = {error['inquiry_no']: error['error'] for error in result['errors']}
+            for inquiry_no, error in errors.items():
+                logger.error(f"  ❌ 인덱싱 실패 ({inquiry_no}, 시도 {attempt + 1}회): {error}")
+
+            pending = [faq for faq in pending if faq['inquiry_no'] in errors]
+            if not pending:
+                return set()
+
+        logger.error(f"  ⏸️  저장 실패 FAQ {len(pending)}개 보류 → {FAILURE_COLLECTION} (증분 동기화에서 재반영)")
+        self._failed += len(pending)
+        await self.park_failures(pending, errors)
+        return {faq['inquiry_no'] for faq in pending}
+
+    # ==================== 통계 ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인덱서 통계
+
+        Returns:
+            lag_seconds(마지막 배치의 변경 발생 → 반영 완료 시간), queue_depth, 처리 건수
+        """
+        return {
+            'lag_seconds': round(self._last_lag, 2) if self._last_lag is not None else None,
+            'queue_depth': self._queue.qsize(),
+            'events_received': self._events_received,
+            'indexed': self._indexed,
+            'deleted': self._deleted,
+            'skipped': self._skipped,
+            'failed': self._failed,
+            'retried': self._retried,
+            'parked': self._parked,
+            'batches': self._batches,
+            'last_flush_at': self._last_flush_at.isoformat() if self._last_flush_at else None
+        }
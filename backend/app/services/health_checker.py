@@ -0,0 +1,191 @@
+# backend/app/services/health_checker.py
+# 2026-10-17 17:40, Claude 작성
+
+"""
+의존 서비스 헬스체크
+
+Weaviate, MongoDB, Redis, Claude API 상태를 동시에 확인합니다.
+
+- 프로브는 asyncio.gather로 동시에 실행 (전체 시간 = 가장 느린 프로브)
+- 프로브마다 짧은 타임아웃, 소요 시간(latency_ms) 기록
+- 결과를 cache_ttl초 동안 재사용, 동시에 들어온 요청은 진행 중인 확인 하나를 공유
+  → 로드밸런서가 1초마다 호출해도 백엔드 부하가 늘지 않음
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+
+# 프로브: 인자 없이 호출해 True(정상)/False(비정상)를 돌려주는 코루틴 함수
+Probe = Callable[[], Awaitable[bool]]
+
+
+class HealthChecker:
+    """
+    동시 실행 + 결과 캐싱 헬스체크
+    
+    Example:
+        >>> checker = HealthChecker({'mongodb': mongodb_service.ping}, timeout=1.0, cache_ttl=3.0)
+        >>> await checker.check()
+        {'status': 'healthy', 'services': {'mongodb': {'status': 'up', 'latency_ms': 1.2}}, ...}
+    """
+    
+    def __init__(
+        self,
+        probes: Dict[str, Optional[Probe]],
+        timeout: float = 1.0,
+        cache_ttl: float = 3.0
+    ):
+        """
+        초기화
+        
+        Args:
+            probes: 서비스명 → 프로브 (None이면 not_configured로 표시)
+            timeout: 프로브별 타임아웃 (초)
+            cache_ttl: 결과 재사용 시간 (초)
+        """
+        self.probes = probes
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        
+        # 통계
+        self.checks = 0
+        self.cache_hits = 0
+    
+    async def _probe(self, name: str, probe: Optional[Probe]) -> Dict[str, Any]:
+        """프로브 하나 실행 (타임아웃, 소요 시간)"""
+        if probe is None:
+            return {'status': 'not_configured'}
+        
+        started = time.perf_counter()
+        try:
+            ok = await asyncio.wait_for(probe(), self.timeout)
+            result = {'status': 'up' if ok else 'down'}
+        except asyncio.TimeoutError:
+            result = {'status': 'timeout', 'error': f"{self.timeout}초 초과"}
+        except Exception as e:
+            result = {'status': 'down', 'error': str(e)}
+        
+        result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        if result['status'] != 'up':
+            logger.warning(f"⚠️ {name} 헬스체크 실패: {result}")
+        return result
+    
+    async def _run_checks(self) -> Dict[str, Any]:
+        """모든 프로브 동시 실행"""
+        started = time.perf_counter()
+        names = list(self.probes)
+        results = await asyncio.gather(*[self._probe(name, self.probes[name]) for name in names])
+        services = dict(zip(names, results))
+        
+        configured = [result for result in services.values() if result['status'] != 'not_configured']
+        if all(result['status'] == 'up' for result in configured):
+            status = 'healthy'
+        elif any(result['status'] == 'up' for result in configured):
+            status = 'degraded'
+        else:
+            status = 'unhealthy'
+        
+        self.checks += 1
+        return {
+            'status': status,
+            'services': services,
+            'checked_at': datetime.now().isoformat(),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    async def check(self, force: bool = False) -> Dict[str, Any]:
+        """
+        헬스체크 결과 반환 (cache_ttl 이내면 캐시된 결과)
+        
+        Args:
+            force: 캐시 무시하고 다시 확인
+        
+        Returns:
+            {'status': healthy/degraded/unhealthy, 'services': {...}, 'checked_at', 'duration_ms',
+             'cached': 캐시 결과 여부, 'age_seconds': 결과가 만들어진 뒤 지난 시간}
+        """
+        now = time.monotonic()
+        if not force and self._result is not None and now - self._checked_at < self.cache_ttl:
+            self.cache_hits += 1
+            return {**self._result, 'cached': True, 'age_seconds': round(now - self._checked_at, 2)}
+        
+        # 동시에 들어온 요청은 진행 중인 확인을 함께 기다림
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._run_checks())
+        task = self._inflight
+        
+        result = await asyncio.shield(task)
+        if task is self._inflight:
+            self._result = result
+            self._checked_at = time.monotonic()
+        
+        return {**result, 'cached': False, 'age_seconds': 0.0}
+
+
+def redis_probe(redis_url: str) -> Probe:
+    """
+    Redis PING 프로브 생성
+    
+    연결 풀은 프로브가 계속 재사용합니다.
+    """
+    client = aioredis.from_url(redis_url, socket_connect_timeout=1.0, socket_timeout=1.0)
+    
+    async def probe() -> bool:
+        return bool(await client.ping())
+    
+    return probe
+
+
+# 싱글톤 인스턴스
+_health_checker: Optional[HealthChecker] = None
+
+
+def get_health_checker() -> HealthChecker:
+    """
+    HealthChecker 싱글톤 인스턴스 반환
+    
+    FastAPI의 Depends에서 사용합니다.
+    """
+    global _health_checker
+    if _health_checker is None:
+        raise RuntimeError("HealthChecker가 초기화되지 않았습니다")
+    return _health_checker
+
+
+def init_health_checker(
+    weaviate_service=None,
+    mongodb_service=None,
+    redis_url: Optional[str] = None,
+    claude_service=None,
+    timeout: float = 1.0,
+    cache_ttl: float = 3.0
+) -> HealthChecker:
+    """
+    HealthChecker 초기화
+    
+    main.py에서 각 서비스 초기화 후 호출합니다. 없는 서비스는 not_configured로 표시됩니다.
+    """
+    global _health_checker
+    _health_checker = HealthChecker(
+        {
+            'weaviate': weaviate_service.is_ready if weaviate_service else None,
+            'mongodb': mongodb_service.ping if mongodb_service else None,
+            'redis': redis_probe(redis_url) if redis_url else None,
+            'claude_api': claude_service.health_check if claude_service else None
+        },
+        timeout=timeout,
+        cache_ttl=cache_ttl
+    )
+    return _health_checker
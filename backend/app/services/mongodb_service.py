@@ -1,5 +1,10 @@
 # backend/app/services/mongodb_service.py
 # 2025-10-02 17:30, Claude 작성
+# 2026-10-17 11:40, Claude 업데이트 (배치 저장을 bulk_write로 변경)
+# 2026-10-17 14:40, Claude 업데이트 (고객 문의 이력 조회)
+# 2026-10-17 17:40, Claude 업데이트 (헬스체크용 ping)
+# 2026-10-17 21:20, Claude 업데이트 (제품 코드 색인: codes 필드 인덱스 + 메모리 색인으로 get_product_by_code)
+# 2026-10-18 00:40, Claude 업데이트 (제품명 없는 문서 backfill 제외, 제품 코드 색인 주기적 재로드)
 
 """
 MongoDB 서비스
@@ -18,13 +23,16 @@ FAQ와 제품 정보를 MongoDB에 저장하고 조회하는 서비스입니다.
 - logs: 처리 로그
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING, IndexModel
-from pymongo.errors import DuplicateKeyError
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import logging
 
+from ..utils.product_codes import ProductCodeIndex, normalize_codes, product_codes, specificity
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,24 +48,38 @@ class MongoDBService:
         >>> await service.store_faq(faq_data)
     """
     
-    def __init__(self, connection_string: str, database_name: str):
+    def __init__(
+        self,
+        connection_string: str,
+        database_name: str,
+        bulk_chunk_size: int = 500,
+        product_index_refresh_seconds: float = 300.0
+    ):
         """
         MongoDB Service 초기화
         
         Args:
             connection_string: MongoDB 연결 문자열
             database_name: 데이터베이스 이름
+            bulk_chunk_size: 배치 저장 시 bulk_write 한 번에 보낼 문서 수
+            product_index_refresh_seconds: 제품 코드 색인 재로드 주기 (초, 0이면 재로드 안 함)
         """
         self.connection_string = connection_string
         self.database_name = database_name
+        self.bulk_chunk_size = bulk_chunk_size
+        self.product_index_refresh_seconds = product_index_refresh_seconds
         self.client: Optional[AsyncIOMotorClient] = None
         self.db: Optional[AsyncIOMotorDatabase] = None
+        
+        # 제품 코드 → 제품 메모리 색인 (connect 시 로드, 이 프로세스의 제품 저장 시 갱신,
+        # 다른 프로세스의 변경은 watch_product_index가 주기적으로 재로드해 반영)
+        self.product_index = ProductCodeIndex()
     
     async def connect(self):
         """
         MongoDB 연결
         
-        연결 후 필요한 인덱스를 자동으로 생성합니다.
+        연결 후 필요한 인덱스를 자동으로 생성하고 제품 코드 색인을 로드합니다.
         """
         try:
             logger.info(f"MongoDB 연결 중: {self.database_name}")
@@ -71,12 +93,22 @@ class MongoDBService:
             # 인덱스 생성
             await self._create_indexes()
             
+            # 제품 코드 색인
+            await self.load_product_index()
+            
             logger.info("✅ MongoDB 연결 성공!")
             
         except Exception as e:
             logger.error(f"❌ MongoDB 연결 실패: {e}")
             raise
     
+    async def ping(self) -> bool:
+        """MongoDB ping (헬스체크용, 연결 전이면 False)"""
+        if self.client is None:
+            return False
+        result = await self.client.admin.command('ping')
+        return bool(result.get('ok'))
+    
     async def disconnect(self):
         """MongoDB 연결 종료"""
         if self.client:
@@ -97,6 +129,10 @@ class MongoDBService:
             IndexModel([("answered", ASCENDING)]),
             IndexModel([("processing_status", ASCENDING)]),
             IndexModel([("inquiry_registration_date_time", DESCENDING)]),
+            IndexModel([
+                ("customer_id", ASCENDING),
+                ("inquiry_registration_date_time", DESCENDING)
+            ]),
             IndexModel([
                 ("brand_channel", ASCENDING),
                 ("inquiry_category", ASCENDING),
@@ -112,12 +148,80 @@ class MongoDBService:
             IndexModel([("brand_channel", ASCENDING)]),
             IndexModel([("product_name", ASCENDING)]),
             IndexModel([("tags", ASCENDING)]),
+            IndexModel([("brand_channel", ASCENDING), ("codes", ASCENDING)]),
         ]
         
         await self.db.products.create_indexes(product_indexes)
         
         logger.info("인덱스 생성 완료") 
     
+    async def _bulk_upsert(
+        self,
+        collection,
+        documents: List[Dict[str, Any]],
+        key_field: str,
+        defaults: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        문서 배치 upsert (bulk_write)
+        
+        key_field 기준 UpdateOne(upsert=True) 작업을 만들어
+        bulk_chunk_size 단위의 unordered bulk_write로 전송합니다.
+        한 문서의 실패가 나머지 문서 저장을 막지 않습니다.
+        
+        Args:
+            collection: 대상 컬렉션
+            documents: 문서 리스트
+            key_field: upsert 기준 필드 (inquiry_no, product_id 등)
+            defaults: 문서에 없을 때 채울 기본값
+            
+        Returns:
+            {'succeeded': int, 'failed': int, 'errors': [{key_field, 'error'}]}
+        """
+        now = datetime.now()
+        errors: List[Dict[str, Any]] = []
+        operations: List[UpdateOne] = []
+        keys: List[Any] = []
+        
+        for document in documents:
+            if key_field not in document:
+                errors.append({key_field: None, 'error': f"{key_field} 누락"})
+                continue
+            
+            document['updated_at'] = now
+            for field, value in (defaults or {}).items():
+                document.setdefault(field, value)
+            
+            update = {'$set': document}
+            if 'created_at' not in document:
+                # 신규 문서에만 생성 시각 기록
+                update['$setOnInsert'] = {'created_at': now}
+            
+            operations.append(UpdateOne({key_field: document[key_field]}, update, upsert=True))
+            keys.append(document[key_field])
+        
+        for start in range(0, len(operations), self.bulk_chunk_size):
+            chunk = operations[start:start + self.bulk_chunk_size]
+            chunk_keys = keys[start:start + self.bulk_chunk_size]
+            
+            try:
+                await collection.bulk_write(chunk, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get('writeErrors', []):
+                    errors.append({
+                        key_field: chunk_keys[write_error['index']],
+                        'error': write_error.get('errmsg', '')
+                    })
+            except Exception as e:
+                logger.error(f"bulk_write 실패 ({len(chunk)}개): {e}")
+                errors.extend({key_field: key, 'error': str(e)} for key in chunk_keys)
+        
+        return {
+            'succeeded': len(documents) - len(errors),
+            'failed': len(errors),
+            'errors': errors
+        }
+    
     # ==================== FAQ 관련 메서드 ====================
     
     async def store_faq(self, faq_data: Dict[str, Any]) -> bool:
@@ -162,31 +266,26 @@ class MongoDBService:
             logger.error(f"FAQ 저장 실패 ({faq_data.get('inquiry_no')}): {e}")
             return False
     
-    async def store_faqs_batch(self, faqs: List[Dict[str, Any]]) -> Dict[str, int]:
+    async def store_faqs_batch(self, faqs: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        FAQ 배치 저장
+        FAQ 배치 저장 (bulk upsert)
         
         Args:
             faqs: FAQ 데이터 리스트
             
         Returns:
-            {'succeeded': int, 'failed': int}
+            {'succeeded': int, 'failed': int, 'errors': [{'inquiry_no', 'error'}]}
         """
-        succeeded = 0
-        failed = 0
+        result = await self._bulk_upsert(
+            self.db.faqs,
+            faqs,
+            key_field='inquiry_no',
+            defaults={'processing_status': 'pending'}
+        )
         
-        for faq in faqs:
-            if await self.store_faq(faq):
-                succeeded += 1
-            else:
-                failed += 1
+        logger.info(f"배치 저장 완료: 성공 {result['succeeded']}, 실패 {result['failed']}")
         
-        logger.info(f"배치 저장 완료: 성공 {succeeded}, 실패 {failed}")
-        
-        return {
-            'succeeded': succeeded,
-            'failed': failed
-        }
+        return result
     
     async def get_faq(self, inquiry_no: int) -> Optional[Dict[str, Any]]:
         """
@@ -302,6 +401,39 @@ class MongoDBService:
             logger.error(f"FAQ 상태 업데이트 실패 ({inquiry_no}): {e}")
             return False
     
+    async def get_customer_history(
+        self,
+        customer_id: str,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        고객의 최근 문의 이력 조회
+        
+        답변 생성 시 고객 컨텍스트(이전 문의/주문)로 사용합니다.
+        
+        Args:
+            customer_id: 고객 ID
+            limit: 최대 개수
+            
+        Returns:
+            최근 문의 리스트 (최신순)
+        """
+        cursor = self.db.faqs.find(
+            {'customer_id': customer_id},
+            {
+                '_id': 0,
+                'inquiry_no': 1,
+                'inquiry_category': 1,
+                'title': 1,
+                'product_name': 1,
+                'order_id': 1,
+                'answered': 1,
+                'inquiry_registration_date_time': 1
+            }
+        ).sort('inquiry_registration_date_time', DESCENDING).limit(limit)
+        
+        return await cursor.to_list(length=limit)
+    
     # ==================== 제품 관련 메서드 ====================
     
     async def store_product(self, product_data: Dict[str, Any]) -> bool:
@@ -321,11 +453,14 @@ class MongoDBService:
             if 'created_at' not in product_data:
                 product_data['created_at'] = now
             
+            self._attach_codes(product_data)
+            
             result = await self.db.products.update_one(
                 {'product_id': product_data['product_id']},
                 {'$set': product_data},
                 upsert=True
             )
+            self._refresh_product_index([product_data])
             
             if result.upserted_id:
                 logger.info(f"새 제품 저장: {product_data['product_id']}")
@@ -341,31 +476,34 @@ class MongoDBService:
     async def store_products_batch(
         self,
         products: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
-        제품 배치 저장
+        제품 배치 저장 (bulk upsert)
         
         Args:
             products: 제품 데이터 리스트
             
         Returns:
-            {'succeeded': int, 'failed': int}
+            {'succeeded': int, 'failed': int, 'errors': [{'product_id', 'error'}]}
         """
-        succeeded = 0
-        failed = 0
-        
         for product in products:
-            if await self.store_product(product):
-                succeeded += 1
-            else:
-                failed += 1
+            self._attach_codes(product)
         
-        logger.info(f"제품 배치 저장 완료: 성공 {succeeded}, 실패 {failed}")
+        result = await self._bulk_upsert(
+            self.db.products,
+            products,
+            key_field='product_id'
+        )
         
-        return {
-            'succeeded': succeeded,
-            'failed': failed
-        }
+        failed = {error['product_id'] for error in result['errors']}
+        self._refresh_product_index(
+            product for product in products
+            if 'product_id' in product and product['product_id'] not in failed
+        )
+        
+        logger.info(f"제품 배치 저장 완료: 성공 {result['succeeded']}, 실패 {result['failed']}")
+        
+        return result
     
     async def get_product(self, product_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -387,7 +525,8 @@ class MongoDBService:
         """
         제품 코드로 제품 검색
         
-        제품명이나 product_id에서 코드를 매칭합니다.
+        코드를 모두 가진 제품 중 제품명이 가장 짧은(가장 기본 모델) 제품을 반환합니다.
+        색인이 로드되어 있으면 메모리에서, 아니면 codes 인덱스 $all 조회로 찾습니다.
         
         Args:
             product_codes: 제품 코드 리스트 (예: ["K10", "PRO MAX"])
@@ -396,14 +535,87 @@ class MongoDBService:
         Returns:
             제품 데이터 또는 None
         """
-        # 코드를 모두 포함하는 정규식 생성
-        # 예: ["K10", "PRO MAX"] → "K10.*PRO MAX"
-        pattern = '.*'.join(product_codes)
+        # 정규화: ["K10", "PRO MAX"] → ["K10", "PROMAX"]
+        codes = normalize_codes(product_codes)
+        if not codes:
+            return None
+        
+        if self.product_index.loaded:
+            return self.product_index.lookup(codes, brand_channel)
         
-        return await self.db.products.find_one({
+        candidates = await self.db.products.find({
             'brand_channel': brand_channel,
-            'product_name': {'$regex': pattern, '$options': 'i'}
-        })
+            'codes': {'$all': codes}
+        }).to_list(length=None)
+        
+        return min(candidates, key=specificity, default=None)
+    
+    async def load_product_index(self) -> int:
+        """
+        제품 코드 메모리 색인 로드
+        
+        codes 필드가 없는 문서(색인 도입 전 임포트)는 제품명/동의어에서 계산해 함께 저장합니다.
+        
+        Returns:
+            색인된 제품 수
+        """
+        products = await self.db.products.find({}).to_list(length=None)
+        
+        backfill = []
+        for product in products:
+            if 'codes' in product or 'product_id' not in product:
+                continue
+            
+            # 제품명이 없는 문서는 코드를 계산할 수 없으므로 건너뜀
+            self._attach_codes(product)
+            if 'codes' in product:
+                backfill.append(UpdateOne(
+                    {'product_id': product['product_id']},
+                    {'$set': {'codes': product['codes']}}
+                ))
+        
+        if backfill:
+            await self.db.products.bulk_write(backfill, ordered=False)
+            logger.info(f"제품 codes 필드 채움: {len(backfill)}개")
+        
+        self.product_index.load(products)
+        logger.info(f"제품 코드 색인 로드 완료: {len(self.product_index)}개")
+        
+        return len(self.product_index)
+    
+    async def watch_product_index(self):
+        """
+        제품 코드 색인 주기적 재로드 (취소될 때까지 실행)
+        
+        메모리 색인은 프로세스마다 따로라 다른 uvicorn 워커나 임포트 스크립트가
+        저장/삭제한 제품은 반영되지 않습니다. product_index_refresh_seconds마다
+        전체를 다시 읽어 색인을 교체합니다. (startup에서 백그라운드 태스크로 실행)
+        """
+        if self.product_index_refresh_seconds <= 0:
+            return
+        
+        while True:
+            await asyncio.sleep(self.product_index_refresh_seconds)
+            try:
+                await self.load_product_index()
+            except Exception as e:
+                logger.warning(f"⚠️ 제품 코드 색인 재로드 실패 (기존 색인 유지): {e}")
+    
+    @staticmethod
+    def _attach_codes(product: Dict[str, Any]):
+        """제품명이 있으면 codes 필드 계산 (동의어는 같은 문서에 있어야 반영, 제품명이 없는 부분 갱신은 건드리지 않음)"""
+        if product.get('product_name'):
+            product['codes'] = product_codes(product['product_name'], product.get('product_name_synonyms'))
+    
+    def _refresh_product_index(self, products):
+        """저장한 제품을 메모리 색인에 반영 (부분 갱신은 기존 항목에 병합)"""
+        if not self.product_index.loaded:
+            return
+        
+        self.product_index.update(
+            {**(self.product_index.get(str(product['product_id'])) or {}), **product}
+            for product in products
+        )
     
     async def search_products(
         self,
@@ -567,12 +779,19 @@ def get_mongodb_service() -> MongoDBService:
     return _mongodb_service
 
 
-def init_mongodb_service(connection_string: str, database_name: str):
+def init_mongodb_service(
+    connection_string: str,
+    database_name: str,
+    bulk_chunk_size: int = 500,
+    product_index_refresh_seconds: float = 300.0
+):
     """
     MongoDB Service 초기화
     
     main.py에서 앱 시작 시 호출합니다.
     """
     global _mongodb_service
-    _mongodb_service = MongoDBService(connection_string, database_name)
+    _mongodb_service = MongoDBService(
+        connection_string, database_name, bulk_chunk_size, product_index_refresh_seconds
+    )
     return _mongodb_service
@@ -7,6 +7,15 @@
 
 2025-10-02 09:15, Claude 작성
 2025-10-02 16:00, Claude 업데이트 (hybrid_search 파라미터 수정)
+2026-10-17 09:10, Claude 업데이트 (공유 EmbeddingEngine 사용)
+2026-10-17 09:40, Claude 업데이트 (analyze 임베딩 마이크로 배칭)
+2026-10-17 15:10, Claude 업데이트 (hybrid_search에 계산된 임베딩 전달)
+2026-10-17 18:50, Claude 업데이트 (spaCy 지연 임포트)
+2026-10-17 19:20, Claude 업데이트 (키워드 사전 단일 스캔 매칭)
+2026-10-17 19:50, Claude 업데이트 (analyze_many 일괄 분석, spaCy 미사용 컴포넌트 제외)
+2026-10-17 20:50, Claude 업데이트 (단계별 분석 analyze_tiered: 규칙 → spaCy → 임베딩/검색, 애매할 때만 승격)
+2026-10-17 21:20, Claude 업데이트 (제품 코드 패턴을 제품 codes 색인과 공유)
+2026-10-17 23:50, Claude 업데이트 (제품 코드만 없으면 spaCy 단계 생략, 계산된 임베딩 재사용)
 
 고객 문의를 분석하여:
 1. 키워드 추출 (spaCy)
@@ -15,18 +24,25 @@
 4. 임베딩 생성 (Sentence-BERT)
 5. 유사 FAQ 검색 (Weaviate)
 6. 복잡도 판단
+
+분석 단계 (analyze_tiered, 애매할 때만 다음 단계로):
+- rules: 정규식 + 키워드 사전 (1ms 미만, 대부분의 배송/반품 문의는 여기서 끝)
+- spacy: + spaCy 키워드로 카테고리 재채점 (제품 코드만 없는 경우는 건너뜀)
+- full: + 임베딩 + 유사 FAQ 검색 (카테고리 투표) + 신뢰도
 """
 
 import re
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
-import spacy
-from sentence_transformers import SentenceTransformer
-import torch
-
 from .weaviate_service import WeaviateService
+from .embedding_engine import EmbeddingEngine, get_embedding_engine, DEFAULT_MODEL_NAME
+from .embedding_batcher import get_embedding_batcher
+from ..utils.keyword_matcher import get_keyword_matcher
+from ..utils.ml_loader import load_spacy, spacy_exclude
+from ..utils.product_codes import PRODUCT_CODE_PATTERNS
 
 
 # ==================== 로깅 설정 ====================
@@ -34,6 +50,19 @@ from .weaviate_service import WeaviateService
 logger = logging.getLogger(__name__)
 
 
+# ==================== 분석 단계 ====================
+
+TIER_RULES = 'rules'    # 정규식 + 키워드 사전
+TIER_SPACY = 'spacy'    # + spaCy 키워드
+TIER_FULL = 'full'      # + 임베딩 + 유사 FAQ 검색 + 신뢰도
+TIERS = (TIER_RULES, TIER_SPACY, TIER_FULL)
+
+# 다음 단계로 올리는 사유
+AMBIGUOUS_CATEGORY_TIE = "카테고리 동점"
+AMBIGUOUS_NO_CATEGORY = "카테고리 키워드 없음"
+AMBIGUOUS_NO_PRODUCT_CODE = "제품 코드 없음"
+
+
 # ==================== 데이터 클래스 ====================
 
 @dataclass
@@ -51,6 +80,8 @@ class AnalysisResult:
         confidence: 답변 가능 신뢰도 (0.0 ~ 1.0)
         should_defer: 사람에게 전가 여부
         defer_reason: 전가 사유
+        tier: 결과를 만든 분석 단계 (rules/spacy/full, 신뢰도/전가 판단은 full에서만)
+        escalation_reason: 마지막 단계로 올라온 사유 (rules에서 끝났으면 None)
     """
     keywords: List[str] = field(default_factory=list)
     product_codes: List[str] = field(default_factory=list)
@@ -61,6 +92,8 @@ class AnalysisResult:
     confidence: float = 0.0
     should_defer: bool = False
     defer_reason: Optional[str] = None
+    tier: str = TIER_FULL
+    escalation_reason: Optional[str] = None
 
 
 # ==================== 질문 분석기 ====================
@@ -83,18 +116,11 @@ class QuestionAnalyzer:
         '기타': ['문의', '질문', '궁금']
     }
     
-    # 제품 코드 패턴 (정규식)
-    PRODUCT_CODE_PATTERNS = [
-        r'K\d{1,2}',  # K10, K8, K5 등
-        r'Q\d{1,2}',  # Q10, Q13 등
-        r'V\d{1,2}',  # V10, V6 등
-        r'B\d{1,2}',  # B6, B1 등
-        r'C\d{1,2}',  # C2 등
-        r'M\d{1,2}',  # M6 (마우스)
-        r'PRO\s*MAX',
-        r'PRO\s*SE\d?',
-        r'ZMK',
-    ]
+    # 제품 코드가 있어야 답할 수 있는 카테고리 (코드가 없으면 애매함)
+    PRODUCT_CATEGORIES = ('상품', '교환')
+    
+    # 제품 코드 패턴 (정규식, 제품 codes 색인과 같은 패턴)
+    PRODUCT_CODE_PATTERNS = PRODUCT_CODE_PATTERNS
     
     # 복잡도 판단 키워드
     HIGH_COMPLEXITY_KEYWORDS = [
@@ -108,33 +134,48 @@ class QuestionAnalyzer:
     def __init__(
         self,
         spacy_model: str = "ko_core_news_sm",
-        sbert_model: str = "jhgan/ko-sroberta-multitask",
-        weaviate_service: Optional[WeaviateService] = None
+        sbert_model: str = DEFAULT_MODEL_NAME,
+        weaviate_service: Optional[WeaviateService] = None,
+        embedding_engine: Optional[EmbeddingEngine] = None,
+        pos_tagging: bool = True
     ):
         """
         초기화
         
         Args:
             spacy_model: spaCy 한국어 모델 이름
-            sbert_model: Sentence-BERT 모델 이름
+            sbert_model: Sentence-BERT 모델 이름 (embedding_engine이 없을 때 사용)
             weaviate_service: WeaviateService 인스턴스
+            embedding_engine: 공유 임베딩 엔진 (없으면 Weaviate 서비스의 엔진 또는 공유 인스턴스 사용)
+            pos_tagging: False면 토크나이저만 실행 (품사 없이 어절 기반 키워드, 더 빠름)
         """
         logger.info("🤖 QuestionAnalyzer 초기화 중...")
         
-        # spaCy 모델 로드
+        # spaCy 모델 로드 (품사 태깅에 필요한 컴포넌트만)
         logger.info(f"  📚 spaCy 모델 로딩: {spacy_model}")
+        self.pos_tagging = pos_tagging
         try:
-            self.nlp = spacy.load(spacy_model)
+            self.nlp = load_spacy(spacy_model, spacy_exclude(pos_tagging))
         except OSError:
             logger.error(f"  ❌ spaCy 모델이 설치되지 않았습니다: {spacy_model}")
             logger.info(f"  💡 설치 명령: python -m spacy download {spacy_model}")
             raise
         
-        # Sentence-BERT 모델 로드
-        logger.info(f"  🧠 Sentence-BERT 모델 로딩: {sbert_model}")
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"     디바이스: {device}")
-        self.sbert = SentenceTransformer(sbert_model, device=device)
+        # Sentence-BERT 모델 (Weaviate 서비스와 같은 인스턴스 공유)
+        if embedding_engine is None:
+            if weaviate_service and weaviate_service.embedding_engine.model_name == sbert_model:
+                embedding_engine = weaviate_service.embedding_engine
+            else:
+                embedding_engine = get_embedding_engine(sbert_model)
+        self.embedding_engine = embedding_engine
+        
+        # 동시 analyze() 호출의 임베딩을 hybrid_search와 같은 배치로 묶음
+        self.embedding_batcher = get_embedding_batcher(embedding_engine)
+        
+        # 카테고리/복잡도 키워드 사전을 한 번에 찾는 매처
+        self.keyword_matcher = get_keyword_matcher(
+            [kw for kws in self.CATEGORY_KEYWORDS.values() for kw in kws] + self.HIGH_COMPLEXITY_KEYWORDS
+        )
         
         # Weaviate 서비스
         self.weaviate = weaviate_service
@@ -154,12 +195,42 @@ class QuestionAnalyzer:
         Returns:
             키워드 리스트
         """
-        doc = self.nlp(text)
+        return self._keywords_from_doc(self.nlp(text), top_k)
+    
+    def extract_keywords_many(
+        self,
+        texts: List[str],
+        top_k: int = 10,
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[List[str]]:
+        """
+        여러 텍스트의 키워드 일괄 추출 (nlp.pipe)
         
+        Args:
+            texts: 분석할 텍스트 리스트
+            top_k: 텍스트별 키워드 수
+            batch_size: spaCy 배치 크기
+            n_process: spaCy 프로세스 수 (1이면 현재 프로세스)
+        
+        Returns:
+            텍스트별 키워드 리스트 (입력 순서 유지)
+        """
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._keywords_from_doc(doc, top_k) for doc in docs]
+    
+    def _keywords_from_doc(self, doc, top_k: int) -> List[str]:
+        """spaCy Doc에서 키워드 추출 (빈도순 상위 top_k개)"""
         # 품사 필터링: 명사(NOUN), 고유명사(PROPN), 동사(VERB)
+        # 토크나이저 전용 모드: 품사가 없으므로 불용어/구두점/숫자가 아닌 어절 사용
         keywords = []
         for token in doc:
-            if token.pos_ in ['NOUN', 'PROPN', 'VERB'] and len(token.text) > 1:
+            if len(token.text) <= 1:
+                continue
+            if self.pos_tagging:
+                if token.pos_ in ['NOUN', 'PROPN', 'VERB']:
+                    keywords.append(token.text)
+            elif not (token.is_stop or token.is_punct or token.like_num):
                 keywords.append(token.text)
         
         # 중복 제거 및 빈도 계산
@@ -196,7 +267,20 @@ class QuestionAnalyzer:
         # 중복 제거
         return list(set(codes))
     
-    def classify_category(self, text: str, keywords: List[str]) -> str:
+    def match_keywords(self, text: str) -> Set[str]:
+        """
+        텍스트에 포함된 사전 키워드 (카테고리 + 복잡도, 한 번의 스캔)
+        
+        analyze()는 한 번 구해서 classify_category/calculate_complexity에 함께 넘깁니다.
+        """
+        return self.keyword_matcher.find(text)
+    
+    def classify_category(
+        self,
+        text: str,
+        keywords: List[str],
+        matched: Optional[Set[str]] = None
+    ) -> str:
         """
         카테고리 분류
         
@@ -205,11 +289,32 @@ class QuestionAnalyzer:
         Args:
             text: 분석할 텍스트
             keywords: 추출된 키워드
+            matched: match_keywords(text) 결과 (없으면 새로 계산)
         
         Returns:
             카테고리 (배송/반품/교환/상품/환불/기타)
         """
-        text_lower = text.lower()
+        return self._top_category(self.category_scores(text, keywords, matched))
+    
+    def category_scores(
+        self,
+        text: str,
+        keywords: List[str],
+        matched: Optional[Set[str]] = None
+    ) -> Dict[str, int]:
+        """
+        카테고리별 키워드 점수 (텍스트에서 발견 +2, 추출 키워드에 포함 +1)
+        
+        Args:
+            text: 분석할 텍스트
+            keywords: 추출된 키워드
+            matched: match_keywords(text) 결과 (없으면 새로 계산)
+        
+        Returns:
+            {카테고리: 점수}
+        """
+        if matched is None:
+            matched = self.match_keywords(text)
         keywords_lower = [k.lower() for k in keywords]
         
         # 각 카테고리별 점수 계산
@@ -218,7 +323,7 @@ class QuestionAnalyzer:
             score = 0
             for keyword in category_keywords:
                 # 텍스트에서 직접 발견
-                if keyword in text_lower:
+                if keyword in matched:
                     score += 2
                 
                 # 추출된 키워드에 포함
@@ -227,13 +332,60 @@ class QuestionAnalyzer:
             
             scores[category] = score
         
-        # 가장 높은 점수의 카테고리 반환
+        return scores
+    
+    @staticmethod
+    def _top_category(scores: Dict[str, int]) -> str:
+        """가장 높은 점수의 카테고리 (모두 0이면 기타)"""
         if max(scores.values()) > 0:
             return max(scores, key=scores.get)
         else:
             return "기타"
     
-    def calculate_complexity(self, text: str, keywords: List[str]) -> float:
+    @staticmethod
+    def _tied_categories(scores: Dict[str, int]) -> List[str]:
+        """최고 점수 카테고리들 (기타는 대체 분류라 제외, 모두 0이면 빈 리스트)"""
+        top = max(scores.values())
+        if top == 0:
+            return []
+        return [category for category, score in scores.items() if score == top and category != '기타']
+    
+    def find_ambiguity(
+        self,
+        result: AnalysisResult,
+        scores: Optional[Dict[str, int]] = None
+    ) -> Optional[str]:
+        """
+        결과가 애매한지 판단 (다음 단계로 올릴 사유)
+        
+        - 카테고리를 직접 분류했는데(scores) 최고 점수가 동점이거나 키워드가 없음
+        - 제품 문의(상품/교환)인데 제품 코드가 없음
+        
+        Args:
+            result: 분석 결과
+            scores: category_scores() 결과 (카테고리가 주어졌으면 None)
+        
+        Returns:
+            사유 (명확하면 None)
+        """
+        if scores is not None:
+            tied = self._tied_categories(scores)
+            if not tied:
+                return AMBIGUOUS_NO_CATEGORY
+            if len(tied) > 1:
+                return AMBIGUOUS_CATEGORY_TIE
+        
+        if result.category in self.PRODUCT_CATEGORIES and not result.product_codes:
+            return AMBIGUOUS_NO_PRODUCT_CODE
+        
+        return None
+    
+    def calculate_complexity(
+        self,
+        text: str,
+        keywords: List[str],
+        matched: Optional[Set[str]] = None
+    ) -> float:
         """
         복잡도 점수 계산
         
@@ -245,18 +397,20 @@ class QuestionAnalyzer:
         Args:
             text: 분석할 텍스트
             keywords: 추출된 키워드
+            matched: match_keywords(text) 결과 (없으면 새로 계산)
         
         Returns:
             복잡도 점수 (0.0 ~ 1.0)
         """
         score = 0.0
         
-        text_lower = text.lower()
+        if matched is None:
+            matched = self.match_keywords(text)
         
         # 1. 고복잡도 키워드 체크 (가중치: 0.5)
         complexity_keyword_count = 0
         for keyword in self.HIGH_COMPLEXITY_KEYWORDS:
-            if keyword in text_lower:
+            if keyword in matched:
                 complexity_keyword_count += 1
         
         if complexity_keyword_count > 0:
@@ -287,12 +441,21 @@ class QuestionAnalyzer:
         Returns:
             768차원 임베딩 벡터
         """
-        embedding = self.sbert.encode(
-            text,
-            convert_to_tensor=False,
-            normalize_embeddings=True
-        )
-        return embedding.tolist()
+        return self.embedding_engine.encode(text)
+    
+    async def agenerate_embedding(self, text: str) -> List[float]:
+        """
+        텍스트 임베딩 생성 (비동기, 마이크로 배칭)
+        
+        동시에 들어온 다른 요청과 함께 한 번의 배치 encode로 처리됩니다.
+        
+        Args:
+            text: 분석할 텍스트
+        
+        Returns:
+            768차원 임베딩 벡터
+        """
+        return await self.embedding_batcher.embed(text)
     
     def calculate_confidence(
         self,
@@ -375,58 +538,30 @@ class QuestionAnalyzer:
         """
         logger.info(f"📝 질문 분석 시작: '{inquiry_content[:50]}...'")
         
-        result = AnalysisResult()
-        
         # 전체 텍스트 (제목 + 내용)
-        full_text = f"{title or ''} {inquiry_content} {product_name or ''}".strip()
+        full_text = self._full_text(inquiry_content, title, product_name)
         
         # 1. 키워드 추출
         logger.info("  🔍 키워드 추출 중...")
-        result.keywords = self.extract_keywords(full_text)
-        logger.info(f"     키워드: {result.keywords[:5]}")
+        keywords = self.extract_keywords(full_text)
+        logger.info(f"     키워드: {keywords[:5]}")
         
-        # 2. 제품 코드 인식
-        logger.info("  🏷️  제품 코드 인식 중...")
-        result.product_codes = self.extract_product_codes(full_text)
+        # 2~4. 제품 코드 인식, 카테고리 분류, 복잡도 계산
+        result = self._analyze_rules(full_text, keywords, category)
         if result.product_codes:
             logger.info(f"     제품 코드: {result.product_codes}")
-        
-        # 3. 카테고리 분류
-        if category:
-            result.category = category
-        else:
-            logger.info("  📂 카테고리 분류 중...")
-            result.category = self.classify_category(full_text, result.keywords)
-            logger.info(f"     카테고리: {result.category}")
-        
-        # 4. 복잡도 계산
-        logger.info("  🧮 복잡도 계산 중...")
-        result.complexity_score = self.calculate_complexity(full_text, result.keywords)
+        logger.info(f"     카테고리: {result.category}")
         logger.info(f"     복잡도: {result.complexity_score:.2f}")
         
         # 5. 임베딩 생성
         logger.info("  🧠 임베딩 생성 중...")
-        result.embedding = self.generate_embedding(inquiry_content)
+        result.embedding = await self.agenerate_embedding(inquiry_content)
         logger.info(f"     임베딩: 768차원 벡터")
         
         # 6. 유사 FAQ 검색 (Weaviate)
         if self.weaviate:
             logger.info("  🔎 유사 FAQ 검색 중...")
-            
-            # 하이브리드 검색 (벡터 + 키워드)
-            result.similar_faqs = await self.weaviate.hybrid_search(
-                query_text=inquiry_content,
-                keywords=result.keywords[:5],  # 상위 5개 키워드
-                brand_channel=brand_channel,
-                category=result.category if result.category != "기타" else None,
-                limit=5
-            )
-            
-            # 최소 점수 필터링 (0.5 이상만)
-            result.similar_faqs = [
-                faq for faq in result.similar_faqs 
-                if faq.get('score', 0) >= 0.5
-            ]
+            result.similar_faqs = await self._search_similar_faqs(result, inquiry_content, brand_channel)
             
             logger.info(f"     유사 FAQ: {len(result.similar_faqs)}개 발견")
             
@@ -447,6 +582,239 @@ class QuestionAnalyzer:
         logger.info("  ✅ 분석 완료!\n")
         
         return result
+    
+    async def analyze_tiered(
+        self,
+        inquiry_content: str,
+        brand_channel: str,
+        title: Optional[str] = None,
+        category: Optional[str] = None,
+        product_name: Optional[str] = None,
+        max_tier: str = TIER_FULL,
+        embedding: Optional[List[float]] = None
+    ) -> AnalysisResult:
+        """
+        단계별 질문 분석 (싼 단계부터, 결과가 애매할 때만 다음 단계로)
+        
+        1. rules: 정규식 제품 코드 + 키워드 사전 카테고리/복잡도 (1ms 미만)
+        2. spacy: spaCy 키워드를 더해 카테고리 재채점
+           (카테고리는 명확하고 제품 코드만 없으면 spaCy로는 코드를 찾을 수 없으므로 건너뜀)
+        3. full: 임베딩 + 유사 FAQ 검색 + 신뢰도 평가
+           (카테고리가 애매하면 카테고리 필터 없이 검색하고 유사 FAQ 카테고리 투표로 결정)
+        
+        애매함의 기준은 find_ambiguity() 참고. 단순 배송/반품 문의는 rules에서 끝나
+        spaCy/임베딩/검색 비용을 내지 않습니다. 신뢰도/전가 판단은 full에서만 채워집니다.
+        
+        Args:
+            inquiry_content: 문의 내용
+            brand_channel: 브랜드 채널
+            title: 문의 제목 (선택)
+            category: 문의 카테고리 (선택, 있으면 재분류하지 않음)
+            product_name: 제품명 (선택)
+            max_tier: 최대 분석 단계 (rules/spacy/full)
+            embedding: 미리 계산된 문의 임베딩 (full 단계에서 재사용, 선택)
+        
+        Returns:
+            AnalysisResult 객체 (tier: 결과를 만든 단계)
+        """
+        if max_tier not in TIERS:
+            raise ValueError(f"알 수 없는 분석 단계입니다: {max_tier}")
+        max_level = TIERS.index(max_tier)
+        
+        full_text = self._full_text(inquiry_content, title, product_name)
+        
+        # 1. 규칙 (키워드는 발견된 사전 키워드)
+        result, scores = self._rules_with_scores(full_text, None, category)
+        result.tier = TIER_RULES
+        reason = self.find_ambiguity(result, scores)
+        
+        # 2. spaCy 키워드로 재채점 (이벤트 루프를 막지 않도록 스레드에서)
+        #    제품 코드는 정규식으로만 찾으므로 코드만 없는 경우는 바로 full로
+        if reason and reason != AMBIGUOUS_NO_PRODUCT_CODE and max_level >= TIERS.index(TIER_SPACY):
+            keywords = await asyncio.to_thread(self.extract_keywords, full_text)
+            result, scores = self._rules_with_scores(full_text, keywords, category)
+            result.tier = TIER_SPACY
+            result.escalation_reason = reason
+            reason = self.find_ambiguity(result, scores)
+        
+        # 3. 임베딩 + 유사 FAQ 검색 + 신뢰도
+        if reason and max_level >= TIERS.index(TIER_FULL):
+            result.tier = TIER_FULL
+            result.escalation_reason = reason
+            category_unclear = reason in (AMBIGUOUS_CATEGORY_TIE, AMBIGUOUS_NO_CATEGORY)
+            
+            result.embedding = embedding or await self.agenerate_embedding(inquiry_content)
+            
+            if self.weaviate:
+                result.similar_faqs = await self._search_similar_faqs(
+                    result, inquiry_content, brand_channel, filter_category=not category_unclear
+                )
+                if category_unclear:
+                    result.category = self._vote_category(
+                        result.similar_faqs, self._tied_categories(scores)
+                    ) or result.category
+            
+            result.confidence, result.should_defer, result.defer_reason = \
+                self.calculate_confidence(result.similar_faqs, result.complexity_score)
+        
+        logger.debug(
+            f"단계별 분석: {result.tier} (사유: {result.escalation_reason}), 카테고리 {result.category}"
+        )
+        
+        return result
+    
+    async def analyze_many(
+        self,
+        inquiries: List[Dict[str, Any]],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[AnalysisResult]:
+        """
+        여러 문의 일괄 분석 (과거 문의 재분석, 배치 처리용)
+        
+        analyze()와 같은 결과를 단계별로 묶어서 처리합니다.
+        - 키워드: nlp.pipe로 한 번에 (batch_size, n_process)
+        - 임베딩: 한 번의 배치 encode
+        - 유사 FAQ 검색: 동시 실행 (Weaviate 스레드 풀 크기가 상한)
+        
+        Args:
+            inquiries: analyze() 인자 딕셔너리 리스트
+                (inquiry_content, brand_channel 필수 / title, category, product_name 선택)
+            batch_size: spaCy 배치 크기
+            n_process: spaCy 프로세스 수 (1이면 현재 프로세스)
+        
+        Returns:
+            AnalysisResult 리스트 (입력 순서 유지)
+        """
+        if not inquiries:
+            return []
+        
+        logger.info(f"📝 질문 일괄 분석 시작: {len(inquiries)}건")
+        
+        full_texts = [
+            self._full_text(inquiry['inquiry_content'], inquiry.get('title'), inquiry.get('product_name'))
+            for inquiry in inquiries
+        ]
+        
+        # 1. 키워드 (spaCy 배치, 이벤트 루프를 막지 않도록 스레드에서)
+        keywords_list = await asyncio.to_thread(
+            self.extract_keywords_many, full_texts, 10, batch_size, n_process
+        )
+        
+        # 2~4. 제품 코드, 카테고리, 복잡도
+        results = [
+            self._analyze_rules(full_text, keywords, inquiry.get('category'))
+            for inquiry, full_text, keywords in zip(inquiries, full_texts, keywords_list)
+        ]
+        
+        # 5. 임베딩 (한 번의 배치 encode)
+        embeddings = await self.embedding_engine.aencode(
+            [inquiry['inquiry_content'] for inquiry in inquiries]
+        )
+        for result, embedding in zip(results, embeddings):
+            result.embedding = embedding
+        
+        # 6. 유사 FAQ 검색 (동시)
+        if self.weaviate:
+            similar = await asyncio.gather(*[
+                self._search_similar_faqs(result, inquiry['inquiry_content'], inquiry['brand_channel'])
+                for result, inquiry in zip(results, inquiries)
+            ])
+            for result, faqs in zip(results, similar):
+                result.similar_faqs = faqs
+        
+        # 7. 신뢰도 평가
+        for result in results:
+            result.confidence, result.should_defer, result.defer_reason = \
+                self.calculate_confidence(result.similar_faqs, result.complexity_score)
+        
+        logger.info(f"  ✅ 일괄 분석 완료: {len(results)}건")
+        
+        return results
+    
+    @staticmethod
+    def _full_text(inquiry_content: str, title: Optional[str], product_name: Optional[str]) -> str:
+        """분석 대상 전체 텍스트 (제목 + 내용 + 제품명)"""
+        return f"{title or ''} {inquiry_content} {product_name or ''}".strip()
+    
+    def _analyze_rules(
+        self,
+        full_text: str,
+        keywords: List[str],
+        category: Optional[str] = None
+    ) -> AnalysisResult:
+        """
+        규칙 기반 분석 (제품 코드, 카테고리, 복잡도)
+        
+        사전 키워드 매칭은 한 번만 하고 카테고리 분류와 복잡도 계산에 함께 사용합니다.
+        category가 주어지면 재분류하지 않습니다.
+        """
+        return self._rules_with_scores(full_text, keywords, category)[0]
+    
+    def _rules_with_scores(
+        self,
+        full_text: str,
+        keywords: Optional[List[str]],
+        category: Optional[str] = None
+    ) -> Tuple[AnalysisResult, Optional[Dict[str, int]]]:
+        """
+        규칙 기반 분석 + 카테고리 점수 (카테고리가 주어졌으면 점수는 None)
+        
+        keywords가 None이면(rules 단계) 발견된 사전 키워드를 결과 키워드로 쓰고
+        카테고리 점수는 텍스트 매칭만으로 계산합니다.
+        """
+        matched = self.match_keywords(full_text)
+        result_keywords = sorted(matched) if keywords is None else keywords
+        keywords = keywords or []
+        
+        scores = None if category else self.category_scores(full_text, keywords, matched)
+        
+        result = AnalysisResult(
+            keywords=result_keywords,
+            product_codes=self.extract_product_codes(full_text),
+            category=category or self._top_category(scores),
+            complexity_score=self.calculate_complexity(full_text, keywords, matched)
+        )
+        return result, scores
+    
+    @staticmethod
+    def _vote_category(similar_faqs: List[Dict[str, Any]], candidates: List[str]) -> Optional[str]:
+        """
+        유사 FAQ 카테고리 투표 (점수 합계, candidates가 있으면 그 안에서만)
+        
+        Returns:
+            가장 많이 득표한 카테고리 (표가 없으면 None)
+        """
+        votes: Dict[str, float] = {}
+        for faq in similar_faqs:
+            faq_category = faq.get('inquiry_category')
+            if faq_category and (not candidates or faq_category in candidates):
+                votes[faq_category] = votes.get(faq_category, 0.0) + faq.get('score', 0)
+        
+        return max(votes, key=votes.get) if votes else None
+    
+    async def _search_similar_faqs(
+        self,
+        result: AnalysisResult,
+        inquiry_content: str,
+        brand_channel: str,
+        filter_category: bool = True
+    ) -> List[Dict[str, Any]]:
+        """유사 FAQ 하이브리드 검색 (벡터 + 키워드), 점수 0.5 이상만"""
+        similar_faqs = await self.weaviate.hybrid_search(
+            query_text=inquiry_content,
+            keywords=result.keywords[:5],  # 상위 5개 키워드
+            brand_channel=brand_channel,
+            category=result.category if filter_category and result.category != "기타" else None,
+            limit=5,
+            query_vector=result.embedding
+        )
+        
+        # 최소 점수 필터링 (0.5 이상만)
+        return [
+            faq for faq in similar_faqs
+            if faq.get('score', 0) >= 0.5
+        ]
 
 
 # ==================== 유틸리티 함수 ====================
@@ -1,6 +1,16 @@
 # backend/app/services/weaviate_service.py
 # 2025-10-02 17:45, Claude 작성
 # 2025-10-02 15:50, Claude 업데이트 (Weaviate v4 API 수정 - data_type 필드명 변경)
+# 2026-10-17 09:10, Claude 업데이트 (공유 EmbeddingEngine 사용)
+# 2026-10-17 09:40, Claude 업데이트 (쿼리 임베딩 마이크로 배칭)
+# 2026-10-17 10:40, Claude 업데이트 (동기 클라이언트 호출을 스레드 풀에서 실행)
+# 2026-10-17 11:10, Claude 업데이트 (add_faqs_batch 벌크 모드, 결정적 UUID)
+# 2026-10-17 14:10, Claude 업데이트 (delete_faqs 일괄 삭제)
+# 2026-10-17 15:10, Claude 업데이트 (검색 시 미리 계산된 쿼리 벡터 사용)
+# 2026-10-17 17:40, Claude 업데이트 (헬스체크용 is_ready)
+# 2026-10-17 23:10, Claude 업데이트 (FAQ 스키마/임베딩 텍스트/UUID를 모든 쓰기 경로가 공유)
+# 2026-10-17 23:30, Claude 업데이트 (faq_vector_state용 내용 해시 faq_content_hash)
+# 2026-10-18 01:00, Claude 업데이트 (벌크 저장 임베딩 배치 크기를 전송 배치 크기와 분리)
 
 """
 Weaviate 서비스
@@ -15,19 +25,80 @@ FAQ 벡터 검색을 위한 Weaviate 서비스입니다.
 
 컬렉션:
 - FAQs: FAQ 벡터 데이터
+  스키마(FAQ_PROPERTIES), 임베딩 텍스트(faq_text), 속성(faq_properties), UUID(faq_uuid),
+  내용 해시(faq_content_hash)는 앱, FAQ 인덱서, scripts/import_to_weaviate.py,
+  scripts/setup_weaviate.py가 모두 이 모듈 것을 사용합니다.
+
+동시성:
+- weaviate v4 동기 클라이언트 호출은 크기가 제한된 스레드 풀에서 실행
+- 임베딩은 EmbeddingEngine의 스레드 풀에서 실행
+→ async 메서드가 이벤트 루프를 막지 않음
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Dict, Any
 import weaviate
 from weaviate.classes.init import Auth
 from weaviate.classes.config import Property, DataType
-from weaviate.classes.query import MetadataQuery
-from sentence_transformers import SentenceTransformer
+from weaviate.classes.query import MetadataQuery, Filter
+from weaviate.util import generate_uuid5
 import logging
 
+from .embedding_engine import EmbeddingEngine, get_embedding_engine, DEFAULT_MODEL_NAME
+from .embedding_batcher import EmbeddingBatcher, get_embedding_batcher
+
 logger = logging.getLogger(__name__)
 
 
+# FAQ 컬렉션 속성 (검색 결과 변환이 읽는 필드와 같아야 함)
+FAQ_PROPERTIES = [
+    Property(
+        name="inquiry_no",
+        data_type=DataType.INT,
+        description="문의 번호"
+    ),
+    Property(
+        name="brand_channel",
+        data_type=DataType.TEXT,
+        description="브랜드 채널"
+    ),
+    Property(
+        name="inquiry_category",
+        data_type=DataType.TEXT,
+        description="문의 카테고리"
+    ),
+    Property(
+        name="title",
+        data_type=DataType.TEXT,
+        description="문의 제목"
+    ),
+    Property(
+        name="inquiry_content",
+        data_type=DataType.TEXT,
+        description="문의 내용"
+    ),
+    Property(
+        name="answer_content",
+        data_type=DataType.TEXT,
+        description="답변 내용"
+    ),
+    Property(
+        name="product_name",
+        data_type=DataType.TEXT,
+        description="제품명"
+    ),
+    Property(
+        name="product_codes",
+        data_type=DataType.TEXT_ARRAY,
+        description="제품 코드 리스트"
+    )
+]
+
+
 class WeaviateService:
     """
     Weaviate 서비스 클래스
@@ -47,25 +118,40 @@ class WeaviateService:
     def __init__(
         self,
         weaviate_url: str,
-        model_name: str = 'jhgan/ko-sroberta-multitask',
-        api_key: Optional[str] = None
+        model_name: str = DEFAULT_MODEL_NAME,
+        api_key: Optional[str] = None,
+        embedding_engine: Optional[EmbeddingEngine] = None,
+        embedding_batcher: Optional[EmbeddingBatcher] = None,
+        max_concurrency: int = 8,
+        encode_batch_size: int = 32
     ):
         """
         Weaviate Service 초기화
         
         Args:
             weaviate_url: Weaviate 서버 URL
-            model_name: Sentence-BERT 모델명
+            model_name: Sentence-BERT 모델명 (embedding_engine이 없을 때 사용)
             api_key: Weaviate API 키 (클라우드 사용 시)
+            embedding_engine: 공유 임베딩 엔진 (없으면 프로세스 공유 인스턴스 사용)
+            embedding_batcher: 임베딩 마이크로 배처 (없으면 엔진 공유 배처 사용)
+            max_concurrency: Weaviate 호출용 스레드 풀 크기 (동시 요청 상한)
+            encode_batch_size: 벌크 저장 시 임베딩 모델에 한 번에 넣을 문장 수
+                (Weaviate 전송 배치 크기와 별개, 모델/장비 메모리에 맞춤)
         """
         self.weaviate_url = weaviate_url
         self.api_key = api_key
         self.client: Optional[weaviate.WeaviateClient] = None
         
-        # Sentence-BERT 모델 로드
-        logger.info(f"Sentence-BERT 모델 로드 중: {model_name}")
-        self.model = SentenceTransformer(model_name)
-        logger.info("✅ Sentence-BERT 모델 로드 완료")
+        # 동기 클라이언트 호출용 스레드 풀 (첫 호출 시 생성)
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Sentence-BERT 모델 (프로세스당 한 번만 로드)
+        self.embedding_engine = embedding_engine or get_embedding_engine(model_name)
+        self.encode_batch_size = encode_batch_size
+        
+        # 동시 요청의 단건 임베딩을 배치로 묶는 배처
+        self.embedding_batcher = embedding_batcher or get_embedding_batcher(self.embedding_engine)
     
     async def connect(self):
         """
@@ -79,19 +165,21 @@ class WeaviateService:
             # 연결 설정
             if self.api_key:
                 # 클라우드 인증
-                self.client = weaviate.connect_to_wcs(
+                self.client = await self._run(
+                    weaviate.connect_to_wcs,
                     cluster_url=self.weaviate_url,
                     auth_credentials=Auth.api_key(self.api_key)
                 )
             else:
                 # 로컬 연결
-                self.client = weaviate.connect_to_local(
+                self.client = await self._run(
+                    weaviate.connect_to_local,
                     host=self.weaviate_url.replace('http://', '').replace('https://', '').split(':')[0],
                     port=int(self.weaviate_url.split(':')[-1]) if ':' in self.weaviate_url else 8080
                 )
             
             # 연결 확인
-            if not self.client.is_ready():
+            if not await self._run(self.client.is_ready):
                 raise ConnectionError("Weaviate 서버에 연결할 수 없습니다")
             
             # 스키마 확인 및 생성
@@ -103,11 +191,59 @@ class WeaviateService:
             logger.error(f"❌ Weaviate 연결 실패: {e}")
             raise
     
+    async def is_ready(self) -> bool:
+        """Weaviate 준비 상태 확인 (헬스체크용, 연결 전이면 False)"""
+        if self.client is None:
+            return False
+        return await self._run(self.client.is_ready)
+    
     async def disconnect(self):
         """Weaviate 연결 종료"""
         if self.client:
-            self.client.close()
+            await self._run(self.client.close)
             logger.info("Weaviate 연결 종료")
+        
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        동기 클라이언트 호출을 스레드 풀에서 실행
+        
+        풀 크기(max_concurrency)가 동시에 진행되는 Weaviate 호출 수의 상한이 됩니다.
+        
+        Args:
+            func: 호출할 동기 함수
+            *args, **kwargs: 함수 인자
+            
+        Returns:
+            함수 반환값
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="weaviate"
+            )
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
+    @staticmethod
+    def _build_filters(
+        brand_channel: Optional[str] = None,
+        category: Optional[str] = None
+    ):
+        """브랜드/카테고리 필터 생성 (조건이 없으면 None)"""
+        filters = None
+        if brand_channel and category:
+            filters = Filter.by_property("brand_channel").equal(brand_channel) & \
+                      Filter.by_property("inquiry_category").equal(category)
+        elif brand_channel:
+            filters = Filter.by_property("brand_channel").equal(brand_channel)
+        elif category:
+            filters = Filter.by_property("inquiry_category").equal(category)
+        return filters
     
     async def _ensure_schema(self):
         """
@@ -117,55 +253,15 @@ class WeaviateService:
         """
         try:
             # 컬렉션 존재 확인
-            if not self.client.collections.exists(self.FAQ_COLLECTION):
+            if not await self._run(self.client.collections.exists, self.FAQ_COLLECTION):
                 logger.info(f"'{self.FAQ_COLLECTION}' 컬렉션 생성 중...")
                 
                 # FAQ 컬렉션 생성 (Weaviate v4 API)
-                self.client.collections.create(
+                await self._run(
+                    self.client.collections.create,
                     name=self.FAQ_COLLECTION,
                     description="고객 FAQ 벡터 저장소",
-                    properties=[
-                        Property(
-                            name="inquiry_no",
-                            data_type=DataType.INT,
-                            description="문의 번호"
-                        ),
-                        Property(
-                            name="brand_channel",
-                            data_type=DataType.TEXT,
-                            description="브랜드 채널"
-                        ),
-                        Property(
-                            name="inquiry_category",
-                            data_type=DataType.TEXT,
-                            description="문의 카테고리"
-                        ),
-                        Property(
-                            name="title",
-                            data_type=DataType.TEXT,
-                            description="문의 제목"
-                        ),
-                        Property(
-                            name="inquiry_content",
-                            data_type=DataType.TEXT,
-                            description="문의 내용"
-                        ),
-                        Property(
-                            name="answer_content",
-                            data_type=DataType.TEXT,
-                            description="답변 내용"
-                        ),
-                        Property(
-                            name="product_name",
-                            data_type=DataType.TEXT,
-                            description="제품명"
-                        ),
-                        Property(
-                            name="product_codes",
-                            data_type=DataType.TEXT_ARRAY,
-                            description="제품 코드 리스트"
-                        ),
-                    ],
+                    properties=FAQ_PROPERTIES,
                     # 벡터 설정 (우리가 직접 임베딩 생성)
                     vectorizer_config=None,
                 )
@@ -178,11 +274,57 @@ class WeaviateService:
             logger.error(f"스키마 생성 실패: {e}")
             raise
     
-    def _create_embedding(self, text: str) -> List[float]:
+    @staticmethod
+    def faq_text(faq: Dict[str, Any]) -> str:
+        """임베딩할 텍스트 (제목 + 문의 내용, 새 문의와 같은 형태로 비교)"""
+        return f"{faq['title']} {faq['inquiry_content']}"
+    
+    @staticmethod
+    def faq_properties(faq: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        FAQ 문서 → Weaviate 속성 (FAQ_PROPERTIES)
+        
+        Raises:
+            KeyError: 필수 필드(inquiry_no, brand_channel, inquiry_category, title, inquiry_content) 누락
+        """
+        return {
+            "inquiry_no": faq['inquiry_no'],
+            "brand_channel": faq['brand_channel'],
+            "inquiry_category": faq['inquiry_category'],
+            "title": faq['title'],
+            "inquiry_content": faq['inquiry_content'],
+            "answer_content": faq.get('answer_content'),
+            "product_name": faq.get('product_name'),
+            "product_codes": faq.get('product_codes') or [],
+        }
+    
+    @classmethod
+    def faq_content_hash(cls, faq: Dict[str, Any]) -> str:
+        """
+        Weaviate에 저장되는 내용(임베딩 텍스트 + 속성)의 해시 (faq_vector_state.text_hash)
+        
+        updated_at 등 저장하지 않는 필드만 바뀐 문서는 같은 해시가 나오므로 다시 임베딩하지 않습니다.
+        """
+        key = cls.faq_text(faq) + "\0" + json.dumps(
+            cls.faq_properties(faq), sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def faq_uuid(cls, inquiry_no: int) -> str:
+        """
+        inquiry_no 기반 결정적 UUID
+        
+        같은 문의는 항상 같은 UUID를 가지므로 존재 여부를 조회하지 않고 덮어쓸 수 있습니다.
+        """
+        return generate_uuid5(inquiry_no, cls.FAQ_COLLECTION)
+    
+    async def _create_embedding(self, text: str) -> List[float]:
         """
         텍스트 임베딩 생성
         
         Sentence-BERT를 사용하여 텍스트를 벡터로 변환합니다.
+        동시에 들어온 다른 요청과 함께 마이크로 배치로 인코딩됩니다.
         
         Args:
             text: 임베딩할 텍스트
@@ -190,8 +332,7 @@ class WeaviateService:
         Returns:
             임베딩 벡터 (리스트)
         """
-        embedding = self.model.encode(text)
-        return embedding.tolist()
+        return await self.embedding_batcher.embed(text)
     
     async def add_faq(
         self,
@@ -227,15 +368,14 @@ class WeaviateService:
             text_to_embed = f"{title} {inquiry_content}"
             
             # 임베딩 생성
-            vector = self._create_embedding(text_to_embed)
+            vector = await self._create_embedding(text_to_embed)
             
             # Weaviate에 저장
             collection = self.client.collections.get(self.FAQ_COLLECTION)
             
             # 기존 데이터 확인 (inquiry_no로)
-            from weaviate.classes.query import Filter
-            
-            existing = collection.query.fetch_objects(
+            existing = await self._run(
+                collection.query.fetch_objects,
                 filters=Filter.by_property("inquiry_no").equal(inquiry_no),
                 limit=1
             )
@@ -243,7 +383,8 @@ class WeaviateService:
             if existing.objects:
                 # 업데이트
                 uuid = existing.objects[0].uuid
-                collection.data.update(
+                await self._run(
+                    collection.data.update,
                     uuid=uuid,
                     properties={
                         "brand_channel": brand_channel,
@@ -258,8 +399,10 @@ class WeaviateService:
                 )
                 logger.info(f"FAQ 업데이트: {inquiry_no}")
             else:
-                # 새로 생성
-                collection.data.insert(
+                # 새로 생성 (배치 경로와 같은 결정적 UUID)
+                await self._run(
+                    collection.data.insert,
+                    uuid=self.faq_uuid(inquiry_no),
                     properties={
                         "inquiry_no": inquiry_no,
                         "brand_channel": brand_channel,
@@ -280,48 +423,122 @@ class WeaviateService:
             logger.error(f"FAQ 추가 실패 ({inquiry_no}): {e}")
             return False
     
-    async def add_faqs_batch(self, faqs: List[Dict[str, Any]]) -> Dict[str, int]:
+    async def add_faqs_batch(
+        self,
+        faqs: List[Dict[str, Any]],
+        batch_size: int = 100,
+        concurrent_requests: int = 2
+    ) -> Dict[str, Any]:
         """
-        FAQ 배치 추가
+        FAQ 배치 추가 (벌크 모드)
+        
+        1. 배치 전체를 한 번의 encode로 임베딩 (모델 배치 크기는 encode_batch_size)
+        2. inquiry_no 기반 결정적 UUID 사용 → 기존 데이터 조회 불필요 (같은 UUID면 덮어씀)
+        3. collection.batch로 묶어서 전송
+        
+        참고: 결정적 UUID 도입 전에 add_faq로 저장된 객체는 임의 UUID를 가지므로
+        컬렉션을 다시 만들고 재임포트해야 중복이 생기지 않습니다.
         
         Args:
             faqs: FAQ 데이터 리스트
+            batch_size: Weaviate에 한 번에 전송할 객체 수
+            concurrent_requests: 동시에 진행할 배치 요청 수
             
         Returns:
-            {'succeeded': int, 'failed': int}
+            {'succeeded': int, 'failed': int, 'errors': [{'inquiry_no', 'error'}]}
         """
-        succeeded = 0
-        failed = 0
+        errors: List[Dict[str, Any]] = []
+        objects: List[Dict[str, Any]] = []
         
+        # 필수 필드 검증
         for faq in faqs:
-            if await self.add_faq(
-                inquiry_no=faq['inquiry_no'],
-                brand_channel=faq['brand_channel'],
-                inquiry_category=faq['inquiry_category'],
-                title=faq['title'],
-                inquiry_content=faq['inquiry_content'],
-                answer_content=faq.get('answer_content'),
-                product_name=faq.get('product_name'),
-                product_codes=faq.get('product_codes', [])
-            ):
-                succeeded += 1
-            else:
-                failed += 1
+            try:
+                objects.append({
+                    'uuid': self.faq_uuid(faq['inquiry_no']),
+                    'text': self.faq_text(faq),
+                    'properties': self.faq_properties(faq)
+                })
+            except KeyError as e:
+                errors.append({
+                    'inquiry_no': faq.get('inquiry_no'),
+                    'error': f"필수 필드 누락: {e}"
+                })
+        
+        if objects:
+            try:
+                # 배치 전체 임베딩 (한 번의 encode)
+                vectors = await self.embedding_engine.aencode(
+                    [obj['text'] for obj in objects],
+                    batch_size=self.encode_batch_size
+                )
+                
+                failed_objects = await self._run(
+                    self._write_batch, objects, vectors, batch_size, concurrent_requests
+                )
+                
+                inquiry_by_uuid = {
+                    str(obj['uuid']): obj['properties']['inquiry_no'] for obj in objects
+                }
+                for failed in failed_objects:
+                    errors.append({
+                        'inquiry_no': inquiry_by_uuid.get(str(failed.original_uuid)),
+                        'error': failed.message
+                    })
+                    
+            except Exception as e:
+                logger.error(f"배치 추가 실패: {e}")
+                errors.extend(
+                    {'inquiry_no': obj['properties']['inquiry_no'], 'error': str(e)}
+                    for obj in objects
+                )
+        
+        failed = len(errors)
+        succeeded = len(faqs) - failed
         
         logger.info(f"배치 추가 완료: 성공 {succeeded}, 실패 {failed}")
         
         return {
             'succeeded': succeeded,
-            'failed': failed
+            'failed': failed,
+            'errors': errors
         }
     
+    def _write_batch(
+        self,
+        objects: List[Dict[str, Any]],
+        vectors: List[List[float]],
+        batch_size: int,
+        concurrent_requests: int
+    ) -> List[Any]:
+        """
+        collection.batch로 객체 전송 (동기, 스레드 풀에서 실행)
+        
+        Returns:
+            실패한 객체 리스트 (weaviate ErrorObject)
+        """
+        collection = self.client.collections.get(self.FAQ_COLLECTION)
+        
+        with collection.batch.fixed_size(
+            batch_size=batch_size,
+            concurrent_requests=concurrent_requests
+        ) as batch:
+            for obj, vector in zip(objects, vectors):
+                batch.add_object(
+                    properties=obj['properties'],
+                    vector=vector,
+                    uuid=obj['uuid']
+                )
+        
+        return list(collection.batch.failed_objects)
+    
     async def search_similar_faqs(
         self,
         query_text: str,
         brand_channel: Optional[str] = None,
         category: Optional[str] = None,
         limit: int = 5,
-        min_similarity: float = 0.7
+        min_similarity: float = 0.7,
+        query_vector: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         유사 FAQ 검색 (벡터 검색)
@@ -332,31 +549,25 @@ class WeaviateService:
             category: 카테고리 필터
             limit: 최대 개수
             min_similarity: 최소 유사도 (0-1)
+            query_vector: 미리 계산된 쿼리 벡터 (배치 처리 시, 없으면 새로 임베딩)
             
         Returns:
             유사 FAQ 리스트
         """
         try:
             # 쿼리 임베딩 생성
-            query_vector = self._create_embedding(query_text)
+            if query_vector is None:
+                query_vector = await self._create_embedding(query_text)
             
             # 컬렉션 가져오기
             collection = self.client.collections.get(self.FAQ_COLLECTION)
             
             # 필터 생성
-            from weaviate.classes.query import Filter
-            
-            filters = None
-            if brand_channel and category:
-                filters = Filter.by_property("brand_channel").equal(brand_channel) & \
-                          Filter.by_property("inquiry_category").equal(category)
-            elif brand_channel:
-                filters = Filter.by_property("brand_channel").equal(brand_channel)
-            elif category:
-                filters = Filter.by_property("inquiry_category").equal(category)
+            filters = self._build_filters(brand_channel, category)
             
             # 벡터 검색
-            response = collection.query.near_vector(
+            response = await self._run(
+                collection.query.near_vector,
                 near_vector=query_vector,
                 limit=limit,
                 return_metadata=MetadataQuery(distance=True),
@@ -396,7 +607,8 @@ class WeaviateService:
         keywords: List[str],
         brand_channel: Optional[str] = None,
         category: Optional[str] = None,
-        limit: int = 5
+        limit: int = 5,
+        query_vector: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         하이브리드 검색 (벡터 + 키워드)
@@ -409,32 +621,26 @@ class WeaviateService:
             brand_channel: 브랜드 필터
             category: 카테고리 필터
             limit: 최대 개수
+            query_vector: 미리 계산된 쿼리 벡터 (없으면 새로 임베딩)
             
         Returns:
             검색 결과 리스트
         """
         try:
             # 쿼리 임베딩 생성
-            query_vector = self._create_embedding(query_text)
+            if query_vector is None:
+                query_vector = await self._create_embedding(query_text)
             
             # 컬렉션 가져오기
             collection = self.client.collections.get(self.FAQ_COLLECTION)
             
             # 필터 생성
-            from weaviate.classes.query import Filter
-            
-            filters = None
-            if brand_channel and category:
-                filters = Filter.by_property("brand_channel").equal(brand_channel) & \
-                          Filter.by_property("inquiry_category").equal(category)
-            elif brand_channel:
-                filters = Filter.by_property("brand_channel").equal(brand_channel)
-            elif category:
-                filters = Filter.by_property("inquiry_category").equal(category)
+            filters = self._build_filters(brand_channel, category)
             
             # 하이브리드 검색
             # alpha=0.5: 벡터 검색과 키워드 검색을 50:50으로
-            response = collection.query.hybrid(
+            response = await self._run(
+                collection.query.hybrid,
                 query=query_text,
                 vector=query_vector,
                 alpha=0.5,  # 0=순수 키워드, 1=순수 벡터, 0.5=하이브리드
@@ -479,16 +685,15 @@ class WeaviateService:
             collection = self.client.collections.get(self.FAQ_COLLECTION)
             
             # inquiry_no로 찾기
-            from weaviate.classes.query import Filter
-            
-            result = collection.query.fetch_objects(
+            result = await self._run(
+                collection.query.fetch_objects,
                 filters=Filter.by_property("inquiry_no").equal(inquiry_no),
                 limit=1
             )
             
             if result.objects:
                 uuid = result.objects[0].uuid
-                collection.data.delete_by_id(uuid)
+                await self._run(collection.data.delete_by_id, uuid)
                 logger.info(f"FAQ 삭제: {inquiry_no}")
                 return True
             else:
@@ -499,6 +704,31 @@ class WeaviateService:
             logger.error(f"FAQ 삭제 실패 ({inquiry_no}): {e}")
             return False
     
+    async def delete_faqs(self, inquiry_nos: List[int]) -> int:
+        """
+        FAQ 일괄 삭제 (결정적 UUID 기준, 조회 없이 삭제)
+        
+        Args:
+            inquiry_nos: 문의 번호 리스트
+            
+        Returns:
+            삭제된 객체 수
+        """
+        if not inquiry_nos:
+            return 0
+        
+        collection = self.client.collections.get(self.FAQ_COLLECTION)
+        uuids = [self.faq_uuid(inquiry_no) for inquiry_no in inquiry_nos]
+        
+        result = await self._run(
+            collection.data.delete_many,
+            where=Filter.by_id().contains_any(uuids)
+        )
+        
+        logger.info(f"FAQ 일괄 삭제: {result.successful}개")
+        
+        return result.successful
+    
     async def get_total_count(self) -> int:
         """
         저장된 FAQ 총 개수 조회
@@ -508,7 +738,7 @@ class WeaviateService:
         """
         try:
             collection = self.client.collections.get(self.FAQ_COLLECTION)
-            response = collection.aggregate.over_all(total_count=True)
+            response = await self._run(collection.aggregate.over_all, total_count=True)
             return response.total_count
         except Exception as e:
             logger.error(f"총 개수 조회 실패: {e}")
@@ -533,8 +763,11 @@ def get_weaviate_service() -> WeaviateService:
 
 def init_weaviate_service(
     weaviate_url: str,
-    model_name: str = 'jhgan/ko-sroberta-multitask',
-    api_key: Optional[str] = None
+    model_name: str = DEFAULT_MODEL_NAME,
+    api_key: Optional[str] = None,
+    embedding_engine: Optional[EmbeddingEngine] = None,
+    max_concurrency: int = 8,
+    encode_batch_size: int = 32
 ):
     """
     Weaviate Service 초기화
@@ -542,5 +775,12 @@ def init_weaviate_service(
     main.py에서 앱 시작 시 호출합니다.
     """
     global _weaviate_service
-    _weaviate_service = WeaviateService(weaviate_url, model_name, api_key)
+    _weaviate_service = WeaviateService(
+        weaviate_url,
+        model_name,
+        api_key,
+        embedding_engine,
+        max_concurrency=max_concurrency,
+        encode_batch_size=encode_batch_size
+    )
     return _weaviate_service
@@ -0,0 +1,83 @@
+# 2026-10-17 19:20, Claude 작성
+"""
+사전 키워드 일괄 매칭
+카테고리/복잡도/기술 용어/색상/스위치 키워드를 정규식 하나로 한 번에 찾습니다.
+
+키워드마다 `keyword in text`로 전체 텍스트를 다시 훑던 방식(문의당 수십 회 스캔)을
+한 번의 스캔으로 대체합니다. 결과는 기존 방식과 같은 "텍스트에 포함된 키워드 집합"입니다.
+"""
+
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class KeywordMatcher:
+    """
+    단일 정규식 다중 키워드 매처
+    
+    - 모든 키워드를 긴 것부터 `(?=(a|b|...))` 한 패턴으로 컴파일 (텍스트/키워드 모두 소문자로 비교)
+    - 위치마다 가장 긴 키워드 하나만 잡히므로, 그 키워드 안에 들어 있는
+      짧은 키워드(예: '저소음 바나나축' → '바나나축')는 미리 계산해 둔 포함 관계로 채웁니다.
+    
+    Example:
+        >>> matcher = KeywordMatcher(['배송', '반품', '바나나축', '저소음 바나나축'])
+        >>> matcher.find("저소음 바나나축 반품 문의")
+        {'저소음 바나나축', '바나나축', '반품'}
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        초기화 (정규식 컴파일)
+        
+        Args:
+            keywords: 찾을 키워드 (소문자로 정규화해 비교)
+        """
+        self.keywords: FrozenSet[str] = frozenset(k.lower() for k in keywords if k)
+        
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+        
+        # 키워드 → 그 안에 포함된 키워드들 (자기 자신 포함)
+        self._contained: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(other for other in self.keywords if other in keyword)
+            for keyword in self.keywords
+        }
+    
+    def find(self, text: str) -> Set[str]:
+        """
+        텍스트에 포함된 키워드 집합 (소문자)
+        
+        `{k for k in keywords if k in text.lower()}`와 같은 결과를 한 번의 스캔으로 구합니다.
+        """
+        found: Set[str] = set()
+        if not self.keywords or not text:
+            return found
+        
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._contained[match.group(1)]
+        return found
+
+
+# 키워드 집합별 공유 인스턴스 (같은 사전을 쓰는 분석기끼리 컴파일 결과 공유)
+_matchers: Dict[FrozenSet[str], KeywordMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    키워드 매처 공유 인스턴스 반환
+    
+    같은 키워드 집합으로 여러 번 호출해도 정규식은 한 번만 컴파일됩니다.
+    """
+    key = frozenset(k.lower() for k in keywords if k)
+    matcher = _matchers.get(key)
+    
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = KeywordMatcher(key)
+                _matchers[key] = matcher
+    
+    return matcher
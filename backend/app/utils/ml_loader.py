@@ -0,0 +1,79 @@
+# 2026-10-17 18:50, Claude 작성
+# 2026-10-17 19:50, Claude 업데이트 (spaCy 미사용 컴포넌트 제외 로드)
+"""
+무거운 ML 라이브러리 지연 로딩
+spacy / sentence_transformers / torch는 모듈 임포트 시점이 아니라
+모델이 처음 필요할 때 임포트합니다.
+
+torch + sentence_transformers 임포트만 수 초가 걸리므로,
+MongoDB만 쓰는 워커(import_data.py, 통계 API 등)는 이 비용을 내지 않습니다.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 키워드 추출은 token.pos_만 사용 → 의존 구문 분석/개체명 인식/표제어 추출은 로드하지 않음
+SPACY_UNUSED_PIPES = ('parser', 'ner', 'lemmatizer', 'trainable_lemmatizer', 'senter')
+
+# 품사 태깅 컴포넌트 (토크나이저 전용 모드에서는 이것까지 제외)
+SPACY_TAGGER_PIPES = ('tok2vec', 'tagger', 'morphologizer', 'attribute_ruler')
+
+# (모델명, 제외 컴포넌트)별 spaCy 파이프라인 (프로세스당 한 번만 로드)
+_spacy_models: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_spacy_lock = threading.Lock()
+
+
+def load_spacy(model_name: str, exclude: Iterable[str] = SPACY_UNUSED_PIPES) -> Any:
+    """
+    spaCy 파이프라인 로드 (모델명 + 제외 컴포넌트별 공유)
+    
+    Args:
+        model_name: spaCy 모델명
+        exclude: 로드하지 않을 컴포넌트 (모델에 없는 이름은 무시)
+    
+    Raises:
+        OSError: 모델이 설치되지 않은 경우
+    """
+    key = (model_name, tuple(sorted(exclude)))
+    nlp = _spacy_models.get(key)
+    if nlp is None:
+        with _spacy_lock:
+            nlp = _spacy_models.get(key)
+            if nlp is None:
+                import spacy
+                nlp = spacy.load(model_name, exclude=list(key[1]))
+                logger.info(f"  📚 spaCy 파이프라인: {nlp.pipe_names or ['tokenizer']}")
+                _spacy_models[key] = nlp
+    return nlp
+
+
+def spacy_exclude(pos_tagging: bool = True) -> Tuple[str, ...]:
+    """
+    제외할 spaCy 컴포넌트
+    
+    Args:
+        pos_tagging: False면 품사 태깅까지 제외 (토크나이저만 실행)
+    """
+    return SPACY_UNUSED_PIPES if pos_tagging else SPACY_UNUSED_PIPES + SPACY_TAGGER_PIPES
+
+
+def load_sentence_transformer(model_name: str, device: str = "cpu") -> Any:
+    """Sentence-BERT 모델 로드 (torch/sentence_transformers는 여기서 처음 임포트)"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name, device=device)
+
+
+def default_device() -> str:
+    """GPU 사용 가능하면 cuda, 아니면 cpu"""
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def cuda_device_name() -> str:
+    """첫 번째 GPU 이름"""
+    import torch
+    return torch.cuda.get_device_name(0)
@@ -0,0 +1,187 @@
+# 2026-10-17 21:20, Claude 작성
+"""
+제품 코드 정규화 / 제품 코드 색인
+제품명과 동의어(product_name_synonyms)에서 정규화된 제품 코드를 뽑아
+products.codes 필드(멀티키 인덱스)와 메모리 색인(코드 → 제품)에 씁니다.
+
+get_product_by_code가 제품명 전체에 `'.*'.join(codes)` 정규식을 돌리던 방식(인덱스 사용 불가,
+매 조회 컬렉션 스캔)을 코드 집합 포함 검사로 대체합니다.
+
+정규화: NFKC → 대문자 → 공백/하이픈/밑줄 제거 ("PRO MAX", "pro-max" → "PROMAX")
+"""
+
+import bisect
+import json
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 제품 코드 패턴 (문의 분석기와 같은 패턴이어야 문의에서 뽑은 코드로 제품을 찾을 수 있음)
+PRODUCT_CODE_PATTERNS = [
+    r'K\d{1,2}',  # K10, K8, K5 등
+    r'Q\d{1,2}',  # Q10, Q13 등
+    r'V\d{1,2}',  # V10, V6 등
+    r'B\d{1,2}',  # B6, B1 등
+    r'C\d{1,2}',  # C2 등
+    r'M\d{1,2}',  # M6 (마우스)
+    r'PRO\s*MAX',
+    r'PRO\s*SE\d?',
+    r'ZMK',
+]
+
+_code_regex = re.compile('|'.join(PRODUCT_CODE_PATTERNS), re.IGNORECASE)
+_separator_regex = re.compile(r'[\s\-_]+')
+
+
+def normalize_code(text: str) -> str:
+    """제품 코드/이름 정규화 (대문자, 공백/하이픈/밑줄 제거)"""
+    return _separator_regex.sub('', unicodedata.normalize('NFKC', text)).upper()
+
+
+def parse_synonyms(value: Any) -> List[str]:
+    """
+    product_name_synonyms 값 파싱
+    
+    CSV에서는 JSON 배열 문자열('["K10", "케이텐"]'), JSON/DB에서는 리스트로 들어옵니다.
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            value = value.split(',')
+    if isinstance(value, str):
+        value = [value]
+    return [str(synonym).strip() for synonym in value if str(synonym).strip()]
+
+
+def extract_codes(text: str) -> List[str]:
+    """텍스트에서 제품 코드 패턴 추출 (정규화, 등장 순서 유지)"""
+    return list(dict.fromkeys(normalize_code(code) for code in _code_regex.findall(text)))
+
+
+def product_codes(product_name: str, synonyms: Any = None) -> List[str]:
+    """
+    제품 색인 코드 (products.codes 필드 값)
+    
+    제품명/동의어 각각의 코드 패턴(K10, PROMAX 등)과 정규화된 전체 이름
+    ("K2HE", "케이텐" 등)을 모읍니다.
+    
+    Args:
+        product_name: 제품명
+        synonyms: product_name_synonyms (JSON 배열 문자열 또는 리스트)
+    
+    Returns:
+        정렬된 코드 리스트
+    """
+    codes: Set[str] = set()
+    for name in [product_name or '', *parse_synonyms(synonyms)]:
+        if not name.strip():
+            continue
+        codes.add(normalize_code(name))
+        codes.update(extract_codes(name))
+    return sorted(codes)
+
+
+def normalize_codes(codes: Iterable[str]) -> List[str]:
+    """조회용 코드 정규화 (빈 값/중복 제거)"""
+    return list(dict.fromkeys(code for code in map(normalize_code, codes) if code))
+
+
+def specificity(product: Dict[str, Any]) -> Tuple[int, str]:
+    """
+    같은 코드를 가진 제품들 중 우선순위 (작을수록 우선)
+    
+    ["K10"]으로 찾으면 "K10 PRO MAX"보다 "K10"이 먼저 오도록 제품명이 짧은 것부터.
+    """
+    return len(product.get('product_name') or ''), str(product.get('product_id', ''))
+
+
+class ProductCodeIndex:
+    """
+    메모리 제품 코드 색인 (브랜드, 코드) → 제품 리스트 (우선순위 순)
+    
+    조회는 요청 코드 중 후보가 가장 적은 코드의 리스트만 훑으므로
+    비용이 카탈로그 크기가 아니라 한 모델의 변형 수에 비례합니다.
+    
+    Example:
+        >>> index = ProductCodeIndex()
+        >>> index.load(products)
+        >>> index.lookup(["K10", "PRO MAX"], "KEYCHRON")
+    """
+    
+    def __init__(self):
+        self.loaded = False
+        self._by_code: Dict[Tuple[str, str], List[Tuple[Tuple[int, str], Dict[str, Any]]]] = {}
+        self._products: Dict[str, Tuple[str, Set[str], Dict[str, Any]]] = {}  # product_id → (브랜드, 코드 집합, 제품)
+    
+    def __len__(self) -> int:
+        return len(self._products)
+    
+    def load(self, products: Iterable[Dict[str, Any]]):
+        """전체 제품으로 색인 재구성"""
+        self._by_code.clear()
+        self._products.clear()
+        self.update(products)
+        self.loaded = True
+    
+    def update(self, products: Iterable[Dict[str, Any]]):
+        """
+        제품 추가/갱신 (product_id 기준으로 기존 항목 교체)
+        
+        codes 필드가 없으면(색인 도입 전 문서) 제품명/동의어에서 계산합니다.
+        """
+        for product in products:
+            product_id = str(product.get('product_id', ''))
+            if not product_id:
+                continue
+            self.remove(product_id)
+            
+            brand = product.get('brand_channel', '')
+            codes = set(product.get('codes') or product_codes(
+                product.get('product_name', ''), product.get('product_name_synonyms')
+            ))
+            self._products[product_id] = (brand, codes, product)
+            
+            entry = (specificity(product), product)
+            for code in codes:
+                bisect.insort(self._by_code.setdefault((brand, code), []), entry, key=lambda item: item[0])
+    
+    def remove(self, product_id: str):
+        """제품 제거 (없으면 무시)"""
+        brand, codes, _ = self._products.pop(product_id, ('', set(), None))
+        for code in codes:
+            entries = self._by_code.get((brand, code), [])
+            entries[:] = [entry for entry in entries if str(entry[1].get('product_id')) != product_id]
+            if not entries:
+                self._by_code.pop((brand, code), None)
+    
+    def get(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """product_id로 색인된 제품 (부분 갱신 병합용)"""
+        return self._products.get(product_id, ('', set(), None))[2]
+    
+    def lookup(self, codes: Iterable[str], brand_channel: str) -> Optional[Dict[str, Any]]:
+        """
+        코드를 모두 가진 제품 중 우선순위가 가장 높은 제품
+        
+        Args:
+            codes: 제품 코드 리스트 (정규화 전이어도 됨)
+            brand_channel: 브랜드 채널
+        
+        Returns:
+            제품 데이터 또는 None
+        """
+        codes = normalize_codes(codes)
+        if not codes:
+            return None
+        
+        candidate_lists = [self._by_code.get((brand_channel, code)) for code in codes]
+        if not all(candidate_lists):
+            return None
+        
+        for _, product in min(candidate_lists, key=len):
+            if self._products[str(product.get('product_id'))][1].issuperset(codes):
+                return product
+        return None
@@ -0,0 +1,153 @@
+# 2026-10-17 15:40, Claude 작성
+"""
+토큰 버킷 레이트 리미터
+외부 API 호출량(분당 요청 수, 분당 토큰 수) 제한
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷
+    
+    capacity만큼 쌓이고 초당 refill_rate씩 채워집니다.
+    acquire()는 필요한 양이 찰 때까지 기다립니다.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        초기화
+        
+        Args:
+            capacity: 버킷 최대 용량 (순간 허용량)
+            refill_rate: 초당 충전량
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        """분당 limit만큼 허용하는 버킷"""
+        return cls(capacity=limit, refill_rate=limit / 60.0)
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+    
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 양"""
+        self._refill()
+        return self._tokens
+    
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        amount만큼 차감 (부족하면 대기)
+        
+        capacity보다 큰 요청은 capacity로 잘라서 처리합니다.
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        
+        # 대기 순서를 지키기 위해 lock을 잡은 채로 기다림
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                
+                delay = (amount - self._tokens) / self.refill_rate
+                await asyncio.sleep(delay)
+                waited += delay
+    
+    def adjust(self, amount: float):
+        """
+        사후 보정 (실제 사용량이 예상과 다를 때)
+        
+        양수면 추가 차감(음수 잔량 허용 → 다음 요청이 대기), 음수면 환급합니다.
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class RateLimiter:
+    """
+    분당 요청 수(RPM) + 분당 토큰 수(TPM) 제한
+    
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=40000)
+        >>> await limiter.acquire(estimated_tokens=1200)
+        >>> ...  # API 호출
+        >>> limiter.record_usage(estimated_tokens=1200, actual_tokens=1450)
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            requests_per_minute: 분당 요청 수 제한 (None이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 제한 (None이면 제한 없음)
+        """
+        self.requests = TokenBucket.per_minute(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket.per_minute(tokens_per_minute) if tokens_per_minute else None
+        
+        # 통계
+        self.acquired = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+    
+    async def acquire(self, estimated_tokens: float = 0.0) -> float:
+        """
+        요청 1건 + 예상 토큰만큼 허용될 때까지 대기
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        if self.requests:
+            waited += await self.requests.acquire(1)
+        if self.tokens and estimated_tokens > 0:
+            waited += await self.tokens.acquire(estimated_tokens)
+        
+        self.acquired += 1
+        if waited > 0:
+            self.throttled += 1
+            self.waited_seconds += waited
+        
+        return waited
+    
+    def record_usage(self, estimated_tokens: float, actual_tokens: float):
+        """응답의 실제 토큰 사용량으로 TPM 버킷 보정"""
+        if self.tokens:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        리미터 통계
+        
+        Returns:
+            허용 횟수, 대기 발생 횟수, 누적 대기 시간, 버킷 잔량
+        """
+        return {
+            'acquired': self.acquired,
+            'throttled': self.throttled,
+            'waited_seconds': round(self.waited_seconds, 2),
+            'requests_available': round(self.requests.available, 1) if self.requests else None,
+            'tokens_available': round(self.tokens.available, 1) if self.tokens else None
+        }
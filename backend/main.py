@@ -1,19 +1,47 @@
 # 2025-09-30 17:45, Claude 작성
+# 2026-10-17 18:20, Claude 업데이트 (lifespan 서비스 초기화/워밍업, 라우터 등록)
 """
 FastAPI 메인 진입점
 애플리케이션 초기화 및 라우터 등록
 """
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-# TODO: Phase 3에서 라우터 임포트 추가
-# from app.api import health, questions, reviews, stats
+from app.api import health, questions, reviews, stats
+from app.core.startup import get_startup_state, start_services, stop_services
+from config import settings
+
+logging.basicConfig(
+    level=settings.LOG_LEVEL,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작/종료 처리
+    
+    시작: 서비스 초기화, 연결 풀 생성, 워밍업 (완료 후 /health/ready가 200)
+    종료: 백그라운드 태스크 취소, 연결 종료
+    """
+    state = get_startup_state()
+    await start_services(settings, state)
+    try:
+        yield
+    finally:
+        await stop_services(state)
+
 
 app = FastAPI(
     title="투비네트웍스 CS AI Agent API",
     description="FAQ 자동 응답 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (프론트엔드 연동용)
@@ -39,11 +67,11 @@ async def root():
     }
 
 
-# TODO: Phase 3에서 라우터 등록
-# app.include_router(health.router, prefix="/health", tags=["Health"])
-# app.include_router(questions.router, prefix="/api/questions", tags=["Questions"])
-# app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
-# app.include_router(stats.router, prefix="/api/stats", tags=["Statistics"])
+# 라우터 등록
+app.include_router(health.router, prefix="/health", tags=["Health"])
+app.include_router(questions.router, prefix="/api/questions", tags=["Questions"])
+app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
+app.include_router(stats.router, prefix="/api/stats", tags=["Statistics"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+질문 분석 프로세스 풀 처리량 벤치마크
+투비네트웍스 글로벌 - CS AI 에이전트 프로젝트
+
+2026-10-17 20:20, Claude 작성
+
+같은 문의 묶음을 현재 프로세스(코어 1개)와 AnalysisPool(워커 N개)로 분석해
+워커 수에 따른 처리량(건/초) 변화를 출력합니다. (app/core/analysis_pool.py)
+
+주요 작업:
+1. 합성 문의 생성 (--count건, 배송/반품/상품 문의 템플릿)
+2. 현재 프로세스 analyze_many 처리량 측정 (기준)
+3. 워커 수별 풀 기동(모델 로드, 측정 제외) → analyze_many 처리량 측정
+4. 결과 표 출력, --output으로 JSON 저장
+
+사용법:
+    python benchmark_analysis_pool.py
+    
+    # 워커 수 지정, 건수 늘리기
+    python benchmark_analysis_pool.py --workers 1 2 4 8 --count 20000
+    
+    # 한국어 모델 없이 빈 다국어 파이프라인으로 (토크나이저 전용)
+    python benchmark_analysis_pool.py --blank
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
+
+from app.core import question_analyzer as analyzer_module
+from app.core.analysis_pool import AnalysisPool, create_analyzer
+from app.core.question_analyzer import InquiryData
+
+
+# ==================== 로깅 설정 ====================
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# ==================== 벤치마크 ====================
+
+TEMPLATES = [
+    ("상품", "K10 PRO MAX 펌웨어 업데이트 후 블루투스 연결이 자꾸 끊겨요. 윈도우에서 드라이버도 다시 설치했는데 인식이 안 됩니다.",
+     "키크론 K10 PRO MAX 쉘화이트 저소음 바나나축"),
+    ("배송", "어제 주문한 키보드 배송 언제 도착하나요? 송장 번호가 아직 안 나와서 문의드립니다.", None),
+    ("반품", "Q6 적축 단순 변심으로 반품하고 싶습니다. 수거는 언제 오나요?", "키크론 Q6 적축 스페이스 그레이"),
+    ("교환", "V1 갈축으로 주문했는데 청축이 왔어요. 교환 가능할까요?", "키크론 V1 갈축"),
+]
+
+
+def blank_analyzer():
+    """한국어 모델 없이 측정할 때 쓰는 분석기 (빈 다국어 파이프라인, 토크나이저 전용)"""
+    import spacy
+    analyzer_module.load_spacy = lambda model_name, exclude=(): spacy.blank('xx')
+    return analyzer_module.QuestionAnalyzer(pos_tagging=False)
+
+
+def make_inquiries(count: int) -> List[InquiryData]:
+    """합성 문의 생성"""
+    inquiries = []
+    for i in range(count):
+        category, content, product_name = TEMPLATES[i % len(TEMPLATES)]
+        inquiries.append(InquiryData(
+            brand_channel="KEYCHRON",
+            inquiry_category=category,
+            title=f"문의 드립니다 #{i}",
+            inquiry_content=f"{content} 주문번호 {100000 + i}",
+            product_name=product_name
+        ))
+    return inquiries
+
+
+async def measure_pool(
+    workers: int,
+    inquiries: List[InquiryData],
+    chunk_size: int,
+    factory,
+    factory_args
+) -> Dict[str, Any]:
+    """워커 workers개 풀의 처리량 측정 (기동 시간은 따로 기록)"""
+    pool = AnalysisPool(
+        max_workers=workers,
+        chunk_size=chunk_size,
+        analyzer_factory=factory,
+        factory_args=factory_args
+    )
+    try:
+        startup = await pool.start()
+        
+        started = time.perf_counter()
+        await pool.analyze_many(inquiries)
+        elapsed = time.perf_counter() - started
+    finally:
+        pool.shutdown()
+    
+    return {
+        'workers': workers,
+        'startup_seconds': round(startup, 2),
+        'seconds': round(elapsed, 3),
+        'per_second': round(len(inquiries) / elapsed, 1)
+    }
+
+
+async def main():
+    """메인 실행 함수"""
+    
+    parser = argparse.ArgumentParser(
+        description='AnalysisPool 워커 수별 처리량 벤치마크'
+    )
+    
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=5000,
+        help='분석할 문의 수 (기본: 5000)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs='+',
+        help='측정할 워커 수 목록 (기본: 1, 2, 4, ... CPU 코어 수)'
+    )
+    
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=64,
+        help='워커 하나에 보낼 문의 수 (기본: 64)'
+    )
+    
+    parser.add_argument(
+        '--spacy-model',
+        type=str,
+        default='ko_core_news_sm',
+        help='spaCy 모델명 (기본: ko_core_news_sm)'
+    )
+    
+    parser.add_argument(
+        '--tokenizer-only',
+        action='store_true',
+        help='품사 태깅 없이 토크나이저만 실행'
+    )
+    
+    parser.add_argument(
+        '--blank',
+        action='store_true',
+        help='한국어 모델 대신 빈 다국어 파이프라인 사용 (모델 미설치 환경)'
+    )
+    
+    parser.add_argument(
+        '--output',
+        type=str,
+        help='결과 JSON 저장 경로'
+    )
+    
+    args = parser.parse_args()
+    
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({cpu_count, *(2 ** i for i in range(cpu_count.bit_length()))})
+    
+    if args.blank:
+        factory, factory_args = blank_analyzer, ()
+    else:
+        factory, factory_args = create_analyzer, (args.spacy_model, not args.tokenizer_only)
+    
+    inquiries = make_inquiries(args.count)
+    logger.info(f"🧪 문의 {len(inquiries)}건, CPU {cpu_count}코어, 워커 {worker_counts}")
+    
+    # 1. 기준: 현재 프로세스 (코어 1개)
+    analyzer = factory(*factory_args)
+    started = time.perf_counter()
+    analyzer.analyze_many(inquiries)
+    baseline_seconds = time.perf_counter() - started
+    baseline = len(inquiries) / baseline_seconds
+    
+    # 2. 워커 수별 프로세스 풀
+    results = []
+    for workers in worker_counts:
+        result = await measure_pool(workers, inquiries, args.chunk_size, factory, factory_args)
+        result['speedup'] = round(result['per_second'] / baseline, 2)
+        results.append(result)
+        logger.info(f"  워커 {workers}개: {result['per_second']}건/초 (x{result['speedup']})")
+    
+    print("\n" + "=" * 70)
+    print(f"📊 분석 처리량 (문의 {len(inquiries)}건, CPU {cpu_count}코어)")
+    print("=" * 70)
+    print(f"{'구성':<16} {'시간(초)':>10} {'건/초':>10} {'배율':>8} {'기동(초)':>10}")
+    print(f"{'현재 프로세스':<16} {baseline_seconds:>10.3f} {baseline:>10.1f} {1.0:>8.2f} {'-':>10}")
+    for result in results:
+        label = f"워커 {result['workers']}개"
+        print(
+            f"{label:<16} {result['seconds']:>10.3f} {result['per_second']:>10.1f} "
+            f"{result['speedup']:>8.2f} {result['startup_seconds']:>10.2f}"
+        )
+    print("=" * 70)
+    
+    if args.output:
+        record = {
+            'measured_at': datetime.now().isoformat(),
+            'count': len(inquiries),
+            'cpu_count': cpu_count,
+            'chunk_size': args.chunk_size,
+            'baseline_per_second': round(baseline, 1),
+            'results': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
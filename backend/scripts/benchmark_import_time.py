@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+엔트리 포인트별 임포트 시간 벤치마크
+투비네트웍스 글로벌 - CS AI 에이전트 프로젝트
+
+2026-10-17 18:50, Claude 작성
+
+엔트리 포인트(모듈)마다 새 인터프리터에서 `python -X importtime -c "import ..."`를 실행해
+임포트 시간 합계와 무거운 ML 라이브러리(torch, spacy 등) 로드 여부를 기록합니다.
+워커 시작 시간 회귀를 추적하는 용도입니다.
+
+주요 작업:
+1. 엔트리 포인트별 N회 실행 → 최소값 기록 (디스크 캐시 영향 제거)
+2. 최상위 임포트 중 오래 걸린 패키지 상위 5개 출력
+3. 경량 엔트리 포인트(관리/통계 워커)가 --max-seconds를 넘으면 종료 코드 1
+4. --output으로 결과 JSON 저장 (회귀 비교용)
+
+사용법:
+    python benchmark_import_time.py
+    
+    # 특정 모듈만, 3회 측정
+    python benchmark_import_time.py --module app.api.stats --runs 3
+    
+    # 결과 저장
+    python benchmark_import_time.py --output import_time.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+# backend 디렉토리 (main.py, config.py 위치)
+backend_root = Path(__file__).parent.parent
+
+
+# 엔트리 포인트 이름 → 모듈
+ENTRY_POINTS = {
+    'api': 'main',
+    'stats_api': 'app.api.stats',
+    'reviews_api': 'app.api.reviews',
+    'mongodb': 'app.services.mongodb_service',
+    'answer_cache': 'app.services.answer_cache',
+    'faq_indexer': 'app.services.faq_indexer',
+    'embedding_engine': 'app.services.embedding_engine',
+    'question_analyzer': 'app.services.question_analyzer',
+}
+
+# 무거운 ML 라이브러리 없이 1초 안에 떠야 하는 엔트리 포인트 (관리/통계 워커)
+# API 엔트리 포인트는 fastapi 자체 임포트(약 0.9초)가 포함되므로 시간만 기록
+LIGHT_ENTRY_POINTS = {'mongodb', 'answer_cache', 'faq_indexer', 'embedding_engine'}
+
+# 로드 여부를 확인할 무거운 라이브러리
+HEAVY_MODULES = ['torch', 'sentence_transformers', 'transformers', 'spacy', 'weaviate']
+
+
+def parse_importtime(stderr: str) -> Dict[str, Any]:
+    """
+    -X importtime 출력 파싱
+    
+    출력 형식: "import time: self [us] | cumulative | imported package"
+    들여쓰기 없는 행이 최상위 임포트이며, 그 cumulative 합이 전체 임포트 시간입니다.
+    
+    Returns:
+        {'total_us': 최상위 cumulative 합, 'top_level': {모듈: cumulative}, 'modules': 로드된 모듈 집합}
+    """
+    top_level: Dict[str, int] = {}
+    modules = set()
+    
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        
+        _, cumulative_us, name = line.split(':', 1)[1].split('|', 2)
+        stripped = name.strip()
+        modules.add(stripped)
+        
+        # 최상위 임포트는 '|' 뒤 공백 한 칸, 중첩될수록 두 칸씩 더 들여씀
+        if not name.startswith('  '):
+            top_level[stripped] = top_level.get(stripped, 0) + int(cumulative_us)
+    
+    return {
+        'total_us': sum(top_level.values()),
+        'top_level': top_level,
+        'modules': modules
+    }
+
+
+def measure(module: str) -> Dict[str, Any]:
+    """새 인터프리터에서 모듈 하나를 임포트하고 시간 측정"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=backend_root,
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}
+    )
+    
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'unknown error'
+        return {'module': module, 'error': error}
+    
+    parsed = parse_importtime(result.stderr)
+    top = sorted(parsed['top_level'].items(), key=lambda item: item[1], reverse=True)[:5]
+    
+    return {
+        'module': module,
+        'seconds': round(parsed['total_us'] / 1_000_000, 3),
+        'heavy_modules': [name for name in HEAVY_MODULES if name in parsed['modules']],
+        'slowest': [{'module': name, 'seconds': round(us / 1_000_000, 3)} for name, us in top]
+    }
+
+
+def run_benchmark(entries: Dict[str, str], runs: int) -> Dict[str, Dict[str, Any]]:
+    """엔트리 포인트별 runs회 측정, 가장 빠른 결과 사용"""
+    results = {}
+    
+    for name, module in entries.items():
+        samples = [measure(module) for _ in range(runs)]
+        ok = [sample for sample in samples if 'error' not in sample]
+        results[name] = min(ok, key=lambda sample: sample['seconds']) if ok else samples[0]
+    
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, Any]], max_seconds: float) -> List[str]:
+    """
+    결과 출력
+    
+    Returns:
+        예산(max_seconds)을 넘은 경량 엔트리 포인트 목록
+    """
+    failures = []
+    
+    print("\n" + "=" * 70)
+    print("⏱️ 엔트리 포인트별 임포트 시간")
+    print("=" * 70)
+    
+    for name, result in results.items():
+        if 'error' in result:
+            print(f"❌ {name:<20} {result['module']}: {result['error']}")
+            continue
+        
+        light = name in LIGHT_ENTRY_POINTS
+        over_budget = light and (result['seconds'] > max_seconds or result['heavy_modules'])
+        if over_budget:
+            failures.append(name)
+        
+        mark = "❌" if over_budget else "✅"
+        heavy = ', '.join(result['heavy_modules']) or '-'
+        print(f"{mark} {name:<20} {result['seconds']:>7.3f}초  (무거운 모듈: {heavy})")
+        for slow in result['slowest']:
+            print(f"      {slow['module']:<40} {slow['seconds']:>7.3f}초")
+    
+    print("=" * 70)
+    return failures
+
+
+def main():
+    """메인 실행 함수"""
+    
+    parser = argparse.ArgumentParser(
+        description='엔트리 포인트별 python -X importtime 벤치마크'
+    )
+    
+    parser.add_argument(
+        '--module',
+        action='append',
+        help='측정할 모듈 (여러 번 지정 가능, 기본: ENTRY_POINTS 전체)'
+    )
+    
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=3,
+        help='엔트리 포인트별 측정 횟수 (최소값 사용, 기본: 3)'
+    )
+    
+    parser.add_argument(
+        '--max-seconds',
+        type=float,
+        default=1.0,
+        help='경량 엔트리 포인트 허용 임포트 시간 (기본: 1.0초)'
+    )
+    
+    parser.add_argument(
+        '--output',
+        type=str,
+        help='결과 JSON 저장 경로'
+    )
+    
+    args = parser.parse_args()
+    
+    entries = {module: module for module in args.module} if args.module else ENTRY_POINTS
+    results = run_benchmark(entries, args.runs)
+    failures = print_report(results, args.max_seconds)
+    
+    if args.output:
+        record = {
+            'measured_at': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'runs': args.runs,
+            'results': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+    
+    if failures:
+        print(f"⚠️ 예산({args.max_seconds}초) 초과 또는 무거운 모듈 로드: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
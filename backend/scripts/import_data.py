@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 # backend/scripts/import_data.py
 # 2025-10-02 09:00, Claude 작성
+# 2026-10-17 12:10, Claude 업데이트 (--chunk-size 벌크 모드, 처리량 출력)
+# 2026-10-17 12:40, Claude 업데이트 (스트리밍 읽기 → 변환 → 청크 쓰기 파이프라인, JSON Lines 지원)
+# 2026-10-17 21:20, Claude 업데이트 (제품 codes 필드: 제품명/동의어에서 정규화된 제품 코드 추출 + 인덱스)
+# 2026-10-18 00:20, Claude 업데이트 (JSON 배열 쉼표 검증, 변환 실패 시 전송 중인 청크 대기)
 
 """
 통합 데이터 임포트 스크립트
@@ -10,11 +14,14 @@ CSV/JSON 데이터를 MongoDB에 임포트하는 통합 스크립트입니다.
 
 주요 기능:
 1. CSV 파일 읽기 및 파싱
-2. JSON 파일 읽기
+2. JSON / JSON Lines 파일 읽기
 3. MongoDB 연결 및 데이터 삽입
 4. 중복 데이터 처리 (upsert)
 5. 진행 상황 로깅
 
+파일은 한 행씩 읽어 변환한 뒤 바로 쓰기 단계로 넘기므로
+파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
 사용법:
     # 제품 데이터 임포트
     python import_data.py --type products --source ../data/raw/products_keychron.csv
@@ -24,6 +31,9 @@ CSV/JSON 데이터를 MongoDB에 임포트하는 통합 스크립트입니다.
     
     # 특정 브랜드만 임포트
     python import_data.py --type products --source ../data/raw/products_keychron.csv --brand KEYCHRON
+    
+    # 벌크 모드 (1000개씩 bulk_write, 동시에 4개 청크 전송)
+    python import_data.py --type faqs --source ../data/raw/naver_store_customer_inquiries.csv --chunk-size 1000 --concurrency 4
 """
 
 import sys
@@ -32,9 +42,10 @@ import csv
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
 import asyncio
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
@@ -42,11 +53,17 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "backend"))
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, IndexModel
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.utils.product_codes import product_codes
 
 
 # ==================== 로깅 설정 ====================
 
+# 로그 디렉터리가 없으면 FileHandler 생성이 실패하므로 먼저 만듦
+(project_root / 'logs').mkdir(exist_ok=True)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -64,58 +81,212 @@ class DataLoader:
     """
     데이터 파일 로더
     
-    CSV, JSON 파일을 읽어서 딕셔너리 리스트로 변환합니다.
+    CSV, JSON, JSON Lines 파일을 한 행(항목)씩 딕셔너리로 읽습니다.
+    iter_* 메서드는 제너레이터라 파일 전체를 메모리에 올리지 않습니다.
     """
     
+    # 스트리밍 JSON 파싱 시 한 번에 읽는 문자 수
+    JSON_READ_SIZE = 64 * 1024
+    
+    # JSON 공백 문자 (파일 맨 앞은 BOM도 허용)
+    JSON_WHITESPACE = ' \t\r\n'
+    
     @staticmethod
-    def load_csv(filepath: Path, encoding: str = 'utf-8') -> List[Dict[str, Any]]:
+    def iter_csv(filepath: Path, encoding: str = 'utf-8') -> Iterator[Dict[str, Any]]:
         """
-        CSV 파일 로드
+        CSV 파일 스트리밍 로드
         
         Args:
             filepath: CSV 파일 경로
             encoding: 파일 인코딩
             
-        Returns:
-            데이터 리스트
+        Yields:
+            행 딕셔너리 (빈 문자열은 None)
         """
-        logger.info(f"📄 CSV 파일 로드 중: {filepath}")
+        logger.info(f"📄 CSV 파일 읽기: {filepath}")
         
-        data = []
-        with open(filepath, 'r', encoding=encoding) as f:
+        with open(filepath, 'r', encoding=encoding, newline='') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 # 빈 문자열을 None으로 변환
-                cleaned_row = {
+                yield {
                     k: (v if v.strip() else None) if isinstance(v, str) else v
                     for k, v in row.items()
                 }
-                data.append(cleaned_row)
+    
+    @classmethod
+    def iter_json(cls, filepath: Path, encoding: str = 'utf-8') -> Iterator[Dict[str, Any]]:
+        """
+        JSON 파일 스트리밍 로드
         
-        logger.info(f"✅ {len(data)}개 행 로드 완료")
-        return data
+        최상위가 배열이면 원소를 하나씩 디코딩하며 반환하고,
+        단일 객체면 그 객체 하나를 반환합니다.
+        
+        Args:
+            filepath: JSON 파일 경로
+            encoding: 파일 인코딩
+            
+        Yields:
+            항목 딕셔너리
+        
+        Raises:
+            ValueError: 잘못된 JSON (원소 사이 쉼표 누락/중복, 끝 쉼표, 닫히지 않은 배열 등)
+        """
+        logger.info(f"📄 JSON 파일 읽기: {filepath}")
+        
+        decoder = json.JSONDecoder()
+        
+        with open(filepath, 'r', encoding=encoding) as f:
+            buffer = ''
+            pos = 0
+            eof = False
+            
+            def fill():
+                nonlocal buffer, pos, eof
+                chunk = f.read(cls.JSON_READ_SIZE)
+                if not chunk:
+                    eof = True
+                buffer = buffer[pos:] + chunk
+                pos = 0
+            
+            def skip(chars: str):
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in chars:
+                        pos += 1
+                    if pos < len(buffer) or eof:
+                        return
+                    fill()
+            
+            skip(cls.JSON_WHITESPACE + '\ufeff')
+            
+            if pos >= len(buffer):
+                return
+            
+            # 단일 객체
+            if buffer[pos] != '[':
+                yield json.loads(buffer[pos:] + f.read())
+                return
+            
+            unclosed = f"JSON 배열이 닫히지 않았습니다: {filepath}"
+            
+            pos += 1
+            skip(cls.JSON_WHITESPACE)
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            
+            while True:
+                # 원소 하나 디코딩 (버퍼 끝에서 끝난 값은 잘렸을 수 있으므로 더 읽고 다시)
+                while True:
+                    if pos >= len(buffer):
+                        raise ValueError(unclosed)
+                    
+                    try:
+                        item, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        fill()
+                        continue
+                    
+                    if end >= len(buffer) and not eof:
+                        fill()
+                        continue
+                    break
+                
+                pos = end
+                yield item
+                
+                # 원소 뒤에는 ']' 또는 쉼표 하나, 쉼표 뒤에는 반드시 다음 원소
+                skip(cls.JSON_WHITESPACE)
+                if pos >= len(buffer):
+                    raise ValueError(unclosed)
+                if buffer[pos] == ']':
+                    return
+                if buffer[pos] != ',':
+                    raise ValueError(f"JSON 배열 원소 사이에 쉼표가 없습니다: {filepath} ({buffer[pos]!r})")
+                
+                pos += 1
+                skip(cls.JSON_WHITESPACE)
+                if pos < len(buffer) and buffer[pos] in ',]':
+                    raise ValueError(f"JSON 배열에 빈 원소가 있습니다: {filepath}")
     
     @staticmethod
-    def load_json(filepath: Path, encoding: str = 'utf-8') -> List[Dict[str, Any]]:
+    def iter_jsonl(filepath: Path, encoding: str = 'utf-8') -> Iterator[Dict[str, Any]]:
         """
-        JSON 파일 로드
+        JSON Lines 파일 스트리밍 로드 (한 줄에 JSON 객체 하나)
         
         Args:
-            filepath: JSON 파일 경로
+            filepath: JSONL 파일 경로
             encoding: 파일 인코딩
             
-        Returns:
-            데이터 리스트 또는 단일 데이터를 리스트로 감싼 것
+        Yields:
+            항목 딕셔너리
         """
-        logger.info(f"📄 JSON 파일 로드 중: {filepath}")
+        logger.info(f"📄 JSON Lines 파일 읽기: {filepath}")
         
         with open(filepath, 'r', encoding=encoding) as f:
-            data = json.load(f)
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{filepath}:{line_no} JSON 파싱 실패: {e}") from e
+    
+    @classmethod
+    def iter_file(cls, filepath: Path, encoding: str = 'utf-8') -> Iterator[Dict[str, Any]]:
+        """
+        확장자에 맞는 스트리밍 로더 선택
+        
+        Args:
+            filepath: 파일 경로 (.csv, .json, .jsonl)
+            encoding: 파일 인코딩
+            
+        Raises:
+            ValueError: 지원하지 않는 확장자
+        """
+        suffix = filepath.suffix.lower()
         
-        # 단일 객체면 리스트로 감싸기
-        if isinstance(data, dict):
-            data = [data]
+        if suffix == '.csv':
+            return cls.iter_csv(filepath, encoding)
+        if suffix == '.json':
+            return cls.iter_json(filepath, encoding)
+        if suffix in ('.jsonl', '.ndjson'):
+            return cls.iter_jsonl(filepath, encoding)
         
+        raise ValueError(f"지원하지 않는 파일 형식: {filepath.suffix}")
+    
+    @classmethod
+    def load_csv(cls, filepath: Path, encoding: str = 'utf-8') -> List[Dict[str, Any]]:
+        """
+        CSV 파일 전체 로드
+        
+        Args:
+            filepath: CSV 파일 경로
+            encoding: 파일 인코딩
+            
+        Returns:
+            데이터 리스트
+        """
+        data = list(cls.iter_csv(filepath, encoding))
+        logger.info(f"✅ {len(data)}개 행 로드 완료")
+        return data
+    
+    @classmethod
+    def load_json(cls, filepath: Path, encoding: str = 'utf-8') -> List[Dict[str, Any]]:
+        """
+        JSON 파일 전체 로드
+        
+        Args:
+            filepath: JSON 파일 경로
+            encoding: 파일 인코딩
+            
+        Returns:
+            데이터 리스트 또는 단일 데이터를 리스트로 감싼 것
+        """
+        data = list(cls.iter_json(filepath, encoding))
         logger.info(f"✅ {len(data)}개 항목 로드 완료")
         return data
 
@@ -175,6 +346,9 @@ class DataTransformer:
                 else:
                     product[field] = value
         
+        # 제품 코드 색인 (get_product_by_code가 codes 인덱스로 조회)
+        product['codes'] = product_codes(product['product_name'], product.get('product_name_synonyms'))
+        
         return product
     
     @staticmethod
@@ -232,16 +406,26 @@ class MongoDBImporter:
     데이터를 MongoDB에 삽입하고 관리합니다.
     """
     
-    def __init__(self, connection_string: str, database_name: str):
+    def __init__(
+        self,
+        connection_string: str,
+        database_name: str,
+        chunk_size: int = 0,
+        concurrency: int = 4
+    ):
         """
         초기화
         
         Args:
             connection_string: MongoDB 연결 문자열
             database_name: 데이터베이스 이름
+            chunk_size: bulk_write 청크 크기 (0이면 행 단위 update_one)
+            concurrency: 벌크 모드에서 동시에 전송할 청크 수
         """
         self.connection_string = connection_string
         self.database_name = database_name
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
         self.client: Optional[AsyncIOMotorClient] = None
         self.db = None
     
@@ -282,6 +466,7 @@ class MongoDBImporter:
                 IndexModel([("product_id", ASCENDING)], unique=True),
                 IndexModel([("brand_channel", ASCENDING)]),
                 IndexModel([("product_name", ASCENDING)]),
+                IndexModel([("brand_channel", ASCENDING), ("codes", ASCENDING)]),
             ]
             await self.db.products.create_indexes(indexes)
         
@@ -297,115 +482,232 @@ class MongoDBImporter:
         
         logger.info(f"✅ {collection_name} 인덱스 생성 완료")
     
-    async def import_products(
+    async def _upsert_rows(
         self,
-        products: List[Dict[str, Any]],
-        brand_filter: Optional[str] = None
+        collection,
+        documents: Iterable[Dict[str, Any]],
+        key_field: str
     ) -> Dict[str, int]:
         """
-        제품 데이터 임포트
+        행 단위 upsert (update_one)
         
         Args:
-            products: 제품 데이터 리스트
-            brand_filter: 브랜드 필터 (선택)
+            collection: 대상 컬렉션
+            documents: 문서 목록
+            key_field: upsert 기준 필드
             
         Returns:
-            {'inserted': int, 'updated': int, 'failed': int}
+            {'inserted': int, 'updated': int, 'failed': int, 'processed': int}
         """
-        logger.info(f"📦 제품 데이터 임포트 시작: {len(products)}개")
-        
-        # 인덱스 생성
-        await self.ensure_indexes('products')
-        
         inserted = 0
         updated = 0
         failed = 0
+        processed = 0
         
-        for product in products:
-            # 브랜드 필터링
-            if brand_filter and product.get('brand_channel') != brand_filter.upper():
-                continue
+        for document in documents:
+            processed += 1
             
             try:
-                result = await self.db.products.update_one(
-                    {'product_id': product['product_id']},
-                    {'$set': product},
+                result = await collection.update_one(
+                    {key_field: document[key_field]},
+                    {'$set': document},
                     upsert=True
                 )
                 
                 if result.upserted_id:
                     inserted += 1
-                    logger.debug(f"  ➕ 새 제품: {product['product_name']}")
+                    logger.debug(f"  ➕ 새 문서: {document[key_field]}")
                 elif result.modified_count > 0:
                     updated += 1
-                    logger.debug(f"  🔄 업데이트: {product['product_name']}")
+                    logger.debug(f"  🔄 업데이트: {document[key_field]}")
                 
             except Exception as e:
                 failed += 1
-                logger.error(f"  ❌ 실패 ({product.get('product_id')}): {e}")
-        
-        logger.info(f"✅ 제품 임포트 완료: 추가 {inserted}, 업데이트 {updated}, 실패 {failed}")
+                logger.error(f"  ❌ 실패 ({document.get(key_field)}): {e}")
         
         return {
             'inserted': inserted,
             'updated': updated,
-            'failed': failed
+            'failed': failed,
+            'processed': processed
         }
     
+    async def _upsert_bulk(
+        self,
+        collection,
+        documents: Iterable[Dict[str, Any]],
+        key_field: str
+    ) -> Dict[str, int]:
+        """
+        청크 단위 upsert (unordered bulk_write)
+        
+        chunk_size개씩 UpdateOne을 묶어 전송하고, 최대 concurrency개 청크를
+        동시에 처리합니다. 추가/업데이트/실패 수는 BulkWriteResult에서 집계합니다.
+        
+        Args:
+            collection: 대상 컬렉션
+            documents: 문서 목록
+            key_field: upsert 기준 필드
+            
+        Returns:
+            {'inserted': int, 'updated': int, 'failed': int, 'processed': int}
+        """
+        totals = {'inserted': 0, 'updated': 0, 'failed': 0, 'processed': 0}
+        written = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: set = set()
+        
+        async def write_chunk(chunk: List[Dict[str, Any]]):
+            nonlocal written
+            operations = [
+                UpdateOne({key_field: doc[key_field]}, {'$set': doc}, upsert=True)
+                for doc in chunk
+            ]
+            
+            try:
+                result = await collection.bulk_write(operations, ordered=False)
+                totals['inserted'] += result.upserted_count
+                totals['updated'] += result.modified_count
+                
+            except BulkWriteError as e:
+                # 실패한 문서를 제외한 나머지는 이미 반영됨
+                details = e.details
+                write_errors = details.get('writeErrors', [])
+                totals['inserted'] += details.get('nUpserted', 0)
+                totals['updated'] += details.get('nModified', 0)
+                totals['failed'] += len(write_errors)
+                
+                for error in write_errors:
+                    doc = chunk[error['index']]
+                    logger.error(f"  ❌ 실패 ({doc.get(key_field)}): {error.get('errmsg')}")
+                
+            except Exception as e:
+                totals['failed'] += len(chunk)
+                logger.error(f"  ❌ 청크 실패 ({len(chunk)}개): {e}")
+                
+            finally:
+                semaphore.release()
+            
+            written += len(chunk)
+            logger.info(f"  📦 {written}개 전송 완료")
+        
+        async def submit(chunk: List[Dict[str, Any]]):
+            # 동시 전송 중인 청크가 concurrency개를 넘지 않도록 대기
+            await semaphore.acquire()
+            task = asyncio.create_task(write_chunk(chunk))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        try:
+            chunk: List[Dict[str, Any]] = []
+            for document in documents:
+                totals['processed'] += 1
+                chunk.append(document)
+                
+                if len(chunk) >= self.chunk_size:
+                    await submit(chunk)
+                    chunk = []
+            
+            if chunk:
+                await submit(chunk)
+        
+        finally:
+            # 읽기/변환 중 예외가 나도 이미 보낸 청크는 끝까지 기다림 (태스크를 버려두지 않음)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return totals
+    
+    async def _import(
+        self,
+        collection,
+        documents: Iterable[Dict[str, Any]],
+        key_field: str,
+        brand_filter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        모드(행 단위/벌크)에 맞게 upsert하고 처리량 계산
+        
+        Returns:
+            {'inserted', 'updated', 'failed', 'processed', 'elapsed', 'rows_per_sec'}
+        """
+        if brand_filter:
+            documents = (
+                doc for doc in documents
+                if doc.get('brand_channel') == brand_filter.upper()
+            )
+        
+        started = time.perf_counter()
+        
+        if self.chunk_size > 0:
+            result = await self._upsert_bulk(collection, documents, key_field)
+        else:
+            result = await self._upsert_rows(collection, documents, key_field)
+        
+        elapsed = time.perf_counter() - started
+        result['elapsed'] = round(elapsed, 2)
+        result['rows_per_sec'] = round(result['processed'] / elapsed, 1) if elapsed > 0 else 0.0
+        
+        return result
+    
+    async def import_products(
+        self,
+        products: Iterable[Dict[str, Any]],
+        brand_filter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        제품 데이터 임포트
+        
+        Args:
+            products: 제품 데이터 (리스트 또는 제너레이터)
+            brand_filter: 브랜드 필터 (선택)
+            
+        Returns:
+            {'inserted': int, 'updated': int, 'failed': int, 'processed': int,
+             'elapsed': float, 'rows_per_sec': float}
+        """
+        logger.info("📦 제품 데이터 임포트 시작")
+        
+        # 인덱스 생성
+        await self.ensure_indexes('products')
+        
+        result = await self._import(self.db.products, products, 'product_id', brand_filter)
+        
+        logger.info(
+            f"✅ 제품 임포트 완료: 추가 {result['inserted']}, "
+            f"업데이트 {result['updated']}, 실패 {result['failed']}"
+        )
+        
+        return result
+    
     async def import_faqs(
         self,
-        faqs: List[Dict[str, Any]],
+        faqs: Iterable[Dict[str, Any]],
         brand_filter: Optional[str] = None
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
         FAQ 데이터 임포트
         
         Args:
-            faqs: FAQ 데이터 리스트
+            faqs: FAQ 데이터 (리스트 또는 제너레이터)
             brand_filter: 브랜드 필터 (선택)
             
         Returns:
-            {'inserted': int, 'updated': int, 'failed': int}
+            {'inserted': int, 'updated': int, 'failed': int, 'processed': int,
+             'elapsed': float, 'rows_per_sec': float}
         """
-        logger.info(f"💬 FAQ 데이터 임포트 시작: {len(faqs)}개")
+        logger.info("💬 FAQ 데이터 임포트 시작")
         
         # 인덱스 생성
         await self.ensure_indexes('faqs')
         
-        inserted = 0
-        updated = 0
-        failed = 0
-        
-        for faq in faqs:
-            # 브랜드 필터링
-            if brand_filter and faq.get('brand_channel') != brand_filter.upper():
-                continue
-            
-            try:
-                result = await self.db.faqs.update_one(
-                    {'inquiry_no': faq['inquiry_no']},
-                    {'$set': faq},
-                    upsert=True
-                )
-                
-                if result.upserted_id:
-                    inserted += 1
-                    logger.debug(f"  ➕ 새 FAQ: {faq['inquiry_no']}")
-                elif result.modified_count > 0:
-                    updated += 1
-                    logger.debug(f"  🔄 업데이트: {faq['inquiry_no']}")
-                
-            except Exception as e:
-                failed += 1
-                logger.error(f"  ❌ 실패 ({faq.get('inquiry_no')}): {e}")
+        result = await self._import(self.db.faqs, faqs, 'inquiry_no', brand_filter)
         
-        logger.info(f"✅ FAQ 임포트 완료: 추가 {inserted}, 업데이트 {updated}, 실패 {failed}")
+        logger.info(
+            f"✅ FAQ 임포트 완료: 추가 {result['inserted']}, "
+            f"업데이트 {result['updated']}, 실패 {result['failed']}"
+        )
         
-        return {
-            'inserted': inserted,
-            'updated': updated,
-            'failed': failed
-        }
+        return result
 
 
 # ==================== 메인 함수 ====================
@@ -427,6 +729,12 @@ async def main():
   
   # JSON 파일 임포트
   python import_data.py --type products --source ../data/products/keychron_products.json
+  
+  # JSON Lines 파일 임포트
+  python import_data.py --type faqs --source ../data/raw/inquiries.jsonl --chunk-size 1000
+  
+  # 벌크 모드 (bulk_write 청크 단위)
+  python import_data.py --type faqs --source ../data/raw/naver_store_customer_inquiries.csv --chunk-size 1000
         """
     )
     
@@ -440,7 +748,7 @@ async def main():
     parser.add_argument(
         '--source',
         required=True,
-        help='소스 파일 경로 (CSV 또는 JSON)'
+        help='소스 파일 경로 (CSV, JSON 배열 또는 JSON Lines)'
     )
     
     parser.add_argument(
@@ -466,6 +774,20 @@ async def main():
         help='특정 브랜드만 임포트 (선택)'
     )
     
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=0,
+        help='bulk_write 청크 크기 (기본값: 0 = 행 단위 upsert)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='벌크 모드에서 동시에 전송할 청크 수 (기본값: 4)'
+    )
+    
     args = parser.parse_args()
     
     # 파일 경로 확인
@@ -474,54 +796,55 @@ async def main():
         logger.error(f"❌ 파일을 찾을 수 없습니다: {source_path}")
         sys.exit(1)
     
-    # 데이터 로드
+    # 데이터 파이프라인: 행 읽기 → 변환 → (임포터에서) 청크 쓰기
+    # 모두 제너레이터로 연결되어 파일 전체를 메모리에 올리지 않음
     loader = DataLoader()
     
-    if source_path.suffix == '.csv':
-        raw_data = loader.load_csv(source_path)
-    elif source_path.suffix == '.json':
-        raw_data = loader.load_json(source_path)
-    else:
-        logger.error(f"❌ 지원하지 않는 파일 형식: {source_path.suffix}")
-        sys.exit(1)
-    
-    if not raw_data:
-        logger.error("❌ 데이터가 비어있습니다")
+    try:
+        raw_rows = loader.iter_file(source_path)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
         sys.exit(1)
     
-    # 데이터 변환
     transformer = DataTransformer()
     
     if args.type == 'products':
-        transformed_data = [
+        documents = (
             transformer.transform_product(item, args.brand)
-            for item in raw_data
-        ]
+            for item in raw_rows
+        )
     else:  # faqs
-        transformed_data = [
+        documents = (
             transformer.transform_faq(item)
-            for item in raw_data
-        ]
-    
-    logger.info(f"🔄 {len(transformed_data)}개 데이터 변환 완료")
+            for item in raw_rows
+        )
     
     # MongoDB 임포트
-    importer = MongoDBImporter(args.mongodb_url, args.database)
+    importer = MongoDBImporter(
+        args.mongodb_url,
+        args.database,
+        chunk_size=args.chunk_size,
+        concurrency=args.concurrency
+    )
     
     try:
         await importer.connect()
         
         if args.type == 'products':
             result = await importer.import_products(
-                transformed_data,
+                documents,
                 brand_filter=args.filter_brand
             )
         else:  # faqs
             result = await importer.import_faqs(
-                transformed_data,
+                documents,
                 brand_filter=args.filter_brand
             )
         
+        if result['processed'] == 0:
+            logger.error("❌ 데이터가 비어있습니다")
+            sys.exit(1)
+        
         # 결과 출력
         logger.info("=" * 60)
         logger.info("📊 임포트 결과 요약")
@@ -529,6 +852,7 @@ async def main():
         logger.info(f"  ➕ 추가됨:   {result['inserted']:>5}개")
         logger.info(f"  🔄 업데이트: {result['updated']:>5}개")
         logger.info(f"  ❌ 실패:     {result['failed']:>5}개")
+        logger.info(f"  ⏱️  처리량:   {result['rows_per_sec']:>5} rows/sec ({result['processed']}개, {result['elapsed']}초)")
         logger.info("=" * 60)
         
         if result['failed'] > 0:
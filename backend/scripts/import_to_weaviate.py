@@ -6,10 +6,29 @@ MongoDB → Weaviate 임베딩 임포트 스크립트
 투비네트웍스 글로벌 - CS AI 에이전트 프로젝트
 
 2025-10-02 17:50, Claude 작성
+2026-10-17 09:10, Claude 업데이트 (공유 EmbeddingEngine 사용)
+2026-10-17 10:10, Claude 업데이트 (임베딩 캐시 사용)
+2026-10-17 13:10, Claude 업데이트 (페이지 단위 스트리밍 파이프라인 --stream)
+2026-10-17 13:40, Claude 업데이트 (증분 동기화 --incremental)
+2026-10-17 22:50, Claude 업데이트 (FAQ 인덱서가 보류한 저장 실패 FAQ를 증분 동기화에서 재반영)
+2026-10-17 23:10, Claude 업데이트 (앱과 같은 FAQs 컬렉션/스키마/UUID 사용)
+2026-10-17 23:30, Claude 업데이트 (모든 임포트 모드에서 faq_vector_state 기록, 삭제 스캔 생략 옵션)
+2026-10-18 02:40, Claude 업데이트 (변환할 수 없는 보류 FAQ를 삭제로 보지 않고 실패로 집계, 보류 유지)
 
 이 스크립트는 MongoDB에 저장된 FAQ 데이터를 읽어서
 Sentence-BERT로 벡터 임베딩을 생성한 후 Weaviate에 저장합니다.
 
+컬렉션 이름, 속성, 임베딩 텍스트, UUID는 앱/FAQ 인덱서와 같은 것을 씁니다.
+(WeaviateService.FAQ_COLLECTION, faq_properties, faq_text, faq_uuid → inquiry_no 기반 UUID)
+따라서 어느 경로로 쓰든 같은 FAQ는 같은 객체를 덮어씁니다.
+
+마이그레이션 (이전 버전 스크립트로 임포트한 경우):
+    이전 버전은 "FAQ" 컬렉션에 faq_id("FAQ-<inquiry_no>") 기반 UUID와
+    combined_text/category 속성으로 저장했고, 앱은 이 컬렉션을 읽지 않았습니다.
+    1. python setup_weaviate.py          # 구 "FAQ" 컬렉션 삭제, FAQs 컬렉션 재생성
+    2. MongoDB에서 faq_vector_state 컬렉션과 sync_state의 weaviate_faq:* 문서 삭제
+    3. python import_to_weaviate.py --type faqs   # 전체 재임포트
+
 주요 작업:
 1. MongoDB에서 FAQ 데이터 읽기
 2. Sentence-BERT로 임베딩 생성 (768차원 벡터)
@@ -25,24 +44,40 @@ Sentence-BERT로 벡터 임베딩을 생성한 후 Weaviate에 저장합니다.
     
     # 배치 크기 조정 (메모리 부족 시)
     python import_to_weaviate.py --type faqs --batch-size 50
+    
+    # 스트리밍 모드 (페이지 단위 읽기, 임베딩과 저장을 겹쳐서 실행)
+    python import_to_weaviate.py --type faqs --stream --page-size 500
+    
+    # 증분 동기화 (지난 실행 이후 변경/삭제된 FAQ만 반영, 야간 배치용)
+    python import_to_weaviate.py --type faqs --incremental
+    
+    # 증분 동기화에서 삭제 스캔 생략 (삭제는 FAQ 인덱서가 실시간 반영, 스캔은 주기적으로만)
+    python import_to_weaviate.py --type faqs --incremental --skip-deletions
 """
 
 import sys
+import time
+import queue
 import logging
 import argparse
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
-import torch
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
 
 from pymongo import MongoClient
 import weaviate
-from weaviate.util import generate_uuid5
-from sentence_transformers import SentenceTransformer
+from weaviate.classes.query import Filter
+
+from app.services.embedding_engine import get_embedding_engine
+from app.services.faq_indexer import FAILURE_COLLECTION, VECTOR_STATE_COLLECTION, vector_state_update
+from app.services.weaviate_service import WeaviateService
 
 
 # ==================== 로깅 설정 ====================
@@ -67,6 +102,16 @@ WEAVIATE_URL = "http://localhost:8081"
 # 한국어 + 영어 멀티링구얼 모델 (768차원 벡터)
 MODEL_NAME = "jhgan/ko-sroberta-multitask"
 
+# Redis 설정 (임베딩 캐시, 앱과 공유)
+REDIS_URL = "redis://localhost:6379"
+REDIS_TTL = 3600
+
+# 증분 동기화 상태 컬렉션
+# sync_state: 동기화 작업별 high-water mark (updated_at 기준)
+# faq_vector_state(VECTOR_STATE_COLLECTION): Weaviate에 저장된 FAQ별 내용 해시 (변경/삭제 감지용)
+#   전체/스트리밍/증분 임포트와 FAQ 인덱서가 모두 기록합니다.
+SYNC_STATE_COLLECTION = "sync_state"
+
 
 # ==================== 임베딩 생성기 ====================
 
@@ -75,54 +120,59 @@ class EmbeddingGenerator:
     Sentence-BERT 임베딩 생성기
     
     텍스트를 768차원 벡터로 변환합니다.
+    모델은 앱과 같은 공유 EmbeddingEngine을 사용하며,
     GPU가 있으면 자동으로 사용합니다 (RTX 3050).
+    이미 임베딩된 텍스트는 임베딩 캐시(로컬 LRU + Redis)에서 재사용합니다.
     """
     
-    def __init__(self, model_name: str = MODEL_NAME):
+    def __init__(self, model_name: str = MODEL_NAME, redis_url: str = None):
         """
         초기화
         
         Args:
             model_name: Sentence-BERT 모델 이름
+            redis_url: 임베딩 캐시 Redis URL (None이면 로컬 캐시만 사용)
         """
-        logger.info(f"🤖 Sentence-BERT 모델 로딩: {model_name}")
-        
-        # GPU 사용 가능 여부 확인
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"  💻 디바이스: {device}")
-        
-        if device == "cuda":
-            logger.info(f"  🎮 GPU: {torch.cuda.get_device_name(0)}")
+        self.engine = get_embedding_engine(model_name, redis_url=redis_url, redis_ttl=REDIS_TTL)
         
-        # 모델 로드
-        self.model = SentenceTransformer(model_name, device=device)
-        
-        logger.info(f"  ✅ 모델 로드 완료! (임베딩 차원: 768)")
+        footprint = self.engine.memory_footprint()
+        logger.info(f"  💾 모델 메모리: {footprint['megabytes']}MB")
     
-    def encode(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = True
+    ) -> List[List[float]]:
         """
         텍스트 리스트를 벡터로 변환
         
         Args:
             texts: 텍스트 리스트
             batch_size: 배치 크기 (GPU 메모리에 따라 조정)
+            show_progress_bar: 진행 표시줄 출력 여부
         
         Returns:
             벡터 리스트 (각 벡터는 768차원)
         """
-        logger.info(f"  🔄 {len(texts)}개 텍스트 임베딩 생성 중... (배치 크기: {batch_size})")
+        if show_progress_bar:
+            logger.info(f"  🔄 {len(texts)}개 텍스트 임베딩 생성 중... (배치 크기: {batch_size})")
         
-        # 배치로 나눠서 처리
-        embeddings = self.model.encode(
+        # 배치로 나눠서 처리 (캐시 미스만 인코딩, 정규화된 벡터 반환)
+        embeddings = self.engine.encode(
             texts,
             batch_size=batch_size,
-            show_progress_bar=True,
-            convert_to_tensor=False,
-            normalize_embeddings=True  # 코사인 유사도 계산 최적화
+            show_progress_bar=show_progress_bar
         )
         
-        # numpy array → list 변환
-        return embeddings.tolist()
+        stats = self.engine.cache.get_stats()
+        log = logger.info if show_progress_bar else logger.debug
+        log(
+            f"  💾 임베딩 캐시: 로컬 적중 {stats['hits_local']}, "
+            f"Redis 적중 {stats['hits_redis']}, 미스 {stats['misses']}"
+        )
+        
+        return embeddings
 
 
 # ==================== FAQ 임포터 ====================
@@ -171,35 +221,44 @@ class FAQImporter:
         
         logger.info("  ✅ Weaviate 연결 성공!")
     
-    def prepare_faq_text(self, faq: Dict[str, Any]) -> str:
+    def prepare_faqs(self, faqs: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str, Dict[str, Any]]]:
         """
-        FAQ 문서를 하나의 텍스트로 결합
+        FAQ 문서를 임베딩 텍스트 + Weaviate 속성으로 변환
         
-        질문 제목 + 질문 내용 + 답변을 결합하여
-        임베딩 생성용 텍스트를 만듭니다.
+        앱과 같은 변환(WeaviateService.faq_text / faq_properties)을 사용합니다.
+        필수 필드가 없는 문서는 경고를 남기고 건너뜁니다.
         
         Args:
-            faq: MongoDB FAQ 문서
+            faqs: MongoDB FAQ 문서 리스트
         
         Returns:
-            결합된 텍스트
+            (문서, 임베딩 텍스트, 속성) 리스트
         """
-        parts = []
+        prepared = []
+        for faq in faqs:
+            try:
+                prepared.append((faq, WeaviateService.faq_text(faq), WeaviateService.faq_properties(faq)))
+            except KeyError as e:
+                logger.warning(f"  ⚠️  필수 필드 누락으로 건너뜀 ({faq.get('inquiry_no', faq.get('_id'))}): {e}")
+        return prepared
+    
+    def _find_faqs(self, brand_filter: str = None, limit: int = None, page_size: int = None):
+        """FAQ 조회 커서 생성"""
+        query = {}
+        if brand_filter:
+            query['brand_channel'] = brand_filter.upper()
+            logger.info(f"  🏷️  브랜드 필터: {brand_filter}")
         
-        # 제목
-        if faq.get('title'):
-            parts.append(faq['title'])
+        cursor = self.mongo_db.faqs.find(query)
         
-        # 질문 내용
-        if faq.get('inquiry_content'):
-            parts.append(faq['inquiry_content'])
+        if page_size:
+            cursor = cursor.batch_size(page_size)
         
-        # 답변
-        if faq.get('answer_content'):
-            parts.append(faq['answer_content'])
+        if limit:
+            cursor = cursor.limit(limit)
+            logger.info(f"  ⚠️  테스트 모드: 최대 {limit}개만 임포트")
         
-        # 공백으로 결합
-        return ' '.join(parts).strip()
+        return cursor
     
     def import_faqs(
         self,
@@ -223,21 +282,9 @@ class FAQImporter:
         logger.info("=" * 70)
         
         # MongoDB에서 FAQ 읽기
-        query = {}
-        if brand_filter:
-            query['brand_channel'] = brand_filter.upper()
-        
         logger.info(f"\n[1/4] MongoDB에서 FAQ 읽기...")
-        if brand_filter:
-            logger.info(f"  🏷️  브랜드 필터: {brand_filter}")
-        
-        cursor = self.mongo_db.faqs.find(query)
-        
-        if limit:
-            cursor = cursor.limit(limit)
-            logger.info(f"  ⚠️  테스트 모드: 최대 {limit}개만 임포트")
         
-        faqs = list(cursor)
+        faqs = list(self._find_faqs(brand_filter, limit))
         logger.info(f"  ✅ {len(faqs)}개 FAQ 로드 완료")
         
         if not faqs:
@@ -246,26 +293,11 @@ class FAQImporter:
         
         # 텍스트 준비
         logger.info(f"\n[2/4] FAQ 텍스트 준비 중...")
-        texts = []
-        metadata_list = []
-        
-        for faq in faqs:
-            # 텍스트 결합
-            combined_text = self.prepare_faq_text(faq)
-            texts.append(combined_text)
-            
-            # 메타데이터 준비
-            metadata = {
-                'faq_id': faq.get('faq_id', f"FAQ-{faq['inquiry_no']}"),
-                'inquiry_no': faq['inquiry_no'],
-                'mongodb_id': str(faq['_id']),
-                'brand_channel': faq.get('brand_channel', ''),
-                'category': faq.get('inquiry_category', ''),
-                'combined_text': combined_text,
-                'answered': faq.get('answered', False),
-                'created_at': faq.get('created_at', datetime.now())
-            }
-            metadata_list.append(metadata)
+        prepared = self.prepare_faqs(faqs)
+        texts = [text for _, text, _ in prepared]
+        metadata_list = [metadata for _, _, metadata in prepared]
+        failed = len(faqs) - len(prepared)
+        faqs = [faq for faq, _, _ in prepared]
         
         logger.info(f"  ✅ {len(texts)}개 텍스트 준비 완료")
         
@@ -277,10 +309,10 @@ class FAQImporter:
         # Weaviate에 저장
         logger.info(f"\n[4/4] Weaviate에 저장 중...")
         
-        collection = self.weaviate_client.collections.get("FAQ")
+        collection = self.weaviate_client.collections.get(WeaviateService.FAQ_COLLECTION)
         
         imported = 0
-        failed = 0
+        run_started = datetime.now()
         
         # 배치로 나눠서 저장
         for i in range(0, len(faqs), batch_size):
@@ -288,22 +320,17 @@ class FAQImporter:
             batch_vectors = embeddings[i:i+batch_size]
             
             try:
-                # 배치 insert
-                with collection.batch.dynamic() as batch:
-                    for metadata, vector in zip(batch_metadata, batch_vectors):
-                        # UUID 생성 (faq_id 기반)
-                        uuid = generate_uuid5(metadata['faq_id'])
-                        
-                        batch.add_object(
-                            properties=metadata,
-                            vector=vector,
-                            uuid=uuid
-                        )
+                # 배치 insert (UUID는 inquiry_no 기반, 앱/인덱서와 같은 UUID)
+                succeeded, batch_failed, failed_uuids = self._write_page(
+                    collection, batch_metadata, batch_vectors, batch_size
+                )
+                self._record_vector_state(faqs[i:i+batch_size], failed_uuids, run_started)
                 
-                imported += len(batch_metadata)
+                imported += succeeded
+                failed += batch_failed
                 
                 # 진행 상황 출력
-                if imported % 100 == 0 or imported == len(faqs):
+                if imported % 100 == 0 or i + batch_size >= len(faqs):
                     logger.info(f"  → {imported}/{len(faqs)} 완료...")
                 
             except Exception as e:
@@ -323,6 +350,409 @@ class FAQImporter:
             'failed': failed
         }
     
+    def _iter_pages(self, cursor, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """커서를 page_size개씩 나눠서 반환"""
+        iterator = iter(cursor)
+        while True:
+            page = list(islice(iterator, page_size))
+            if not page:
+                return
+            yield page
+    
+    def _record_vector_state(
+        self,
+        faqs: List[Dict[str, Any]],
+        failed_uuids: set,
+        synced_at: datetime
+    ) -> int:
+        """
+        Weaviate 저장에 성공한 FAQ의 내용 해시를 faq_vector_state에 기록
+        
+        전체/스트리밍 임포트도 기록해야 다음 증분 동기화가 같은 FAQ를 다시 임베딩하지 않고,
+        삭제 스캔이 이 FAQ들의 벡터도 정리할 수 있습니다.
+        
+        Returns:
+            기록한 FAQ 수
+        """
+        operations = [
+            vector_state_update(faq, WeaviateService.faq_content_hash(faq), synced_at)
+            for faq in faqs
+            if str(WeaviateService.faq_uuid(faq['inquiry_no'])) not in failed_uuids
+        ]
+        if operations:
+            self.mongo_db[VECTOR_STATE_COLLECTION].bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    def _write_page(
+        self,
+        collection,
+        metadata_list: List[Dict[str, Any]],
+        vectors: List[List[float]],
+        batch_size: int
+    ) -> Tuple[int, int, set]:
+        """
+        한 페이지를 Weaviate에 저장
+        
+        Returns:
+            (성공 수, 실패 수, 실패한 객체 UUID 집합)
+        """
+        with collection.batch.fixed_size(batch_size=batch_size) as batch:
+            for metadata, vector in zip(metadata_list, vectors):
+                batch.add_object(
+                    properties=metadata,
+                    vector=vector,
+                    uuid=WeaviateService.faq_uuid(metadata['inquiry_no'])
+                )
+        
+        failed_objects = collection.batch.failed_objects
+        for failed_object in failed_objects[:3]:
+            logger.error(f"  ❌ 저장 실패: {failed_object.message}")
+        
+        failed_uuids = {str(failed_object.object_.uuid) for failed_object in failed_objects}
+        
+        return len(metadata_list) - len(failed_objects), len(failed_objects), failed_uuids
+    
+    def import_faqs_streaming(
+        self,
+        brand_filter: str = None,
+        batch_size: int = 100,
+        page_size: int = 500,
+        queue_size: int = 2,
+        limit: int = None
+    ) -> Dict[str, Any]:
+        """
+        FAQ 데이터를 스트리밍 파이프라인으로 Weaviate에 임포트
+        
+        MongoDB 커서를 page_size개씩 읽어 임베딩하고, 저장은 별도 스레드가 맡습니다.
+        두 단계 사이의 큐 크기가 queue_size로 제한되므로 메모리에는 최대
+        (queue_size + 2)개 페이지만 올라가며, 페이지 N 임베딩과 페이지 N-1 저장이
+        동시에 진행되어 전체 시간이 max(임베딩, 저장)에 가까워집니다.
+        
+        Args:
+            brand_filter: 브랜드 필터 (예: "KEYCHRON")
+            batch_size: 임베딩/Weaviate 배치 크기
+            page_size: 한 번에 읽고 임베딩할 FAQ 수
+            queue_size: 임베딩 완료 후 저장 대기 중인 최대 페이지 수
+            limit: 임포트할 최대 개수 (테스트용)
+        
+        Returns:
+            {'imported': int, 'failed': int, 'elapsed': float,
+             'embed_seconds': float, 'write_seconds': float}
+        """
+        logger.info("=" * 70)
+        logger.info(f"📦 FAQ → Weaviate 스트리밍 임포트 시작 (페이지 {page_size}개, 큐 {queue_size})")
+        logger.info("=" * 70)
+        
+        collection = self.weaviate_client.collections.get(WeaviateService.FAQ_COLLECTION)
+        pages: "queue.Queue[Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[List[float]]]]]" = queue.Queue(maxsize=queue_size)
+        
+        stats = {'imported': 0, 'failed': 0, 'embed_seconds': 0.0, 'write_seconds': 0.0}
+        run_started = datetime.now()
+        
+        def writer():
+            while True:
+                item = pages.get()
+                if item is None:
+                    return
+                
+                page_faqs, metadata_list, vectors = item
+                started = time.perf_counter()
+                
+                try:
+                    imported, failed, failed_uuids = self._write_page(collection, metadata_list, vectors, batch_size)
+                    self._record_vector_state(page_faqs, failed_uuids, run_started)
+                except Exception as e:
+                    imported, failed = 0, len(metadata_list)
+                    logger.error(f"  ❌ 페이지 저장 실패 ({len(metadata_list)}개): {e}")
+                
+                stats['write_seconds'] += time.perf_counter() - started
+                stats['imported'] += imported
+                stats['failed'] += failed
+                logger.info(f"  → {stats['imported'] + stats['failed']}개 저장 처리 완료 (대기 페이지 {pages.qsize()})")
+        
+        writer_thread = threading.Thread(target=writer, name="weaviate-writer", daemon=True)
+        writer_thread.start()
+        
+        started = time.perf_counter()
+        skipped = 0
+        
+        try:
+            cursor = self._find_faqs(brand_filter, limit, page_size)
+            
+            for page in self._iter_pages(cursor, page_size):
+                prepared = self.prepare_faqs(page)
+                skipped += len(page) - len(prepared)
+                if not prepared:
+                    continue
+                
+                texts = [text for _, text, _ in prepared]
+                metadata_list = [metadata for _, _, metadata in prepared]
+                
+                embed_started = time.perf_counter()
+                vectors = self.embedding_generator.encode(
+                    texts,
+                    batch_size=batch_size,
+                    show_progress_bar=False
+                )
+                stats['embed_seconds'] += time.perf_counter() - embed_started
+                
+                # 큐가 가득 차면 저장 스레드가 따라올 때까지 대기 (메모리 상한)
+                pages.put(([faq for faq, _, _ in prepared], metadata_list, vectors))
+        finally:
+            pages.put(None)
+            writer_thread.join()
+        
+        stats['failed'] += skipped
+        elapsed = time.perf_counter() - started
+        
+        # 결과 출력
+        logger.info("\n" + "=" * 70)
+        logger.info("📊 임포트 결과")
+        logger.info("=" * 70)
+        logger.info(f"  ✅ 성공: {stats['imported']:>5}개")
+        logger.info(f"  ❌ 실패: {stats['failed']:>5}개")
+        logger.info(
+            f"  ⏱️  전체 {elapsed:.1f}초 "
+            f"(임베딩 {stats['embed_seconds']:.1f}초, 저장 {stats['write_seconds']:.1f}초)"
+        )
+        logger.info("=" * 70)
+        
+        return {
+            'imported': stats['imported'],
+            'failed': stats['failed'],
+            'elapsed': round(elapsed, 2),
+            'embed_seconds': round(stats['embed_seconds'], 2),
+            'write_seconds': round(stats['write_seconds'], 2)
+        }
+    
+    # ==================== 증분 동기화 ====================
+    
+    def _delete_vectors(self, collection, inquiry_nos: List[int]) -> int:
+        """inquiry_no 목록에 해당하는 Weaviate 객체 삭제"""
+        deleted = 0
+        for i in range(0, len(inquiry_nos), 1000):
+            uuids = [WeaviateService.faq_uuid(inquiry_no) for inquiry_no in inquiry_nos[i:i + 1000]]
+            result = collection.data.delete_many(where=Filter.by_id().contains_any(uuids))
+            deleted += result.successful
+        return deleted
+    
+    def _sync_deletions(self, collection, brand_filter: str = None, page_size: int = 1000) -> int:
+        """
+        MongoDB에서 삭제된 FAQ의 벡터 삭제
+        
+        faq_vector_state에 기록된 inquiry_no 중 faqs에 더 이상 없는 것을 찾아
+        Weaviate 객체와 상태 문서를 함께 지웁니다. (임베딩 없이 ID만 조회)
+        
+        비용: 삭제는 흔적(updated_at 등)을 남기지 않으므로 변경량이 아니라 전체 FAQ 수에
+        비례합니다 (page_size개씩 _id 인덱스 조회 2회). FAQ 인덱서가 실행 중이면 삭제는
+        change stream으로 바로 반영되고 상태 문서도 지워지므로, 이 스캔은 누락분을 맞추는
+        점검용입니다. 자주 도는 증분 동기화에서는 --skip-deletions로 생략하고 주기적으로만 실행하세요.
+        """
+        state = self.mongo_db[VECTOR_STATE_COLLECTION]
+        query = {'brand_channel': brand_filter.upper()} if brand_filter else {}
+        
+        removed: List[Dict[str, Any]] = []
+        cursor = state.find(query, {'_id': 1}).batch_size(page_size)
+        
+        for page in self._iter_pages(cursor, page_size):
+            ids = [doc['_id'] for doc in page]
+            existing = {
+                doc['inquiry_no']
+                for doc in self.mongo_db.faqs.find({'inquiry_no': {'$in': ids}}, {'inquiry_no': 1})
+            }
+            removed.extend(doc for doc in page if doc['_id'] not in existing)
+        
+        if not removed:
+            return 0
+        
+        deleted = self._delete_vectors(collection, [doc['_id'] for doc in removed])
+        state.delete_many({'_id': {'$in': [doc['_id'] for doc in removed]}})
+        
+        logger.info(f"  🗑️  삭제된 FAQ {len(removed)}개 → Weaviate 객체 {deleted}개 삭제")
+        return len(removed)
+    
+    def import_faqs_incremental(
+        self,
+        brand_filter: str = None,
+        batch_size: int = 100,
+        page_size: int = 500,
+        sync_deletions: bool = True
+    ) -> Dict[str, Any]:
+        """
+        지난 실행 이후 변경된 FAQ만 Weaviate에 반영
+        
+        1. sync_state의 high-water mark 이후 updated_at이 바뀐 FAQ
+           + FAQ 인덱서가 보류한 저장 실패 FAQ(faq_index_failures)만 조회
+        2. 내용 해시가 faq_vector_state와 같으면 건너뜀 (보류된 FAQ는 항상 다시 저장)
+        3. 바뀐 FAQ만 임베딩 후 upsert (UUID는 inquiry_no 기반이라 덮어쓰기)
+        4. faqs에서 사라진 FAQ의 벡터 삭제 (sync_deletions, 전체 FAQ 수에 비례 → _sync_deletions)
+        
+        첫 실행(상태 없음)은 전체 임포트와 같고, 이후 1~3단계는 변경량에 비례합니다.
+        
+        Args:
+            brand_filter: 브랜드 필터 (상태도 브랜드별로 따로 관리)
+            batch_size: 임베딩/Weaviate 배치 크기
+            page_size: 한 번에 읽고 처리할 FAQ 수
+            sync_deletions: 삭제된 FAQ 스캔 여부
+        
+        Returns:
+            {'scanned': int, 'imported': int, 'unchanged': int,
+             'deleted': int, 'failed': int}
+        """
+        logger.info("=" * 70)
+        logger.info("📦 FAQ → Weaviate 증분 동기화 시작")
+        logger.info("=" * 70)
+        
+        sync_state = self.mongo_db[SYNC_STATE_COLLECTION]
+        vector_state = self.mongo_db[VECTOR_STATE_COLLECTION]
+        state_id = f"weaviate_faq:{brand_filter.upper() if brand_filter else 'ALL'}"
+        
+        failures = self.mongo_db[FAILURE_COLLECTION]
+        
+        state = sync_state.find_one({'_id': state_id}) or {}
+        high_water_mark = state.get('high_water_mark')
+        run_started = datetime.now()
+        
+        brand_query = {'brand_channel': brand_filter.upper()} if brand_filter else {}
+        parked = {doc['_id'] for doc in failures.find(brand_query, {'_id': 1})}
+        if parked:
+            logger.info(f"  ⏸️  FAQ 인덱서 보류 {len(parked)}개 재반영")
+        
+        if high_water_mark:
+            logger.info(f"  🕒 마지막 동기화 기준: {high_water_mark}")
+        else:
+            logger.info("  🆕 동기화 기록 없음 → 전체 동기화")
+        
+        query: Dict[str, Any] = dict(brand_query)
+        if high_water_mark:
+            # 같은 시각에 갱신된 문서를 놓치지 않도록 $gte (중복은 해시로 걸러짐)
+            changed_query = {'updated_at': {'$gte': high_water_mark}}
+            if parked:
+                query['$or'] = [changed_query, {'inquiry_no': {'$in': list(parked)}}]
+            else:
+                query.update(changed_query)
+        
+        collection = self.weaviate_client.collections.get(WeaviateService.FAQ_COLLECTION)
+        stats = {'scanned': 0, 'imported': 0, 'unchanged': 0, 'deleted': 0, 'failed': 0}
+        
+        new_mark = high_water_mark
+        oldest_failure = None
+        found_parked = set()
+        synced_parked = []
+        
+        cursor = self.mongo_db.faqs.find(query).batch_size(page_size)
+        
+        for page in self._iter_pages(cursor, page_size):
+            stats['scanned'] += len(page)
+            
+            known = {
+                doc['_id']: doc.get('text_hash')
+                for doc in vector_state.find(
+                    {'_id': {'$in': [faq['inquiry_no'] for faq in page]}},
+                    {'text_hash': 1}
+                )
+            }
+            
+            for faq in page:
+                updated_at = faq.get('updated_at')
+                if updated_at and (new_mark is None or updated_at > new_mark):
+                    new_mark = updated_at
+            
+            # 보류 FAQ는 변환 전에 발견 처리 (필수 필드 누락으로 건너뛰어도 삭제된 것으로 보지 않음)
+            page_parked = {faq['inquiry_no'] for faq in page if faq['inquiry_no'] in parked}
+            found_parked |= page_parked
+            
+            prepared = self.prepare_faqs(page)
+            
+            # 건너뛴 보류 FAQ는 실패로 집계하고 보류 유지 (다음 실행에서 다시 시도)
+            stats['failed'] += len(page_parked - {faq['inquiry_no'] for faq, _, _ in prepared})
+            
+            changed = []
+            for faq, text, metadata in prepared:
+                text_hash = WeaviateService.faq_content_hash(faq)
+                
+                # 보류 FAQ는 해시가 같아도 다시 저장
+                if faq['inquiry_no'] not in parked and known.get(faq['inquiry_no']) == text_hash:
+                    stats['unchanged'] += 1
+                    continue
+                
+                changed.append((faq, text, metadata, text_hash))
+            
+            if not changed:
+                continue
+            
+            vectors = self.embedding_generator.encode(
+                [text for _, text, _, _ in changed],
+                batch_size=batch_size,
+                show_progress_bar=False
+            )
+            
+            try:
+                _, _, failed_uuids = self._write_page(
+                    collection,
+                    [metadata for _, _, metadata, _ in changed],
+                    vectors,
+                    batch_size
+                )
+            except Exception as e:
+                logger.error(f"  ❌ 페이지 저장 실패 ({len(changed)}개): {e}")
+                failed_uuids = {str(WeaviateService.faq_uuid(faq['inquiry_no'])) for faq, _, _, _ in changed}
+            
+            synced = []
+            for faq, _, _, text_hash in changed:
+                if str(WeaviateService.faq_uuid(faq['inquiry_no'])) in failed_uuids:
+                    stats['failed'] += 1
+                    updated_at = faq.get('updated_at')
+                    if updated_at and (oldest_failure is None or updated_at < oldest_failure):
+                        oldest_failure = updated_at
+                    continue
+                
+                if faq['inquiry_no'] in parked:
+                    synced_parked.append(faq['inquiry_no'])
+                
+                synced.append(vector_state_update(faq, text_hash, run_started))
+            
+            if synced:
+                vector_state.bulk_write(synced, ordered=False)
+            
+            stats['imported'] += len(synced)
+            logger.info(f"  → {stats['scanned']}개 확인, {stats['imported']}개 반영")
+        
+        if sync_deletions:
+            stats['deleted'] = self._sync_deletions(collection, brand_filter, page_size)
+        
+        # 다시 저장했거나 faqs에서 사라진 보류 FAQ는 보류 해제
+        resolved = synced_parked + list(parked - found_parked)
+        if resolved:
+            failures.delete_many({'_id': {'$in': resolved}})
+        
+        # 실패한 문서가 있으면 다음 실행에서 다시 보도록 기준 시각을 그 이전으로 유지
+        if oldest_failure is not None:
+            new_mark = oldest_failure if high_water_mark is None else max(high_water_mark, oldest_failure)
+        
+        sync_state.update_one(
+            {'_id': state_id},
+            {'$set': {
+                'high_water_mark': new_mark,
+                'last_run_at': run_started,
+                'last_run_stats': stats
+            }},
+            upsert=True
+        )
+        
+        # 결과 출력
+        logger.info("\n" + "=" * 70)
+        logger.info("📊 증분 동기화 결과")
+        logger.info("=" * 70)
+        logger.info(f"  🔎 확인:   {stats['scanned']:>5}개")
+        logger.info(f"  ✅ 반영:   {stats['imported']:>5}개")
+        logger.info(f"  ⏭️  변경 없음: {stats['unchanged']:>5}개")
+        logger.info(f"  🗑️  삭제:   {stats['deleted']:>5}개")
+        logger.info(f"  ❌ 실패:   {stats['failed']:>5}개")
+        logger.info("=" * 70)
+        
+        return stats
+    
     def close(self):
         """연결 종료"""
         self.mongo_client.close()
@@ -365,11 +795,58 @@ def main():
         help='임포트할 최대 개수 (테스트용)'
     )
     
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='스트리밍 모드 (페이지 단위 읽기, 임베딩과 저장 병렬 진행)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='증분 동기화 (지난 실행 이후 변경/삭제된 FAQ만 반영)'
+    )
+    
+    parser.add_argument(
+        '--skip-deletions',
+        action='store_true',
+        help='증분 동기화에서 삭제된 FAQ 스캔 생략 (전체 FAQ 수에 비례하는 단계)'
+    )
+    
+    parser.add_argument(
+        '--page-size',
+        type=int,
+        default=500,
+        help='스트리밍/증분 모드에서 한 번에 읽고 임베딩할 FAQ 수 (기본값: 500)'
+    )
+    
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=2,
+        help='스트리밍 모드에서 저장 대기 페이지 최대 수 (기본값: 2)'
+    )
+    
+    parser.add_argument(
+        '--redis-url',
+        default=REDIS_URL,
+        help=f'임베딩 캐시 Redis URL (기본값: {REDIS_URL})'
+    )
+    
+    parser.add_argument(
+        '--no-redis-cache',
+        action='store_true',
+        help='Redis 임베딩 캐시 사용 안 함 (로컬 캐시만 사용)'
+    )
+    
     args = parser.parse_args()
     
     try:
         # 임베딩 생성기 초기화
-        embedding_generator = EmbeddingGenerator(MODEL_NAME)
+        embedding_generator = EmbeddingGenerator(
+            MODEL_NAME,
+            redis_url=None if args.no_redis_cache else args.redis_url
+        )
         
         # 임포터 초기화
         importer = FAQImporter(
@@ -380,7 +857,22 @@ def main():
         )
         
         # FAQ 임포트
-        if args.type == 'faqs':
+        if args.type == 'faqs' and args.incremental:
+            result = importer.import_faqs_incremental(
+                brand_filter=args.brand,
+                batch_size=args.batch_size,
+                page_size=args.page_size,
+                sync_deletions=not args.skip_deletions
+            )
+        elif args.type == 'faqs' and args.stream:
+            result = importer.import_faqs_streaming(
+                brand_filter=args.brand,
+                batch_size=args.batch_size,
+                page_size=args.page_size,
+                queue_size=args.queue_size,
+                limit=args.limit
+            )
+        elif args.type == 'faqs':
             result = importer.import_faqs(
                 brand_filter=args.brand,
                 batch_size=args.batch_size,
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+FAQ 실시간 인덱서 실행 스크립트
+투비네트웍스 글로벌 - CS AI 에이전트 프로젝트
+
+2026-10-17 14:10, Claude 작성
+
+MongoDB faqs 컬렉션의 변경을 change stream으로 받아
+Weaviate에 계속 반영하는 상주 워커를 실행합니다. (app/services/faq_indexer.py)
+
+주요 작업:
+1. MongoDB / Weaviate 연결 (config.py 설정 사용)
+2. pre-image 활성화 (삭제 반영용, MongoDB 6.0+)
+3. 인덱서 실행 + 주기적 통계 출력 (lag, 큐 길이)
+4. Ctrl+C / SIGTERM 시 대기 중인 이벤트를 반영하고 종료
+
+사용법:
+    python run_faq_indexer.py
+
+    # 배치 크기 / 대기 시간 조정
+    python run_faq_indexer.py --batch-size 128 --max-wait 2.0
+
+    # 저장된 resume token을 무시하고 현재 시점부터 시작
+    python run_faq_indexer.py --reset
+"""
+
+import sys
+import signal
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
+
+from config import settings
+from app.services.embedding_engine import get_embedding_engine
+from app.services.faq_indexer import FAQIndexer
+from app.services.mongodb_service import MongoDBService
+from app.services.weaviate_service import WeaviateService
+
+
+# ==================== 로깅 설정 ====================
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# ==================== 메인 함수 ====================
+
+async def report_stats(indexer: FAQIndexer, interval: float):
+    """주기적으로 인덱서 통계 출력"""
+    while True:
+        await asyncio.sleep(interval)
+        stats = indexer.get_stats()
+        logger.info(
+            f"📊 lag {stats['lag_seconds']}초, 대기 {stats['queue_depth']}개, "
+            f"저장 {stats['indexed']}, 삭제 {stats['deleted']}, "
+            f"건너뜀 {stats['skipped']}, 실패 {stats['failed']}"
+        )
+
+
+async def main():
+    """메인 실행 함수"""
+
+    parser = argparse.ArgumentParser(
+        description='MongoDB change stream → Weaviate FAQ 실시간 인덱서'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=settings.FAQ_INDEXER_BATCH_SIZE,
+        help=f'한 번에 반영할 최대 이벤트 수 (기본값: {settings.FAQ_INDEXER_BATCH_SIZE})'
+    )
+
+    parser.add_argument(
+        '--max-wait',
+        type=float,
+        default=settings.FAQ_INDEXER_MAX_WAIT_SECONDS,
+        help=f'배치 수집 최대 대기 시간 초 (기본값: {settings.FAQ_INDEXER_MAX_WAIT_SECONDS})'
+    )
+
+    parser.add_argument(
+        '--stats-interval',
+        type=float,
+        default=30.0,
+        help='통계 출력 주기 초 (기본값: 30)'
+    )
+
+    parser.add_argument(
+        '--reset',
+        action='store_true',
+        help='저장된 resume token 삭제 후 현재 시점부터 시작'
+    )
+
+    args = parser.parse_args()
+
+    mongodb_service = MongoDBService(settings.MONGODB_URL, settings.MONGODB_DB_NAME)
+    weaviate_service = WeaviateService(
+        settings.WEAVIATE_URL,
+        settings.SENTENCE_BERT_MODEL,
+        settings.WEAVIATE_API_KEY,
+        embedding_engine=get_embedding_engine(
+            settings.SENTENCE_BERT_MODEL,
+            redis_url=settings.REDIS_URL,
+            redis_ttl=settings.REDIS_TTL
+        ),
+        max_concurrency=settings.WEAVIATE_MAX_CONCURRENCY
+    )
+
+    await mongodb_service.connect()
+    await weaviate_service.connect()
+
+    indexer = FAQIndexer(
+        mongodb_service.db,
+        weaviate_service,
+        batch_size=args.batch_size,
+        max_wait_seconds=args.max_wait
+    )
+
+    if args.reset:
+        await mongodb_service.db.sync_state.delete_one({'_id': indexer.state_id})
+        logger.info("🧹 resume token 초기화")
+
+    await indexer.enable_pre_images()
+
+    # 종료 시그널 → 대기 중인 이벤트 반영 후 종료
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, indexer.stop)
+        except NotImplementedError:
+            pass  # Windows
+
+    reporter = asyncio.create_task(report_stats(indexer, args.stats_interval))
+
+    try:
+        logger.info("🚀 FAQ 인덱서 시작")
+        await indexer.run()
+    finally:
+        reporter.cancel()
+        await weaviate_service.disconnect()
+        await mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
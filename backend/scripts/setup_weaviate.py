@@ -6,6 +6,7 @@ Weaviate 초기 설정 스크립트
 투비네트웍스 글로벌 - CS AI 에이전트 프로젝트
 
 2025-10-02 17:40, Claude 작성
+2026-10-17 23:10, Claude 업데이트 (FAQ 스키마를 앱과 공유, 구 "FAQ" 컬렉션 정리)
 
 이 스크립트는 Weaviate Vector Database의 스키마를 설정합니다.
 FAQ와 제품 정보를 벡터로 저장하기 위한 클래스를 생성합니다.
@@ -27,10 +28,13 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
 
 import weaviate
 from weaviate.classes.config import Configure, Property, DataType
 
+from app.services.weaviate_service import FAQ_PROPERTIES, WeaviateService
+
 
 # ==================== 로깅 설정 ====================
 
@@ -45,6 +49,9 @@ logger = logging.getLogger(__name__)
 
 WEAVIATE_URL = "http://localhost:8081"  # docker-compose.yml 참고
 
+# 이전 버전이 만든 FAQ 컬렉션 (faq_id 기반 UUID, combined_text 스키마)
+LEGACY_FAQ_COLLECTION = "FAQ"
+
 
 # ==================== Weaviate 스키마 ====================
 
@@ -52,7 +59,8 @@ def create_faq_schema(client: weaviate.WeaviateClient):
     """
     FAQ 클래스 스키마 생성
     
-    FAQ 문서를 벡터로 저장하기 위한 클래스를 정의합니다.
+    앱(WeaviateService)이 검색하는 컬렉션과 같은 이름/속성으로 만듭니다. (FAQ_PROPERTIES)
+    이전 버전이 만든 "FAQ" 컬렉션(faq_id/combined_text 스키마)은 앱이 읽지 않으므로 삭제합니다.
     
     Args:
         client: Weaviate 클라이언트
@@ -60,78 +68,26 @@ def create_faq_schema(client: weaviate.WeaviateClient):
     logger.info("📋 FAQ 클래스 스키마 생성 중...")
     
     try:
+        # 구 스키마 컬렉션 정리
+        if client.collections.exists(LEGACY_FAQ_COLLECTION):
+            client.collections.delete(LEGACY_FAQ_COLLECTION)
+            logger.info(f"  🧹 구 스키마 {LEGACY_FAQ_COLLECTION} 클래스 삭제 (재임포트 필요)")
+        
         # 기존 클래스가 있으면 삭제 (재생성)
-        if client.collections.exists("FAQ"):
-            client.collections.delete("FAQ")
-            logger.info("  ♻️  기존 FAQ 클래스 삭제")
+        if client.collections.exists(WeaviateService.FAQ_COLLECTION):
+            client.collections.delete(WeaviateService.FAQ_COLLECTION)
+            logger.info(f"  ♻️  기존 {WeaviateService.FAQ_COLLECTION} 클래스 삭제")
         
         # FAQ 클래스 생성
         client.collections.create(
-            name="FAQ",
-            description="고객 문의 FAQ - 질문과 답변을 벡터로 저장",
+            name=WeaviateService.FAQ_COLLECTION,
+            description="고객 FAQ 벡터 저장소",
             
             # 벡터 인덱스 설정
             vectorizer_config=Configure.Vectorizer.none(),  # 우리가 직접 벡터 제공
             
-            # 프로퍼티 정의
-            properties=[
-                Property(
-                    name="faq_id",
-                    data_type=DataType.TEXT,
-                    description="FAQ 고유 ID (예: FAQ-302260746)",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="inquiry_no",
-                    data_type=DataType.INT,
-                    description="문의 번호 (네이버 스토어)",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="mongodb_id",
-                    data_type=DataType.TEXT,
-                    description="MongoDB 문서 _id (상세 조회용)",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="brand_channel",
-                    data_type=DataType.TEXT,
-                    description="브랜드 채널 (KEYCHRON, GTGEAR, AIPER)",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="category",
-                    data_type=DataType.TEXT,
-                    description="문의 카테고리 (배송, 반품, 상품 등)",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="combined_text",
-                    data_type=DataType.TEXT,
-                    description="질문 + 답변 결합 텍스트 (벡터 생성 원본)",
-                    index_filterable=False,
-                    index_searchable=True  # 전문 검색 가능
-                ),
-                Property(
-                    name="answered",
-                    data_type=DataType.BOOL,
-                    description="답변 완료 여부",
-                    index_filterable=True,
-                    index_searchable=False
-                ),
-                Property(
-                    name="created_at",
-                    data_type=DataType.DATE,
-                    description="생성 일시",
-                    index_filterable=True,
-                    index_searchable=False
-                )
-            ]
+            # 프로퍼티 정의 (앱과 공유)
+            properties=FAQ_PROPERTIES
         )
         
         logger.info("  ✅ FAQ 클래스 생성 완료!")
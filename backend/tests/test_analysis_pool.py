@@ -0,0 +1,91 @@
+# backend/tests/test_analysis_pool.py
+# 2026-10-17 20:20, Claude 작성
+# 2026-10-17 23:59, Claude 업데이트 (워커별 워밍업 확인, load_spacy 교체 범위 한정)
+
+"""
+AnalysisPool 테스트
+
+워커 프로세스에서 빈 다국어 spaCy 파이프라인(토크나이저 전용)으로 분석기를 만들어
+분배/결과 순서, 건별 분석이 현재 프로세스 분석과 같은지,
+start()가 모든 워커를 한 번씩 워밍업하는지 확인합니다.
+
+사용법:
+    pytest tests/test_analysis_pool.py
+"""
+
+import sys
+import os
+
+import pytest
+import spacy
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import question_analyzer as core_module
+from app.core.analysis_pool import AnalysisPool
+from app.core.question_analyzer import InquiryData
+
+
+def blank_spacy(model_name, exclude=()):
+    return spacy.blank('xx')
+
+
+def blank_analyzer():
+    """워커 프로세스용 분석기 팩토리 (한국어 모델 대신 빈 파이프라인, 생성하는 동안만 교체)"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(core_module, 'load_spacy', blank_spacy)
+        return core_module.QuestionAnalyzer(pos_tagging=False)
+
+
+def make_inquiries(count):
+    templates = [
+        ("상품", "K10 PRO MAX 펌웨어 업데이트 후 블루투스 연결이 안돼요", "키크론 K10 PRO MAX 쉘화이트 바나나축"),
+        ("배송", "주문한 키보드 배송 언제 도착하나요?", None),
+        ("반품", "Q6 적축 반품 수거 요청드립니다", "키크론 Q6 적축"),
+    ]
+    return [
+        InquiryData(
+            brand_channel="KEYCHRON",
+            inquiry_category=category,
+            title=f"문의 {i}",
+            inquiry_content=f"{content} ({i})",
+            product_name=product_name
+        )
+        for i, (category, content, product_name) in
+        ((i, templates[i % len(templates)]) for i in range(count))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pool_matches_in_process_analysis():
+    data_list = make_inquiries(25)
+    expected = [result.to_dict() for result in blank_analyzer().analyze_many(data_list)]
+    
+    pool = AnalysisPool(max_workers=2, chunk_size=4, analyzer_factory=blank_analyzer, factory_args=())
+    try:
+        await pool.start()
+        
+        results = await pool.analyze_many(data_list)
+        single = await pool.analyze(data_list[0])
+    finally:
+        pool.shutdown()
+    
+    assert [result.to_dict() for result in results] == expected
+    assert single.to_dict() == expected[0]
+    assert pool.get_stats()['tasks'] == 7 + 1
+    assert pool.get_stats()['analyzed'] == 26
+    # 워밍업은 워커마다 한 번씩
+    assert pool.get_stats()['warmed_workers'] == 2
+    assert core_module.load_spacy is not blank_spacy
+
+
+@pytest.mark.asyncio
+async def test_start_warms_every_worker():
+    pool = AnalysisPool(max_workers=3, analyzer_factory=blank_analyzer, factory_args=())
+    try:
+        await pool.start(timeout=60.0)
+    finally:
+        await pool.close()
+    
+    assert len(pool.worker_pids) == 3
+    assert len(set(pool.worker_pids)) == 3
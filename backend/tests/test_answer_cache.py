@@ -0,0 +1,417 @@
+# backend/tests/test_answer_cache.py
+# 2026-10-17 17:10, Claude 작성
+# 2026-10-17 21:50, Claude 업데이트 (change stream 미지원/재연결 테스트)
+# 2026-10-17 22:00, Claude 업데이트 (캐시 비활성화 시 검수 API 테스트)
+# 2026-10-17 22:20, Claude 업데이트 (승인 대기 저장소: 다른 워커 승인, 없는 answer_id 404)
+# 2026-10-18 01:30, Claude 업데이트 (승인된 항목 저장소: 재시작 로드, 워커 간 동기화/무효화, 전체 워커 통계)
+
+"""
+SemanticAnswerCache 테스트
+
+승인 전/후 조회, 버킷(brand_channel + 카테고리) 분리, TTL 만료,
+FAQ/제품 변경 무효화, 통계 API를 확인합니다.
+change stream은 가짜 컬렉션으로 미지원 서버(standalone)와 끊김/재연결 경로를 확인합니다.
+승인 대기 저장소는 가짜 컬렉션으로 다른 워커(캐시 인스턴스)에서의 승인을 확인합니다.
+승인된 항목도 같은 저장소로 재시작 후 로드, 워커 간 동기화/무효화, 전체 워커 통계를 확인합니다.
+
+사용법:
+    pytest tests/test_answer_cache.py
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.api import reviews, stats
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from app.services.answer_cache import CHANGE_STREAM_UNSUPPORTED, SemanticAnswerCache, get_optional_answer_cache
+
+
+RETURN_ADDRESS = [1.0, 0.0, 0.0]
+RETURN_ADDRESS_NEAR = [0.98, 0.05, 0.0]
+SHIPPING = [0.0, 1.0, 0.0]
+
+
+def stage_return_answer(cache, answer_id='a1', **kwargs):
+    cache.stage(
+        answer_id, "반품 주소가 어디인가요", RETURN_ADDRESS, "반품 주소는 ...입니다",
+        "KEYCHRON", "반품", faq_ids=[101], product_ids=['K10'], references=['FAQ_101'],
+        **kwargs
+    )
+
+
+def test_only_approved_answers_are_returned():
+    cache = SemanticAnswerCache(similarity_threshold=0.9)
+    stage_return_answer(cache)
+
+    assert cache.lookup(RETURN_ADDRESS_NEAR, "KEYCHRON", "반품") is None
+
+    assert cache.approve('a1') is True
+    hit = cache.lookup(RETURN_ADDRESS_NEAR, "KEYCHRON", "반품")
+    assert hit['answer_id'] == 'a1'
+    assert hit['similarity'] >= 0.9
+    assert hit['references'] == ['FAQ_101']
+
+    # 다른 질문, 다른 카테고리/브랜드는 미스
+    assert cache.lookup(SHIPPING, "KEYCHRON", "반품") is None
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "배송") is None
+    assert cache.lookup(RETURN_ADDRESS, "GTGEAR", "반품") is None
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 4
+    assert stats['hit_rate'] == 0.2
+
+
+def test_modified_approval_and_rejection():
+    cache = SemanticAnswerCache()
+    stage_return_answer(cache, 'a1')
+    stage_return_answer(cache, 'a2')
+
+    assert cache.approve('a1', "수정된 답변") is True
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품")['answer'] == "수정된 답변"
+
+    assert cache.discard('a2') is True
+    assert cache.approve('a2') is False
+    assert cache.approve('unknown') is False
+
+
+def test_ttl_expiry():
+    cache = SemanticAnswerCache(ttl=0.05)
+    stage_return_answer(cache)
+    cache.approve('a1')
+
+    time.sleep(0.06)
+
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품") is None
+    assert cache.get_stats()['entries'] == 0
+    assert cache.get_stats()['expired'] == 1
+
+
+def test_invalidation_on_source_faq_or_product_change():
+    cache = SemanticAnswerCache()
+    stage_return_answer(cache, 'a1')
+    stage_return_answer(cache, 'a2')
+    cache.approve('a1')
+
+    assert cache.invalidate_faqs([999]) == 0
+    assert cache.invalidate_products(['K10']) == 2  # 승인된 항목 + 승인 대기 항목
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품") is None
+    assert cache.approve('a2') is False
+
+    stage_return_answer(cache, 'a3')
+    cache.approve('a3')
+    assert cache.invalidate_faqs([101]) == 1
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_review_approval_feeds_cache_and_stats_endpoint():
+    cache = SemanticAnswerCache()
+    stage_return_answer(cache)
+
+    app = FastAPI()
+    app.include_router(reviews.router, prefix="/api/reviews")
+    app.include_router(stats.router, prefix="/api/stats")
+    app.dependency_overrides[get_optional_answer_cache] = lambda: cache
+    client = TestClient(app)
+
+    response = client.post("/api/reviews/a1/approve")
+    assert response.json()['cached'] is True
+
+    cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품")
+
+    stats_response = client.get("/api/stats/answer-cache").json()
+    assert stats_response['entries'] == 1
+    assert stats_response['hits'] == 1
+    assert stats_response['promoted'] == 1
+
+
+def test_review_endpoints_work_without_cache():
+    app = FastAPI()
+    app.include_router(reviews.router, prefix="/api/reviews")
+    app.include_router(stats.router, prefix="/api/stats")
+    app.dependency_overrides[get_optional_answer_cache] = lambda: None
+    client = TestClient(app)
+
+    approved = client.post("/api/reviews/a1/approve")
+    assert approved.status_code == 200
+    assert approved.json() == {'answer_id': 'a1', 'status': 'approved', 'cached': False}
+
+    assert client.post("/api/reviews/a1/reject", params={'reason': "오답"}).status_code == 200
+    assert client.put("/api/reviews/a1", params={'content': "수정"}).json()['cached'] is False
+    assert client.get("/api/stats/answer-cache").json() == {'enabled': False}
+
+
+def matches(document, query):
+    """가짜 컬렉션용 쿼리 비교 (값 일치, $in, $gt만)"""
+    for field_name, condition in query.items():
+        value = document.get(field_name)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        values = value if isinstance(value, list) else [value]
+        if '$in' in condition and not set(values) & set(condition['$in']):
+            return False
+        if '$gt' in condition and (value is None or value <= condition['$gt']):
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents.sort(key=lambda document: document.get(key) or 0, reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield document
+
+
+class FakePendingCollection:
+    """answer_cache_pending 컬렉션 흉내 (_id 키 문서 dict)"""
+
+    def __init__(self):
+        self.documents = {}
+        self.indexes = []
+
+    async def create_index(self, key, **kwargs):
+        self.indexes.append((key, kwargs))
+
+    async def replace_one(self, query, document, upsert=False):
+        self.documents[query['_id']] = {'_id': query['_id'], **document}
+
+    async def update_one(self, query, update, upsert=False):
+        document = self.documents.setdefault(query['_id'], {'_id': query['_id']})
+        for field_name, amount in update['$inc'].items():
+            document[field_name] = document.get(field_name, 0) + amount
+
+    async def find_one(self, query):
+        return self.documents.get(query['_id'])
+
+    def find(self, query, projection=None):
+        return FakeCursor([document for document in self.documents.values() if matches(document, query)])
+
+    async def delete_one(self, query):
+        self.documents.pop(query['_id'], None)
+
+    async def delete_many(self, query):
+        for answer_id, document in list(self.documents.items()):
+            if matches(document, query):
+                del self.documents[answer_id]
+
+
+@pytest.mark.asyncio
+async def test_pending_answer_is_approved_by_another_worker():
+    store = FakePendingCollection()
+    generating_worker = SemanticAnswerCache(pending_collection=store)
+    await generating_worker.ensure_pending_indexes()
+    stage_return_answer(generating_worker, 'a1')
+    stage_return_answer(generating_worker, 'a2')
+    await generating_worker.save_pending('a1')
+    await generating_worker.save_pending('a2')
+    assert store.indexes[0] == ('expires_at', {'expireAfterSeconds': 0})
+
+    # 검수 요청은 다른 워커(캐시 인스턴스)로 들어옴
+    reviewing_worker = SemanticAnswerCache(pending_collection=store)
+    app = FastAPI()
+    app.include_router(reviews.router, prefix="/api/reviews")
+    app.dependency_overrides[get_optional_answer_cache] = lambda: reviewing_worker
+    client = TestClient(app)
+
+    approved = client.post("/api/reviews/a1/approve")
+    assert approved.status_code == 200
+    assert approved.json()['cached'] is True
+    assert reviewing_worker.lookup(RETURN_ADDRESS_NEAR, "KEYCHRON", "반품")['answer_id'] == 'a1'
+    assert store.documents['a1']['approved'] is True
+
+    # 생성한 워커도 동기화 후 같은 승인 답변을 재사용
+    assert await generating_worker.sync_approved() == 1
+    assert generating_worker.lookup(RETURN_ADDRESS_NEAR, "KEYCHRON", "반품")['answer_id'] == 'a1'
+
+    # 이미 처리됐거나 없는 answer_id는 404
+    assert client.post("/api/reviews/a1/approve").status_code == 404
+    assert client.post("/api/reviews/unknown/reject", params={'reason': "오답"}).status_code == 404
+    assert client.put("/api/reviews/unknown", params={'content': "수정"}).status_code == 404
+
+    # 근거 FAQ가 바뀌면 저장소의 승인 대기/승인 항목도 삭제 → 다른 워커도 동기화 때 제거
+    await reviewing_worker._invalidate_stored('faq_ids', [101])
+    assert [answer_id for answer_id in store.documents if answer_id != '_stats'] == []
+    assert client.post("/api/reviews/a2/reject", params={'reason': "오답"}).status_code == 404
+    await generating_worker.sync_approved()
+    assert generating_worker.lookup(RETURN_ADDRESS_NEAR, "KEYCHRON", "반품") is None
+
+
+@pytest.mark.asyncio
+async def test_approved_answers_survive_restart_and_share_stats():
+    store = FakePendingCollection()
+    worker = SemanticAnswerCache(pending_collection=store)
+    for answer_id in ['a1', 'a2', 'a3']:
+        stage_return_answer(worker, answer_id)
+        worker.approve(answer_id)
+        await worker.save_approved(answer_id)
+    worker.lookup(RETURN_ADDRESS, "KEYCHRON", "반품")
+    await worker.sync_approved()
+
+    # 재시작한 워커는 최신 승인 항목을 max_entries개까지 불러옴
+    restarted = SemanticAnswerCache(max_entries=2, pending_collection=store)
+    assert await restarted.sync_approved() == 2
+    assert set(restarted._entries) == {'a2', 'a3'}
+    restarted.lookup(SHIPPING, "KEYCHRON", "반품")
+
+    # 적중/미스는 워커별 통계와 별도로 저장소에서 합산
+    assert restarted.get_stats()['hits'] == 0
+    assert await restarted.get_shared_stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    # 다른 워커가 거부(삭제)한 항목은 동기화 때 제거, 저장 전인 이 워커의 승인은 유지
+    await store.delete_one({'_id': 'a3'})
+    stage_return_answer(worker, 'a4')
+    worker.approve('a4')
+    assert await worker.sync_approved() == 0
+    assert set(worker._entries) == {'a1', 'a2', 'a4'}
+
+
+@pytest.mark.asyncio
+async def test_lost_stream_clears_stored_approved_answers():
+    store = FakePendingCollection()
+    cache = SemanticAnswerCache(retry_interval=0, pending_collection=store)
+    stage_return_answer(cache, 'a1')
+    stage_return_answer(cache, 'a2')
+    await cache.save_pending('a2')
+    cache.approve('a1')
+    await cache.save_approved('a1')
+
+    faqs = FakeWatchedCollection('faqs', [FakeStream(error=AutoReconnect("connection lost")), unsupported])
+    await asyncio.wait_for(
+        cache._watch_collection(faqs, 'inquiry_no', cache.invalidate_faqs, None),
+        timeout=1
+    )
+
+    # 승인된 항목은 저장소에서도 비워 다음 동기화에서 다시 불러오지 않음 (승인 대기는 유지)
+    assert set(store.documents) == {'a2'}
+    assert await cache.sync_approved() == 0
+    assert cache.get_stats()['entries'] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_stored_pending_answer_is_not_restored():
+    store = FakePendingCollection()
+    cache = SemanticAnswerCache(pending_ttl=0.01, pending_collection=store)
+    stage_return_answer(cache)
+    await cache.save_pending('a1')
+
+    time.sleep(0.02)
+
+    assert await SemanticAnswerCache(pending_collection=store).restore_pending('a1') is False
+
+
+class FakeStream:
+    """이벤트를 내보낸 뒤 error를 던지는(없으면 끝나는) change stream"""
+
+    def __init__(self, events=(), error=None):
+        self.events = list(events)
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.events:
+            return self.events.pop(0)
+        if self.error:
+            raise self.error
+        raise StopAsyncIteration
+
+
+class FakeWatchedCollection:
+    """watch() 호출마다 attempts의 다음 동작 실행 (예외면 열기 실패, FakeStream이면 수신)"""
+
+    def __init__(self, name, attempts):
+        self.name = name
+        self.attempts = list(attempts)
+        self.calls = 0
+
+    def watch(self, pipeline, **kwargs):
+        self.calls += 1
+        attempt = self.attempts.pop(0)
+        if callable(attempt):
+            attempt = attempt()
+        if isinstance(attempt, Exception):
+            raise attempt
+        return attempt
+
+
+def unsupported():
+    return OperationFailure("The $changeStream stage is only supported on replica sets", code=CHANGE_STREAM_UNSUPPORTED)
+
+
+@pytest.mark.asyncio
+async def test_watch_stops_without_clearing_on_standalone_server(caplog):
+    cache = SemanticAnswerCache(retry_interval=0)
+    stage_return_answer(cache)
+    cache.approve('a1')
+
+    class FakeDB:
+        faqs = FakeWatchedCollection('faqs', [unsupported])
+        products = FakeWatchedCollection('products', [unsupported])
+
+    await asyncio.wait_for(cache.watch_invalidations(FakeDB), timeout=1)
+
+    # 재시도 없이 종료, 승인된 답변 유지
+    assert FakeDB.faqs.calls == FakeDB.products.calls == 1
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품")['answer_id'] == 'a1'
+    assert sum('change stream 미지원' in record.message for record in caplog.records) == 2
+
+
+@pytest.mark.asyncio
+async def test_watch_clears_only_when_working_stream_is_lost():
+    cache = SemanticAnswerCache(retry_interval=0)
+    stage_return_answer(cache, 'a1')
+    cache.approve('a1')
+    seen = {}
+
+    def reopen_fails():
+        # 동작하던 스트림이 끊겼으므로 비워져 있어야 함
+        seen['after_loss'] = cache.get_stats()['entries']
+        stage_return_answer(cache, 'a2')
+        cache.approve('a2')
+        return AutoReconnect("connection refused")
+
+    def reopen_fails_again():
+        # 열기 실패만으로는 비우지 않음
+        seen['after_failed_reopen'] = cache.get_stats()['entries']
+        return unsupported()
+
+    faqs = FakeWatchedCollection('faqs', [
+        FakeStream(error=AutoReconnect("connection lost")),
+        reopen_fails,
+        reopen_fails_again,
+    ])
+    await asyncio.wait_for(
+        cache._watch_collection(faqs, 'inquiry_no', cache.invalidate_faqs, None),
+        timeout=1
+    )
+
+    assert seen == {'after_loss': 0, 'after_failed_reopen': 1}
+    assert cache.lookup(RETURN_ADDRESS, "KEYCHRON", "반품")['answer_id'] == 'a2'
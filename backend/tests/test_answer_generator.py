@@ -0,0 +1,382 @@
+# backend/tests/test_answer_generator.py
+# 2026-10-17 14:40, Claude 작성
+# 2026-10-17 16:10, Claude 업데이트 (스트리밍 답변 테스트)
+# 2026-10-17 16:40, Claude 업데이트 (브랜드 카탈로그 로드 테스트)
+# 2026-10-17 23:50, Claude 업데이트 (단계별 질문 분석 연결 테스트)
+# 2026-10-18 02:20, Claude 업데이트 (iter_batch 중단 시 남은 작업 정리 테스트)
+
+"""
+AnswerGenerator 테스트
+
+가짜 서비스를 주입하여 독립 조회 단계의 병렬 실행,
+단계별 타임아웃 처리, 소요 시간 기록을 확인합니다.
+
+사용법:
+    pytest tests/test_answer_generator.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.answer_generator import AnswerGenerator
+
+
+class FakeWeaviateService:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+    
+    async def search_similar_faqs(self, query_text, brand_channel=None, limit=5,
+                                  min_similarity=0.6, query_vector=None):
+        await asyncio.sleep(self.delay)
+        return [{'inquiry_no': 1, 'title': '배송 문의', 'similarity': 0.9}]
+
+
+class FakeMongoDBService:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+    
+    async def get_product_by_code(self, product_codes, brand_channel):
+        await asyncio.sleep(self.delay)
+        return {'product_id': 'K10', 'product_name': '키크론 K10'}
+    
+    async def get_customer_history(self, customer_id, limit=5):
+        await asyncio.sleep(self.delay)
+        return [{'inquiry_no': 2, 'title': '이전 문의'}]
+    
+    async def search_products(self, brand_channel=None, limit=50, **kwargs):
+        self.catalog_calls = getattr(self, 'catalog_calls', 0) + 1
+        await asyncio.sleep(self.delay)
+        return [{'product_id': 'K10', 'product_name': '키크론 K10'}]
+
+
+class FakeClaudeService:
+    def __init__(self):
+        self.contexts = []
+    
+    async def generate_answer(self, question, context):
+        self.contexts.append(context)
+        return {'answer': '안녕하세요 고객님', 'reasoning': ''}
+    
+    async def stream_answer(self, question, context):
+        self.contexts.append(context)
+        for text in ['안녕하세요 ', '고객님']:
+            await asyncio.sleep(0.05)
+            yield {'type': 'text', 'text': text}
+        yield {'type': 'done', 'usage': {'input_tokens': 10, 'output_tokens': 2}}
+
+
+@pytest.mark.asyncio
+async def test_lookups_run_concurrently_before_generation():
+    claude = FakeClaudeService()
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.1),
+        mongodb_service=FakeMongoDBService(0.1),
+        claude_service=claude
+    )
+    
+    started = time.perf_counter()
+    result = await generator.generate_answer("K10 배송 언제 오나요?", customer_id="abc", product_codes=["K10"])
+    elapsed = time.perf_counter() - started
+    
+    # 세 조회(각 0.1초)가 순차 실행이면 0.3초 이상
+    assert elapsed < 0.25
+    assert result['answer'] == '안녕하세요 고객님'
+    assert result['references'] == ['FAQ_1', 'PRODUCT_K10']
+    assert result['requires_review'] is False
+    assert claude.contexts[0]['product_info']['product_id'] == 'K10'
+    assert claude.contexts[0]['customer_info'][0]['inquiry_no'] == 2
+    
+    for stage in ('similar_faqs_ms', 'product_lookup_ms', 'customer_lookup_ms',
+                  'fanout_ms', 'generation_ms', 'total_ms'):
+        assert stage in result['timings']
+
+
+@pytest.mark.asyncio
+async def test_stage_timeout_falls_back_without_blocking_other_stages():
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.01),
+        mongodb_service=FakeMongoDBService(0.5),
+        claude_service=FakeClaudeService(),
+        stage_timeouts={'product_lookup': 0.05, 'customer_lookup': 0.05}
+    )
+    
+    result = await generator.generate_answer("K10 배송 문의", customer_id="abc", product_codes=["K10"])
+    
+    assert set(result['stage_errors']) == {'product_lookup', 'customer_lookup'}
+    assert result['references'] == ['FAQ_1']
+    assert result['answer'] == '안녕하세요 고객님'
+    assert result['timings']['fanout_ms'] < 400
+
+
+class CountingEngine:
+    """배치 임베딩 호출 기록용 가짜 엔진"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def aencode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        return [[float(i)] for i in range(len(texts))]
+
+
+class VectorRecordingWeaviate(FakeWeaviateService):
+    def __init__(self, delay=0.05):
+        super().__init__(delay)
+        self.embedding_engine = CountingEngine()
+        self.vectors = []
+        self.active = 0
+        self.max_active = 0
+    
+    async def search_similar_faqs(self, query_text, query_vector=None, **kwargs):
+        self.vectors.append(query_vector)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if query_text == "느림":
+                await asyncio.sleep(1)
+            return await super().search_similar_faqs(query_text)
+        finally:
+            self.active -= 1
+
+
+class FailingAnswerGenerator(AnswerGenerator):
+    async def generate_answer(self, question_text, *args, **kwargs):
+        if question_text == "실패":
+            raise RuntimeError("생성 오류")
+        return await super().generate_answer(question_text, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_process_batch_limits_concurrency_and_shares_embedding():
+    weaviate = VectorRecordingWeaviate()
+    generator = AnswerGenerator(weaviate_service=weaviate, claude_service=FakeClaudeService())
+    
+    questions = [{"text": f"질문 {i}"} for i in range(10)]
+    results = await generator.process_batch(questions, concurrency=3)
+    
+    assert len(results) == 10
+    assert all(result['answer'] == '안녕하세요 고객님' for result in results)
+    assert weaviate.max_active == 3
+    assert weaviate.embedding_engine.calls == [[q["text"] for q in questions]]
+    assert sorted(v[0] for v in weaviate.vectors) == [float(i) for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_isolates_failures_and_streams_in_completion_order():
+    generator = FailingAnswerGenerator(
+        weaviate_service=VectorRecordingWeaviate(0.01),
+        claude_service=FakeClaudeService()
+    )
+    
+    questions = [{"text": "느림"}, {"text": "실패"}, {"text": "정상"}]
+    items = [item async for item in generator.iter_batch(questions, item_timeout=0.3)]
+    
+    assert [item['index'] for item in items][-1] == 0
+    by_index = {item['index']: item for item in items}
+    assert by_index[0]['error'].startswith('timeout')
+    assert by_index[1]['error'] == '생성 오류'
+    assert by_index[2]['error'] is None
+    assert by_index[2]['result']['answer'] == '안녕하세요 고객님'
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_waits_for_cancelled_tasks_when_closed_early():
+    weaviate = VectorRecordingWeaviate(0.01)
+    generator = AnswerGenerator(weaviate_service=weaviate, claude_service=FakeClaudeService())
+    
+    items = generator.iter_batch([{"text": "정상"}, {"text": "느림"}], item_timeout=5)
+    first = await items.__anext__()
+    await items.aclose()
+    
+    # 느린 질문은 취소됐고, 닫힌 뒤에는 검색 중인 작업이 남아 있지 않음
+    assert first['index'] == 0
+    assert weaviate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_sends_metadata_before_tokens():
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.01),
+        mongodb_service=FakeMongoDBService(0.01),
+        claude_service=FakeClaudeService()
+    )
+    
+    started = time.perf_counter()
+    events = []
+    async for event in generator.stream_answer("K10 배송 언제 오나요?", product_codes=["K10"]):
+        events.append((event, time.perf_counter() - started))
+    
+    names = [event['event'] for event, _ in events]
+    assert names == ['metadata', 'token', 'token', 'done']
+    
+    # 메타데이터는 생성(0.1초)을 기다리지 않고 조회 직후 도착
+    metadata, metadata_at = events[0]
+    assert metadata_at < 0.05
+    assert metadata['data']['confidence'] == 0.9
+    assert metadata['data']['similar_faqs'][0]['inquiry_no'] == 1
+    assert metadata['data']['references'] == ['FAQ_1', 'PRODUCT_K10']
+    
+    done = events[-1][0]['data']
+    assert done['answer'] == '안녕하세요 고객님'
+    assert done['requires_review'] is False
+    assert done['usage'] == {'input_tokens': 10, 'output_tokens': 2}
+    assert 'first_token_ms' in done['timings']
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_reports_generation_timeout():
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.01),
+        claude_service=FakeClaudeService(),
+        stage_timeouts={'generation': 0.07}
+    )
+    
+    events = [event async for event in generator.stream_answer("배송 문의")]
+    
+    assert [event['event'] for event in events] == ['metadata', 'token', 'error']
+    assert events[-1]['data']['partial_answer'] == '안녕하세요 '
+    assert events[-1]['data']['requires_review'] is True
+    assert 'generation' in events[-1]['data']['stage_errors']
+
+
+class CatalogClaudeService(FakeClaudeService):
+    """브랜드 카탈로그(프롬프트 캐시 prefix)를 지원하는 가짜 ClaudeService"""
+    
+    def __init__(self):
+        super().__init__()
+        self.catalogs = {}
+    
+    def brand_catalog_age(self, brand_channel):
+        return 0.0 if brand_channel in self.catalogs else None
+    
+    def set_brand_catalog(self, brand_channel, products):
+        self.catalogs[brand_channel] = products
+
+
+@pytest.mark.asyncio
+async def test_brand_catalog_loaded_once_and_brand_passed_to_generation():
+    mongodb = FakeMongoDBService(0.01)
+    claude = CatalogClaudeService()
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.01),
+        mongodb_service=mongodb,
+        claude_service=claude
+    )
+    
+    await asyncio.gather(*[
+        generator.generate_answer(f"K10 문의 {i}", brand_channel="KEYCHRON") for i in range(3)
+    ])
+    
+    assert mongodb.catalog_calls == 1
+    assert claude.catalogs['KEYCHRON'][0]['product_id'] == 'K10'
+    assert all(context['brand_channel'] == 'KEYCHRON' for context in claude.contexts)
+
+
+@pytest.mark.asyncio
+async def test_cached_answer_skips_lookups_and_generation():
+    from app.services.answer_cache import SemanticAnswerCache
+
+    class FixedEngine:
+        async def aencode(self, texts, batch_size=32):
+            return [[0.6, 0.8] for _ in texts]
+
+    cache = SemanticAnswerCache(similarity_threshold=0.9)
+    weaviate = VectorRecordingWeaviate(0.01)
+    weaviate.embedding_engine = FixedEngine()
+    claude = FakeClaudeService()
+    generator = AnswerGenerator(
+        weaviate_service=weaviate,
+        claude_service=claude,
+        answer_cache=cache
+    )
+
+    first = await generator.generate_answer("반품 주소가 어디인가요")
+    assert first['cached'] is False
+    assert len(claude.contexts) == 1
+    # 캐시 조회용으로 계산한 임베딩을 검색에도 재사용
+    assert weaviate.vectors == [[0.6, 0.8]]
+
+    # CS 승인 전에는 다시 생성
+    await generator.generate_answer("반품 주소가 어디인가요")
+    assert len(claude.contexts) == 2
+
+    cache.approve(first['answer_id'])
+    second = await generator.generate_answer("반품 주소가 어디인가요")
+
+    assert second['cached'] is True
+    assert second['cached_from'] == first['answer_id']
+    assert second['answer'] == '안녕하세요 고객님'
+    assert len(claude.contexts) == 2
+    assert cache.get_stats()['hits'] == 1
+
+
+class FakeTieredAnalyzer:
+    """analyze_tiered 흉내 (full 단계: 임베딩 포함, fail이면 예외)"""
+    
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+    
+    async def analyze_tiered(self, inquiry_content, brand_channel, max_tier='full', embedding=None):
+        self.calls.append((inquiry_content, max_tier, embedding))
+        if self.fail:
+            raise RuntimeError("embedding down")
+        return SimpleNamespace(
+            category='상품',
+            product_codes=['K10'],
+            tier='full',
+            escalation_reason='제품 코드 없음',
+            embedding=embedding or [0.3, 0.4]
+        )
+    
+    def classify_category(self, text, keywords):
+        return '배송'
+    
+    def extract_product_codes(self, text):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_tiered_analysis_feeds_category_codes_and_embedding():
+    analyzer = FakeTieredAnalyzer()
+    weaviate = VectorRecordingWeaviate(0.01)
+    generator = AnswerGenerator(
+        weaviate_service=weaviate,
+        mongodb_service=FakeMongoDBService(0.01),
+        claude_service=FakeClaudeService(),
+        question_analyzer=analyzer,
+        tiered_analysis=True,
+        analysis_max_tier='spacy'
+    )
+    
+    result = await generator.generate_answer("키보드가 고장났어요")
+    
+    assert analyzer.calls == [("키보드가 고장났어요", 'spacy', None)]
+    assert (result['category'], result['analysis_tier']) == ('상품', 'full')
+    assert result['references'] == ['FAQ_1', 'PRODUCT_K10']
+    # 분석 단계에서 만든 임베딩을 유사 FAQ 검색에 재사용
+    assert weaviate.vectors == [[0.3, 0.4]]
+
+
+@pytest.mark.asyncio
+async def test_tiered_analysis_failure_falls_back_to_rules():
+    generator = AnswerGenerator(
+        weaviate_service=FakeWeaviateService(0.01),
+        claude_service=FakeClaudeService(),
+        question_analyzer=FakeTieredAnalyzer(fail=True),
+        tiered_analysis=True
+    )
+    
+    result = await generator.generate_answer("배송 언제 오나요?")
+    
+    assert result['category'] == '배송'
+    assert result['analysis_tier'] is None
+    assert result['stage_errors']['analysis'] == "embedding down"
+    assert result['answer'] == '안녕하세요 고객님'
@@ -0,0 +1,303 @@
+# backend/tests/test_claude_service.py
+# 2026-10-17 15:40, Claude 작성
+# 2026-10-17 16:10, Claude 업데이트 (스트리밍 응답 테스트)
+# 2026-10-17 16:40, Claude 업데이트 (프롬프트 캐싱 테스트)
+# 2026-10-17 17:40, Claude 업데이트 (health_check 테스트)
+
+"""
+ClaudeService / RateLimiter 테스트
+
+실제 API 대신 로컬 가짜 Messages API 서버에 붙여
+429 재시도, 동시 요청 수 제한, 토큰 버킷 대기를 확인합니다.
+
+사용법:
+    pytest tests/test_claude_service.py
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.claude_service import ClaudeService
+from app.utils.exceptions import AnswerGenerationError
+from app.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeMessagesAPI(BaseHTTPRequestHandler):
+    """
+    가짜 /v1/messages 엔드포인트
+    
+    server.fail_first 만큼 429를 돌려준 뒤 정상 응답하고,
+    동시에 처리 중인 요청 수의 최댓값을 기록합니다.
+    같은 system prefix가 다시 오면 캐시 읽기로 응답합니다.
+    """
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        if self.path.startswith('/v1/models') and self.headers.get('x-api-key') == 'test-key':
+            self._send(200, {'data': [], 'has_more': False})
+        else:
+            self._send(401, {'type': 'error', 'error': {'type': 'authentication_error', 'message': 'invalid'}})
+    
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            reject = server.requests <= server.fail_first
+            if not reject:
+                server.bodies.append(body)
+                prefix = json.dumps(body.get('system'), ensure_ascii=False)
+                cached = prefix in server.prefixes
+                server.prefixes.add(prefix)
+        usage = {
+            'input_tokens': 10, 'output_tokens': 5,
+            'cache_creation_input_tokens': 0 if cached else 100,
+            'cache_read_input_tokens': 100 if cached else 0
+        } if not reject else None
+        
+        try:
+            time.sleep(server.delay)
+            if reject:
+                payload = {'type': 'error', 'error': {'type': 'rate_limit_error', 'message': 'slow down'}}
+                self._send(429, payload, {'retry-after': '0'})
+                return
+            
+            if body.get('stream'):
+                self._send_stream(body['model'], ['안녕하세요 ', '고객님'], usage)
+                return
+            
+            payload = {
+                'id': f"msg_{server.requests}",
+                'type': 'message',
+                'role': 'assistant',
+                'model': body['model'],
+                'content': [{'type': 'text', 'text': '답변입니다'}],
+                'stop_reason': 'end_turn',
+                'stop_sequence': None,
+                'usage': usage
+            }
+            self._send(200, payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+    
+    def _send_stream(self, model, chunks, usage):
+        message = {
+            'id': 'msg_stream', 'type': 'message', 'role': 'assistant', 'model': model,
+            'content': [], 'stop_reason': None, 'stop_sequence': None,
+            'usage': {**usage, 'output_tokens': 0}
+        }
+        events = [('message_start', {'type': 'message_start', 'message': message}),
+                  ('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                           'content_block': {'type': 'text', 'text': ''}})]
+        for chunk in chunks:
+            events.append(('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                                   'delta': {'type': 'text_delta', 'text': chunk}}))
+        events += [('content_block_stop', {'type': 'content_block_stop', 'index': 0}),
+                   ('message_delta', {'type': 'message_delta',
+                                      'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                                      'usage': {'output_tokens': len(chunks)}}),
+                   ('message_stop', {'type': 'message_stop'})]
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        for name, data in events:
+            self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+    
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def fake_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeMessagesAPI)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.fail_first = 0
+    server.delay = 0.0
+    server.bodies = []
+    server.prefixes = set()
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_service(server, **kwargs):
+    options = {
+        'requests_per_minute': None,
+        'tokens_per_minute': None,
+        'backoff_base': 0.01,
+        'base_url': f"http://127.0.0.1:{server.server_address[1]}"
+    }
+    options.update(kwargs)
+    return ClaudeService('test-key', 'test-model', **options)
+
+
+@pytest_asyncio.fixture
+async def service_factory():
+    services = []
+    
+    def factory(server, **kwargs):
+        service = make_service(server, **kwargs)
+        services.append(service)
+        return service
+    
+    yield factory
+    for service in services:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_answer_retries_after_429(fake_server, service_factory):
+    fake_server.fail_first = 2
+    service = service_factory(fake_server, max_retries=3)
+    
+    result = await service.generate_answer("배터리 교체 가능한가요?", {})
+    
+    assert result['answer'] == '답변입니다'
+    assert result['usage']['input_tokens'] == 10
+    assert result['usage']['output_tokens'] == 5
+    assert fake_server.requests == 3
+    
+    stats = service.get_stats()
+    assert stats['retries'] == 2
+    assert stats['failures'] == 0
+    assert stats['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_answer_raises_when_retries_exhausted(fake_server, service_factory):
+    fake_server.fail_first = 10
+    service = service_factory(fake_server, max_retries=1)
+    
+    with pytest.raises(AnswerGenerationError):
+        await service.generate_answer("질문", {})
+    
+    assert fake_server.requests == 2
+    assert service.get_stats()['failures'] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_respect_max_concurrency(fake_server, service_factory):
+    fake_server.delay = 0.05
+    service = service_factory(fake_server, max_concurrency=2)
+    
+    results = await asyncio.gather(*[
+        service.generate_answer(f"질문 {i}", {}) for i in range(6)
+    ])
+    
+    assert len(results) == 6
+    assert fake_server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_retries_before_first_token(fake_server, service_factory):
+    fake_server.fail_first = 1
+    service = service_factory(fake_server, max_retries=2)
+    
+    events = [event async for event in service.stream_answer("배터리 교체 가능한가요?", {})]
+    
+    assert [event['text'] for event in events if event['type'] == 'text'] == ['안녕하세요 ', '고객님']
+    assert events[-1]['type'] == 'done'
+    assert events[-1]['usage']['output_tokens'] == 2
+    assert events[-1]['usage']['cache_creation_input_tokens'] == 100
+    assert fake_server.requests == 2
+    assert service.get_stats()['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_brand_catalog_goes_into_cached_prefix(fake_server, service_factory):
+    service = service_factory(fake_server)
+    service.set_brand_catalog('KEYCHRON', [
+        {'product_id': 'K8', 'product_name': '키크론 K8', 'price': 139000},
+        {'product_id': 'K10', 'product_name': '키크론 K10', 'price': 159000},
+    ])
+    
+    first = await service.generate_answer("K10 가격이 얼마인가요?", {'brand_channel': 'KEYCHRON'})
+    second = await service.generate_answer("K8 배터리 용량은?", {'brand_channel': 'KEYCHRON'})
+    
+    # 고정 prefix는 system에, 질문은 user 메시지에만 들어감
+    system = fake_server.bodies[0]['system']
+    assert system[-1]['cache_control'] == {'type': 'ephemeral'}
+    assert 'K10: product_name: 키크론 K10' in system[-1]['text']
+    assert 'K10 가격' not in json.dumps(system, ensure_ascii=False)
+    assert fake_server.bodies[0]['system'] == fake_server.bodies[1]['system']
+    
+    assert first['usage']['cache_creation_input_tokens'] == 100
+    assert second['usage']['cache_read_input_tokens'] == 100
+    
+    cache = service.get_stats()['cache']
+    assert cache['hits'] == 1
+    assert cache['misses'] == 1
+    assert cache['read_tokens'] == 100
+    assert cache['brands'] == ['KEYCHRON']
+
+
+@pytest.mark.asyncio
+async def test_health_check_uses_models_endpoint(fake_server, service_factory):
+    assert await service_factory(fake_server).health_check() is True
+    
+    bad_key = ClaudeService('wrong-key', 'test-model', base_url=f"http://127.0.0.1:{fake_server.server_address[1]}")
+    try:
+        assert await bad_key.health_check() is False
+    finally:
+        await bad_key.close()
+    
+    # 헬스체크는 메시지 요청 수/레이트 리미터에 잡히지 않음
+    assert fake_server.requests == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(capacity=2, refill_rate=20)
+    
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() == 0
+    
+    started = time.monotonic()
+    waited = await bucket.acquire()
+    assert waited > 0
+    assert time.monotonic() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_reconciles_actual_token_usage():
+    limiter = RateLimiter(tokens_per_minute=600)
+    
+    await limiter.acquire(estimated_tokens=100)
+    limiter.record_usage(estimated_tokens=100, actual_tokens=300)
+    
+    stats = limiter.get_stats()
+    assert stats['acquired'] == 1
+    assert stats['requests_available'] is None
+    assert stats['tokens_available'] == pytest.approx(300, abs=1)
@@ -0,0 +1,125 @@
+# backend/tests/test_embedding_batcher.py
+# 2026-10-17 09:40, Claude 작성
+# 2026-10-18 02:30, Claude 업데이트 (워커 중단 시 요청 실패 처리/재시작 테스트)
+
+"""
+EmbeddingBatcher 테스트
+
+동시 요청이 하나의 배치 encode로 묶이는지, 결과가 요청별로
+올바르게 분배되는지, 워커가 멈춰도 요청이 영원히 기다리지 않는지 확인합니다.
+
+사용법:
+    pytest tests/test_embedding_batcher.py
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.embedding_cache import EmbeddingCache
+
+
+class FakeEngine:
+    """배치 호출 기록용 가짜 임베딩 엔진"""
+
+    model_name = 'fake-model'
+
+    def __init__(self, fail: bool = False, delay: float = 0):
+        self.batches = []
+        self.fail = fail
+        self.delay = delay
+        self.abort = None
+        self.cache = EmbeddingCache(self.model_name)
+
+    async def aencode(self, texts, batch_size=32):
+        self.batches.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if self.abort:
+            error, self.abort = self.abort, None
+            raise error
+        if self.fail:
+            raise RuntimeError("encode 실패")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    engine = FakeEngine()
+    batcher = EmbeddingBatcher(engine, max_batch_size=32, max_wait_ms=20)
+
+    texts = [f"문의 {'가' * i}" for i in range(10)]
+    vectors = await asyncio.gather(*(batcher.embed(text) for text in texts))
+
+    assert len(engine.batches) == 1
+    assert vectors == [[float(len(text))] for text in texts]
+
+    stats = batcher.get_stats()
+    assert stats['batches'] == 1
+    assert stats['max_batch_size'] == 10
+    assert stats['queue_depth'] == 0
+
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit_splits_batches():
+    engine = FakeEngine()
+    batcher = EmbeddingBatcher(engine, max_batch_size=4, max_wait_ms=20)
+
+    await asyncio.gather(*(batcher.embed(str(i)) for i in range(10)))
+
+    assert [len(batch) for batch in engine.batches] == [4, 4, 2]
+    assert batcher.get_stats()['batch_size_histogram'] == {2: 1, 4: 2}
+
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_encode_error_is_raised_to_every_caller():
+    batcher = EmbeddingBatcher(FakeEngine(fail=True), max_wait_ms=5)
+
+    results = await asyncio.gather(
+        batcher.embed("배송"),
+        batcher.embed("반품"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    await batcher.close()
+
+
+class Abort(BaseException):
+    """Exception이 아닌 중단 (KeyboardInterrupt 등 흉내)"""
+
+
+@pytest.mark.asyncio
+async def test_worker_abort_fails_waiting_callers_and_restarts():
+    engine = FakeEngine()
+    engine.abort = Abort()
+    batcher = EmbeddingBatcher(engine, max_wait_ms=5)
+
+    with pytest.raises(RuntimeError, match="워커 중단"):
+        await asyncio.wait_for(batcher.embed("배송"), timeout=1)
+
+    # 다음 요청에서 워커를 다시 시작
+    assert await asyncio.wait_for(batcher.embed("반품"), timeout=1) == [2.0]
+
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_in_flight_and_queued_requests():
+    batcher = EmbeddingBatcher(FakeEngine(delay=1), max_batch_size=1, max_wait_ms=5)
+
+    requests = [asyncio.create_task(batcher.embed(text)) for text in ["배송", "반품"]]
+    await asyncio.sleep(0.05)
+    await batcher.close()
+
+    results = await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, RuntimeError) for result in results)
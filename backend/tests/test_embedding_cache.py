@@ -0,0 +1,80 @@
+# backend/tests/test_embedding_cache.py
+# 2026-10-17 10:10, Claude 작성
+# 2026-10-18 02:00, Claude 업데이트 (Redis 타임아웃 설정 확인)
+
+"""
+EmbeddingCache 테스트
+
+키 정규화, float32 직렬화, 로컬 LRU 제한, Redis 장애 시 동작을 확인합니다.
+Redis 서버 없이 실행할 수 있습니다.
+
+사용법:
+    pytest tests/test_embedding_cache.py
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.embedding_cache import EmbeddingCache
+
+
+def test_key_ignores_whitespace_and_case_but_not_model():
+    cache = EmbeddingCache('model-a')
+
+    assert cache.make_key("반품주소  여기로 보내면되나요") == cache.make_key(" 반품주소 여기로\n보내면되나요 ")
+    assert cache.make_key("K10 PRO") == cache.make_key("k10 pro")
+    assert cache.make_key("배송") != EmbeddingCache('model-b').make_key("배송")
+
+
+def test_pack_roundtrip_is_float32_bytes():
+    vector = [0.5, -1.25, 3.0]
+    data = EmbeddingCache.pack(vector)
+
+    assert len(data) == 4 * len(vector)
+    assert EmbeddingCache.unpack(data) == vector
+
+
+def test_local_lru_evicts_oldest_and_counts_hits():
+    cache = EmbeddingCache('model-a', max_items=2)
+    cache.put_many(["a", "b"], [[1.0], [2.0]])
+
+    # "a"를 최근 사용으로 갱신한 뒤 "c" 추가 → "b" 제거
+    assert cache.get_many(["a"]) == [[1.0]]
+    cache.put_many(["c"], [[3.0]])
+
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+    stats = cache.get_stats()
+    assert stats['hits_local'] == 3
+    assert stats['misses'] == 1
+    assert stats['local_items'] == 2
+
+
+def test_unreachable_redis_falls_back_to_local():
+    cache = EmbeddingCache('model-a', redis_url='redis://127.0.0.1:1')
+
+    cache.put_many(["배송"], [[1.0, 2.0]])
+
+    assert cache.get_many(["배송", "교환"]) == [[1.0, 2.0], None]
+    assert cache.get_stats()['redis_errors'] == 1
+
+
+def test_redis_clients_use_short_timeouts():
+    cache = EmbeddingCache('model-a', redis_url='redis://127.0.0.1:1')
+
+    for client in (cache._redis, cache._aredis):
+        kwargs = client.connection_pool.connection_kwargs
+        assert kwargs['socket_connect_timeout'] == EmbeddingCache.REDIS_TIMEOUT
+        assert kwargs['socket_timeout'] == EmbeddingCache.REDIS_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_async_lookup_uses_local_tier():
+    cache = EmbeddingCache('model-a')
+    await cache.aput_many(["반품"], [[0.25]])
+
+    assert await cache.aget_many(["반품", "환불"]) == [[0.25], None]
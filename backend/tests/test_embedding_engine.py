@@ -0,0 +1,95 @@
+# backend/tests/test_embedding_engine.py
+# 2026-10-17 09:10, Claude 작성
+
+"""
+EmbeddingEngine 테스트
+
+실제 Sentence-BERT 모델 대신 가벼운 가짜 모델을 주입하여
+공유 인스턴스, 배치 인코딩, 메모리 조회 동작을 확인합니다.
+
+사용법:
+    pytest tests/test_embedding_engine.py
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+import torch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import embedding_engine as engine_module
+from app.services.embedding_engine import EmbeddingEngine, get_embedding_engine
+
+
+class FakeSentenceTransformer(torch.nn.Module):
+    """텍스트 길이를 벡터로 돌려주는 가짜 모델"""
+
+    loads = 0
+
+    def __init__(self, model_name, device=None):
+        super().__init__()
+        FakeSentenceTransformer.loads += 1
+        self.weight = torch.nn.Parameter(torch.zeros(4, 2))
+        self.register_buffer('scale', torch.ones(4))
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return np.array([len(texts), 1.0])
+        return np.array([[len(t), 1.0] for t in texts])
+
+
+@pytest.fixture(autouse=True)
+def fake_model(monkeypatch):
+    FakeSentenceTransformer.loads = 0
+    monkeypatch.setattr(engine_module, 'load_sentence_transformer', FakeSentenceTransformer)
+    monkeypatch.setattr(engine_module, '_engines', {})
+
+
+def test_engine_is_loaded_once_per_model():
+    first = get_embedding_engine('fake-model', device='cpu')
+    second = get_embedding_engine('fake-model', device='cpu')
+
+    assert first is second
+    assert FakeSentenceTransformer.loads == 1
+
+
+def test_encode_single_and_batch():
+    engine = EmbeddingEngine('fake-model', device='cpu')
+
+    assert engine.encode('배송') == [2.0, 1.0]
+    assert engine.encode(['반품', '교환 문의']) == [[2.0, 1.0], [5.0, 1.0]]
+
+
+@pytest.mark.asyncio
+async def test_aencode_matches_encode():
+    engine = EmbeddingEngine('fake-model', device='cpu')
+
+    assert await engine.aencode(['배송 언제']) == engine.encode(['배송 언제'])
+
+
+def test_memory_footprint_counts_parameters_and_buffers():
+    engine = EmbeddingEngine('fake-model', device='cpu')
+    footprint = engine.memory_footprint()
+
+    assert footprint['parameters'] == 8
+    assert footprint['bytes'] == (8 + 4) * 4
+    assert footprint['model_name'] == 'fake-model'
+
+
+def test_encode_reads_through_cache():
+    engine = EmbeddingEngine('fake-model', device='cpu')
+    calls = []
+    original = engine.model.encode
+    engine.model.encode = lambda texts, **kwargs: calls.append(list(texts)) or original(texts)
+
+    engine.encode(['배송 문의', '반품 문의'])
+    vectors = engine.encode(['반품  문의', '교환 문의', '교환 문의'])
+
+    assert calls == [['배송 문의', '반품 문의'], ['교환 문의']]
+    assert vectors == [[5.0, 1.0], [5.0, 1.0], [5.0, 1.0]]
@@ -0,0 +1,278 @@
+# backend/tests/test_faq_indexer.py
+# 2026-10-17 14:10, Claude 작성
+# 2026-10-17 22:50, Claude 업데이트 (부분 실패 재시도/보류, 실패 배치 뒤 token 전진 방지 테스트)
+# 2026-10-17 23:30, Claude 업데이트 (faq_vector_state 기록 테스트)
+
+"""
+FAQIndexer 테스트
+
+가짜 change stream과 가짜 WeaviateService를 주입하여
+마이크로 배칭, 이벤트 병합, 삭제 반영, resume token 저장을 확인합니다.
+저장 실패 시 재시도/보류와 실패한 배치를 건너뛰어 token이 전진하지 않는지도 확인합니다.
+
+사용법:
+    pytest tests/test_faq_indexer.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+import pytest
+from bson import Timestamp
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.faq_indexer import FAILURE_COLLECTION, VECTOR_STATE_COLLECTION, FAQIndexer
+
+
+def make_change(seq, operation, inquiry_no, updated_fields=None, **fields):
+    """change stream 이벤트 생성"""
+    document = {'inquiry_no': inquiry_no, 'title': f"제목 {inquiry_no}", **fields}
+    change = {
+        '_id': {'_data': f"token-{seq}"},
+        'operationType': operation,
+        'clusterTime': Timestamp(int(time.time()), seq),
+        'documentKey': {'_id': f"oid-{inquiry_no}"},
+    }
+    if operation == 'delete':
+        change['fullDocumentBeforeChange'] = document
+    else:
+        change['fullDocument'] = document
+    if operation == 'update':
+        change['updateDescription'] = {'updatedFields': updated_fields or {}, 'removedFields': []}
+    return change
+
+
+class FakeStream:
+    """이벤트를 순서대로 돌려준 뒤 대기하는 가짜 change stream"""
+
+    def __init__(self, changes):
+        self.changes = list(changes)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.changes:
+            return self.changes.pop(0)
+        await asyncio.sleep(3600)
+
+
+class FakeFAQs:
+    def __init__(self, changes):
+        self.changes = changes
+        self.watch_kwargs = []
+
+    def watch(self, pipeline, **kwargs):
+        self.watch_kwargs.append(kwargs)
+        return FakeStream(self.changes)
+
+
+class FakeSyncState:
+    def __init__(self, token=None):
+        self.doc = {'_id': 'faq_indexer', 'resume_token': token} if token else None
+        self.saved = []
+
+    async def find_one(self, query):
+        return self.doc
+
+    async def update_one(self, query, update, upsert=False):
+        self.doc = {'_id': query['_id'], **update['$set']}
+        self.saved.append(update['$set']['resume_token']['_data'])
+
+
+class FakeFailures:
+    def __init__(self):
+        self.docs = {}
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs[query['_id']] = update['$set']
+
+
+class FakeVectorState:
+    def __init__(self):
+        self.docs = {}
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            self.docs[operation._filter['_id']] = operation._doc['$set']
+
+    async def delete_many(self, query):
+        for inquiry_no in query['_id']['$in']:
+            self.docs.pop(inquiry_no, None)
+
+
+class FakeDB:
+    def __init__(self, changes, token=None):
+        self.faqs = FakeFAQs(changes)
+        self.sync_state = FakeSyncState(token)
+        self.failures = FakeFailures()
+        self.vector_state = FakeVectorState()
+
+    def __getitem__(self, name):
+        return {FAILURE_COLLECTION: self.failures, VECTOR_STATE_COLLECTION: self.vector_state}[name]
+
+
+class FakeWeaviateService:
+    def __init__(self):
+        self.batches = []
+        self.deleted = []
+
+    async def add_faqs_batch(self, faqs):
+        self.batches.append([faq['inquiry_no'] for faq in faqs])
+        return {'succeeded': len(faqs), 'failed': 0, 'errors': []}
+
+    async def delete_faqs(self, inquiry_nos):
+        self.deleted.extend(inquiry_nos)
+        return len(inquiry_nos)
+
+    @staticmethod
+    def faq_content_hash(faq):
+        return f"hash-{faq['inquiry_no']}-{faq['title']}"
+
+
+@pytest.mark.asyncio
+async def test_process_batch_merges_events_and_saves_token():
+    db = FakeDB([])
+    weaviate = FakeWeaviateService()
+    indexer = FAQIndexer(db, weaviate)
+
+    await indexer.process_batch([
+        make_change(1, 'insert', 1),
+        make_change(2, 'update', 1, {'answer_content': '답변'}),
+        make_change(3, 'update', 2, {'processing_status': 'completed'}),
+        make_change(4, 'insert', 3),
+        make_change(5, 'delete', 3),
+    ])
+
+    # 1번은 한 번만 저장, 상태 변경만 있는 2번은 건너뜀, 3번은 마지막 이벤트(삭제)만 반영
+    assert weaviate.batches == [[1]]
+    assert weaviate.deleted == [3]
+    assert db.sync_state.doc['resume_token'] == {'_data': 'token-5'}
+
+    # 저장한 FAQ는 증분 동기화와 같은 내용 해시로 기록
+    assert db.vector_state.docs[1]['text_hash'] == "hash-1-제목 1"
+    assert 3 not in db.vector_state.docs
+
+    stats = indexer.get_stats()
+    assert stats['indexed'] == 1
+    assert stats['deleted'] == 1
+    assert stats['skipped'] == 1
+    assert stats['lag_seconds'] is not None
+
+
+@pytest.mark.asyncio
+async def test_run_micro_batches_stream_and_resumes_from_saved_token():
+    changes = [make_change(i, 'insert', i) for i in range(1, 6)]
+    db = FakeDB(changes, token={'_data': 'token-0'})
+    weaviate = FakeWeaviateService()
+    indexer = FAQIndexer(db, weaviate, batch_size=3, max_wait_seconds=0.05)
+
+    task = asyncio.create_task(indexer.run())
+    for _ in range(100):
+        if indexer.get_stats()['indexed'] == 5:
+            break
+        await asyncio.sleep(0.01)
+    indexer.stop()
+    await task
+
+    assert db.faqs.watch_kwargs[0]['resume_after'] == {'_data': 'token-0'}
+    assert weaviate.batches == [[1, 2, 3], [4, 5]]
+    assert db.sync_state.doc['resume_token'] == {'_data': 'token-5'}
+    assert indexer.get_stats()['queue_depth'] == 0
+
+
+class FlakyWeaviateService(FakeWeaviateService):
+    """fail_times[inquiry_no]번 저장 실패 후 성공 (None이면 계속 실패), raise_times번은 호출 자체가 예외"""
+
+    def __init__(self, fail_times=None, raise_times=0):
+        super().__init__()
+        self.fail_times = dict(fail_times or {})
+        self.raise_times = raise_times
+
+    async def add_faqs_batch(self, faqs):
+        self.batches.append([faq['inquiry_no'] for faq in faqs])
+        if self.raise_times is None or self.raise_times > 0:
+            if self.raise_times:
+                self.raise_times -= 1
+            raise ConnectionError("weaviate unavailable")
+
+        errors = []
+        for faq in faqs:
+            remaining = self.fail_times.get(faq['inquiry_no'], 0)
+            if remaining is None or remaining > 0:
+                errors.append({'inquiry_no': faq['inquiry_no'], 'error': "timeout"})
+                if remaining:
+                    self.fail_times[faq['inquiry_no']] = remaining - 1
+        return {'succeeded': len(faqs) - len(errors), 'failed': len(errors), 'errors': errors}
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_retries_then_parks_before_saving_token():
+    db = FakeDB([])
+    weaviate = FlakyWeaviateService(fail_times={2: None, 3: 1})
+    indexer = FAQIndexer(db, weaviate, max_retries=2, retry_backoff=0)
+
+    await indexer.process_batch([make_change(i, 'insert', i) for i in (1, 2, 3)])
+
+    # 실패한 FAQ만 재시도, 3번은 두 번째 시도에 성공, 2번은 끝내 실패 → 보류
+    assert weaviate.batches == [[1, 2, 3], [2, 3], [2]]
+    assert list(db.failures.docs) == [2]
+    assert db.failures.docs[2]['error'] == "timeout"
+    assert set(db.vector_state.docs) == {1, 3}
+    assert db.sync_state.doc['resume_token'] == {'_data': 'token-3'}
+
+    stats = indexer.get_stats()
+    assert stats['indexed'] == 2
+    assert stats['failed'] == 1
+    assert stats['parked'] == 1
+    assert stats['retried'] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_before_later_batches_save_token():
+    changes = [make_change(i, 'insert', i) for i in range(1, 5)]
+    db = FakeDB(changes)
+    weaviate = FlakyWeaviateService(raise_times=2)
+    indexer = FAQIndexer(db, weaviate, batch_size=2, max_wait_seconds=0.05, retry_backoff=0.01)
+
+    task = asyncio.create_task(indexer.run())
+    for _ in range(100):
+        if indexer.get_stats()['batches'] == 2:
+            break
+        await asyncio.sleep(0.01)
+    indexer.stop()
+    await task
+
+    # 실패한 첫 배치가 반영된 뒤에야 다음 배치 처리, token은 순서대로만 전진
+    assert weaviate.batches == [[1, 2], [1, 2], [1, 2], [3, 4]]
+    assert db.sync_state.saved == ['token-2', 'token-4']
+
+
+@pytest.mark.asyncio
+async def test_stop_during_failure_keeps_token_at_failed_batch():
+    changes = [make_change(i, 'insert', i) for i in range(1, 5)]
+    db = FakeDB(changes, token={'_data': 'token-0'})
+    weaviate = FlakyWeaviateService(raise_times=None)
+    indexer = FAQIndexer(db, weaviate, batch_size=2, max_wait_seconds=0.05, retry_backoff=10)
+
+    task = asyncio.create_task(indexer.run())
+    for _ in range(100):
+        if weaviate.batches:
+            break
+        await asyncio.sleep(0.01)
+    indexer.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    # 재시도 대기 중 종료 → 남은 배치는 반영하지 않고 token 유지 (다음 실행에서 다시 수신)
+    assert weaviate.batches == [[1, 2]]
+    assert db.sync_state.saved == []
+    assert indexer.get_stats()['failed'] == 4
@@ -0,0 +1,102 @@
+# backend/tests/test_health_checker.py
+# 2026-10-17 17:40, Claude 작성
+
+"""
+HealthChecker 테스트
+
+가짜 프로브로 동시 실행, 타임아웃/실패 보고, 결과 캐싱,
+동시 요청의 확인 공유, /health/detailed 응답을 확인합니다.
+
+사용법:
+    pytest tests/test_health_checker.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.api import health
+from app.services.health_checker import HealthChecker, get_health_checker
+
+
+class CountingProbe:
+    def __init__(self, delay=0.0, result=True, error=None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_and_report_failures():
+    checker = HealthChecker({
+        'weaviate': CountingProbe(0.1),
+        'mongodb': CountingProbe(0.1),
+        'redis': CountingProbe(0.5),
+        'claude_api': CountingProbe(error=ConnectionError("연결 거부")),
+        'extra': None,
+    }, timeout=0.2)
+
+    started = time.perf_counter()
+    result = await checker.check()
+    elapsed = time.perf_counter() - started
+
+    # 순차 실행이면 0.4초 이상
+    assert elapsed < 0.35
+    services = result['services']
+    assert services['weaviate']['status'] == 'up'
+    assert services['weaviate']['latency_ms'] >= 90
+    assert services['redis']['status'] == 'timeout'
+    assert services['claude_api'] == {'status': 'down', 'error': '연결 거부',
+                                      'latency_ms': services['claude_api']['latency_ms']}
+    assert services['extra'] == {'status': 'not_configured'}
+    assert result['status'] == 'degraded'
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_and_shared_between_concurrent_callers():
+    probe = CountingProbe(0.05)
+    checker = HealthChecker({'mongodb': probe}, cache_ttl=0.2)
+
+    results = await asyncio.gather(*[checker.check() for _ in range(10)])
+    assert probe.calls == 1
+    assert all(result['status'] == 'healthy' for result in results)
+
+    cached = await checker.check()
+    assert cached['cached'] is True
+    assert probe.calls == 1
+
+    await asyncio.sleep(0.25)
+    refreshed = await checker.check()
+    assert refreshed['cached'] is False
+    assert probe.calls == 2
+
+
+def test_detailed_endpoint_returns_probe_results():
+    checker = HealthChecker({'mongodb': CountingProbe(), 'weaviate': CountingProbe(result=False)})
+
+    app = FastAPI()
+    app.include_router(health.router, prefix="/health")
+    app.dependency_overrides[get_health_checker] = lambda: checker
+    client = TestClient(app)
+
+    body = client.get("/health/detailed").json()
+
+    assert body['status'] == 'degraded'
+    assert body['services']['mongodb']['status'] == 'up'
+    assert body['services']['weaviate']['status'] == 'down'
+    assert client.get("/health/detailed").json()['cached'] is True
@@ -0,0 +1,121 @@
+# backend/tests/test_import_data.py
+# 2026-10-18 00:20, Claude 작성
+
+"""
+scripts/import_data.py 스트리밍 로더 / 벌크 upsert 테스트
+
+CSV, JSON 배열, 단일 JSON 객체, JSON Lines를 한 행씩 읽는지,
+읽기 단위(JSON_READ_SIZE)를 작게 잡아 값이 버퍼 경계에서 잘려도 그대로 복원하는지,
+쉼표가 빠지거나 겹친 배열을 거부하는지,
+변환 중 예외가 나도 이미 보낸 청크 쓰기를 끝까지 기다리는지 확인합니다.
+
+사용법:
+    pytest tests/test_import_data.py
+"""
+
+import sys
+import os
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from import_data import DataLoader, MongoDBImporter
+
+
+ITEMS = [
+    {'id': 1, 'product_name': "키크론 K10 PRO MAX", 'tags': "무선, 기계식"},
+    {'id': 22, 'product_name': "키크론 Q6 \"스페이스 그레이\"", 'price': 259000.5},
+    {'id': 333, 'product_name': "키크론 V1 [갈축]", 'features': {'rgb': True, 'knob': None}},
+]
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def test_iter_csv_streams_rows_with_empty_values_as_none(tmp_path):
+    path = write(tmp_path, 'products.csv', "id,product_name,price\n1,키크론 K10,\n2,\"키크론 Q6, 적축\",189000\n")
+
+    rows = DataLoader.iter_file(path)
+
+    assert next(rows) == {'id': '1', 'product_name': "키크론 K10", 'price': None}
+    assert list(rows) == [{'id': '2', 'product_name': "키크론 Q6, 적축", 'price': '189000'}]
+
+
+@pytest.mark.parametrize('read_size', [1, 3, 7, 64 * 1024])
+def test_iter_json_array_survives_read_boundaries(tmp_path, monkeypatch, read_size):
+    monkeypatch.setattr(DataLoader, 'JSON_READ_SIZE', read_size)
+    text = '\ufeff [\n' + ' ,\n  '.join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + '\n]\n'
+    path = write(tmp_path, 'products.json', text)
+
+    assert list(DataLoader.iter_file(path)) == ITEMS
+    # 숫자 원소는 버퍼 끝에서 잘려도(12 | 345) 다시 읽어 디코딩
+    assert list(DataLoader.iter_json(write(tmp_path, 'numbers.json', '[12345, 6]'))) == [12345, 6]
+    assert list(DataLoader.iter_json(write(tmp_path, 'empty.json', '[ ]'))) == []
+
+
+def test_iter_json_single_object(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLoader, 'JSON_READ_SIZE', 4)
+    path = write(tmp_path, 'product.json', json.dumps(ITEMS[2], ensure_ascii=False))
+
+    assert list(DataLoader.iter_json(path)) == [ITEMS[2]]
+
+
+@pytest.mark.parametrize('text', ['[1,,2]', '[,1]', '[1,]', '[1 2]', '[{"a": 1} {"b": 2}]', '[1, 2'])
+def test_iter_json_rejects_malformed_arrays(tmp_path, monkeypatch, text):
+    monkeypatch.setattr(DataLoader, 'JSON_READ_SIZE', 2)
+    path = write(tmp_path, 'broken.json', text)
+
+    with pytest.raises(ValueError):
+        list(DataLoader.iter_json(path))
+
+
+def test_iter_jsonl_streams_lines_and_reports_line_number(tmp_path):
+    path = write(tmp_path, 'products.jsonl', '\n'.join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + '\n\n')
+
+    rows = DataLoader.iter_file(path)
+    assert next(rows) == ITEMS[0]
+    assert list(rows) == ITEMS[1:]
+
+    broken = write(tmp_path, 'broken.jsonl', '{"id": 1}\n{"id": \n')
+    with pytest.raises(ValueError, match=r"broken\.jsonl:2"):
+        list(DataLoader.iter_jsonl(broken))
+
+
+class SlowCollection:
+    """bulk_write가 오래 걸리는 가짜 컬렉션 (끝난 청크 크기 기록)"""
+
+    def __init__(self):
+        self.finished = []
+
+    async def bulk_write(self, operations, ordered=True):
+        await asyncio.sleep(0.05)
+        self.finished.append(len(operations))
+        return SimpleNamespace(upserted_count=len(operations), modified_count=0)
+
+
+@pytest.mark.asyncio
+async def test_upsert_bulk_waits_for_sent_chunks_when_transform_fails():
+    collection = SlowCollection()
+    importer = MongoDBImporter('mongodb://unused', 'csai', chunk_size=2, concurrency=2)
+
+    def documents():
+        for i in range(5):
+            yield {'product_id': str(i)}
+        raise ValueError("변환 실패")
+
+    with pytest.raises(ValueError, match="변환 실패"):
+        await importer._upsert_bulk(collection, documents(), 'product_id')
+
+    # 예외 전에 보낸 두 청크는 버려지지 않고 끝까지 기록됨
+    assert collection.finished == [2, 2]
+
+    result = await importer._upsert_bulk(collection, ({'product_id': str(i)} for i in range(3)), 'product_id')
+    assert result == {'inserted': 3, 'updated': 0, 'failed': 0, 'processed': 3}
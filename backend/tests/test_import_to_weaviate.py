@@ -0,0 +1,240 @@
+# backend/tests/test_import_to_weaviate.py
+# 2026-10-17 23:30, Claude 작성
+# 2026-10-18 02:40, Claude 업데이트 (변환할 수 없는 보류 FAQ 유지 테스트)
+
+"""
+scripts/import_to_weaviate.py 증분 동기화 테스트
+
+가짜 MongoDB(동기 pymongo 흉내), 가짜 Weaviate 컬렉션, 가짜 임베딩 생성기를 주입하여
+high-water mark 이후 변경분만 조회하는지, 내용 해시가 같으면 다시 임베딩하지 않는지,
+저장 실패 시 기준 시각을 유지하는지, 전체 임포트도 faq_vector_state를 기록하는지 확인합니다.
+
+사용법:
+    pytest tests/test_import_to_weaviate.py
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from import_to_weaviate import FAQImporter, SYNC_STATE_COLLECTION
+from app.services.faq_indexer import FAILURE_COLLECTION, VECTOR_STATE_COLLECTION
+from app.services.weaviate_service import WeaviateService
+
+
+BASE_TIME = datetime(2026, 10, 17, 9, 0)
+
+
+def make_faq(inquiry_no, minutes=0, title=None):
+    return {
+        '_id': f"oid-{inquiry_no}",
+        'inquiry_no': inquiry_no,
+        'brand_channel': 'KEYCHRON',
+        'inquiry_category': '배송',
+        'title': title or f"제목 {inquiry_no}",
+        'inquiry_content': f"내용 {inquiry_no}",
+        'updated_at': BASE_TIME + timedelta(minutes=minutes),
+    }
+
+
+def matches(doc, query):
+    """pymongo 쿼리 일부($or, $in, $gte, 값 비교) 평가"""
+    for key, condition in query.items():
+        if key == '$or':
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = doc.get(key)
+            if '$in' in condition and value not in condition['$in']:
+                return False
+            if '$gte' in condition and (value is None or value < condition['$gte']):
+                return False
+        elif doc.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCursor(list):
+    def batch_size(self, size):
+        return self
+
+    def limit(self, count):
+        return FakeCursor(self[:count])
+
+
+class FakeCollection:
+    """동기 pymongo 컬렉션 흉내 (_id 키 문서 dict)"""
+
+    def __init__(self, docs=()):
+        self.docs = {doc['_id']: dict(doc) for doc in docs}
+        self.queries = []
+
+    def find(self, query=None, projection=None):
+        self.queries.append(query or {})
+        return FakeCursor(dict(doc) for doc in self.docs.values() if matches(doc, query or {}))
+
+    def find_one(self, query):
+        return next(iter(self.find(query)), None)
+
+    def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query['_id'], {'_id': query['_id']}).update(update['$set'])
+
+    def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            self.update_one(operation._filter, operation._doc, upsert=True)
+
+    def delete_many(self, query):
+        for key in [key for key, doc in self.docs.items() if matches(doc, query)]:
+            del self.docs[key]
+
+
+class FakeMongoDB(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+    @property
+    def faqs(self):
+        return self['faqs']
+
+
+class FakeWeaviateCollection:
+    """batch.fixed_size / data.delete_many 흉내 (fail_inquiry_nos는 저장 실패)"""
+
+    def __init__(self, fail_inquiry_nos=()):
+        self.objects = {}
+        self.fail_uuids = {WeaviateService.faq_uuid(inquiry_no) for inquiry_no in fail_inquiry_nos}
+        self.failed_objects = []
+        self.batch = self
+        self.data = self
+
+    def fixed_size(self, batch_size):
+        self.failed_objects = []
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_object(self, properties, vector, uuid):
+        if uuid in self.fail_uuids:
+            self.failed_objects.append(SimpleNamespace(message="timeout", object_=SimpleNamespace(uuid=uuid)))
+        else:
+            self.objects[uuid] = properties
+
+    def delete_many(self, where):
+        removed = [uuid for uuid in where.value if self.objects.pop(uuid, None) is not None]
+        return SimpleNamespace(successful=len(removed))
+
+
+class FakeEmbeddingGenerator:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32, show_progress_bar=True):
+        self.encoded.append(list(texts))
+        return [[0.1, 0.2] for _ in texts]
+
+
+def make_importer(faqs, collection=None):
+    importer = FAQImporter.__new__(FAQImporter)
+    importer.mongo_db = FakeMongoDB(faqs=FakeCollection(faqs))
+    importer.embedding_generator = FakeEmbeddingGenerator()
+    importer.weaviate_client = SimpleNamespace(
+        collections=SimpleNamespace(get=lambda name: collection)
+    )
+    return importer
+
+
+def test_incremental_sync_uses_high_water_mark_and_content_hash():
+    collection = FakeWeaviateCollection()
+    importer = make_importer([make_faq(1, 0), make_faq(2, 1), make_faq(3, 2)], collection)
+
+    first = importer.import_faqs_incremental()
+    assert first['imported'] == 3
+    assert importer.mongo_db[SYNC_STATE_COLLECTION].docs['weaviate_faq:ALL']['high_water_mark'] == BASE_TIME + timedelta(minutes=2)
+    assert set(importer.mongo_db[VECTOR_STATE_COLLECTION].docs) == {1, 2, 3}
+
+    # 3번은 updated_at만 바뀜(해시 같음), 2번은 내용 변경, 4번은 새 FAQ, 1번은 기준 이전
+    faqs = importer.mongo_db.faqs.docs
+    faqs['oid-3']['updated_at'] = BASE_TIME + timedelta(minutes=5)
+    faqs['oid-2'].update(make_faq(2, 6, title="바뀐 제목"))
+    faqs['oid-4'] = make_faq(4, 7)
+    importer.embedding_generator.encoded.clear()
+
+    second = importer.import_faqs_incremental(sync_deletions=False)
+
+    assert importer.mongo_db.faqs.queries[-1]['updated_at'] == {'$gte': BASE_TIME + timedelta(minutes=2)}
+    assert second['scanned'] == 3
+    assert second['unchanged'] == 1
+    assert second['imported'] == 2
+    assert importer.embedding_generator.encoded == [["바뀐 제목 내용 2", "제목 4 내용 4"]]
+    assert collection.objects[WeaviateService.faq_uuid(2)]['title'] == "바뀐 제목"
+    assert importer.mongo_db[SYNC_STATE_COLLECTION].docs['weaviate_faq:ALL']['high_water_mark'] == BASE_TIME + timedelta(minutes=7)
+
+
+def test_incremental_sync_holds_mark_at_failed_faq_and_retries_parked():
+    collection = FakeWeaviateCollection(fail_inquiry_nos=[2])
+    importer = make_importer([make_faq(1, 0), make_faq(2, 1), make_faq(3, 2)], collection)
+    importer.mongo_db[FAILURE_COLLECTION].update_one({'_id': 1}, {'$set': {'brand_channel': 'KEYCHRON'}})
+
+    stats = importer.import_faqs_incremental()
+
+    # 실패한 2번의 updated_at에 기준 시각을 묶어 다음 실행에서 다시 조회
+    assert stats['failed'] == 1
+    assert importer.mongo_db[SYNC_STATE_COLLECTION].docs['weaviate_faq:ALL']['high_water_mark'] == BASE_TIME + timedelta(minutes=1)
+    assert 2 not in importer.mongo_db[VECTOR_STATE_COLLECTION].docs
+
+    # 인덱서가 보류한 1번은 해시가 같아도 다시 저장되고 보류 해제
+    importer.mongo_db[FAILURE_COLLECTION].update_one({'_id': 1}, {'$set': {'brand_channel': 'KEYCHRON'}})
+    collection.fail_uuids.clear()
+    importer.embedding_generator.encoded.clear()
+
+    stats = importer.import_faqs_incremental()
+
+    assert importer.embedding_generator.encoded == [["제목 1 내용 1", "제목 2 내용 2"]]
+    assert stats['unchanged'] == 1
+    assert importer.mongo_db[FAILURE_COLLECTION].docs == {}
+
+
+def test_incremental_sync_keeps_parked_faq_that_cannot_be_prepared():
+    broken = make_faq(2, 1)
+    del broken['title']
+    importer = make_importer([make_faq(1, 0), broken], FakeWeaviateCollection())
+    failures = importer.mongo_db[FAILURE_COLLECTION]
+    failures.update_one({'_id': 2}, {'$set': {'brand_channel': 'KEYCHRON'}})
+    failures.update_one({'_id': 3}, {'$set': {'brand_channel': 'KEYCHRON'}})
+
+    stats = importer.import_faqs_incremental(sync_deletions=False)
+
+    # 필수 필드가 없는 2번은 삭제가 아닌 실패로 보고 보류 유지, faqs에서 사라진 3번만 보류 해제
+    assert stats['failed'] == 1
+    assert stats['imported'] == 1
+    assert set(failures.docs) == {2}
+
+
+def test_full_import_records_vector_state_for_incremental_and_deletions():
+    collection = FakeWeaviateCollection()
+    importer = make_importer([make_faq(1, 0), make_faq(2, 1)], collection)
+
+    assert importer.import_faqs(batch_size=10)['imported'] == 2
+    assert set(importer.mongo_db[VECTOR_STATE_COLLECTION].docs) == {1, 2}
+
+    # 전체 임포트가 기록한 해시 → 증분 동기화는 다시 임베딩하지 않음
+    importer.embedding_generator.encoded.clear()
+    stats = importer.import_faqs_incremental(sync_deletions=False)
+    assert stats['unchanged'] == 2
+    assert importer.embedding_generator.encoded == []
+
+    # 삭제 스캔은 생략 옵션이 없을 때만
+    del importer.mongo_db.faqs.docs['oid-2']
+    assert importer.import_faqs_incremental(sync_deletions=False)['deleted'] == 0
+    assert importer.import_faqs_incremental()['deleted'] == 1
+    assert list(collection.objects) == [WeaviateService.faq_uuid(1)]
+    assert set(importer.mongo_db[VECTOR_STATE_COLLECTION].docs) == {1}
@@ -0,0 +1,107 @@
+# backend/tests/test_keyword_matcher.py
+# 2026-10-17 19:20, Claude 작성
+# 2026-10-18 02:10, Claude 업데이트 (분석 1회당 문의 내용 스캔 1회 확인)
+
+"""
+KeywordMatcher 테스트
+
+단일 스캔 결과가 키워드별 `in` 검사와 같은지(겹치는/포함된 키워드 포함),
+공유 인스턴스 재사용, 분석기가 문의 내용을 한 번만 스캔하는지 확인합니다.
+
+사용법:
+    pytest tests/test_keyword_matcher.py
+"""
+
+import sys
+import os
+
+import spacy
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import question_analyzer as core_module
+from app.core.question_analyzer import InquiryData, QuestionAnalyzer
+from app.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+DICTIONARY = QuestionAnalyzer.COLOR_KEYWORDS + QuestionAnalyzer.SWITCH_TYPES + QuestionAnalyzer.TECH_TERMS
+
+TEXTS = [
+    "K10 PRO MAX 쉘화이트 저소음 바나나축 펌웨어 업데이트 후 블루투스 페어링이 안돼요",
+    "레트로 블루 색상 재입고 언제 되나요? Shell White도 궁금합니다",
+    "Windows에서 2.4GHz 리시버 인식이 안 됩니다. A/S 가능한가요?",
+    "배송 언제 오나요",
+    "",
+]
+
+
+def naive_find(keywords, text):
+    text_lower = text.lower()
+    return {keyword.lower() for keyword in keywords if keyword.lower() in text_lower}
+
+
+def test_find_matches_per_keyword_scan():
+    matcher = KeywordMatcher(DICTIONARY)
+    
+    for text in TEXTS:
+        assert matcher.find(text) == naive_find(DICTIONARY, text)
+
+
+def test_nested_and_overlapping_keywords():
+    matcher = KeywordMatcher(['저소음 바나나축', '바나나축', '레트로', '레트로 블루', '블루', '트로 블'])
+    
+    assert matcher.find("저소음 바나나축") == {'저소음 바나나축', '바나나축'}
+    assert matcher.find("레트로 블루") == {'레트로', '레트로 블루', '블루', '트로 블'}
+
+
+def test_shared_instance_per_keyword_set():
+    first = get_keyword_matcher(['배송', '반품'])
+    second = get_keyword_matcher(['반품', '배송', '배송'])
+    
+    assert first is second
+    assert first is not get_keyword_matcher(['교환'])
+
+
+class CountingMatcher(KeywordMatcher):
+    """find()에 넘어온 텍스트 기록"""
+    
+    def __init__(self, keywords):
+        super().__init__(keywords)
+        self.texts = []
+    
+    def find(self, text):
+        self.texts.append(text)
+        return super().find(text)
+
+
+def test_analyzer_scans_content_once(monkeypatch):
+    monkeypatch.setattr(core_module, 'load_spacy', lambda model_name, exclude=(): spacy.blank('xx'))
+    analyzer = QuestionAnalyzer(pos_tagging=False)
+    analyzer.keyword_matcher = CountingMatcher(DICTIONARY)
+    
+    result = analyzer.analyze(InquiryData(
+        brand_channel="KEYCHRON",
+        inquiry_category="상품",
+        title="연결 문의",
+        inquiry_content=TEXTS[0],
+        product_name="키크론 K10 PRO MAX",
+        product_order_option="레트로 블루, 적축"
+    ))
+    
+    assert analyzer.keyword_matcher.texts.count(TEXTS[0]) == 1
+    assert all(TEXTS[0] not in text for text in analyzer.keyword_matcher.texts if text != TEXTS[0])
+    assert result.product_color == "쉘화이트"
+    assert result.product_switch == "바나나축"
+    assert result.tech_terms == analyzer._extract_tech_terms(naive_find(DICTIONARY, TEXTS[0]))
+    
+    # 색상/스위치는 상품명/옵션에서도, 기술 용어는 문의 내용에서만
+    result = analyzer.analyze(InquiryData(
+        brand_channel="KEYCHRON",
+        inquiry_category="배송",
+        title="배송 문의",
+        inquiry_content=TEXTS[3],
+        product_name="키크론 K3 블루투스",
+        product_order_option="레트로 블루, 적축"
+    ))
+    assert (result.product_color, result.product_switch) == ("레트로", "적축")
+    assert result.tech_terms == []
@@ -0,0 +1,187 @@
+# backend/tests/test_mongodb_service.py
+# 2026-10-17 11:40, Claude 작성
+# 2026-10-17 21:20, Claude 업데이트 (제품 코드 조회 테스트)
+# 2026-10-18 00:40, Claude 업데이트 (codes backfill / 색인 재로드 테스트)
+
+"""
+MongoDBService 배치 저장 테스트
+
+실제 MongoDB 대신 bulk_write 호출을 기록하는 가짜 컬렉션을 주입하여
+청크 분할, upsert 작업 구성, 문서별 오류 집계를 확인합니다.
+제품 코드 조회는 codes $all 쿼리(색인 로드 전)와 메모리 색인 갱신,
+색인 로드 시 codes backfill과 주기적 재로드를 확인합니다.
+
+사용법:
+    pytest tests/test_mongodb_service.py
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.mongodb_service import MongoDBService
+
+
+class FakeCollection:
+    """bulk_write 호출 기록용 가짜 컬렉션"""
+
+    def __init__(self, fail_indexes=None):
+        self.calls = []
+        self.fail_indexes = fail_indexes or set()
+
+    async def bulk_write(self, operations, ordered=True):
+        self.calls.append((list(operations), ordered))
+
+        failed = [i for i in range(len(operations)) if i in self.fail_indexes]
+        if failed:
+            raise BulkWriteError({
+                'writeErrors': [
+                    {'index': i, 'code': 11000, 'errmsg': 'duplicate key'}
+                    for i in failed
+                ],
+                'nUpserted': len(operations) - len(failed)
+            })
+
+
+class FakeDB:
+    def __init__(self, faqs=None, products=None):
+        self.faqs = faqs or FakeCollection()
+        self.products = products or FakeCollection()
+
+
+def make_service(db, chunk_size=500):
+    service = MongoDBService("mongodb://localhost:27017", "test", bulk_chunk_size=chunk_size)
+    service.db = db
+    return service
+
+
+@pytest.mark.asyncio
+async def test_faqs_batch_uses_chunked_unordered_bulk_write():
+    db = FakeDB()
+    service = make_service(db, chunk_size=2)
+
+    faqs = [{'inquiry_no': i, 'inquiry_content': f"문의 {i}"} for i in range(5)]
+    result = await service.store_faqs_batch(faqs)
+
+    assert result == {'succeeded': 5, 'failed': 0, 'errors': []}
+    assert [len(ops) for ops, _ in db.faqs.calls] == [2, 2, 1]
+    assert all(ordered is False for _, ordered in db.faqs.calls)
+
+    operation = db.faqs.calls[0][0][0]
+    assert isinstance(operation, UpdateOne)
+    assert operation._filter == {'inquiry_no': 0}
+    assert operation._doc['$set']['processing_status'] == 'pending'
+    assert 'created_at' in operation._doc['$setOnInsert']
+
+
+@pytest.mark.asyncio
+async def test_write_errors_are_reported_per_document():
+    db = FakeDB(products=FakeCollection(fail_indexes={1}))
+    service = make_service(db, chunk_size=2)
+
+    products = [{'product_id': f"P{i}"} for i in range(4)]
+    products.insert(2, {'product_name': "ID 없음"})
+    result = await service.store_products_batch(products)
+
+    assert result['succeeded'] == 2
+    assert result['failed'] == 3
+    assert {'product_id': None, 'error': 'product_id 누락'} in result['errors']
+    assert {'product_id': 'P1', 'error': 'duplicate key'} in result['errors']
+    assert {'product_id': 'P3', 'error': 'duplicate key'} in result['errors']
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+class FakeProducts(FakeCollection):
+    """find 쿼리 기록 + codes $all 필터만 흉내 내는 가짜 제품 컬렉션"""
+
+    def __init__(self, documents):
+        super().__init__()
+        self.documents = documents
+        self.queries = []
+
+    def find(self, query):
+        self.queries.append(query)
+        codes = query.get('codes', {}).get('$all', [])
+        return FakeCursor([
+            document for document in self.documents
+            if set(codes) <= set(document.get('codes', []))
+            and query.get('brand_channel', document['brand_channel']) == document['brand_channel']
+        ])
+
+
+@pytest.mark.asyncio
+async def test_product_lookup_uses_codes_query_then_memory_index():
+    documents = [
+        {'product_id': '3', 'brand_channel': 'KEYCHRON', 'product_name': 'K10 PRO MAX'},
+        {'product_id': '1', 'brand_channel': 'KEYCHRON', 'product_name': 'K10', 'product_name_synonyms': '["케이텐"]'},
+    ]
+    products = FakeProducts(documents)
+    service = make_service(FakeDB(products=products))
+
+    # 색인 로드 전: codes 인덱스 $all 조회 (정규식 아님), 기본 모델 우선
+    await service.store_products_batch(documents)
+    product = await service.get_product_by_code(["K10"], "KEYCHRON")
+
+    assert product['product_id'] == '1'
+    assert products.queries == [{'brand_channel': 'KEYCHRON', 'codes': {'$all': ['K10']}}]
+    assert await service.get_product_by_code([], "KEYCHRON") is None
+
+    # 색인 로드 후: DB 조회 없이 메모리에서, 제품 저장 시 갱신
+    assert await service.load_product_index() == 2
+    products.queries.clear()
+
+    await service.store_products_batch([{'product_id': '1', 'product_name': 'K10 ZMK'}])
+
+    assert (await service.get_product_by_code(["k10", "zmk"], "KEYCHRON"))['product_id'] == '1'
+    assert await service.get_product_by_code(["케이텐"], "KEYCHRON") is None
+    assert (await service.get_product_by_code(["K10", "PRO MAX"], "KEYCHRON"))['product_id'] == '3'
+    assert products.queries == []
+
+
+@pytest.mark.asyncio
+async def test_load_product_index_backfills_only_named_products():
+    products = FakeProducts([
+        {'product_id': '1', 'brand_channel': 'KEYCHRON', 'product_name': 'K10'},
+        {'product_id': '2', 'brand_channel': 'KEYCHRON'},
+        {'product_id': '3', 'brand_channel': 'KEYCHRON', 'product_name': 'Q6', 'codes': ['Q6']},
+    ])
+    service = make_service(FakeDB(products=products))
+
+    # 제품명 없는 예전 문서가 있어도 KeyError 없이 로드, 계산할 수 있는 문서만 codes 저장
+    assert await service.load_product_index() == 3
+
+    operations, _ = products.calls[0]
+    assert [(operation._filter, operation._doc) for operation in operations] == [
+        ({'product_id': '1'}, {'$set': {'codes': ['K10']}})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_watch_product_index_picks_up_other_process_writes():
+    products = FakeProducts([{'product_id': '1', 'brand_channel': 'KEYCHRON', 'product_name': 'K10', 'codes': ['K10']}])
+    service = make_service(FakeDB(products=products))
+    service.product_index_refresh_seconds = 0.01
+    await service.load_product_index()
+
+    # 다른 워커가 저장한 제품 (이 프로세스 색인에는 아직 없음)
+    products.documents.append({'product_id': '2', 'brand_channel': 'KEYCHRON', 'product_name': 'Q6', 'codes': ['Q6']})
+    assert await service.get_product_by_code(["Q6"], "KEYCHRON") is None
+
+    watcher = asyncio.create_task(service.watch_product_index())
+    await asyncio.sleep(0.05)
+    watcher.cancel()
+
+    assert (await service.get_product_by_code(["Q6"], "KEYCHRON"))['product_id'] == '2'
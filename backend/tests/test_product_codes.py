@@ -0,0 +1,64 @@
+# backend/tests/test_product_codes.py
+# 2026-10-17 21:20, Claude 작성
+
+"""
+제품 코드 색인 테스트
+
+제품명/동의어에서 정규화된 코드 추출, 메모리 색인 조회 우선순위와 갱신을 확인합니다.
+
+사용법:
+    pytest tests/test_product_codes.py
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.product_codes import ProductCodeIndex, normalize_codes, product_codes
+
+
+PRODUCTS = [
+    {'product_id': '3', 'brand_channel': 'KEYCHRON', 'product_name': 'K10 PRO MAX',
+     'product_name_synonyms': '["K10 프로 맥스", "K10"]'},
+    {'product_id': '1', 'brand_channel': 'KEYCHRON', 'product_name': 'K10',
+     'product_name_synonyms': '["케이텐", "k텐", "K10"]'},
+    {'product_id': '2', 'brand_channel': 'KEYCHRON', 'product_name': 'K2 HE',
+     'product_name_synonyms': ["K2 HE", "케이투", "k2he"]},
+    {'product_id': '9', 'brand_channel': 'GTGEAR', 'product_name': 'K10'},
+]
+
+
+def test_codes_from_name_and_synonyms():
+    assert product_codes('K10 PRO MAX', '["K10 프로 맥스", "K10"]') == ['K10', 'K10PROMAX', 'K10프로맥스', 'PROMAX']
+    assert product_codes('K2 HE', ["케이투", "k2he"]) == ['K2', 'K2HE', '케이투']
+    assert normalize_codes(['pro max', 'PRO-MAX', ' ', 'k10']) == ['PROMAX', 'K10']
+
+
+def test_lookup_prefers_base_model_and_matches_synonyms():
+    index = ProductCodeIndex()
+    index.load(PRODUCTS)
+    
+    assert index.lookup(['K10'], 'KEYCHRON')['product_id'] == '1'
+    assert index.lookup(['k10', 'PRO MAX'], 'KEYCHRON')['product_id'] == '3'
+    assert index.lookup(['케이텐'], 'KEYCHRON')['product_id'] == '1'
+    assert index.lookup(['K2HE'], 'KEYCHRON')['product_id'] == '2'
+    assert index.lookup(['K10'], 'GTGEAR')['product_id'] == '9'
+    assert index.lookup(['K10', 'ZMK'], 'KEYCHRON') is None
+    assert index.lookup([], 'KEYCHRON') is None
+
+
+def test_update_replaces_previous_codes():
+    index = ProductCodeIndex()
+    index.load(PRODUCTS)
+    
+    index.update([{'product_id': '1', 'brand_channel': 'KEYCHRON', 'product_name': 'K10 ZMK'}])
+    
+    assert len(index) == 4
+    assert index.lookup(['케이텐'], 'KEYCHRON') is None
+    assert index.lookup(['K10', 'ZMK'], 'KEYCHRON')['product_id'] == '1'
+    # 'K10 ZMK'도 'K10 PRO MAX'보다 제품명이 짧아 계속 우선
+    assert index.lookup(['K10'], 'KEYCHRON')['product_id'] == '1'
+    
+    index.remove('1')
+    assert index.lookup(['K10'], 'KEYCHRON')['product_id'] == '3'
@@ -0,0 +1,210 @@
+# backend/tests/test_question_analyzer.py
+# 2026-10-17 19:50, Claude 작성
+# 2026-10-17 20:50, Claude 업데이트 (단계별 분석 승격 테스트)
+# 2026-10-17 23:50, Claude 업데이트 (제품 코드만 없으면 spaCy 생략 테스트)
+
+"""
+QuestionAnalyzer 일괄 분석 / 단계별 분석 테스트
+
+한국어 spaCy 모델 대신 빈 다국어 파이프라인(토크나이저 전용 모드)으로
+analyze_many()가 건별 analyze()와 같은 결과를 내는지,
+analyze_tiered()가 애매한 문의만 다음 단계로 올리는지 확인합니다.
+
+사용법:
+    pytest tests/test_question_analyzer.py
+"""
+
+import sys
+import os
+
+import pytest
+import spacy
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import question_analyzer as core_module
+from app.core.question_analyzer import InquiryData
+from app.services import question_analyzer as service_module
+from app.services.embedding_cache import EmbeddingCache
+
+
+INQUIRIES = [
+    {
+        'inquiry_content': "K10 PRO MAX 펌웨어 업데이트 후 블루투스 연결이 안돼요. 어떻게 하나요?",
+        'brand_channel': "KEYCHRON",
+        'title': "연결 문제",
+        'product_name': "키크론 K10 PRO MAX 쉘화이트 바나나축"
+    },
+    {
+        'inquiry_content': "주문한 키보드 배송 언제 도착하나요?",
+        'brand_channel': "KEYCHRON"
+    },
+    {
+        'inquiry_content': "반품 수거 요청드립니다",
+        'brand_channel': "GTGEAR",
+        'category': "반품"
+    },
+]
+
+
+class FakeEngine:
+    model_name = 'fake-model'
+    
+    def __init__(self):
+        self.cache = EmbeddingCache(self.model_name)
+    
+    async def aencode(self, texts, batch_size=32):
+        if isinstance(texts, str):
+            return [float(len(texts)), 1.0]
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeWeaviateService:
+    def __init__(self):
+        self.embedding_engine = FakeEngine()
+        self.calls = []
+    
+    async def hybrid_search(self, query_text, keywords, brand_channel=None, category=None,
+                            limit=5, query_vector=None):
+        self.calls.append((query_text, category, query_vector))
+        return [
+            {'inquiry_no': 1, 'score': 0.8, 'inquiry_category': '환불'},
+            {'inquiry_no': 2, 'score': 0.3, 'inquiry_category': '반품'},
+        ]
+
+
+@pytest.fixture(autouse=True)
+def blank_spacy(monkeypatch):
+    def load(model_name, exclude=()):
+        return spacy.blank('xx')
+    
+    monkeypatch.setattr(core_module, 'load_spacy', load)
+    monkeypatch.setattr(service_module, 'load_spacy', load)
+
+
+def test_core_analyze_many_matches_analyze():
+    analyzer = core_module.QuestionAnalyzer(pos_tagging=False)
+    data_list = [
+        InquiryData(
+            brand_channel=item['brand_channel'],
+            inquiry_category=item.get('category', '상품'),
+            title=item.get('title', ''),
+            inquiry_content=item['inquiry_content'],
+            product_name=item.get('product_name')
+        )
+        for item in INQUIRIES
+    ]
+    
+    batched = analyzer.analyze_many(data_list, batch_size=2)
+    
+    assert [result.to_dict() for result in batched] == [analyzer.analyze(data).to_dict() for data in data_list]
+    assert batched[0].product_color == '쉘화이트'
+    assert batched[0].product_switch == '바나나축'
+    assert '펌웨어' in batched[0].tech_terms
+    # 토크나이저 전용 모드: 구두점/한 글자 토큰 제외
+    assert all(len(keyword) > 1 and keyword != '?' for keyword in batched[1].keywords)
+
+
+@pytest.mark.asyncio
+async def test_service_analyze_many_matches_analyze():
+    weaviate = FakeWeaviateService()
+    analyzer = service_module.QuestionAnalyzer(
+        weaviate_service=weaviate,
+        embedding_engine=weaviate.embedding_engine,
+        pos_tagging=False
+    )
+    
+    batched = await analyzer.analyze_many(INQUIRIES, batch_size=2)
+    single = [await analyzer.analyze(**inquiry) for inquiry in INQUIRIES]
+    await analyzer.embedding_batcher.close()
+    
+    assert batched == single
+    assert batched[0].product_codes
+    assert batched[1].category == '배송'
+    assert batched[2].category == '반품'
+    assert [faq['inquiry_no'] for faq in batched[0].similar_faqs] == [1]
+    assert batched[0].embedding == [float(len(INQUIRIES[0]['inquiry_content'])), 1.0]
+
+
+def make_service_analyzer():
+    weaviate = FakeWeaviateService()
+    analyzer = service_module.QuestionAnalyzer(
+        weaviate_service=weaviate,
+        embedding_engine=weaviate.embedding_engine,
+        pos_tagging=False
+    )
+    return analyzer, weaviate
+
+
+@pytest.mark.asyncio
+async def test_tiered_simple_inquiries_stop_at_rules():
+    analyzer, weaviate = make_service_analyzer()
+    
+    def no_spacy(text):
+        raise AssertionError("rules 단계에서 spaCy를 쓰면 안 됩니다")
+    
+    analyzer.nlp = no_spacy
+    
+    shipping = await analyzer.analyze_tiered("주문한 키보드 배송 언제 도착하나요? 문의드립니다", "KEYCHRON")
+    returning = await analyzer.analyze_tiered("반품 수거 요청드립니다", "KEYCHRON")
+    product = await analyzer.analyze_tiered("K10 블루투스 연결이 안돼요", "KEYCHRON")
+    
+    assert (shipping.tier, shipping.category, shipping.escalation_reason) == (service_module.TIER_RULES, '배송', None)
+    assert (returning.tier, returning.category) == (service_module.TIER_RULES, '반품')
+    assert (product.tier, product.product_codes) == (service_module.TIER_RULES, ['K10'])
+    assert '배송' in shipping.keywords
+    assert shipping.embedding is None
+    assert weaviate.calls == []
+
+
+@pytest.mark.asyncio
+async def test_tiered_category_tie_escalates_to_retrieval_vote():
+    analyzer, weaviate = make_service_analyzer()
+    
+    result = await analyzer.analyze_tiered("환불 부탁드립니다", "KEYCHRON")
+    await analyzer.embedding_batcher.close()
+    
+    assert result.tier == service_module.TIER_FULL
+    assert result.escalation_reason == service_module.AMBIGUOUS_CATEGORY_TIE
+    # 카테고리 필터 없이 검색, 유사 FAQ 투표로 결정
+    assert weaviate.calls[0][1] is None
+    assert result.category == '환불'
+    assert result.embedding is not None
+    assert [faq['inquiry_no'] for faq in result.similar_faqs] == [1]
+
+
+@pytest.mark.asyncio
+async def test_tiered_missing_product_code_skips_spacy():
+    analyzer, weaviate = make_service_analyzer()
+    
+    def no_spacy(text):
+        raise AssertionError("제품 코드만 없으면 spaCy 단계를 건너뛰어야 합니다")
+    
+    analyzer.nlp = no_spacy
+    
+    capped = await analyzer.analyze_tiered("키보드가 고장났어요", "KEYCHRON", max_tier=service_module.TIER_SPACY)
+    assert (capped.tier, capped.escalation_reason, capped.category) == (service_module.TIER_RULES, None, '상품')
+    assert weaviate.calls == []
+    
+    # 계산된 임베딩을 넘기면 다시 임베딩하지 않고 그대로 검색에 사용
+    result = await analyzer.analyze_tiered("키보드가 고장났어요", "KEYCHRON", embedding=[0.5, 0.5])
+    
+    assert result.tier == service_module.TIER_FULL
+    assert result.escalation_reason == service_module.AMBIGUOUS_NO_PRODUCT_CODE
+    assert result.embedding == [0.5, 0.5]
+    # 카테고리는 명확하므로 카테고리 필터로 검색
+    assert weaviate.calls == [("키보드가 고장났어요", '상품', [0.5, 0.5])]
+
+
+@pytest.mark.asyncio
+async def test_tiered_respects_max_tier():
+    analyzer, weaviate = make_service_analyzer()
+    
+    result = await analyzer.analyze_tiered("환불 부탁드립니다", "KEYCHRON", max_tier=service_module.TIER_SPACY)
+    
+    assert result.tier == service_module.TIER_SPACY
+    assert result.escalation_reason == service_module.AMBIGUOUS_CATEGORY_TIE
+    assert weaviate.calls == []
+    
+    with pytest.raises(ValueError):
+        await analyzer.analyze_tiered("배송 문의", "KEYCHRON", max_tier='gpu')
@@ -0,0 +1,80 @@
+# backend/tests/test_questions_api.py
+# 2026-10-17 16:10, Claude 작성
+
+"""
+Questions API 테스트
+
+AnswerGenerator 의존성을 가짜로 바꿔
+/analyze의 SSE 스트리밍 응답 형식과 JSON 응답을 확인합니다.
+
+사용법:
+    pytest tests/test_questions_api.py
+"""
+
+import sys
+import os
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.api import questions
+from app.core.answer_generator import get_answer_generator
+
+
+class FakeAnswerGenerator:
+    def __init__(self):
+        self.calls = []
+
+    async def stream_answer(self, question_text, customer_id=None, brand_channel="KEYCHRON",
+                            product_codes=None):
+        self.calls.append((question_text, customer_id, brand_channel, product_codes))
+        yield {'event': 'metadata', 'data': {'category': '배송', 'confidence': 0.9, 'similar_faqs': []}}
+        yield {'event': 'token', 'data': {'text': '안녕하세요'}}
+        yield {'event': 'done', 'data': {'answer': '안녕하세요', 'requires_review': False}}
+
+    async def generate_answer(self, question_text, customer_id=None, brand_channel="KEYCHRON",
+                              product_codes=None):
+        return {'answer': '안녕하세요', 'confidence': 0.9, 'requires_review': False}
+
+
+def make_client(generator):
+    app = FastAPI()
+    app.include_router(questions.router, prefix="/api/questions")
+    app.dependency_overrides[get_answer_generator] = lambda: generator
+    return TestClient(app)
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+def test_analyze_streams_server_sent_events():
+    generator = FakeAnswerGenerator()
+    client = make_client(generator)
+
+    response = client.post("/api/questions/analyze", json={"question": "언제 와요?", "customer_id": "c1"})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+
+    events = parse_sse(response.text)
+    assert [name for name, _ in events] == ['metadata', 'token', 'done']
+    assert events[0][1]['category'] == '배송'
+    assert events[1][1]['text'] == '안녕하세요'
+    assert generator.calls == [("언제 와요?", "c1", "KEYCHRON", None)]
+
+
+def test_analyze_returns_json_when_stream_disabled():
+    client = make_client(FakeAnswerGenerator())
+
+    response = client.post("/api/questions/analyze", json={"question": "언제 와요?", "stream": False})
+
+    assert response.status_code == 200
+    assert response.json()['answer'] == '안녕하세요'
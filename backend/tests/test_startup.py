@@ -0,0 +1,113 @@
+# backend/tests/test_startup.py
+# 2026-10-17 18:20, Claude 작성
+
+"""
+앱 시작/종료 처리 테스트
+
+단계별 타이밍/실패 기록, /health/ready 응답(준비 전 503, 준비 후 200),
+종료 시 백그라운드 태스크 취소와 연결 종료를 확인합니다.
+
+사용법:
+    pytest tests/test_startup.py
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.api import health
+from app.core.startup import StartupState, get_startup_state, stop_services
+
+
+class FakeService:
+    def __init__(self, error=None):
+        self.error = error
+        self.closed = False
+    
+    async def close(self):
+        self.closed = True
+    
+    async def disconnect(self):
+        if self.error:
+            raise self.error
+        self.closed = True
+
+
+def make_client(state):
+    app = FastAPI()
+    app.include_router(health.router, prefix="/health")
+    app.dependency_overrides[get_startup_state] = lambda: state
+    return TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_step_records_timing_and_errors():
+    state = StartupState()
+    
+    async with state.step('mongodb'):
+        await asyncio.sleep(0.01)
+    
+    async with state.step('weaviate'):
+        raise ConnectionError("연결 거부")
+    
+    assert state.timings['mongodb'] >= 10
+    assert 'weaviate' in state.timings
+    assert state.errors == {'weaviate': "연결 거부"}
+
+
+def test_ready_endpoint_returns_503_until_ready():
+    state = StartupState()
+    client = make_client(state)
+    
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()['status'] == 'starting'
+    
+    state.timings = {'embedding_model': 2100.0, 'mongodb': 12.5}
+    state.total_ms = 2200.0
+    state.ready = True
+    
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body['status'] == 'ready'
+    assert body['timings_ms']['embedding_model'] == 2100.0
+
+
+def test_ready_endpoint_reports_failed_startup():
+    state = StartupState()
+    state.errors = {'weaviate': "연결 거부"}
+    state.total_ms = 150.0
+    
+    response = make_client(state).get("/health/ready")
+    
+    assert response.status_code == 503
+    assert response.json()['status'] == 'failed'
+    assert response.json()['errors'] == {'weaviate': "연결 거부"}
+
+
+@pytest.mark.asyncio
+async def test_stop_services_cancels_tasks_and_closes_connections():
+    state = StartupState()
+    state.ready = True
+    state.services = {
+        'claude': FakeService(),
+        'weaviate': FakeService(error=RuntimeError("이미 닫힘")),
+        'mongodb': FakeService()
+    }
+    watcher = asyncio.create_task(asyncio.sleep(3600))
+    state.tasks.append(watcher)
+    
+    await stop_services(state)
+    
+    assert watcher.cancelled()
+    assert state.ready is False
+    assert state.services['claude'].closed
+    # 한 서비스 종료 실패가 나머지 종료를 막지 않음
+    assert state.services['mongodb'].closed
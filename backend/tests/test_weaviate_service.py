@@ -0,0 +1,195 @@
+# backend/tests/test_weaviate_service.py
+# 2026-10-17 10:40, Claude 작성
+# 2026-10-17 23:10, Claude 업데이트 (공유 FAQ 스키마/속성 일치 테스트)
+# 2026-10-18 01:00, Claude 업데이트 (고정 UUID, 임베딩 배치 크기 분리 테스트)
+
+"""
+WeaviateService 동시성 테스트
+
+느린 가짜 Weaviate 클라이언트(동기 호출에서 sleep)를 주입하여
+병렬 검색이 직렬화되지 않고 겹쳐서 실행되는지, 그동안 이벤트 루프가
+막히지 않는지 확인합니다. Weaviate 서버와 실제 모델 없이 실행됩니다.
+
+사용법:
+    pytest tests/test_weaviate_service.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.weaviate_service import FAQ_PROPERTIES, WeaviateService
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.embedding_cache import EmbeddingCache
+
+
+QUERY_DELAY = 0.2
+
+
+class FakeEngine:
+    """고정 벡터를 돌려주는 가짜 임베딩 엔진"""
+
+    model_name = 'fake-model'
+
+    def __init__(self):
+        self.cache = EmbeddingCache(self.model_name)
+
+    async def aencode(self, texts, batch_size=32):
+        return [[1.0, 0.0] for _ in texts]
+
+
+class SlowQuery:
+    """동기 클라이언트처럼 호출 스레드를 막는 가짜 쿼리 API"""
+
+    def _slow(self, **kwargs):
+        time.sleep(QUERY_DELAY)
+        return SimpleNamespace(objects=[])
+
+    near_vector = _slow
+    hybrid = _slow
+
+
+class FakeClient:
+    def __init__(self):
+        collection = SimpleNamespace(query=SlowQuery())
+        self.collections = SimpleNamespace(get=lambda name: collection)
+
+    def close(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def service():
+    engine = FakeEngine()
+    service = WeaviateService(
+        "http://localhost:8081",
+        embedding_engine=engine,
+        embedding_batcher=EmbeddingBatcher(engine),
+        max_concurrency=8
+    )
+    service.client = FakeClient()
+    yield service
+    await service.embedding_batcher.close()
+    await service.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_parallel_searches_overlap(service):
+    n = 6
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        service.search_similar_faqs(f"배송 문의 {i}") for i in range(n)
+    ))
+    elapsed = time.perf_counter() - start
+
+    # 직렬이면 n * QUERY_DELAY (1.2초), 겹치면 QUERY_DELAY 근처
+    assert elapsed < QUERY_DELAY * n / 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_search(service):
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    await service.hybrid_search("K10 키보드 문제", keywords=["K10"])
+    done.set()
+    await ticker_task
+
+    # 검색 중(0.2초)에도 ticker가 계속 실행되어야 함
+    assert ticks >= 5
+
+
+class RecordingBatch:
+    """collection.batch 대역: 추가된 객체를 기록하고 지정한 UUID를 실패로 보고"""
+
+    def __init__(self, fail_uuids=()):
+        self.objects = []
+        self.fail_uuids = set(fail_uuids)
+        self.options = None
+        self.failed_objects = []
+
+    def fixed_size(self, batch_size, concurrent_requests):
+        self.options = (batch_size, concurrent_requests)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.failed_objects = [
+            SimpleNamespace(original_uuid=obj['uuid'], message="vector dimension mismatch")
+            for obj in self.objects if obj['uuid'] in self.fail_uuids
+        ]
+        return False
+
+    def add_object(self, properties, vector, uuid):
+        self.objects.append({'properties': properties, 'vector': vector, 'uuid': uuid})
+
+
+@pytest.mark.asyncio
+async def test_add_faqs_batch_uses_one_encode_and_deterministic_uuids(service):
+    encode_calls = []
+    original = service.embedding_engine.aencode
+
+    async def recording_aencode(texts, batch_size=32):
+        encode_calls.append((list(texts), batch_size))
+        return await original(texts, batch_size)
+
+    service.embedding_engine.aencode = recording_aencode
+
+    batch = RecordingBatch(fail_uuids=[WeaviateService.faq_uuid(3)])
+    collection = SimpleNamespace(batch=batch)
+    service.client.collections = SimpleNamespace(get=lambda name: collection)
+
+    faqs = [
+        {'inquiry_no': i, 'brand_channel': 'KEYCHRON', 'inquiry_category': '배송',
+         'title': f'제목 {i}', 'inquiry_content': f'내용 {i}'}
+        for i in range(1, 4)
+    ]
+    faqs.append({'inquiry_no': 4, 'title': '필드 누락'})
+
+    result = await service.add_faqs_batch(faqs, batch_size=50, concurrent_requests=4)
+
+    assert len(encode_calls) == 1
+    # 모델 배치 크기는 Weaviate 전송 배치 크기(50)와 별개
+    assert encode_calls[0][1] == service.encode_batch_size == 32
+    assert batch.options == (50, 4)
+    assert [obj['uuid'] for obj in batch.objects] == [WeaviateService.faq_uuid(i) for i in range(1, 4)]
+    # UUID는 inquiry_no와 컬렉션 이름으로만 정해짐 (프로세스/실행이 달라도 같은 값 → 덮어쓰기)
+    assert WeaviateService.faq_uuid(1) == 'b9c4051d-9c37-5412-910f-f0bda18035b6'
+
+    assert result['succeeded'] == 2
+    assert result['failed'] == 2
+    assert {error['inquiry_no'] for error in result['errors']} == {3, 4}
+
+    # 같은 FAQ를 다시 저장하면 같은 UUID로 덮어씀
+    batch.objects.clear()
+    await service.add_faqs_batch(faqs[:1])
+    assert [obj['uuid'] for obj in batch.objects] == ['b9c4051d-9c37-5412-910f-f0bda18035b6']
+
+
+def test_faq_properties_match_shared_schema():
+    faq = {
+        'inquiry_no': 7, 'brand_channel': 'KEYCHRON', 'inquiry_category': '상품',
+        'title': '펌웨어', 'inquiry_content': '업데이트 방법', 'answer_content': '...',
+        'updated_at': '2026-10-17', '_id': 'oid-7'
+    }
+
+    # 모든 쓰기 경로(앱, 인덱서, 임포트 스크립트)가 같은 속성/텍스트를 사용
+    assert set(WeaviateService.faq_properties(faq)) == {prop.name for prop in FAQ_PROPERTIES}
+    assert WeaviateService.faq_text(faq) == "펌웨어 업데이트 방법"